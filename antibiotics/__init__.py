@@ -1,12 +1,30 @@
 """
 Antibiotics Module - Dosing and TDM Tools
 Modular structure for easy maintenance
+
+Page renders (Streamlit) are imported on first access, so the headless
+modules (renal_report) never import Streamlit.
 """
 
-from .crcl import render as render_crcl
-from .vancomycin import render as render_vancomycin
-from .aminoglycoside import render as render_aminoglycoside
-from .database import render_antibiotic_lookup, render_database
+from importlib import import_module
+
+# Page renders (Streamlit), imported lazily: name → (module, attribute)
+_RENDERS = {
+    'render_crcl': ('crcl', 'render'),
+    'render_vancomycin': ('vancomycin', 'render'),
+    'render_aminoglycoside': ('aminoglycoside', 'render'),
+    'render_antibiotic_lookup': ('database', 'render_antibiotic_lookup'),
+    'render_database': ('database', 'render_database'),
+}
+
+
+def __getattr__(name):
+    if name in _RENDERS:
+        module, attribute = _RENDERS[name]
+        render = getattr(import_module(f".{module}", __name__), attribute)
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'render_crcl',
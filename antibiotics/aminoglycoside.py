@@ -3,8 +3,16 @@ Aminoglycoside Dosing Calculator
 Extended-Interval Dosing (Once-Daily)
 """
 
+import pandas as pd
 import streamlit as st
 
+from labs.converter import convert_units
+from scores.engine.infectious.aminoglycoside_pk import (
+    AMINOGLYCOSIDES,
+    compare_regimens,
+    hartford_interval,
+)
+
 
 def render():
     """Aminoglycoside Dosing Calculator"""
@@ -106,7 +114,7 @@ def render():
                 step=5.0,
                 key="ag_scr_umol"
             )
-            scr_mgdl = scr_umol / 88.4
+            scr_mgdl = convert_units("Creatinine", scr_umol, "µmol/L", "mg/dL")
         
         # Calculate CrCl using IBW
         crcl = ((140 - age) * dosing_weight) / (72 * scr_mgdl)
@@ -349,5 +357,51 @@ def render():
                 - https://www.idsociety.org/practice-guideline/
                 """)
     
+    st.markdown("---")
+    render_simulation(drug, dosing_weight, crcl)
+    
     st.markdown("---")
     st.caption("⚠️ Công cụ hỗ trợ - Tham khảo dược sĩ lâm sàng và Hartford Nomogram để điều chỉnh chính xác")
+
+
+def render_simulation(drug, dosing_weight, crcl):
+    """Hartford interval from a random level and multi-dose regimen comparison"""
+    st.markdown("### 📈 Hartford Nomogram & Mô Phỏng Nồng Độ")
+    info = AMINOGLYCOSIDES[drug]
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        level = st.number_input("Nồng độ ngẫu nhiên (mg/L)", min_value=0.0, max_value=100.0,
+                                value=3.0 * info["nomogram_scale"], step=0.1, key="ag_sim_level")
+    with col2:
+        hours = st.number_input("Thời điểm lấy mẫu (giờ sau bắt đầu truyền)", min_value=0.0,
+                                max_value=48.0, value=10.0, step=0.5, key="ag_sim_hours")
+    
+    nomogram = hartford_interval(level, hours, drug)
+    if nomogram["in_window"]:
+        low, high = nomogram["boundaries"]
+        st.success(f"**Hartford:** interval **q{nomogram['interval']}h** "
+                   f"(ranh giới tại {hours:g}h: q24/q36 = {low:.1f}, q36/q48 = {high:.1f} mg/L)")
+    else:
+        st.warning("Mẫu ngoài cửa sổ 6-14h - Hartford nomogram không áp dụng")
+    
+    result = compare_regimens(drug, dosing_weight, crcl)
+    table = pd.DataFrame({
+        "Liều (mg)": result["dose"],
+        "mg/kg": result["mg_per_kg"],
+        "Interval (h)": result["interval"],
+        "Peak (mg/L)": result["peak"].round(1),
+        "Trough (mg/L)": result["trough"].round(2),
+        "% thời gian < MIC": result["time_below_mic_pct"].round(0),
+        "Đạt mục tiêu": result["meets_target"],
+    })
+    st.caption(f"CrCl {crcl} mL/phút, cân nặng tính liều {dosing_weight:.1f} kg, "
+               f"peak mục tiêu {info['peak_target'][0]}-{info['peak_target'][1]} mg/L, "
+               f"trough < {info['trough_max']:g} mg/L, MIC {info['mic']:g} mg/L")
+    st.dataframe(table, hide_index=True)
+    
+    labels = [f"{dose:.0f} mg q{interval:.0f}h" for dose, interval in zip(result["dose"], result["interval"])]
+    shown = st.multiselect("Phác đồ hiển thị", labels, default=labels[-3:], key="ag_sim_regimens")
+    if shown:
+        curves = pd.DataFrame(result["concentration"].T, index=result["time"], columns=labels)
+        st.line_chart(curves[shown], x_label="Giờ", y_label="mg/L")
@@ -5,6 +5,8 @@ Cockcroft-Gault Formula
 
 import streamlit as st
 
+from labs.converter import convert_units
+
 
 def render():
     """Creatinine Clearance (CrCl) Calculator - Cockcroft-Gault"""
@@ -63,13 +65,13 @@ def render():
                 help="Bình thường: 62-106 µmol/L",
                 key="scr_umol"
             )
-            scr_mgdl = scr_input / 88.4  # Convert to mg/dL
+            scr_mgdl = convert_units("Creatinine", scr_input, "µmol/L", "mg/dL")
         
         # Display converted value
         if scr_unit == "µmol/L":
             st.caption(f"≈ {scr_mgdl:.2f} mg/dL")
         else:
-            st.caption(f"≈ {scr_mgdl * 88.4:.1f} µmol/L")
+            st.caption(f"≈ {convert_units('Creatinine', scr_mgdl, 'mg/dL', 'µmol/L'):.1f} µmol/L")
         
         sex = st.radio(
             "Giới tính",
@@ -131,7 +133,7 @@ def render():
                 - Creatinine: 1 mg/dL = 88.4 µmol/L
                 - Scr input: {scr_input} {scr_unit}
                 - Scr (mg/dL): {scr_mgdl:.2f}
-                - Scr (µmol/L): {scr_mgdl * 88.4:.1f}
+                - Scr (µmol/L): {convert_units('Creatinine', scr_mgdl, 'mg/dL', 'µmol/L'):.1f}
                 
                 **Reference:** 
                 Cockcroft DW, Gault MH. Prediction of creatinine clearance from serum creatinine. Nephron. 1976;16(1):31-41.
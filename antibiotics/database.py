@@ -1,48 +1,104 @@
 """
 Antibiotic Database and Lookup Functions
+Data: data/Antibiotics.csv (scores/engine/formulary.py)
 """
 
 import streamlit as st
 import pandas as pd
 
+from scores.engine.formulary import get_renal_regimen, load_formulary, search_formulary
+
+
+AWARE_CLASSES = ["Access", "Watch", "Reserve"]
+DISPLAY_COLUMNS = {
+    "drug": "Thuốc",
+    "indication": "Chỉ định",
+    "aware": "AWaRe",
+    "route": "Đường dùng",
+    "adult_dose": "Liều người lớn",
+    "renal_thr": "Ngưỡng thận",
+    "renal_dose_lt_thr": "Liều khi suy thận",
+    "pediatric": "Trẻ em",
+    "notes": "Ghi chú",
+    "refs": "Tham khảo",
+}
+
+
+def _routes(formulary):
+    return sorted({row["route"] for row in formulary["rows"] if row["route"]})
+
 
 def render_antibiotic_lookup():
     """Antibiotic Lookup Tool"""
     st.subheader("🔍 Tra Cứu Kháng Sinh")
     st.caption("Tìm kiếm thông tin kháng sinh theo tên hoặc chỉ định")
-    
-    st.warning("🚧 **Đang phát triển** - Dự kiến hoàn thành: Tuần 2")
-    
-    st.info("""
-    **Tra cứu kháng sinh:**
-    - Liều dùng chuẩn
-    - Điều chỉnh theo chức năng thận
-    - Chỉ định
-    - Tác dụng phụ
-    - Tương tác thuốc
-    """)
-    
-    # Preview
-    search = st.text_input("🔍 Tìm kiếm kháng sinh:", placeholder="Ví dụ: Ceftriaxone, Sepsis...")
-    
-    if search:
-        st.info(f"Đang tìm kiếm: **{search}**")
-        st.write("Kết quả sẽ hiển thị ở đây khi hoàn thành...")
+
+    formulary = load_formulary()
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        search = st.text_input("🔍 Tìm kiếm kháng sinh:", placeholder="Ví dụ: Ceftriaxone, Sepsis...",
+                               key="abx_lookup_search")
+    with col2:
+        aware = st.selectbox("AWaRe", ["Tất cả"] + AWARE_CLASSES, key="abx_lookup_aware")
+    with col3:
+        route = st.selectbox("Đường dùng", ["Tất cả"] + _routes(formulary), key="abx_lookup_route")
+
+    crcl = st.number_input("CrCl (mL/phút) - để chọn liều theo chức năng thận", min_value=0.0,
+                           max_value=200.0, value=90.0, step=5.0, key="abx_lookup_crcl")
+
+    rows = search_formulary(
+        search or None,
+        aware=None if aware == "Tất cả" else aware,
+        route=None if route == "Tất cả" else route,
+        formulary=formulary
+    )
+
+    st.caption(f"{len(rows)} kết quả · Antibiotics_VERSION {formulary['version']}")
+    if not rows:
+        st.info("Không tìm thấy kháng sinh phù hợp")
+        return
+
+    for row in rows[:50]:
+        regimen = get_renal_regimen(row["drug"], crcl, indication=row["indication"], formulary=formulary)
+        with st.expander(f"💊 {row['drug']} - {row['indication']}"):
+            st.markdown(f"**AWaRe:** {row['aware']} · **Đường dùng:** {row['route']}")
+            if regimen["adjusted"]:
+                st.warning(f"**Liều tại CrCl {crcl:g}:** {regimen['regimen']} ({regimen['rule']})")
+            else:
+                st.success(f"**Liều tại CrCl {crcl:g}:** {regimen['regimen']}")
+            st.write(f"- **Liều người lớn:** {row['adult_dose']}")
+            if row["renal_thr"]:
+                st.write(f"- **Điều chỉnh thận:** {row['renal_thr']} → {row['renal_dose_lt_thr']}")
+            st.write(f"- **Trẻ em:** {row['pediatric']}")
+            if row["notes"]:
+                st.caption(f"{row['notes']} · {row['refs']}")
+    if len(rows) > 50:
+        st.caption(f"Hiển thị 50/{len(rows)} kết quả - thu hẹp tìm kiếm để xem thêm")
 
 
 def render_database():
     """Antibiotic Database Viewer"""
     st.subheader("📊 Cơ Sở Dữ Liệu Kháng Sinh")
     st.caption("Danh sách đầy đủ kháng sinh và hướng dẫn sử dụng")
-    
-    st.warning("🚧 **Đang phát triển** - Dự kiến hoàn thành: Tuần 3")
-    
-    st.info("""
-    **Cơ sở dữ liệu bao gồm:**
-    - Danh sách kháng sinh
-    - Phân loại theo nhóm
-    - Liều dùng chi tiết
-    - Điều chỉnh theo chức năng thận/gan
-    - Guidelines quốc tế
-    """)
 
+    formulary = load_formulary()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        aware = st.multiselect("AWaRe", AWARE_CLASSES, key="abx_db_aware")
+    with col2:
+        routes = st.multiselect("Đường dùng", _routes(formulary), key="abx_db_route")
+
+    rows = formulary["rows"]
+    if aware:
+        ids = set()
+        for aware_class in aware:
+            ids.update(row["id"] for row in search_formulary(aware=aware_class, formulary=formulary))
+        rows = [row for row in rows if row["id"] in ids]
+    if routes:
+        rows = [row for row in rows if row["route"] in routes]
+
+    table = pd.DataFrame(rows, columns=list(DISPLAY_COLUMNS)).rename(columns=DISPLAY_COLUMNS)
+    st.dataframe(table, hide_index=True)
+    st.caption(f"{len(rows)}/{len(formulary['rows'])} dòng · Antibiotics_VERSION {formulary['version']}")
@@ -0,0 +1,201 @@
+"""
+Renal Dose-Adjustment Report
+Check every active antibiotic order of a ward / hospital against renal function
+
+Inputs (DataFrames or CSV / Parquet paths):
+- orders: order_id, patient, drug, dose (ordered regimen text), optional indication
+- patients: patient, age, weight (kg), sex
+- labs: patient, time, test, value, unit - long-format results as in
+  labs/bulk.py; only the latest Creatinine of each patient is used
+
+CrCl is computed once per patient with calculate_crcl_array() (the vectorized
+calculate_crcl(), Cockcroft-Gault). Orders are then grouped by (drug,
+indication) and each group's CrCl column is evaluated against the formulary
+renal thresholds (data/Antibiotics.csv) in one get_renal_regimen_array() call.
+
+Regimens are compared by dose and interval (regimen_key: "2 g IV q12h",
+"2000 mg q12h" and "2g IV every 12 h" are the same), falling back to the
+text for regimens that cannot be parsed.
+
+Status per order:
+- ok: the ordered regimen is the one that applies at the patient's CrCl
+- adjust: CrCl falls under a renal threshold, the formulary gives a
+  concrete renal regimen (dose + interval) and the order differs from it
+- review: the expected regimen is not quantitative (e.g. "See label"), or
+  no renal threshold applies but the order differs from adult_dose, or the
+  drug has several formulary rows and the order no indication
+- no_crcl: no creatinine (with a unit) / age / weight / sex for the patient
+- unknown_drug: drug not in the formulary
+
+Usage:
+    from antibiotics.renal_report import renal_dose_report
+
+    report = renal_dose_report("orders.csv", "patients.csv", "labs.csv")
+    report["orders"][report["orders"]["needs_adjustment"]]
+"""
+
+import numpy as np
+import pandas as pd
+
+from labs.converter import convert_array
+from labs.normal_ranges import FEMALE_VALUES
+from scores.engine.formulary import get_renal_regimen_array, load_formulary
+from scores.engine.metabolism.crcl import calculate_crcl_array
+
+
+STATUSES = ("ok", "adjust", "review", "no_crcl", "unknown_drug")
+
+_DOSE = r"(\d+(?:[.,]\d+)?)\s*(mg|g|mcg|µg|μg|iu|units?)\b(\s*/\s*kg)?"
+_INTERVAL = r"(?:q|every)\s*(\d+(?:\.\d+)?)\s*(?:h|hours?)\b"
+DOSE_UNITS = {"mg": (1.0, "mg"), "g": (1000.0, "mg"), "mcg": (1e-3, "mg"), "µg": (1e-3, "mg"),
+              "μg": (1e-3, "mg"), "iu": (1.0, "units"), "unit": (1.0, "units"), "units": (1.0, "units")}
+DAILY_FREQUENCIES = ((r"\b(?:once daily|daily|od|qd)\b", 24), (r"\b(?:bid|twice daily)\b", 12),
+                     (r"\btid\b", 8), (r"\bqid\b", 6))
+
+
+def _read(source):
+    if isinstance(source, pd.DataFrame):
+        return source
+    if str(source).lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+def _normalize_regimen(text):
+    """Regimen text compared case- and whitespace-insensitively"""
+    return text.fillna("").astype(str).str.lower().str.split().str.join(" ")
+
+
+def regimen_key(text) -> pd.Series:
+    """
+    Dose and interval of regimen texts, e.g. "2 g IV q12h" → "2000 mg/12h"
+
+    Returns:
+        Series of keys (object), NaN where the text has no dose +
+        interval (not quantitative, e.g. "See label")
+    """
+    text = pd.Series(text).fillna("").astype(str).str.lower()
+    dose = text.str.extract(_DOSE)
+    unit = dose[1].map(DOSE_UNITS)
+    amount = pd.to_numeric(dose[0].str.replace(",", "."), errors="coerce") * unit.str[0]
+    interval = pd.to_numeric(text.str.extract(_INTERVAL)[0], errors="coerce")
+    for pattern, hours in DAILY_FREQUENCIES:
+        interval = interval.mask(interval.isna() & text.str.contains(pattern), hours)
+    keys = pd.Series(None, index=text.index, dtype=object)
+    parsed = amount.notna() & interval.notna()
+    # Formatted only where both parts parsed (no str / NaN dtype mixing)
+    keys[parsed] = [f"{value:g} {dimension}{'/kg' if per_kg else ''}/{hours:g}h"
+                    for value, dimension, per_kg, hours in zip(amount[parsed], unit[parsed].str[1],
+                                                               dose[2][parsed].notna(), interval[parsed])]
+    return keys
+
+
+def latest_creatinine(labs) -> pd.DataFrame:
+    """
+    Latest creatinine per patient, in mg/dL
+
+    Results without a known unit are skipped (never assumed to be mg/dL).
+
+    Returns:
+        DataFrame indexed by patient: creatinine (mg/dL), creatinine_time
+    """
+    creatinine = labs[labs["test"] == "Creatinine"]
+    values = convert_array("Creatinine", pd.to_numeric(creatinine["value"], errors="coerce"),
+                           creatinine["unit"], "mg/dL")
+    creatinine = pd.DataFrame({
+        "patient": creatinine["patient"].to_numpy(),
+        "creatinine": values,
+        "creatinine_time": pd.to_datetime(creatinine["time"].to_numpy(), utc=True),
+    }).dropna(subset=["creatinine", "creatinine_time"])
+    latest = creatinine.sort_values("creatinine_time", kind="stable").groupby("patient").tail(1)
+    return latest.set_index("patient")
+
+
+def patient_crcl(patients, labs) -> pd.DataFrame:
+    """
+    CrCl per patient from demographics and the latest creatinine
+
+    Returns:
+        DataFrame indexed by patient: age, weight, sex, creatinine,
+        creatinine_time, crcl (mL/min, NaN if anything is missing)
+    """
+    table = patients.drop_duplicates("patient", keep="last").set_index("patient")
+    table = table.join(latest_creatinine(labs), how="left")
+    gender = np.where(table["sex"].isin(FEMALE_VALUES), "female", "male")
+    table["crcl"] = calculate_crcl_array(
+        pd.to_numeric(table["age"], errors="coerce"),
+        pd.to_numeric(table["weight"], errors="coerce"),
+        table["creatinine"],
+        gender,
+        creatinine_unit="mg/dL"
+    )
+    table.loc[~np.isfinite(table["crcl"]) | (table["crcl"] <= 0), "crcl"] = np.nan
+    return table
+
+
+def renal_dose_report(orders, patients, labs, formulary=None) -> dict:
+    """
+    Evaluate antibiotic orders against renal dose thresholds
+
+    Args:
+        orders, patients, labs: DataFrames or file paths (see module docstring)
+        formulary: Compiled formulary (default load_formulary())
+
+    Returns:
+        dict: orders (input columns + creatinine, creatinine_time, crcl,
+        expected_regimen, renal_rule, status, needs_adjustment), summary
+        (count per status), patients (number with a CrCl)
+    """
+    orders = _read(orders).reset_index(drop=True)
+    formulary = formulary or load_formulary()
+    crcl_table = patient_crcl(_read(patients), _read(labs))
+
+    joined = crcl_table.reindex(orders["patient"].to_numpy())
+    crcl = joined["crcl"].to_numpy(dtype=float)
+    expected = np.full(len(orders), None, dtype=object)
+    rule = np.full(len(orders), None, dtype=object)
+    adjusted = np.zeros(len(orders), dtype=bool)
+    known = np.zeros(len(orders), dtype=bool)
+
+    indication = orders["indication"].fillna("") if "indication" in orders else pd.Series("", index=orders.index)
+    for (drug, drug_indication), rows in orders.groupby([orders["drug"], indication], sort=False).indices.items():
+        try:
+            result = get_renal_regimen_array(drug, crcl[rows], indication=drug_indication or None,
+                                             formulary=formulary)
+        except KeyError:
+            continue
+        except ValueError:
+            known[rows] = True      # several formulary rows, no indication: review
+            continue
+        known[rows] = True
+        expected[rows] = result["regimen"]
+        rule[rows] = result["rule"]
+        adjusted[rows] = result["adjusted"]
+
+    ordered_key = regimen_key(orders["dose"]).to_numpy()
+    expected_key = regimen_key(expected).to_numpy()
+    concrete = pd.notna(expected_key)
+    matches = concrete & ((ordered_key == expected_key)
+                          | (_normalize_regimen(orders["dose"]).to_numpy()
+                             == _normalize_regimen(pd.Series(expected)).to_numpy()))
+    status = np.select(
+        [~known, np.isnan(crcl), ~concrete, matches, adjusted],
+        ["unknown_drug", "no_crcl", "review", "ok", "adjust"],
+        default="review"
+    )
+
+    report = orders.copy()
+    report["creatinine"] = joined["creatinine"].to_numpy()
+    report["creatinine_time"] = joined["creatinine_time"].to_numpy()
+    report["crcl"] = crcl
+    report["expected_regimen"] = expected
+    report["renal_rule"] = rule
+    report["status"] = status
+    report["needs_adjustment"] = status == "adjust"
+
+    counts = pd.Series(status).value_counts()
+    return {
+        "orders": report,
+        "summary": {name: int(counts.get(name, 0)) for name in STATUSES},
+        "patients": int(crcl_table["crcl"].notna().sum()),
+    }
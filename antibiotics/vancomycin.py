@@ -5,6 +5,9 @@ Loading and Maintenance Dosing with TDM
 
 import streamlit as st
 
+from labs.converter import convert_units
+from scores.engine.infectious.vancomycin_pk import AUC_TARGET, calculate_vancomycin_map
+
 
 def render():
     """Vancomycin Dosing Calculator"""
@@ -102,7 +105,7 @@ def render():
                 step=5.0,
                 key="vanco_scr_umol"
             )
-            scr_mgdl = scr_umol / 88.4
+            scr_mgdl = convert_units("Creatinine", scr_umol, "µmol/L", "mg/dL")
         
         # Calculate CrCl
         crcl = ((140 - age) * dosing_weight) / (72 * scr_mgdl)
@@ -281,5 +284,73 @@ def render():
                 - https://www.ashp.org/pharmacy-practice/resource-centers/infectious-diseases
                 """)
     
+    st.markdown("---")
+    render_bayesian_auc(weight, crcl)
+    
     st.markdown("---")
     st.caption("⚠️ Công cụ hỗ trợ - Tham khảo dược sĩ lâm sàng để tính AUC chính xác")
+
+
+def render_bayesian_auc(weight, crcl):
+    """AUC24 from 1-2 measured levels (MAP Bayesian) and a new regimen"""
+    st.markdown("### 🎯 Ước Tính AUC Từ Nồng Độ Đo (Bayesian)")
+    st.caption("Mô hình 1 ngăn + prior quần thể (CL theo CrCl, V theo cân nặng)")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        dose = st.number_input("Liều hiện tại (mg)", min_value=250, max_value=4000,
+                               value=1000, step=250, key="vanco_map_dose")
+        interval = st.selectbox("Khoảng cách (giờ)", [8, 12, 24, 48], index=1,
+                                key="vanco_map_interval")
+    with col2:
+        infusion = st.number_input("Thời gian truyền (giờ)", min_value=0.5, max_value=4.0,
+                                   value=1.0, step=0.5, key="vanco_map_infusion")
+        n_doses = st.number_input("Số liều đã dùng (tính cả liều trước mẫu)",
+                                  min_value=1, max_value=30, value=4, step=1,
+                                  key="vanco_map_n_doses")
+    with col3:
+        st.caption("Giờ lấy mẫu tính từ lúc **bắt đầu** liều gần nhất")
+        time1 = st.number_input("Mẫu 1 - giờ", min_value=0.0, max_value=72.0,
+                                value=2.0, step=0.5, key="vanco_map_time1")
+        level1 = st.number_input("Mẫu 1 - nồng độ (mg/L)", min_value=0.0, max_value=100.0,
+                                 value=30.0, step=0.5, key="vanco_map_level1")
+        use_second = st.checkbox("Có mẫu 2", value=True, key="vanco_map_second")
+        if use_second:
+            time2 = st.number_input("Mẫu 2 - giờ", min_value=0.0, max_value=72.0,
+                                    value=11.5, step=0.5, key="vanco_map_time2")
+            level2 = st.number_input("Mẫu 2 - nồng độ (mg/L)", min_value=0.0, max_value=100.0,
+                                     value=12.0, step=0.5, key="vanco_map_level2")
+    
+    if st.button("📈 Ước Tính AUC", key="vanco_map_calc"):
+        last_start = (n_doses - 1) * interval
+        doses = [(i * interval, dose, infusion) for i in range(n_doses)]
+        levels = [(last_start + time1, level1)]
+        if use_second:
+            levels.append((last_start + time2, level2))
+        
+        result = calculate_vancomycin_map(weight, crcl, doses, levels, interval=interval)
+        proposal = result["proposal"]
+        
+        c1, c2, c3 = st.columns(3)
+        c1.metric("CL cá thể", f"{result['cl']:.2f} L/h", f"quần thể {result['cl_pop']:.2f}",
+                  delta_color="off")
+        c2.metric("V cá thể", f"{result['v']:.1f} L", f"quần thể {result['v_pop']:.1f}",
+                  delta_color="off")
+        c3.metric("T½", f"{result['half_life']:.1f} h")
+        
+        message = f"**AUC₀₋₂₄ hiện tại:** {result['auc24']:.0f} mg·h/L (mục tiêu {AUC_TARGET[0]}-{AUC_TARGET[1]})"
+        if result["auc_status"] == "target":
+            st.success(message)
+        elif result["auc_status"] == "low":
+            st.warning(message + " - thấp")
+        else:
+            st.error(message + " - cao, nguy cơ độc thận")
+        
+        st.info(f"""
+        **Liều đề xuất:** {proposal['dose']:.0f} mg mỗi {proposal['interval']:.0f}h (truyền {proposal['infusion']:.1f}h)
+        - AUC₀₋₂₄ dự kiến: {proposal['auc24']:.0f} mg·h/L
+        - Peak / trough ở steady state: {proposal['peak']:.1f} / {proposal['trough']:.1f} mg/L
+        """)
+        st.caption("Dự đoán tại các mẫu: " + ", ".join(
+            f"{c:.1f} mg/L (đo {obs:.1f})" for (_, c), (_, obs) in zip(result["predicted_levels"], levels)
+        ))
@@ -12,6 +12,8 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 
+from registry import CALCULATORS, SPECIALTIES, get_calculators, search_calculators
+
 # ========== PAGE CONFIG ==========
 st.set_page_config(
     page_title="Clinical Assistant",
@@ -30,66 +32,6 @@ if 'recently_used' not in st.session_state:
 if 'total_calculations' not in st.session_state:
     st.session_state.total_calculations = 0
 
-# ========== CALCULATOR REGISTRY ==========
-ALL_CALCULATORS = {
-    # Scores - Cardiology
-    "cha2ds2vasc": {"name": "CHA₂DS₂-VASc", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "hasbled": {"name": "HAS-BLED", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "score2": {"name": "SCORE2", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "score2_op": {"name": "SCORE2-OP", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "heart": {"name": "HEART Score", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "timi": {"name": "TIMI", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "grace": {"name": "GRACE", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    "framingham": {"name": "Framingham", "category": "Tim Mạch", "icon": "❤️", "page": "Scores"},
-    
-    # Scores - Emergency
-    "qsofa": {"name": "qSOFA", "category": "Cấp Cứu", "icon": "🚨", "page": "Scores"},
-    "sofa": {"name": "SOFA", "category": "Cấp Cứu", "icon": "🚨", "page": "Scores"},
-    "apache2": {"name": "APACHE II", "category": "Cấp Cứu", "icon": "🚨", "page": "Scores"},
-    "saps2": {"name": "SAPS II", "category": "Cấp Cứu", "icon": "🚨", "page": "Scores"},
-    "mods": {"name": "MODS", "category": "Cấp Cứu", "icon": "🚨", "page": "Scores"},
-    
-    # Scores - Respiratory
-    "curb65": {"name": "CURB-65", "category": "Hô Hấp", "icon": "🫁", "page": "Scores"},
-    "psi_port": {"name": "PSI/PORT", "category": "Hô Hấp", "icon": "🫁", "page": "Scores"},
-    "wells_pe": {"name": "Wells PE", "category": "Hô Hấp", "icon": "🫁", "page": "Scores"},
-    "smartcop": {"name": "SMART-COP", "category": "Hô Hấp", "icon": "🫁", "page": "Scores"},
-    
-    # Scores - Neurology
-    "gcs": {"name": "GCS", "category": "Thần Kinh", "icon": "🧠", "page": "Scores"},
-    "nihss": {"name": "NIHSS", "category": "Thần Kinh", "icon": "🧠", "page": "Scores"},
-    "ich_score": {"name": "ICH Score", "category": "Thần Kinh", "icon": "🧠", "page": "Scores"},
-    "hunt_hess": {"name": "Hunt & Hess", "category": "Thần Kinh", "icon": "🧠", "page": "Scores"},
-    "mrs": {"name": "mRS", "category": "Thần Kinh", "icon": "🧠", "page": "Scores"},
-    
-    # Antibiotics/Drugs
-    "crcl": {"name": "CrCl Calculator", "category": "Thuốc", "icon": "💊", "page": "Drugs"},
-    "vancomycin": {"name": "Vancomycin Dosing", "category": "Thuốc", "icon": "💊", "page": "Drugs"},
-    "aminoglycoside": {"name": "Aminoglycoside", "category": "Thuốc", "icon": "💊", "page": "Drugs"},
-    
-    # Labs
-    "cbc": {"name": "CBC", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "bmp": {"name": "BMP", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "cmp": {"name": "CMP", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "lft": {"name": "LFT", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "lipid": {"name": "Lipid Panel", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "cardiac_markers": {"name": "Cardiac Markers", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "coag": {"name": "Coagulation", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "thyroid": {"name": "Thyroid", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    "abg": {"name": "ABG", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs"},
-    
-    # Ventilator
-    "ardsnet": {"name": "ARDSNet Calculator", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator"},
-    "peep_fio2": {"name": "PEEP/FiO2 Table", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator"},
-    
-    # Protocols
-    "sepsis": {"name": "Sepsis Bundle", "category": "Phác Đồ", "icon": "📋", "page": "Protocols"},
-    "copd": {"name": "COPD", "category": "Phác Đồ", "icon": "📋", "page": "Protocols"},
-    "asthma": {"name": "Asthma", "category": "Phác Đồ", "icon": "📋", "page": "Protocols"},
-    "acs": {"name": "ACS", "category": "Phác Đồ", "icon": "📋", "page": "Protocols"},
-    "heart_failure": {"name": "Heart Failure", "category": "Phác Đồ", "icon": "📋", "page": "Protocols"},
-}
-
 # ========== HELPER FUNCTIONS ==========
 def add_to_favorites(calc_id):
     """Add calculator to favorites"""
@@ -108,15 +50,6 @@ def add_to_recently_used(calc_id):
     st.session_state.recently_used.insert(0, calc_id)
     st.session_state.recently_used = st.session_state.recently_used[:10]  # Keep only last 10
 
-def search_calculators(query):
-    """Search calculators by name or category"""
-    query = query.lower()
-    results = []
-    for calc_id, calc_info in ALL_CALCULATORS.items():
-        if query in calc_info['name'].lower() or query in calc_info['category'].lower():
-            results.append((calc_id, calc_info))
-    return results
-
 # ========== CUSTOM CSS ==========
 st.markdown("""
 <style>
@@ -196,7 +129,7 @@ with st.sidebar:
     # Version info & Stats
     st.caption("**Version:** 2.0.0 🔥")
     st.caption("**Updated:** 2025-10-29")
-    st.caption(f"**Calculators:** {len(ALL_CALCULATORS)}")
+    st.caption(f"**Calculators:** {len(CALCULATORS)}")
     st.caption(f"**Favorites:** {len(st.session_state.favorites)}")
     
     # Footer
@@ -261,8 +194,8 @@ st.markdown("### ⭐ Yêu Thích")
 if st.session_state.favorites:
     cols = st.columns(min(4, len(st.session_state.favorites)))
     for idx, calc_id in enumerate(st.session_state.favorites[:8]):  # Show max 8
-        if calc_id in ALL_CALCULATORS:
-            calc_info = ALL_CALCULATORS[calc_id]
+        if calc_id in CALCULATORS:
+            calc_info = CALCULATORS[calc_id]
             with cols[idx % 4]:
                 with st.container():
                     st.markdown(f"""
@@ -293,8 +226,8 @@ st.markdown("### 🕐 Sử Dụng Gần Đây")
 if st.session_state.recently_used:
     cols = st.columns(min(5, len(st.session_state.recently_used)))
     for idx, calc_id in enumerate(st.session_state.recently_used[:5]):  # Show max 5
-        if calc_id in ALL_CALCULATORS:
-            calc_info = ALL_CALCULATORS[calc_id]
+        if calc_id in CALCULATORS:
+            calc_info = CALCULATORS[calc_id]
             with cols[idx]:
                 is_fav = calc_id in st.session_state.favorites
                 fav_icon = "⭐" if is_fav else "☆"
@@ -328,11 +261,11 @@ col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     with st.container():
-        st.markdown("""
+        st.markdown(f"""
         <div style="text-align: center; padding: 20px; background-color: #e3f2fd; border-radius: 10px;">
             <h2>📊</h2>
             <h4>Scores</h4>
-            <p style="font-size: 0.85em;">34 calculators<br/>8 specialties</p>
+            <p style="font-size: 0.85em;">{len(get_calculators(page="Scores"))} calculators<br/>{len(SPECIALTIES)} specialties</p>
         </div>
         """, unsafe_allow_html=True)
         if st.button("📊 Mở Scores", key="quick_scores", use_container_width=True):
@@ -352,11 +285,11 @@ with col2:
 
 with col3:
     with st.container():
-        st.markdown("""
+        st.markdown(f"""
         <div style="text-align: center; padding: 20px; background-color: #fff3e0; border-radius: 10px;">
             <h2>🔬</h2>
             <h4>Labs</h4>
-            <p style="font-size: 0.85em;">9 panels<br/>Unit conversion</p>
+            <p style="font-size: 0.85em;">{len(get_calculators(page="Labs"))} panels<br/>Unit conversion</p>
         </div>
         """, unsafe_allow_html=True)
         if st.button("🔬 Mở Labs", key="quick_labs", use_container_width=True):
@@ -376,11 +309,11 @@ with col4:
 
 with col5:
     with st.container():
-        st.markdown("""
+        st.markdown(f"""
         <div style="text-align: center; padding: 20px; background-color: #f3e5f5; border-radius: 10px;">
             <h2>📋</h2>
             <h4>Protocols</h4>
-            <p style="font-size: 0.85em;">5 protocols<br/>Evidence-based</p>
+            <p style="font-size: 0.85em;">{len(get_calculators(page="Protocols"))} protocols<br/>Evidence-based</p>
         </div>
         """, unsafe_allow_html=True)
         if st.button("📋 Mở Protocols", key="quick_protocols", use_container_width=True):
@@ -392,7 +325,7 @@ st.markdown("---")
 st.subheader("📈 Thống Kê Hệ Thống")
 
 # Calculate real stats
-total_calcs = len(ALL_CALCULATORS)
+total_calcs = len(CALCULATORS)
 total_favorites = len(st.session_state.favorites)
 total_recent = len(st.session_state.recently_used)
 session_calcs = st.session_state.total_calculations
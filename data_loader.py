@@ -0,0 +1,66 @@
+"""
+Data Loader - Versioned access to the data/*.csv reference tables
+
+Each table in data/ has a <Table>_VERSION row in data/Meta.csv. Modules that
+compile a table into lookup structures cache the result by that version, so
+editing a CSV and bumping its version is picked up without restarting the
+app, while unchanged tables are parsed only once per process.
+
+Usage:
+    from data_loader import get_data_version, load_table
+
+    version = get_data_version("Scores")
+    rows = load_table("Scores")
+"""
+
+import csv
+import os
+from functools import lru_cache
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def _table_path(table: str) -> str:
+    return os.path.join(DATA_DIR, f"{table}.csv")
+
+
+@lru_cache(maxsize=None)
+def _read_meta(mtime_ns: int) -> dict:
+    with open(_table_path("Meta"), newline="", encoding="utf-8") as f:
+        return {row["key"]: row["value"] for row in csv.DictReader(f)}
+
+
+def read_meta() -> dict:
+    """data/Meta.csv as {key: value}, re-read only when the file changes"""
+    return _read_meta(os.stat(_table_path("Meta")).st_mtime_ns)
+
+
+def get_data_version(table: str) -> str:
+    """
+    Version of a data table from data/Meta.csv
+
+    Args:
+        table: Table name without extension (e.g. "Scores")
+
+    Returns:
+        str: Value of <table>_VERSION
+
+    Raises:
+        KeyError: Meta.csv has no version row for the table
+    """
+    key = f"{table}_VERSION"
+    meta = read_meta()
+    if key not in meta:
+        raise KeyError(f"{key} not found in data/Meta.csv")
+    return meta[key]
+
+
+def load_table(table: str) -> list:
+    """
+    Read data/<table>.csv as a list of row dicts (all values are strings)
+
+    Callers cache the parsed result by get_data_version(table).
+    """
+    with open(_table_path(table), newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
@@ -1,27 +1,47 @@
 """
 Labs Module - Laboratory Values & Interpretation
 Modular structure - Each panel in its own file for easy maintenance
+
+Panel renders (Streamlit) are imported on first access, so the headless
+modules (bulk, critical_alerts, delta_check, and their worker processes)
+never import Streamlit.
 """
 
-from .normal_ranges import get_normal_range, is_critical, interpret_value
+from importlib import import_module
+
+from .normal_ranges import (
+    get_normal_range, is_critical, interpret_value, classify_value, interpret_many
+)
 from .converter import convert_units
 
-# Import individual panels (each in separate file)
-from .cbc import render as render_cbc
-from .bmp import render as render_bmp
-from .cmp import render as render_cmp
-from .lft import render as render_lft
-from .lipid import render as render_lipid
-from .cardiac import render as render_cardiac_markers
-from .coag import render as render_coag
-from .thyroid import render as render_thyroid
-from .abg import render as render_abg
+# Individual panels (each in separate file), imported lazily: name → module
+_PANELS = {
+    'render_cbc': 'cbc',
+    'render_bmp': 'bmp',
+    'render_cmp': 'cmp',
+    'render_lft': 'lft',
+    'render_lipid': 'lipid',
+    'render_cardiac_markers': 'cardiac',
+    'render_coag': 'coag',
+    'render_thyroid': 'thyroid',
+    'render_abg': 'abg',
+}
+
+
+def __getattr__(name):
+    if name in _PANELS:
+        render = import_module(f".{_PANELS[name]}", __name__).render
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # Core functions
     'get_normal_range',
     'is_critical',
     'interpret_value',
+    'classify_value',
+    'interpret_many',
     'convert_units',
     
     # Lab panels
@@ -5,6 +5,8 @@ Arterial Blood Gas (ABG)
 import streamlit as st
 from .normal_ranges import get_normal_range, is_critical, interpret_value, ALL_RANGES
 
+from scores.engine.metabolism.abg import calculate_abg
+
 
 def render():
     """Arterial Blood Gas"""
@@ -21,14 +23,24 @@ def render():
         po2 = st.number_input("PaO₂ (mmHg)", 30.0, 600.0, 95.0, 1.0)
         hco3 = st.number_input("HCO₃ (mEq/L)", 5.0, 50.0, 24.0, 0.1)
         fio2 = st.number_input("FiO₂ (%)", 21.0, 100.0, 21.0, 1.0)
+        
+        use_lytes = st.checkbox("Có Na, Cl (tính Anion Gap)", key="abg_lytes")
+        if use_lytes:
+            na = st.number_input("Na (mEq/L)", 100.0, 180.0, 140.0, 1.0)
+            cl = st.number_input("Cl (mEq/L)", 70.0, 140.0, 104.0, 1.0)
     
     with col2:
         st.markdown("#### Interpretation")
         
+        result = calculate_abg(
+            ph, pco2, hco3, pao2=po2, fio2=fio2,
+            na=na if use_lytes else None, cl=cl if use_lytes else None
+        )
+        
         # pH
-        if 7.35 <= ph <= 7.45:
+        if result['ph_status'] == "Normal":
             st.success(f"**pH:** {ph} - Normal ✓")
-        elif ph < 7.35:
+        elif result['ph_status'] == "Acidemia":
             st.error(f"**pH:** {ph} - ACIDEMIA ⚠️")
         else:
             st.error(f"**pH:** {ph} - ALKALEMIA ⚠️")
@@ -50,32 +62,33 @@ def render():
             st.warning(f"**HCO₃:** {hco3} - High (metabolic alkalosis)")
         
         # PaO2/FiO2 ratio
-        pf_ratio = po2 / (fio2 / 100)
-        st.info(f"**P/F ratio:** {pf_ratio:.0f}")
-        if pf_ratio >= 400:
-            st.success("Normal oxygenation ✓")
-        elif pf_ratio >= 300:
-            st.warning("Mild hypoxemia")
-        elif pf_ratio >= 200:
-            st.warning("Moderate hypoxemia (Mild ARDS)")
-        elif pf_ratio >= 100:
-            st.error("Severe hypoxemia (Moderate ARDS)")
+        st.info(f"**P/F ratio:** {result['pf_ratio']:.0f}")
+        if result['pf_ratio'] >= 400:
+            st.success(f"{result['oxygenation']} ✓")
+        elif result['pf_ratio'] >= 200:
+            st.warning(result['oxygenation'])
         else:
-            st.error("Very severe hypoxemia (Severe ARDS)")
+            st.error(result['oxygenation'])
         
         # Acid-base disorder
         st.markdown("---")
         st.markdown("**Acid-Base Disorder:**")
         
-        if ph < 7.35:
-            if pco2 > 45:
-                st.error("**Respiratory Acidosis**")
-            if hco3 < 22:
-                st.error("**Metabolic Acidosis**")
-        elif ph > 7.45:
-            if pco2 < 35:
-                st.error("**Respiratory Alkalosis**")
-            if hco3 > 26:
-                st.error("**Metabolic Alkalosis**")
-        else:
+        if result['disorder_code'] in (0, 7):
             st.success("**Normal or Compensated**")
+        else:
+            st.error(f"**{result['disorder']}**")
+        
+        if result['expected_range'] is not None:
+            low, high = result['expected_range']
+            variable = "HCO₃" if result['disorder_code'] in (1, 4) else "PaCO₂"
+            st.caption(f"Bù trừ dự kiến: {variable} {low:.1f} - {high:.1f}")
+            if result['secondary_disorder']:
+                st.warning(f"Bù trừ không tương xứng → kèm **{result['secondary_disorder']}**")
+            else:
+                st.success("Bù trừ tương xứng ✓")
+        
+        if result['anion_gap'] is not None:
+            st.info(f"**Anion Gap:** {result['anion_gap']:.1f} mEq/L")
+            if result['delta_interpretation']:
+                st.caption(f"Delta ratio {result['delta_ratio']:.2f}: {result['delta_interpretation']}")
@@ -0,0 +1,243 @@
+"""
+Bulk Lab Interpretation
+Stream a long-format lab extract (one result per row) through unit
+normalization and reference-range flagging, chunk by chunk
+
+Input columns: patient, time, test, value, unit (+ optional sex, age).
+test must be a key of ALL_RANGES; value is converted to the table unit
+(labs/converter.py) and flagged with interpret_many() (labs/normal_ranges.py).
+
+Output = input columns + ref_value, ref_unit, flag (HL7: N/L/H/LL/HH, "" when
+the test, unit or range is unknown). Chunks are interpreted in worker
+processes (which also encode the output) and written in input order as soon
+as they are ready, so memory stays bounded by (workers x 2) chunks whatever
+the file size. CSV text columns (value included) are read as strings, so
+the output schema never depends on chunksize.
+
+Usage:
+    from labs.bulk import interpret_lab_file
+
+    summary = interpret_lab_file("labs_2024.csv", "labs_2024_flagged.parquet")
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .converter import get_reference_unit_factor
+from .normal_ranges import ALL_RANGES, RESULT_FLAGS, RESULT_NO_RANGE, interpret_many
+
+
+LAB_COLUMNS = ["patient", "time", "test", "value", "unit"]
+DEFAULT_CHUNKSIZE = 250_000
+# CSV columns read as text in every chunk, so chunking never changes the
+# output schema (value keeps its raw text, e.g. "<0.5"; ref_value is numeric)
+TEXT_COLUMNS = {"patient": str, "time": str, "test": str, "value": str, "unit": str, "sex": str}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Parquet lab extracts need pyarrow: pip install pyarrow") from None
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith((".parquet", ".pq"))
+
+
+def _unit_factors(test_name, units):
+    """Factor to the table unit for each distinct unit (NaN if unknown)"""
+    factors = {}
+    for unit in units:
+        factor = get_reference_unit_factor(test_name, "" if pd.isna(unit) else str(unit))
+        factors[unit] = np.nan if factor is None else factor
+    return factors
+
+
+def interpret_lab_chunk(chunk):
+    """
+    Interpret one chunk of a long-format lab extract
+
+    Args:
+        chunk: DataFrame with LAB_COLUMNS (+ optional sex, age)
+
+    Returns:
+        tuple: (annotated DataFrame, np.ndarray of counts per RESULT_* code,
+        set of test names not in ALL_RANGES)
+    """
+    values = pd.to_numeric(chunk["value"], errors="coerce").to_numpy(dtype=float)
+    ref_value = np.full(len(chunk), np.nan)
+    ref_unit = np.full(len(chunk), "", dtype=object)
+    codes = np.full(len(chunk), RESULT_NO_RANGE, dtype=np.int8)
+    unknown_tests = set()
+
+    has_sex = "sex" in chunk.columns
+    has_age = "age" in chunk.columns
+    ages = pd.to_numeric(chunk["age"], errors="coerce").to_numpy(dtype=float) if has_age else None
+
+    for test_name, rows in chunk.groupby("test", sort=False).indices.items():
+        if test_name not in ALL_RANGES:
+            unknown_tests.add(test_name)
+            continue
+
+        units = chunk["unit"].iloc[rows]
+        factors = _unit_factors(test_name, units.unique())
+        if len(factors) == 1:
+            factor = next(iter(factors.values()))
+        else:
+            factor = units.map(factors).to_numpy(dtype=float)
+
+        converted = values[rows] * factor
+        ref_value[rows] = converted
+        ref_unit[rows] = ALL_RANGES[test_name]["unit"]
+        codes[rows] = interpret_many(
+            test_name,
+            converted,
+            chunk["sex"].iloc[rows] if has_sex else "male",
+            ages[rows] if has_age else None
+        )
+
+    out = chunk.copy()
+    if has_age:
+        out["age"] = ages
+    out["ref_value"] = ref_value
+    out["ref_unit"] = ref_unit
+    out["flag"] = np.take(RESULT_FLAGS, codes)
+    counts = np.bincount(codes, minlength=len(RESULT_FLAGS))
+    return out, counts, unknown_tests
+
+
+def read_lab_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield DataFrame chunks from a CSV (optionally compressed) or Parquet extract"""
+    if _is_parquet(path):
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=TEXT_COLUMNS)
+
+
+def _encode(out, parquet, header):
+    """Serialize an annotated chunk in the worker: Arrow table or CSV bytes"""
+    if parquet:
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(out, preserve_index=False)
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return out.to_csv(index=False, header=header).encode("utf-8")
+
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(
+        pa.Table.from_pandas(out, preserve_index=False),
+        sink,
+        pa_csv.WriteOptions(include_header=header, quoting_style="needed")
+    )
+    return sink.getvalue().to_pybytes()
+
+
+def _interpret_encoded(chunk, parquet, header):
+    out, counts, unknown_tests = interpret_lab_chunk(chunk)
+    return _encode(out, parquet, header), counts, unknown_tests
+
+
+class _LabWriter:
+    """Append encoded chunks to a CSV or Parquet file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = _is_parquet(path)
+        self.writer = None
+        if self.parquet:
+            _require_pyarrow()
+        self.file = None if self.parquet else open(path, "wb")
+
+    def write(self, payload):
+        if not self.parquet:
+            self.file.write(payload)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.writer is None:
+            # A column that is empty in the first chunk is text, not null
+            schema = pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                                for field in payload.schema])
+            self.writer = pq.ParquetWriter(self.path, schema)
+        payload = payload.cast(self.writer.schema)
+        self.writer.write_table(payload)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self.file is not None:
+            self.file.close()
+
+
+def interpret_lab_file(src, dst, chunksize=DEFAULT_CHUNKSIZE, workers=None):
+    """
+    Interpret a whole lab extract, streaming chunk by chunk
+
+    Args:
+        src: Input .csv / .csv.gz / .parquet path
+        dst: Output .csv / .parquet path (overwritten)
+        chunksize: Rows per chunk
+        workers: Worker processes (default: CPU count; 1 = no subprocesses)
+
+    Returns:
+        dict: rows, chunks, flags (HL7 flag → count, "" = not interpreted),
+        unknown_tests (sorted), seconds
+
+    Parquet input/output requires pyarrow; with pyarrow installed CSV output
+    is also encoded by Arrow (~10x faster than DataFrame.to_csv).
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    counts = np.zeros(len(RESULT_FLAGS), dtype=np.int64)
+    unknown_tests = set()
+    chunks = 0
+    writer = _LabWriter(dst)
+
+    def collect(result):
+        nonlocal chunks
+        payload, chunk_counts, chunk_unknown = result
+        writer.write(payload)
+        counts[:] += chunk_counts
+        unknown_tests.update(chunk_unknown)
+        chunks += 1
+
+    try:
+        if workers == 1:
+            for index, chunk in enumerate(read_lab_chunks(src, chunksize)):
+                collect(_interpret_encoded(chunk, writer.parquet, index == 0))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for index, chunk in enumerate(read_lab_chunks(src, chunksize)):
+                    pending.append(
+                        pool.submit(_interpret_encoded, chunk, writer.parquet, index == 0)
+                    )
+                    if len(pending) >= 2 * workers:
+                        collect(pending.popleft().result())
+                while pending:
+                    collect(pending.popleft().result())
+    finally:
+        writer.close()
+
+    return {
+        "rows": int(counts.sum()),
+        "chunks": chunks,
+        "flags": dict(zip(RESULT_FLAGS, counts.tolist())),
+        "unknown_tests": sorted(unknown_tests, key=str),
+        "seconds": time.perf_counter() - start,
+    }
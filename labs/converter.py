@@ -1,58 +1,299 @@
 """
 Unit Converter for Lab Values
 Convert between conventional and SI units
+
+Every unit belongs to a dimension with a scale to that dimension's base
+(mass: g/L, molar: mol/L, equivalent: Eq/L, ...). Mass ↔ molar ↔ equivalent
+conversions go through the analyte's molar mass and valence. All factors are
+precomputed at import into a dense (test, from unit, to unit) array, so a
+conversion is an index lookup and whole columns convert with convert_array().
+
+Where ALL_RANGES gives a laboratory si_conversion factor (e.g. creatinine
+88.4), the molar mass is derived from it so every path through the matrix
+agrees with the published factor; MOLAR_MASS covers the other analytes.
 """
 
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
 from .normal_ranges import ALL_RANGES
 
 
+# Unit -> (dimension, scale to the dimension's base unit)
+UNITS = {
+    # Mass concentration (base g/L)
+    "g/L": ("mass", 1.0),
+    "g/dL": ("mass", 10.0),
+    "mg/dL": ("mass", 1e-2),
+    "mg/L": ("mass", 1e-3),
+    "µg/mL": ("mass", 1e-3),
+    "µg/dL": ("mass", 1e-5),
+    "µg/L": ("mass", 1e-6),
+    "ng/mL": ("mass", 1e-6),
+    "ng/dL": ("mass", 1e-8),
+    "ng/L": ("mass", 1e-9),
+    "pg/mL": ("mass", 1e-9),
+    # Molar concentration (base mol/L)
+    "mol/L": ("molar", 1.0),
+    "mmol/L": ("molar", 1e-3),
+    "µmol/L": ("molar", 1e-6),
+    "nmol/L": ("molar", 1e-9),
+    "pmol/L": ("molar", 1e-12),
+    # Charge concentration (base Eq/L)
+    "mEq/L": ("equivalent", 1e-3),
+    # Enzyme / hormone activity
+    "U/L": ("activity", 1.0),
+    "IU/L": ("activity", 1.0),
+    "mIU/L": ("activity", 1e-3),
+    "µIU/mL": ("activity", 1e-3),
+    # Cell counts (base cells/L)
+    "x10³/µL": ("count", 1e9),
+    "x10⁹/L": ("count", 1e9),
+    "x10⁶/µL": ("count", 1e12),
+    "x10¹²/L": ("count", 1e12),
+    # Unit-specific, identity only
+    "%": ("percent", 1.0),
+    "fL": ("volume", 1.0),
+    "pg": ("cell_mass", 1.0),
+    "seconds": ("time", 1.0),
+    "": ("ratio", 1.0),
+}
+
+UNIT_ALIASES = {
+    "umol/l": "µmol/L",
+    "μmol/l": "µmol/L",          # Greek mu
+    "mcmol/l": "µmol/L",
+    "ug/ml": "µg/mL",
+    "μg/ml": "µg/mL",
+    "mcg/ml": "µg/mL",
+    "ug/dl": "µg/dL",
+    "μg/dl": "µg/dL",
+    "uiu/ml": "µIU/mL",
+    "μiu/ml": "µIU/mL",
+    "10^9/l": "x10⁹/L",
+    "x10^9/l": "x10⁹/L",
+    "10^3/ul": "x10³/µL",
+    "x10^3/ul": "x10³/µL",
+    "10^12/l": "x10¹²/L",
+    "x10^12/l": "x10¹²/L",
+    "10^6/ul": "x10⁶/µL",
+    "x10^6/ul": "x10⁶/µL",
+    "sec": "seconds",
+    "s": "seconds",
+}
+
+# Molar masses (g/mol) for mass ↔ molar conversions
+MOLAR_MASS = {
+    "Hemoglobin": 16114.5,      # per heme monomer (mmol/L convention)
+    "MCHC": 16114.5,
+    "Sodium": 22.99,
+    "Potassium": 39.098,
+    "Chloride": 35.453,
+    "CO2": 61.017,              # as bicarbonate
+    "BUN": 28.014,              # urea nitrogen
+    "Creatinine": 113.12,
+    "Glucose": 180.16,
+    "Calcium": 40.078,
+    "Magnesium": 24.305,
+    "Phosphate": 30.974,        # as phosphorus
+    "Uric_Acid": 168.11,
+    "Bilirubin_Total": 584.66,
+    "Bilirubin_Direct": 584.66,
+    "Albumin": 66472.0,
+    "Cholesterol": 386.65,
+    "LDL": 386.65,
+    "HDL": 386.65,
+    "Triglycerides": 885.4,     # as triolein
+    "Free_T4": 776.87,
+    "Free_T3": 650.97,
+}
+
+# Charge per molecule for mmol/L ↔ mEq/L
+VALENCE = {
+    "Sodium": 1,
+    "Potassium": 1,
+    "Chloride": 1,
+    "CO2": 1,
+    "Calcium": 2,
+    "Magnesium": 2,
+}
+
+_BRIDGED = ("mass", "molar", "equivalent")
+
+
+def _molar_mass(test):
+    """Molar mass, derived from the lab si_conversion when it is mass → molar"""
+    unit, si_unit = test["unit"], test.get("si_unit")
+    if "si_conversion" in test and si_unit in UNITS and unit in UNITS:
+        (dim, scale), (si_dim, si_scale) = UNITS[unit], UNITS[si_unit]
+        if dim == "mass" and si_dim == "molar":
+            return scale / (si_scale * test["si_conversion"])
+    return None
+
+
+def _to_molar(dimension, molar_mass, valence):
+    """Multiplier from a base unit of the dimension to mol/L (None if unknown)"""
+    if dimension == "molar":
+        return 1.0
+    if dimension == "mass":
+        return 1.0 / molar_mass if molar_mass else None
+    return 1.0 / valence if valence else None
+
+
+def _build_matrix():
+    tests = list(ALL_RANGES)
+    units = list(UNITS)
+    factors = np.full((len(tests), len(units), len(units)), np.nan)
+
+    for t, test_name in enumerate(tests):
+        test = ALL_RANGES[test_name]
+        molar_mass = _molar_mass(test) or MOLAR_MASS.get(test_name)
+        valence = VALENCE.get(test_name)
+        for i, from_unit in enumerate(units):
+            from_dim, from_scale = UNITS[from_unit]
+            for j, to_unit in enumerate(units):
+                to_dim, to_scale = UNITS[to_unit]
+                if from_dim == to_dim:
+                    factors[t, i, j] = from_scale / to_scale
+                elif from_dim in _BRIDGED and to_dim in _BRIDGED:
+                    a = _to_molar(from_dim, molar_mass, valence)
+                    b = _to_molar(to_dim, molar_mass, valence)
+                    if a is not None and b is not None:
+                        factors[t, i, j] = from_scale * a / (to_scale * b)
+
+        # Mass ↔ mass lab factors (g/dL → g/L ...) follow from the scales;
+        # a mass → molar one defines the molar mass above. Either way the
+        # published factor is reproduced exactly.
+        if "si_conversion" in test and test.get("si_unit") in UNITS:
+            i, j = units.index(test["unit"]), units.index(test["si_unit"])
+            factors[t, i, j] = test["si_conversion"]
+            factors[t, j, i] = 1 / test["si_conversion"]
+
+    return tests, units, factors
+
+
+TESTS, UNIT_NAMES, CONVERSION_FACTORS = _build_matrix()
+TEST_INDEX = {name: i for i, name in enumerate(TESTS)}
+UNIT_INDEX = {name: i for i, name in enumerate(UNIT_NAMES)}
+
+
+def normalize_unit(unit):
+    """Canonical unit name (handles µ/μ/u, case and common spellings), or None"""
+    if unit is None:
+        return None
+    if unit in UNIT_INDEX:
+        return unit
+    key = str(unit).strip()
+    if key in UNIT_INDEX:
+        return key
+    key = key.lower()
+    if key in UNIT_ALIASES:
+        return UNIT_ALIASES[key]
+    for name in UNIT_NAMES:
+        if name.lower() == key:
+            return name
+    return None
+
+
+def get_conversion_factor(test_name, from_unit, to_unit):
+    """
+    Multiplicative factor from one unit of a test to another
+
+    Returns:
+        float, or None if the conversion is not available
+    """
+    t = TEST_INDEX.get(test_name)
+    i = UNIT_INDEX.get(normalize_unit(from_unit))
+    j = UNIT_INDEX.get(normalize_unit(to_unit))
+    if t is None or i is None or j is None:
+        return None
+    factor = CONVERSION_FACTORS[t, i, j]
+    return None if factor != factor else float(factor)
+
+
+@lru_cache(maxsize=None)
+def get_reference_unit_factor(test_name, unit):
+    """
+    Factor from a reported unit to the ALL_RANGES unit of a test
+
+    A blank unit is taken to be the reference unit already.
+
+    Returns:
+        float, or None if the test or unit is unknown
+    """
+    if test_name not in ALL_RANGES:
+        return None
+    if not unit:
+        return 1.0
+    return get_conversion_factor(test_name, unit, ALL_RANGES[test_name]["unit"])
+
+
 def convert_units(test_name, value, from_unit, to_unit):
     """
     Convert lab value between units
-    
+
     Args:
         test_name: Name of the lab test
         value: Numeric value to convert
         from_unit: Current unit
         to_unit: Target unit
-    
+
     Returns:
         Converted value or None if conversion not available
     """
-    if test_name not in ALL_RANGES:
-        return None
-    
-    test = ALL_RANGES[test_name]
-    
-    # Check if SI conversion available
-    if "si_unit" not in test or "si_conversion" not in test:
+    factor = get_conversion_factor(test_name, from_unit, to_unit)
+    if factor is None:
         return None
-    
-    conventional_unit = test["unit"]
-    si_unit = test["si_unit"]
-    conversion_factor = test["si_conversion"]
-    
-    # Convert from conventional to SI
-    if from_unit == conventional_unit and to_unit == si_unit:
-        return value * conversion_factor
-    
-    # Convert from SI to conventional
-    if from_unit == si_unit and to_unit == conventional_unit:
-        return value / conversion_factor
-    
-    return None
+    return value * factor
+
+
+def convert_array(test_name, values, from_unit, to_unit):
+    """
+    Vectorized convert_units for a whole column
+
+    Args:
+        test_name: Name of the lab test
+        values: Array-like of values
+        from_unit: One unit for all rows, or array-like of per-row units
+        to_unit: Target unit
+
+    Returns:
+        np.ndarray (float): converted values, NaN where the conversion is
+        not available
+
+    Raises:
+        KeyError: Unknown test or target unit
+    """
+    factors = CONVERSION_FACTORS[TEST_INDEX[test_name], :, UNIT_INDEX[normalize_unit(to_unit)]]
+    values = np.asarray(values, dtype=float)
+
+    if np.ndim(from_unit) == 0:
+        i = UNIT_INDEX.get(normalize_unit(from_unit))
+        return values * (np.nan if i is None else factors[i])
+
+    # Map each distinct unit once, then gather per-row factors
+    if not hasattr(from_unit, "dtype"):
+        from_unit = np.asarray(from_unit, dtype=object)
+    codes, distinct = pd.factorize(from_unit)
+    lookup = np.array([
+        factors[UNIT_INDEX[unit]] if unit in UNIT_INDEX else np.nan
+        for unit in (normalize_unit(name) for name in distinct)
+    ] + [np.nan])                                   # code -1: missing unit
+    return values * lookup[codes.reshape(values.shape)]
 
 
 def get_available_units(test_name):
     """Get list of available units for a test"""
-    if test_name not in ALL_RANGES:
+    if test_name not in TEST_INDEX:
         return []
-    
+
     test = ALL_RANGES[test_name]
+    row = CONVERSION_FACTORS[TEST_INDEX[test_name], UNIT_INDEX[test["unit"]]]
     units = [test["unit"]]
-    
-    if "si_unit" in test:
+    if test.get("si_unit") and test["si_unit"] != test["unit"]:
         units.append(test["si_unit"])
-    
+    units += [unit for unit, factor in zip(UNIT_NAMES, row)
+              if factor == factor and unit not in units]
     return units
-
@@ -0,0 +1,202 @@
+"""
+Critical Value Alerts
+Event processor for a live (or replayed) lab result feed
+
+Every result is checked against critical_low / critical_high in ALL_RANGES
+(after unit conversion to the table unit). A critical result raises an alert
+unless the same patient already had an alert for the same test in the same
+direction within the dedup window (TTL cache keyed by (patient, test)).
+
+replay_lab_feed() stands in for the LIS: it streams a JSONL or CSV file,
+optionally paced at a fixed rate, and reports alert latency percentiles
+measured from result arrival to alert dispatch.
+
+Usage:
+    from labs.critical_alerts import replay_lab_feed
+
+    summary = replay_lab_feed("lis_feed.jsonl", rate=200, on_alert=page_ward)
+"""
+
+import csv
+import json
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from .converter import get_reference_unit_factor
+from .normal_ranges import ALL_RANGES, RANGE_INDEX
+
+
+def parse_result_time(value):
+    """
+    Result time from ISO-8601 text, epoch seconds or datetime, always as an
+    aware UTC datetime (times without an offset are taken as UTC)
+
+    Raises:
+        ValueError: Missing (None, NaN) or unparseable time
+    """
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromtimestamp(float(value), tz=timezone.utc)
+        except (TypeError, ValueError, OverflowError, OSError):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid result time: {value!r}") from None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class CriticalAlertStream:
+    """
+    Critical-value detector with per-patient/test alert suppression
+
+    Args:
+        dedup_window: Repeat alerts for the same patient, test and direction
+            are suppressed for this long after the last alert (timedelta)
+    """
+
+    def __init__(self, dedup_window=timedelta(hours=1)):
+        self.dedup_window = dedup_window
+        self._last_alert = {}      # (patient, test) -> (expiry, flag)
+        self._expiry = deque()     # (expiry, key) in alert order, for eviction
+        self.counts = {"results": 0, "critical": 0, "alerts": 0,
+                       "suppressed": 0, "unevaluated": 0}
+
+    def _evict(self, now):
+        while self._expiry and self._expiry[0][0] <= now:
+            expiry, key = self._expiry.popleft()
+            entry = self._last_alert.get(key)
+            if entry is not None and entry[0] == expiry:
+                del self._last_alert[key]
+
+    def check(self, patient, test, value, result_time, unit=None):
+        """
+        Evaluate one result
+
+        Args:
+            result_time: Anything parse_result_time() accepts (compared in UTC)
+
+        Returns:
+            dict: alert (patient, test, value, unit, ref_value, ref_unit,
+            flag 'LL'/'HH', limit, time), or None if not critical / suppressed
+            / unevaluated (unknown unit, missing value or time)
+        """
+        self.counts["results"] += 1
+        factor = get_reference_unit_factor(test, unit or "")
+        try:
+            result_time = parse_result_time(result_time)
+        except ValueError:
+            factor = None
+        if factor is None or value is None or value != value:
+            self.counts["unevaluated"] += 1
+            return None
+
+        entry = RANGE_INDEX[test]
+        ref_value = value * factor
+        if ref_value < entry["critical_low"]:
+            flag, limit = "LL", entry["critical_low"]
+        elif ref_value > entry["critical_high"]:
+            flag, limit = "HH", entry["critical_high"]
+        else:
+            return None
+        self.counts["critical"] += 1
+
+        self._evict(result_time)
+        key = (patient, test)
+        previous = self._last_alert.get(key)
+        # Expiry checked explicitly: out-of-order results can leave expired
+        # entries behind a later one in the eviction queue
+        if previous is not None and previous[1] == flag and previous[0] > result_time:
+            self.counts["suppressed"] += 1
+            return None
+
+        expiry = result_time + self.dedup_window
+        self._last_alert[key] = (expiry, flag)
+        self._expiry.append((expiry, key))
+        self.counts["alerts"] += 1
+        return {
+            "patient": patient,
+            "test": test,
+            "value": value,
+            "unit": unit,
+            "ref_value": ref_value,
+            "ref_unit": ALL_RANGES[test]["unit"],
+            "flag": flag,
+            "limit": limit,
+            "time": result_time.isoformat(),
+        }
+
+
+def read_lab_feed(path):
+    """Yield result dicts (patient, time, test, value, unit) from JSONL or CSV"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if str(path).lower().endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def replay_lab_feed(path, rate=None, dedup_window=timedelta(hours=1), on_alert=None):
+    """
+    Replay a lab feed through the critical-value detector
+
+    Args:
+        path: .jsonl / .ndjson or .csv feed, one result per line
+        rate: Results per second to pace the feed at (None = as fast as possible)
+        dedup_window: Alert suppression window per patient and test
+        on_alert: Callable receiving each alert dict (e.g. pager, queue)
+
+    Returns:
+        dict: counts (results, critical, alerts, suppressed, unevaluated),
+        latency_ms (p50, p95, p99, max; arrival → on_alert returned),
+        results_per_second, seconds
+    """
+    stream = CriticalAlertStream(dedup_window)
+    latencies = []
+    start = time.perf_counter()
+
+    for index, record in enumerate(read_lab_feed(path)):
+        if rate:
+            arrival = start + index / rate
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        else:
+            arrival = time.perf_counter()
+
+        value = record.get("value")
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            value = None
+        alert = stream.check(
+            record.get("patient"),
+            record.get("test"),
+            value,
+            record.get("time"),
+            record.get("unit")
+        )
+        if alert is not None:
+            if on_alert is not None:
+                on_alert(alert)
+            latencies.append(time.perf_counter() - arrival)
+
+    seconds = time.perf_counter() - start
+    if latencies:
+        p50, p95, p99 = (np.percentile(latencies, [50, 95, 99]) * 1000).tolist()
+        latency_ms = {"p50": p50, "p95": p95, "p99": p99, "max": max(latencies) * 1000}
+    else:
+        latency_ms = {"p50": None, "p95": None, "p99": None, "max": None}
+
+    return {
+        "counts": stream.counts,
+        "latency_ms": latency_ms,
+        "results_per_second": stream.counts["results"] / seconds if seconds else None,
+        "seconds": seconds,
+    }
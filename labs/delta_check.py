@@ -0,0 +1,196 @@
+"""
+Delta Check
+Compare each new result with the patient's previous result of the same test
+
+Flags implausible changes (mislabelled / contaminated repeat specimens)
+against DELTA_LIMITS in labs/normal_ranges.py: absolute change, percentage
+change and rate of change per hour, within a per-test look-back window.
+The rate is only judged for results more than rate_min_hours apart (an
+hourly rate from minutes apart is noise), and missing (NaN) results are
+never stored, so they cannot become the "previous" value.
+
+History is kept in memory as fixed-size ring buffers: per test, one
+(patients x history) array of values and one of times, plus a patient → row
+dict. A batch is checked with vectorized array lookups; repeated results of
+the same patient inside one batch are processed in arrival order.
+
+Values must already be in the ALL_RANGES unit (see
+converter.get_reference_unit_factor or labs/bulk.py ref_value).
+
+Usage:
+    from labs.delta_check import DeltaCheckEngine
+
+    engine = DeltaCheckEngine()
+    result = engine.check_batch(df)     # columns patient, test, value, time
+    df[result["failed"]]
+"""
+
+import numpy as np
+import pandas as pd
+
+from .normal_ranges import DELTA_LIMITS, DELTA_RATE_MIN_HOURS
+
+
+# Bits of the 'reasons' mask
+DELTA_ABS = 1
+DELTA_PCT = 2
+DELTA_RATE = 4
+
+
+class _TestHistory:
+    """Ring buffers of the last `history` results per patient for one test"""
+
+    def __init__(self, history, capacity=1024):
+        self.history = history
+        self.rows = {}                                        # patient -> row
+        self.values = np.full((capacity, history), np.nan)
+        self.times = np.zeros((capacity, history), dtype=np.int64)  # epoch seconds
+        self.count = np.zeros(capacity, dtype=np.int64)       # results ever pushed
+
+    def lookup_rows(self, patients):
+        """Row of each patient, allocating rows for new patients"""
+        rows = self.rows
+        result = np.empty(len(patients), dtype=np.int64)
+        for i, patient in enumerate(patients):
+            row = rows.get(patient)
+            if row is None:
+                row = rows[patient] = len(rows)
+            result[i] = row
+        if len(rows) > len(self.count):
+            self._grow(len(rows))
+        return result
+
+    def _grow(self, needed):
+        capacity = max(needed, 2 * len(self.count))
+        extra = capacity - len(self.count)
+        self.values = np.vstack([self.values, np.full((extra, self.history), np.nan)])
+        self.times = np.vstack([self.times, np.zeros((extra, self.history), dtype=np.int64)])
+        self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+
+    def previous(self, rows):
+        """(value, time) of each row's latest result (NaN if none)"""
+        position = (self.count[rows] - 1) % self.history
+        value = self.values[rows, position]
+        value[self.count[rows] == 0] = np.nan
+        return value, self.times[rows, position]
+
+    def push(self, rows, values, times):
+        """Append one result per row (rows must be unique)"""
+        position = self.count[rows] % self.history
+        self.values[rows, position] = values
+        self.times[rows, position] = times
+        self.count[rows] += 1
+
+    def last(self, row):
+        """Stored results of one row, oldest first: list of (time, value)"""
+        count = self.count[row]
+        positions = [i % self.history for i in range(max(0, count - self.history), count)]
+        return [(int(self.times[row, p]), float(self.values[row, p])) for p in positions]
+
+
+class DeltaCheckEngine:
+    """
+    Streaming delta checks over serial lab results
+
+    Args:
+        limits: Per-test limits (default DELTA_LIMITS)
+        history: Results kept per patient and test
+    """
+
+    def __init__(self, limits=None, history=8):
+        self.limits = DELTA_LIMITS if limits is None else limits
+        self.history = history
+        self._tests = {}
+
+    def _test_history(self, test_name):
+        if test_name not in self._tests:
+            self._tests[test_name] = _TestHistory(self.history)
+        return self._tests[test_name]
+
+    def check_batch(self, df) -> dict:
+        """
+        Delta-check a batch of new results and add them to the history
+
+        Args:
+            df: DataFrame or dict of equal-length arrays with patient, test,
+                value and time (datetimes or ISO text), rows in arrival order
+
+        Returns:
+            dict of arrays aligned with the rows: previous, previous_time,
+            delta, delta_pct, rate_per_hour, reasons (DELTA_* bit mask) and
+            failed (bool). Tests without limits are stored but never fail.
+        """
+        tests = pd.Series(np.asarray(df["test"], dtype=object))
+        patients = np.asarray(df["patient"], dtype=object)
+        values = np.asarray(df["value"], dtype=float)
+        times = pd.to_datetime(pd.Series(np.asarray(df["time"])), utc=True)
+        times = times.dt.tz_convert(None).to_numpy("datetime64[s]").astype(np.int64)
+        groups = tests.groupby(tests, sort=False).indices
+
+        n = len(values)
+        previous = np.full(n, np.nan)
+        previous_time = np.zeros(n, dtype=np.int64)
+
+        for test_name, index in groups.items():
+            store = self._test_history(test_name)
+            rows = store.lookup_rows(patients[index])
+            # k-th result of a patient in this batch is handled in round k
+            rounds = pd.Series(rows).groupby(rows).cumcount().to_numpy()
+            for k in range(rounds.max() + 1):
+                in_round = index[rounds == k]
+                round_rows = rows[rounds == k]
+                previous[in_round], previous_time[in_round] = store.previous(round_rows)
+                measured = ~np.isnan(values[in_round])
+                store.push(round_rows[measured], values[in_round][measured], times[in_round][measured])
+
+        delta = values - previous
+        hours = (times - previous_time) / 3600
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta_pct = 100 * delta / np.abs(previous)
+            rate_per_hour = np.abs(delta) / hours
+        rate_per_hour[delta == 0] = 0.0
+        rate_per_hour[hours <= 0] = np.nan      # same timestamp: no rate
+
+        reasons = np.zeros(n, dtype=np.int8)
+        for test_name, index in groups.items():
+            limit = self.limits.get(test_name)
+            if not limit:
+                continue
+            in_window = ~np.isnan(delta[index])
+            if "window_hours" in limit:
+                in_window &= hours[index] <= limit["window_hours"]
+            mask = np.zeros(len(index), dtype=np.int8)
+            if "abs" in limit:
+                mask |= np.where(np.abs(delta[index]) > limit["abs"], DELTA_ABS, 0).astype(np.int8)
+            if "pct" in limit:
+                mask |= np.where(np.abs(delta_pct[index]) > limit["pct"], DELTA_PCT, 0).astype(np.int8)
+            if "rate" in limit:
+                timed = hours[index] > limit.get("rate_min_hours", DELTA_RATE_MIN_HOURS)
+                mask |= np.where(timed & (rate_per_hour[index] > limit["rate"]), DELTA_RATE, 0).astype(np.int8)
+            reasons[index] = np.where(in_window, mask, 0)
+
+        return {
+            "previous": previous,
+            "previous_time": np.where(np.isnan(previous), np.datetime64("NaT"),
+                                      previous_time.astype("datetime64[s]")),
+            "delta": delta,
+            "delta_pct": delta_pct,
+            "rate_per_hour": rate_per_hour,
+            "reasons": reasons,
+            "failed": reasons > 0,
+        }
+
+    def check(self, patient, test_name, value, time) -> dict:
+        """Delta-check a single result (same fields as check_batch, as scalars)"""
+        result = self.check_batch(
+            {"patient": [patient], "test": [test_name], "value": [value], "time": [time]}
+        )
+        return {key: array[0].item() if hasattr(array[0], "item") else array[0]
+                for key, array in result.items()}
+
+    def history_of(self, patient, test_name) -> list:
+        """Stored results of a patient for a test, oldest first: (epoch s, value)"""
+        store = self._tests.get(test_name)
+        if store is None or patient not in store.rows:
+            return []
+        return store.last(store.rows[patient])
@@ -3,6 +3,12 @@ Normal Laboratory Ranges
 Reference ranges for common lab values
 """
 
+import re
+from bisect import bisect_right
+
+import numpy as np
+
+
 # CBC - Complete Blood Count
 CBC_RANGES = {
     "WBC": {
@@ -405,67 +411,253 @@ ALL_RANGES = {
     **ADDITIONAL_RANGES
 }
 
+# Delta-check limits vs the patient's previous result (labs/delta_check.py)
+# Units as in ALL_RANGES. A limit fails when exceeded:
+#   abs: |change|, pct: |change| in % of the previous value,
+#   rate: |change| per hour, only when the results are more than
+#   rate_min_hours apart (default DELTA_RATE_MIN_HOURS);
+#   window_hours: older previous results are not compared
+DELTA_RATE_MIN_HOURS = 1.0
+DELTA_LIMITS = {
+    "Hemoglobin": {"abs": 2.0, "rate": 1.0, "window_hours": 24},
+    "Hematocrit": {"abs": 6, "window_hours": 24},
+    "MCV": {"abs": 3, "window_hours": 72},
+    "Platelets": {"pct": 50, "window_hours": 24},
+    "WBC": {"pct": 50, "window_hours": 24},
+    "Sodium": {"abs": 8, "rate": 0.5, "window_hours": 24},
+    "Potassium": {"abs": 1.0, "window_hours": 24},
+    "Chloride": {"abs": 8, "window_hours": 24},
+    "CO2": {"abs": 8, "window_hours": 24},
+    "Calcium": {"abs": 1.5, "window_hours": 24},
+    "BUN": {"pct": 50, "window_hours": 48},
+    "Creatinine": {"pct": 50, "window_hours": 48},
+    "Bilirubin_Total": {"pct": 50, "window_hours": 48},
+}
+
+
+# ========== RANGE INDEX ==========
+# ALL_RANGES is compiled once into RANGE_INDEX: per test, sorted age-band
+# lower bounds (bisect / np.searchsorted) and per-sex (min, max) tables.
+#
+# Range keys understood in the tables above:
+#   normal                  all patients (or males if "male": True and a
+#                           normal_female range exists)
+#   normal_female           females
+#   normal_under_50         age < 50
+#   normal_50_75            50 <= age < 75
+#   normal_over_75          age >= 75
+# Sex and age parts combine, e.g. normal_female_under_50.
+
+# Result codes (HL7 abnormal flags in RESULT_FLAGS)
+RESULT_NORMAL = 0
+RESULT_LOW = 1
+RESULT_HIGH = 2
+RESULT_CRITICAL_LOW = 3
+RESULT_CRITICAL_HIGH = 4
+RESULT_NO_RANGE = 5       # no range for this test/sex/age, or value missing
+
+RESULT_FLAGS = ("N", "L", "H", "LL", "HH", "")
+RESULT_LABELS = (
+    "Normal ✓",
+    "Low ⬇️",
+    "High ⬆️",
+    "CRITICALLY LOW ⚠️",
+    "CRITICALLY HIGH ⚠️",
+    "See reference ranges",
+)
+
+SEX_MALE = 0
+SEX_FEMALE = 1
+FEMALE_VALUES = ("female", "Female", "F", "f", "Nữ", "nữ")
+
+_RANGE_KEY = re.compile(
+    r"^normal(?:_(male|female))?(?:_under_(\d+)|_(\d+)_(\d+)|_over_(\d+))?$"
+)
+
+
+def _compile_test(test):
+    bands = {}  # (age_low, age_high) -> [male range, female range]
+    for key, normal in test.items():
+        match = _RANGE_KEY.match(key)
+        if not match or not isinstance(normal, dict):
+            continue
+        sex, under, low, high, over = match.groups()
+        if under:
+            age_band = (0, float(under))
+        elif low:
+            age_band = (float(low), float(high))
+        elif over:
+            age_band = (float(over), float("inf"))
+        else:
+            age_band = (float("-inf"), float("inf"))
+
+        ranges = bands.setdefault(age_band, [None, None])
+        if sex == "female":
+            ranges[SEX_FEMALE] = normal
+        elif sex == "male" or normal.get("male"):
+            ranges[SEX_MALE] = normal
+        else:
+            ranges[SEX_MALE] = normal
+            if ranges[SEX_FEMALE] is None:
+                ranges[SEX_FEMALE] = normal
+
+    # A "male": True range with no female counterpart applies to everyone
+    for ranges in bands.values():
+        if ranges[SEX_FEMALE] is None:
+            ranges[SEX_FEMALE] = ranges[SEX_MALE]
+
+    age_bands = sorted(bands)
+    limits = np.full((2, max(len(age_bands), 1), 2), np.nan)
+    for band, age_band in enumerate(age_bands):
+        for sex in (SEX_MALE, SEX_FEMALE):
+            normal = bands[age_band][sex]
+            if normal is not None:
+                limits[sex, band] = (
+                    normal.get("min", float("-inf")), normal.get("max", float("inf"))
+                )
+
+    return {
+        "age_low": [low for low, _ in age_bands],
+        "age_high": [high for _, high in age_bands],
+        "all_ages": age_bands == [(float("-inf"), float("inf"))],
+        "ranges": [bands[age_band] for age_band in age_bands],
+        "limits": limits,                 # [sex, band] -> (min, max), NaN = no range
+        "bounds": limits.tolist(),        # same as floats, for scalar lookups
+        "critical_low": test.get("critical_low", float("-inf")),
+        "critical_high": test.get("critical_high", float("inf")),
+    }
+
+
+RANGE_INDEX = {name: _compile_test(test) for name, test in ALL_RANGES.items()}
+
+
+def _sex_index(gender):
+    return SEX_FEMALE if gender in FEMALE_VALUES else SEX_MALE
+
+
+def _band_index(entry, age):
+    """Age band of a test (None if the age falls outside every band)"""
+    if entry["all_ages"]:
+        return 0
+    if age is None or age != age:
+        return None
+    band = bisect_right(entry["age_low"], age) - 1
+    if band < 0 or age >= entry["age_high"][band]:
+        return None
+    return band
+
 
 def get_normal_range(test_name, gender="male", age=None):
-    """Get normal range for a lab test"""
-    if test_name not in ALL_RANGES:
+    """Get normal range for a lab test (by sex and age band)"""
+    if test_name not in RANGE_INDEX:
         return None
-    
-    test = ALL_RANGES[test_name]
-    
-    # Handle gender-specific ranges
-    if gender == "female" and "normal_female" in test:
-        return test["normal_female"]
-    
-    return test.get("normal", {})
+
+    entry = RANGE_INDEX[test_name]
+    band = _band_index(entry, age)
+    if band is None or not entry["ranges"]:
+        return {}
+    return entry["ranges"][band][_sex_index(gender)] or {}
 
 
 def is_critical(test_name, value):
     """Check if value is critically abnormal"""
-    if test_name not in ALL_RANGES:
+    if test_name not in RANGE_INDEX:
         return False
-    
-    test = ALL_RANGES[test_name]
-    
-    if "critical_low" in test and value < test["critical_low"]:
-        return True
-    
-    if "critical_high" in test and value > test["critical_high"]:
-        return True
-    
-    return False
+
+    entry = RANGE_INDEX[test_name]
+    return value < entry["critical_low"] or value > entry["critical_high"]
+
+
+def classify_value(test_name, value, gender="male", age=None):
+    """
+    Result code for one lab value
+
+    Returns:
+        int: RESULT_* code (RESULT_FLAGS / RESULT_LABELS give flag and label)
+
+    Raises:
+        KeyError: Unknown test
+    """
+    entry = RANGE_INDEX[test_name]
+    if value is None or value != value:
+        return RESULT_NO_RANGE
+    if value < entry["critical_low"]:
+        return RESULT_CRITICAL_LOW
+    if value > entry["critical_high"]:
+        return RESULT_CRITICAL_HIGH
+
+    band = _band_index(entry, age)
+    if band is None or not entry["ranges"]:
+        return RESULT_NO_RANGE
+    low, high = entry["bounds"][_sex_index(gender)][band]
+    if low != low:
+        return RESULT_NO_RANGE
+    if value < low:
+        return RESULT_LOW
+    if value > high:
+        return RESULT_HIGH
+    return RESULT_NORMAL
 
 
 def interpret_value(test_name, value, gender="male", age=None):
     """Interpret lab value"""
-    if test_name not in ALL_RANGES:
+    if test_name not in RANGE_INDEX:
         return "Unknown test"
-    
-    test = ALL_RANGES[test_name]
-    normal = get_normal_range(test_name, gender, age)
-    
-    # Check critical
-    if is_critical(test_name, value):
-        if value < test.get("critical_low", float('-inf')):
-            return "CRITICALLY LOW ⚠️"
-        else:
-            return "CRITICALLY HIGH ⚠️"
-    
-    # Check normal range
-    if "min" in normal and "max" in normal:
-        if value < normal["min"]:
-            return "Low ⬇️"
-        elif value > normal["max"]:
-            return "High ⬆️"
+    return RESULT_LABELS[classify_value(test_name, value, gender, age)]
+
+
+def interpret_many(test_name, values, sex="male", age=None):
+    """
+    Vectorized interpretation of many results of one test
+
+    Args:
+        test_name: Key of ALL_RANGES (e.g. "Hemoglobin")
+        values: Array of results in the table unit (NaN = missing)
+        sex: One value for all rows or an array / Series ("male"/"female",
+            "Nam"/"Nữ"); a pandas string Series is matched fastest
+        age: None, one age for all rows or an array of ages (years)
+
+    Returns:
+        np.ndarray (int8): RESULT_* code per row; np.take(RESULT_FLAGS, codes)
+        gives HL7 flags
+
+    Raises:
+        KeyError: Unknown test
+    """
+    entry = RANGE_INDEX[test_name]
+    values = np.asarray(values, dtype=float)
+    codes = np.full(values.shape, RESULT_NO_RANGE, dtype=np.int8)
+    limits = entry["limits"]
+
+    if entry["ranges"]:
+        if np.ndim(sex) == 0:
+            sex_index = _sex_index(sex)
         else:
-            return "Normal ✓"
-    
-    # Check max only (like HbA1c, Cholesterol)
-    if "max" in normal and "min" not in normal:
-        if value <= normal["max"]:
-            return "Normal ✓"
+            if hasattr(sex, "isin"):
+                female = sex.isin(FEMALE_VALUES).to_numpy()
+            else:
+                sex = np.asarray(sex)
+                female = np.zeros(values.shape, dtype=bool)
+                for token in FEMALE_VALUES:
+                    female |= sex == token
+            sex_index = female.astype(np.intp)
+
+        if limits.shape[1] == 1:
+            band = 0
+            in_band = True
         else:
-            return "High ⬆️"
-    
-    return "See reference ranges"
+            ages = np.asarray(np.nan if age is None else age, dtype=float)
+            band = np.searchsorted(entry["age_low"], ages, side="right") - 1
+            in_band = (band >= 0) & (ages < np.take(entry["age_high"], band))
+            band = np.where(in_band, band, 0)
+
+        low = limits[sex_index, band, 0]
+        high = limits[sex_index, band, 1]
+        known = in_band & (low == low)
+        codes[known & (values >= low) & (values <= high)] = RESULT_NORMAL
+        codes[known & (values < low)] = RESULT_LOW
+        codes[known & (values > high)] = RESULT_HIGH
 
+    codes[values < entry["critical_low"]] = RESULT_CRITICAL_LOW
+    codes[values > entry["critical_high"]] = RESULT_CRITICAL_HIGH
+    return codes
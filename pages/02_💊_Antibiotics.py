@@ -1,6 +1,6 @@
 """
 Antibiotics Module - Dosing & TDM
-Main Router - Imports from antibiotics module
+Main Router - Tools listed in registry.py
 """
 
 import streamlit as st
@@ -10,13 +10,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from antibiotics import (
-    render_crcl,
-    render_vancomycin,
-    render_aminoglycoside,
-    render_antibiotic_lookup,
-    render_database
-)
+from registry import CALCULATORS, get_calculators, render_calculator
 
 st.set_page_config(page_title="Kháng Sinh - Clinical Assistant", page_icon="💊", layout="wide")
 
@@ -31,13 +25,8 @@ with st.sidebar:
     
     function_type = st.selectbox(
         "Công cụ:",
-        [
-            "🧮 Tính CrCl (Cockcroft-Gault)",
-            "💉 Vancomycin - Tính Liều",
-            "💊 Aminoglycoside - Tính Liều",
-            "🔍 Tra Cứu Kháng Sinh",
-            "📊 Cơ Sở Dữ Liệu"
-        ]
+        get_calculators(page="Drugs"),
+        format_func=lambda calc_id: CALCULATORS[calc_id]["label"]
     )
     
     st.markdown("---")
@@ -52,20 +41,7 @@ with st.sidebar:
 # ========== MAIN CONTENT ==========
 
 # Route to appropriate function
-if "CrCl" in function_type:
-    render_crcl()
-
-elif "Vancomycin" in function_type:
-    render_vancomycin()
-
-elif "Aminoglycoside" in function_type:
-    render_aminoglycoside()
-
-elif "Tra Cứu" in function_type:
-    render_antibiotic_lookup()
-
-elif "Cơ Sở Dữ Liệu" in function_type:
-    render_database()
+render_calculator(function_type)
 
 # ========== FOOTER ==========
 st.markdown("---")
@@ -1,6 +1,6 @@
 """
 Ventilator Module - Mechanical Ventilation Tools
-Main Router - Imports from ventilator module
+Main Router - Tools listed in registry.py
 """
 
 import streamlit as st
@@ -10,11 +10,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ventilator import (
-    render_ardsnet,
-    render_initial_settings,
-    render_peep_fio2_table
-)
+from registry import CALCULATORS, get_calculators, render_calculator
 
 st.set_page_config(page_title="Thở Máy - Clinical Assistant", page_icon="🫁", layout="wide")
 
@@ -29,11 +25,8 @@ with st.sidebar:
     
     function_type = st.selectbox(
         "Công cụ:",
-        [
-            "🫁 ARDSNet - Tidal Volume",
-            "⚙️ Cài Đặt Ban Đầu",
-            "📊 Bảng PEEP/FiO2"
-        ]
+        get_calculators(page="Ventilator"),
+        format_func=lambda calc_id: CALCULATORS[calc_id]["label"]
     )
     
     st.markdown("---")
@@ -48,14 +41,7 @@ with st.sidebar:
 # ========== MAIN CONTENT ==========
 
 # Route to appropriate function
-if "ARDSNet" in function_type:
-    render_ardsnet()
-
-elif "Cài Đặt Ban Đầu" in function_type:
-    render_initial_settings()
-
-elif "PEEP/FiO2" in function_type:
-    render_peep_fio2_table()
+render_calculator(function_type)
 
 # ========== FOOTER ==========
 st.markdown("---")
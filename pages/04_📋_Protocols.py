@@ -1,6 +1,6 @@
 """
 Protocols Module - Clinical Treatment Protocols
-Main Router - Imports from protocols module
+Main Router - Protocols listed in registry.py
 """
 
 import streamlit as st
@@ -10,14 +10,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from protocols import (
-    render_sepsis,
-    render_shock,
-    render_copd,
-    render_asthma,
-    render_acs,
-    render_hf
-)
+from registry import CALCULATORS, get_calculators, get_sections, render_calculator
 
 st.set_page_config(page_title="Phác Đồ - Clinical Assistant", page_icon="📋", layout="wide")
 
@@ -32,43 +25,18 @@ with st.sidebar:
     
     specialty = st.selectbox(
         "Chuyên khoa:",
-        [
-            "🚨 Cấp Cứu (Emergency)",
-            "🫁 Hô Hấp (Respiratory)",
-            "❤️ Tim Mạch (Cardiology)"
-        ]
+        get_sections("Protocols")
     )
     
     st.markdown("---")
     
     # Display protocols based on specialty
-    if "Cấp Cứu" in specialty:
-        protocol = st.radio(
-            "Phác đồ:",
-            [
-                "🦠 Sepsis 1-Hour Bundle",
-                "💔 Quản Lý Sốc"
-            ],
-            label_visibility="collapsed"
-        )
-    elif "Hô Hấp" in specialty:
-        protocol = st.radio(
-            "Phác đồ:",
-            [
-                "🫁 COPD Exacerbation",
-                "🫁 Cơn Hen Cấp"
-            ],
-            label_visibility="collapsed"
-        )
-    elif "Tim Mạch" in specialty:
-        protocol = st.radio(
-            "Phác đồ:",
-            [
-                "💔 ACS - Hội Chứng Vành Cấp",
-                "💔 Suy Tim Cấp"
-            ],
-            label_visibility="collapsed"
-        )
+    protocol = st.radio(
+        "Phác đồ:",
+        get_calculators(page="Protocols", section=specialty),
+        format_func=lambda calc_id: CALCULATORS[calc_id]["label"],
+        label_visibility="collapsed"
+    )
     
     st.markdown("---")
     st.info("""
@@ -80,32 +48,18 @@ with st.sidebar:
 
 # ========== MAIN CONTENT ==========
 
+protocol_label = CALCULATORS[protocol]["label"]
+
 st.info(f"""
 **Chuyên khoa:** {specialty}
 
-**Phác đồ đang xem:** {protocol.split(' ', 1)[1] if ' ' in protocol else protocol}
+**Phác đồ đang xem:** {protocol_label.split(' ', 1)[1] if ' ' in protocol_label else protocol_label}
 """)
 
 st.markdown("---")
 
 # Route to appropriate protocol
-if "Sepsis" in protocol:
-    render_sepsis()
-
-elif "Sốc" in protocol:
-    render_shock()
-
-elif "COPD" in protocol:
-    render_copd()
-
-elif "Hen" in protocol:
-    render_asthma()
-
-elif "ACS" in protocol:
-    render_acs()
-
-elif "Suy Tim" in protocol:
-    render_hf()
+render_calculator(protocol)
 
 # ========== FOOTER ==========
 st.markdown("---")
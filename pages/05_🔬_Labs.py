@@ -10,17 +10,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from labs import (
-    render_cbc,
-    render_bmp,
-    render_cmp,
-    render_lft,
-    render_lipid,
-    render_cardiac_markers,
-    render_coag,
-    render_thyroid,
-    render_abg
-)
+from registry import CALCULATORS, get_calculators, render_calculator
 
 st.set_page_config(page_title="Lab Values - Clinical Assistant", page_icon="🔬", layout="wide")
 
@@ -35,17 +25,8 @@ with st.sidebar:
     
     lab_panel = st.selectbox(
         "Lab Panel:",
-        [
-            "🩸 CBC - Complete Blood Count",
-            "🧪 BMP - Basic Metabolic Panel",
-            "🧪 CMP - Comprehensive Metabolic Panel",
-            "🫀 LFT - Liver Function Tests",
-            "💊 Lipid Panel",
-            "❤️ Cardiac Markers",
-            "🩸 Coagulation Panel",
-            "🦋 Thyroid Function Tests",
-            "💨 ABG - Arterial Blood Gas"
-        ]
+        get_calculators(page="Labs"),
+        format_func=lambda calc_id: CALCULATORS[calc_id]["label"]
     )
     
     st.markdown("---")
@@ -67,8 +48,10 @@ with st.sidebar:
 
 # ========== MAIN CONTENT ==========
 
+panel_label = CALCULATORS[lab_panel]["label"]
+
 st.info(f"""
-**Lab Panel:** {lab_panel.split(' - ')[1] if ' - ' in lab_panel else lab_panel}
+**Lab Panel:** {panel_label.split(' - ')[1] if ' - ' in panel_label else panel_label}
 
 **Instructions:** 
 1. Enter patient lab values
@@ -79,32 +62,7 @@ st.info(f"""
 st.markdown("---")
 
 # Route to appropriate panel
-if "CBC" in lab_panel:
-    render_cbc()
-
-elif "BMP" in lab_panel and "CMP" not in lab_panel:
-    render_bmp()
-
-elif "CMP" in lab_panel:
-    render_cmp()
-
-elif "LFT" in lab_panel or "Liver" in lab_panel:
-    render_lft()
-
-elif "Lipid" in lab_panel:
-    render_lipid()
-
-elif "Cardiac" in lab_panel:
-    render_cardiac_markers()
-
-elif "Coag" in lab_panel:
-    render_coag()
-
-elif "Thyroid" in lab_panel:
-    render_thyroid()
-
-elif "ABG" in lab_panel:
-    render_abg()
+render_calculator(lab_panel)
 
 # ========== FOOTER ==========
 st.markdown("---")
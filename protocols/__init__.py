@@ -1,11 +1,31 @@
 """
 Protocols Module - Clinical Treatment Protocols
 Modular structure for easy maintenance
+
+Protocol renders (Streamlit) are imported on first access, so the headless
+modules (emergency.sepsis_bundle) never import Streamlit.
 """
 
-from .emergency import render_sepsis, render_shock
-from .respiratory import render_copd, render_asthma
-from .cardiology import render_acs, render_hf
+from importlib import import_module
+
+# Page renders (Streamlit), imported lazily: name → (module, attribute)
+_RENDERS = {
+    'render_sepsis': ('emergency', 'render_sepsis'),
+    'render_shock': ('emergency', 'render_shock'),
+    'render_copd': ('respiratory', 'render_copd'),
+    'render_asthma': ('respiratory', 'render_asthma'),
+    'render_acs': ('cardiology', 'render_acs'),
+    'render_hf': ('cardiology', 'render_hf'),
+}
+
+
+def __getattr__(name):
+    if name in _RENDERS:
+        module, attribute = _RENDERS[name]
+        render = getattr(import_module(f".{module}", __name__), attribute)
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'render_sepsis',
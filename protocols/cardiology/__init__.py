@@ -1,10 +1,26 @@
 """
 Cardiology Protocols
 ACS, Heart Failure, and cardiac emergency protocols organized by individual files
+
+Protocol renders are imported on first access (Streamlit only when drawn).
 """
 
-from .acs import render as render_acs
-from .heart_failure import render as render_hf
+from importlib import import_module
+
+# Page renders (Streamlit), imported lazily: name → (module, attribute)
+_RENDERS = {
+    'render_acs': ('acs', 'render'),
+    'render_hf': ('heart_failure', 'render'),
+}
+
+
+def __getattr__(name):
+    if name in _RENDERS:
+        module, attribute = _RENDERS[name]
+        render = getattr(import_module(f".{module}", __name__), attribute)
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
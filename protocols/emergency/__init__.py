@@ -1,9 +1,26 @@
 """
 Emergency Protocols
 Sepsis, shock, and critical care protocols organized by individual files
+
+Protocol renders are imported on first access, so sepsis_bundle can be used
+without Streamlit.
 """
 
-from .sepsis import render as render_sepsis
+from importlib import import_module
+
+# Page renders (Streamlit), imported lazily: name → (module, attribute)
+_RENDERS = {
+    'render_sepsis': ('sepsis', 'render'),
+}
+
+
+def __getattr__(name):
+    if name in _RENDERS:
+        module, attribute = _RENDERS[name]
+        render = getattr(import_module(f".{module}", __name__), attribute)
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def render_shock():
@@ -3,8 +3,82 @@ Sepsis 1-Hour Bundle Protocol
 Surviving Sepsis Campaign 2021
 """
 
+from datetime import datetime
+
+import pandas as pd
 import streamlit as st
 
+from .sepsis_bundle import ELEMENT_LABELS, SepsisBundleScheduler
+
+
+STATUS_ICONS = {"pending": "⏳", "done": "✅", "late": "🟠", "overdue": "🔴", "not_required": "➖"}
+
+
+def render_bundle_tracker():
+    """Timed hour-1 bundle for every active patient (scheduler kept across reruns)"""
+    st.markdown("### ⏱️ Theo Dõi Bundle Theo Thời Gian")
+    if "sepsis_bundles" not in st.session_state:
+        st.session_state["sepsis_bundles"] = SepsisBundleScheduler()
+    scheduler = st.session_state["sepsis_bundles"]
+    now = datetime.now()
+    
+    with st.form("sepsis_bundle_start"):
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            patient = st.text_input("Bệnh nhân / giường", key="sepsis_bundle_patient")
+        with col2:
+            weight = st.number_input("Cân nặng (kg)", 0.0, 300.0, 0.0, 1.0, key="sepsis_bundle_weight")
+        with col3:
+            submitted = st.form_submit_button("▶️ Bắt đầu bundle", type="primary")
+        if submitted and patient:
+            try:
+                scheduler.start(patient, now, weight=weight or None)
+            except ValueError as error:
+                st.error(str(error))
+    
+    for event in scheduler.advance(now):
+        st.error(f"🔴 {event['patient']}: quá hạn {ELEMENT_LABELS[event['element']]} "
+                 f"({event['deadline']:%H:%M})")
+    
+    if not len(scheduler):
+        st.caption("Chưa có bundle đang chạy")
+        return
+    
+    for patient in list(scheduler.bundles):
+        bundle = scheduler.bundles[patient]
+        result = scheduler.compliance(patient)
+        elapsed = (now - bundle["start"]).total_seconds() / 60
+        title = (f"{patient} · {elapsed:.0f} phút · {result['on_time']}/{result['required']} đúng hạn"
+                 + (f" · dịch {bundle['fluid_ml']:.0f} mL" if bundle["fluid_ml"] else ""))
+        with st.expander(title, expanded=result["elements"].get("lactate") == "pending"):
+            for element, state in bundle["elements"].items():
+                col1, col2, col3 = st.columns([3, 1, 1])
+                remaining = (state["deadline"] - now).total_seconds() / 60
+                col1.write(f"{STATUS_ICONS[state['status']]} {ELEMENT_LABELS[element]} "
+                           f"(hạn {state['deadline']:%H:%M})")
+                if state["status"] in ("pending", "overdue"):
+                    col2.caption(f"còn {remaining:.0f} phút" if remaining >= 0 else f"trễ {-remaining:.0f} phút")
+                    value = None
+                    if element in ("lactate", "repeat_lactate"):
+                        value = col2.number_input("mmol/L", 0.0, 30.0, 0.0, 0.1,
+                                                  key=f"sepsis_{patient}_{element}_value") or None
+                    if col3.button("Hoàn thành", key=f"sepsis_{patient}_{element}"):
+                        scheduler.complete(patient, element, datetime.now(), value=value)
+                        st.rerun()
+            if result["cultures_before_antibiotics"] is False:
+                st.warning("⚠️ Cấy máu được làm SAU kháng sinh")
+            if st.button("Kết thúc bundle", key=f"sepsis_{patient}_close"):
+                scheduler.close(patient)
+                st.rerun()
+    
+    summary = scheduler.summary()
+    st.caption(f"{summary['bundles']} bundle đang chạy · {summary['complete']} hoàn thành đúng hạn · "
+               f"{summary['overdue']} mục quá hạn")
+    st.dataframe(
+        pd.DataFrame({ELEMENT_LABELS[element]: counts for element, counts in summary["counts"].items()}),
+        use_container_width=True
+    )
+
 
 def render():
     """Sepsis 1-Hour Bundle Protocol"""
@@ -49,6 +123,8 @@ def render():
        - Mục tiêu MAP ≥65 mmHg
     """)
     
+    render_bundle_tracker()
+    
     st.markdown("---")
     
     st.markdown("### 💊 Lựa Chọn Kháng Sinh Thực Nghiệm")
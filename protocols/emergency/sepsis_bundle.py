@@ -0,0 +1,356 @@
+"""
+Sepsis Hour-1 Bundle Scheduler
+Surviving Sepsis Campaign 2021 / SEP-1 timed bundle elements
+
+Starting a bundle registers one deadline per element in a single min-heap
+shared by every active patient:
+
+- lactate, cultures, antibiotics: 60 min
+- fluids (30 mL/kg crystalloid): 180 min
+- repeat_lactate: 360 min, only required if the first lactate > 2 mmol/L
+
+advance(now) pops every deadline < now that is still pending and returns
+them as overdue events. Completing an element does not touch the heap: the
+entry is skipped when popped (lazy deletion), and the heap is rebuilt once
+stale entries outnumber live ones. start() is O(k log n), complete() O(1),
+advance() O(log n) per popped deadline.
+
+Times are datetimes (offsets as timedelta) or numbers in minutes.
+
+Event log (replay_event_log): time, patient, event (start, close or an
+element name), optional value (lactate mmol/L) and weight (kg).
+
+Usage:
+    scheduler = SepsisBundleScheduler()
+    scheduler.start("Bed 7", t0, weight=70)
+    scheduler.complete("Bed 7", "lactate", t0 + timedelta(minutes=20), value=3.1)
+    overdue = scheduler.advance(now)
+
+Replay benchmark:
+    python -m protocols.emergency.sepsis_bundle events.csv
+    python -m protocols.emergency.sepsis_bundle --synthetic 5000
+"""
+
+import heapq
+import sys
+import time as timer
+from datetime import timedelta
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+
+
+# (element, label, deadline in minutes after bundle start)
+SEPSIS_BUNDLE = (
+    ("lactate", "Đo lactate", 60),
+    ("cultures", "Cấy máu trước kháng sinh", 60),
+    ("antibiotics", "Kháng sinh phổ rộng", 60),
+    ("fluids", "Dịch tinh thể 30 mL/kg", 180),
+    ("repeat_lactate", "Đo lại lactate (nếu lactate > 2)", 360),
+)
+ELEMENTS = tuple(element for element, _, _ in SEPSIS_BUNDLE)
+ELEMENT_LABELS = {element: label for element, label, _ in SEPSIS_BUNDLE}
+LACTATE_REPEAT_THRESHOLD = 2.0   # mmol/L
+FLUID_ML_PER_KG = 30
+STATUSES = ("pending", "done", "late", "overdue", "not_required")
+
+
+def _offset(start, minutes):
+    """Deadline = start + minutes (numbers are minutes, otherwise timedelta)"""
+    if isinstance(start, Number):
+        return start + minutes
+    return start + timedelta(minutes=minutes)
+
+
+class SepsisBundleScheduler:
+    """
+    Hour-1 bundle deadlines for many concurrent patients
+
+    Args:
+        bundle: (element, label, minutes) tuples (default SEPSIS_BUNDLE)
+    """
+
+    def __init__(self, bundle=SEPSIS_BUNDLE):
+        self.bundle = bundle
+        self.bundles = {}
+        self._heap = []
+        self._sequence = 0
+        self._stale = 0
+
+    def __len__(self):
+        return len(self.bundles)
+
+    def start(self, patient, time, weight=None) -> dict:
+        """
+        Start a bundle (time zero = sepsis recognition)
+
+        Raises:
+            ValueError: The patient already has an active bundle
+        """
+        if patient in self.bundles:
+            raise ValueError(f"{patient}: bundle already started")
+        elements = {}
+        for element, _, minutes in self.bundle:
+            deadline = _offset(time, minutes)
+            elements[element] = {"deadline": deadline, "status": "pending", "time": None, "value": None}
+            self._sequence += 1
+            heapq.heappush(self._heap, (deadline, self._sequence, patient, element))
+        self.bundles[patient] = {
+            "start": time,
+            "weight": weight,
+            "fluid_ml": FLUID_ML_PER_KG * weight if weight else None,
+            "elements": elements,
+        }
+        return self.bundles[patient]
+
+    def complete(self, patient, element, time, value=None) -> str:
+        """
+        Record a completed element
+
+        Args:
+            value: Lactate result (mmol/L) for lactate / repeat_lactate
+
+        Returns:
+            str: 'done' (on time) or 'late'
+
+        Raises:
+            KeyError: No active bundle for the patient / unknown element
+        """
+        state = self.bundles[patient]["elements"][element]
+        if state["status"] in ("done", "late"):
+            return state["status"]
+        if state["status"] == "pending":
+            self._stale += 1
+        state["time"] = time
+        state["value"] = value
+        state["status"] = "done" if time <= state["deadline"] else "late"
+
+        if element == "lactate" and value is not None and value <= LACTATE_REPEAT_THRESHOLD:
+            repeat = self.bundles[patient]["elements"].get("repeat_lactate")
+            if repeat is not None and repeat["status"] in ("pending", "overdue"):
+                self._stale += repeat["status"] == "pending"
+                repeat["status"] = "not_required"
+        self._compact()
+        return state["status"]
+
+    def close(self, patient) -> dict:
+        """Remove a bundle (discharge / all elements done); returns its compliance"""
+        result = self.compliance(patient)
+        bundle = self.bundles.pop(patient)
+        self._stale += sum(state["status"] == "pending" for state in bundle["elements"].values())
+        self._compact()
+        return result
+
+    def _compact(self):
+        if self._stale > 64 and self._stale * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if self._pending(entry)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _pending(self, entry):
+        _, _, patient, element = entry
+        bundle = self.bundles.get(patient)
+        return (bundle is not None and bundle["elements"][element]["status"] == "pending"
+                and bundle["elements"][element]["deadline"] == entry[0])
+
+    def next_deadline(self):
+        """Earliest pending deadline as (time, patient, element), or None"""
+        while self._heap and not self._pending(self._heap[0]):
+            heapq.heappop(self._heap)
+            self._stale = max(self._stale - 1, 0)
+        if not self._heap:
+            return None
+        deadline, _, patient, element = self._heap[0]
+        return deadline, patient, element
+
+    def advance(self, now) -> list:
+        """
+        Fire every pending deadline < now (done exactly at the deadline is on time)
+
+        Returns:
+            list of dicts (patient, element, deadline), in deadline order;
+            the elements are marked 'overdue'
+        """
+        fired = []
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            entry = heapq.heappop(heap)
+            if not self._pending(entry):
+                self._stale = max(self._stale - 1, 0)
+                continue
+            deadline, _, patient, element = entry
+            self.bundles[patient]["elements"][element]["status"] = "overdue"
+            fired.append({"patient": patient, "element": element, "deadline": deadline})
+        return fired
+
+    def compliance(self, patient) -> dict:
+        """
+        Bundle compliance of one patient
+
+        Returns:
+            dict: patient, start, elements (element → status), on_time,
+            required, complete (all required elements on time),
+            cultures_before_antibiotics (None until both are done)
+        """
+        bundle = self.bundles[patient]
+        elements = bundle["elements"]
+        statuses = {element: state["status"] for element, state in elements.items()}
+        required = [element for element, status in statuses.items() if status != "not_required"]
+        on_time = sum(statuses[element] == "done" for element in required)
+        cultures, antibiotics = elements.get("cultures"), elements.get("antibiotics")
+        order = None
+        if cultures and antibiotics and cultures["time"] is not None and antibiotics["time"] is not None:
+            order = cultures["time"] <= antibiotics["time"]
+        return {
+            "patient": patient,
+            "start": bundle["start"],
+            "fluid_ml": bundle["fluid_ml"],
+            "elements": statuses,
+            "on_time": on_time,
+            "required": len(required),
+            "complete": on_time == len(required),
+            "cultures_before_antibiotics": order,
+        }
+
+    def summary(self) -> dict:
+        """
+        Compliance over every active bundle
+
+        Returns:
+            dict: bundles, complete (all required elements on time),
+            counts (element → status → count), element_pct (element →
+            % on time among required), overdue (elements currently overdue)
+        """
+        counts = {element: dict.fromkeys(STATUSES, 0) for element in ELEMENTS}
+        complete = 0
+        for patient in self.bundles:
+            result = self.compliance(patient)
+            complete += result["complete"]
+            for element, status in result["elements"].items():
+                counts.setdefault(element, dict.fromkeys(STATUSES, 0))[status] += 1
+        element_pct = {}
+        for element, count in counts.items():
+            required = len(self.bundles) - count["not_required"]
+            element_pct[element] = 100 * count["done"] / required if required else None
+        return {
+            "bundles": len(self.bundles),
+            "complete": complete,
+            "counts": counts,
+            "element_pct": element_pct,
+            "overdue": sum(count["overdue"] for count in counts.values()),
+        }
+
+
+def _read_log(source):
+    if isinstance(source, pd.DataFrame):
+        return source
+    if str(source).lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+def replay_event_log(source, scheduler=None) -> dict:
+    """
+    Replay an event log through the scheduler
+
+    Before each event, advance() fires every deadline that passed. Events
+    for unknown patients / elements are counted as skipped.
+
+    Args:
+        source: DataFrame or CSV / Parquet path (time, patient, event
+            [, value, weight]); time as datetime text or minutes
+        scheduler: Existing scheduler (default: a new one)
+
+    Returns:
+        dict: scheduler, events (processed), skipped, fired (DataFrame of
+        overdue events), closed (DataFrame of closed-bundle compliance),
+        seconds (replay time)
+    """
+    log = _read_log(source)
+    scheduler = scheduler or SepsisBundleScheduler()
+    times = log["time"]
+    if not pd.api.types.is_numeric_dtype(times):
+        times = pd.to_datetime(times)
+    order = np.argsort(times.to_numpy(), kind="stable")
+    times = times.to_numpy()[order]
+    if not pd.api.types.is_numeric_dtype(log["time"]):
+        times = pd.DatetimeIndex(times).to_pydatetime()
+    else:
+        times = times.tolist()
+    patients = log["patient"].to_numpy()[order].tolist()
+    events = log["event"].to_numpy()[order].tolist()
+    values = (pd.to_numeric(log["value"], errors="coerce").to_numpy()[order].tolist()
+              if "value" in log else [None] * len(log))
+    weights = (pd.to_numeric(log["weight"], errors="coerce").to_numpy()[order].tolist()
+               if "weight" in log else [None] * len(log))
+
+    fired, closed = [], []
+    skipped = 0
+    started = timer.perf_counter()
+    for now, patient, event, value, weight in zip(times, patients, events, values, weights):
+        fired.extend(scheduler.advance(now))
+        value = None if value is None or value != value else value
+        try:
+            if event == "start":
+                scheduler.start(patient, now, weight=None if weight is None or weight != weight else weight)
+            elif event == "close":
+                closed.append(scheduler.close(patient))
+            else:
+                scheduler.complete(patient, event, now, value=value)
+        except (KeyError, ValueError):
+            skipped += 1
+    seconds = timer.perf_counter() - started
+
+    return {
+        "scheduler": scheduler,
+        "events": len(events),
+        "skipped": skipped,
+        "fired": pd.DataFrame(fired, columns=["patient", "element", "deadline"]),
+        "closed": pd.DataFrame(closed),
+        "seconds": seconds,
+    }
+
+
+def synthetic_event_log(bundles, seed=0, span_hours=24 * 30) -> pd.DataFrame:
+    """
+    Random event log for benchmarking (times in minutes)
+
+    Bundles start uniformly over span_hours; each element is done with a
+    delay around its deadline (some late, some missing) and the bundle is
+    closed after 8 h.
+    """
+    rng = np.random.default_rng(seed)
+    starts = np.sort(rng.uniform(0, span_hours * 60, bundles))
+    rows = []
+    for i, start in enumerate(starts):
+        patient = f"P{i:06d}"
+        rows.append((start, patient, "start", np.nan, rng.uniform(45, 110)))
+        lactate = rng.lognormal(0.8, 0.5)
+        for element, _, minutes in SEPSIS_BUNDLE:
+            if rng.random() < 0.05:
+                continue
+            delay = rng.gamma(2.0, minutes / 2.5)
+            if element == "repeat_lactate" and lactate <= LACTATE_REPEAT_THRESHOLD:
+                continue
+            rows.append((start + delay, patient, element,
+                         lactate if element == "lactate" else np.nan, np.nan))
+        rows.append((start + 480, patient, "close", np.nan, np.nan))
+    return pd.DataFrame(rows, columns=["time", "patient", "event", "value", "weight"])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--synthetic":
+        source = synthetic_event_log(int(sys.argv[2]))
+    elif len(sys.argv) > 1:
+        source = sys.argv[1]
+    else:
+        sys.exit("usage: python -m protocols.emergency.sepsis_bundle <events.csv> | --synthetic N")
+    result = replay_event_log(source)
+    closed = result["closed"]
+    print(f"{result['events']} events ({result['skipped']} skipped) in {result['seconds']:.3f} s "
+          f"= {result['events'] / max(result['seconds'], 1e-9):,.0f} events/s")
+    print(f"{len(result['fired'])} overdue deadlines fired, {len(closed)} bundles closed, "
+          f"{len(result['scheduler'])} still active")
+    if len(closed):
+        print(f"bundle compliance (all required elements on time): {100 * closed['complete'].mean():.1f}%")
@@ -0,0 +1,101 @@
+"""
+Generic Protocol Renderer
+Any protocol in data/Protocols.csv (scores/engine/data_protocols.py), with
+a per-patient checklist kept in st.session_state
+"""
+
+import streamlit as st
+
+from scores.engine.data_protocols import ProtocolChecklist, get_protocol
+
+
+STATUS_ICONS = {"available": "⬜", "done": "✅", "skipped": "⏭️", "locked": "🔒", "excluded": "➖"}
+
+
+def _checklist(protocol):
+    """Checklist for this protocol, restarted when Protocols_VERSION changes"""
+    key = f"protocol_checklist_{protocol['topic_id']}"
+    checklist = st.session_state.get(key)
+    if checklist is None or checklist.version != protocol["version"]:
+        checklist = st.session_state[key] = ProtocolChecklist(protocol)
+    return checklist
+
+
+def render_protocol(topic_id):
+    """Render a data-driven protocol with its checklist"""
+    try:
+        protocol = get_protocol(topic_id)
+    except (KeyError, ValueError) as error:
+        st.error(f"Không tải được phác đồ: {error}")
+        return
+    
+    st.subheader(protocol["title"])
+    if protocol["summary_md"]:
+        st.info(protocol["summary_md"])
+    
+    checklist = _checklist(protocol)
+    topic = protocol["topic_id"]
+    
+    if protocol["red_flags"]:
+        st.markdown("### 🚩 Dấu Hiệu Nguy Hiểm")
+        for flag in protocol["red_flags"]:
+            present = st.checkbox(flag["flag"], value=flag["flag"] in checklist.flags,
+                                  key=f"protocol_{topic}_flag_{flag['flag']}")
+            checklist.set_flag(flag["flag"], present)
+    
+    progress = checklist.progress()
+    if progress["red_flags"]:
+        actions = [f"- **{flag['flag']}**" + (f" → {flag['action']}" if flag["action"] else "")
+                   for flag in protocol["red_flags"] if flag["flag"] in checklist.flags]
+        st.error("🚨 **Có dấu hiệu nguy hiểm - cân nhắc nâng mức xử trí:**\n" + "\n".join(actions))
+    
+    st.markdown("### ✅ Các Bước")
+    st.progress(progress["done"] / progress["total"] if progress["total"] else 0.0,
+                text=f"{progress['done']}/{progress['total']} bước")
+    
+    for step in protocol["steps"]:
+        status = checklist.status[step["id"]]
+        if status == "excluded":
+            continue
+        col1, col2 = st.columns([4, 2])
+        with col1:
+            title = f"{STATUS_ICONS[status]} **{step['index'] + 1}. {step['title']}**"
+            if step["decision"] and status == "done":
+                title += f" → {checklist.done[step['id']]}"
+            st.markdown(title)
+            if step["details"]:
+                st.caption(step["details"])
+        with col2:
+            key = f"protocol_{topic}_{step['id']}"
+            if status == "available":
+                if step["decision"]:
+                    labels = [label for label, _ in step["choices"]]
+                    choice = st.radio("Lựa chọn", labels, horizontal=True, key=f"{key}_choice",
+                                      label_visibility="collapsed")
+                    if st.button("Xác nhận", key=f"{key}_done"):
+                        checklist.complete(step["id"], choice)
+                        st.rerun()
+                else:
+                    if st.button("Hoàn thành", key=f"{key}_done"):
+                        checklist.complete(step["id"])
+                        st.rerun()
+                if step["optional"] and st.button("Bỏ qua", key=f"{key}_skip"):
+                    checklist.skip(step["id"])
+                    st.rerun()
+            elif status in ("done", "skipped"):
+                if st.button("↩️ Hoàn tác", key=f"{key}_undo"):
+                    checklist.undo(step["id"])
+                    st.rerun()
+    
+    if progress["complete"]:
+        st.success("✅ Đã hoàn thành phác đồ")
+    if st.button("🔄 Bắt đầu lại", key=f"protocol_{topic}_reset"):
+        del st.session_state[f"protocol_checklist_{topic}"]
+        st.rerun()
+    
+    with st.expander("📋 Toàn bộ phác đồ"):
+        st.markdown(protocol["steps_md"])
+    if protocol["refs"]:
+        with st.expander("📚 Tài Liệu Tham Khảo"):
+            st.markdown(protocol["refs"])
+            st.caption(f"Protocols_VERSION {protocol['version']}")
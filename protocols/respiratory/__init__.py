@@ -1,10 +1,26 @@
 """
 Respiratory Protocols
 COPD, Asthma, and respiratory emergency protocols organized by individual files
+
+Protocol renders are imported on first access (Streamlit only when drawn).
 """
 
-from .copd import render as render_copd
-from .asthma import render as render_asthma
+from importlib import import_module
+
+# Page renders (Streamlit), imported lazily: name → (module, attribute)
+_RENDERS = {
+    'render_copd': ('copd', 'render'),
+    'render_asthma': ('asthma', 'render'),
+}
+
+
+def __getattr__(name):
+    if name in _RENDERS:
+        module, attribute = _RENDERS[name]
+        render = getattr(import_module(f".{module}", __name__), attribute)
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
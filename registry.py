@@ -0,0 +1,482 @@
+"""
+Calculator Registry - Single source of truth for every calculator
+
+Every page router, the home-page search and any API layer read from this
+module instead of keeping their own lists. The registry is built once per
+process at import time; render and compute functions are imported lazily on
+first use and cached, so only the selected calculator module is loaded.
+
+Usage:
+    from registry import CALCULATORS, get_compute_function, render_calculator
+
+    calculate = get_compute_function("qSOFA")
+    result = calculate(rr=24, sbp=95, gcs=14)
+"""
+
+import importlib
+import inspect
+from functools import lru_cache, partial
+
+from data_loader import load_table
+
+
+# ========== SPECIALTIES (Scores page) ==========
+# Package name -> sidebar label, short category and icon
+
+SPECIALTIES = {
+    "emergency": {"label": "🚨 Cấp Cứu & Hồi Sức (Emergency & Critical Care)", "category": "Cấp Cứu", "icon": "🚨"},
+    "cardiology": {"label": "❤️ Tim Mạch (Cardiology)", "category": "Tim Mạch", "icon": "❤️"},
+    "respiratory": {"label": "🫁 Hô Hấp (Respiratory)", "category": "Hô Hấp", "icon": "🫁"},
+    "neurology": {"label": "🧠 Thần Kinh (Neurology)", "category": "Thần Kinh", "icon": "🧠"},
+    "gi": {"label": "🩸 Tiêu Hóa - Gan Mật (GI/Hepatology)", "category": "Tiêu Hóa", "icon": "🩸"},
+    "hematology": {"label": "🩺 Huyết Học & Đông Máu (Hematology)", "category": "Huyết Học", "icon": "🩺"},
+    "nephrology": {"label": "🧪 Thận - Điện Giải (Nephrology)", "category": "Thận", "icon": "🧪"},
+    "trauma": {"label": "🦴 Chấn Thương & Chỉnh Hình (Trauma/Orthopedics)", "category": "Chấn Thương", "icon": "🦴"},
+    "ent": {"label": "👂 Tai Mũi Họng (ENT)", "category": "Tai Mũi Họng", "icon": "👂"},
+    "pediatrics": {"label": "👶 Nhi Khoa (Pediatrics)", "category": "Nhi Khoa", "icon": "👶"},
+    "obstetrics": {"label": "🤰 Sản Khoa (Obstetrics)", "category": "Sản Khoa", "icon": "🤰"},
+    "metabolism": {"label": "💉 Nội Tiết - Chuyển Hóa (Endocrinology/Metabolism)", "category": "Nội Tiết", "icon": "💉"},
+    "rheumatology": {"label": "🦴 Thấp Khớp - Miễn Dịch (Rheumatology/Immunology)", "category": "Thấp Khớp", "icon": "🦴"},
+    "infectious": {"label": "🦠 Nhiễm Khuẩn (Infectious Disease)", "category": "Nhiễm Khuẩn", "icon": "🦠"},
+    "dermatology": {"label": "🩹 Da Liễu (Dermatology)", "category": "Da Liễu", "icon": "🩹"},
+    "oncology": {"label": "🎗️ Ung Thư (Oncology)", "category": "Ung Thư", "icon": "🎗️"},
+    "psychiatry": {"label": "🧠 Tâm Thần - Tâm Lý (Psychiatry/Psychology)", "category": "Tâm Thần", "icon": "🧠"},
+    "surgery": {"label": "🔪 Phẫu Thuật & Gây Mê (Surgery/Anesthesia)", "category": "Phẫu Thuật", "icon": "🔪"},
+    "ophthalmology": {"label": "👁️ Mắt (Ophthalmology)", "category": "Mắt", "icon": "👁️"},
+}
+
+
+# ========== SCORES ==========
+# UI lives in scores.<specialty>.<module>.render,
+# math in scores.engine.<specialty>.<module>.<compute>
+
+SCORES = {
+    "emergency": {
+        "qSOFA": {"name": "qSOFA - Quick SOFA", "desc": "Sàng lọc nhiễm trùng huyết", "status": "✅", "module": "qsofa", "compute": "calculate_qsofa"},
+        "SOFA": {"name": "SOFA - Sequential Organ Failure Assessment", "desc": "Đánh giá suy cơ quan", "status": "✅", "module": "sofa", "compute": "calculate_sofa"},
+        "APACHE II": {"name": "APACHE II", "desc": "Dự đoán tử vong ICU", "status": "✅", "module": "apache2", "compute": "calculate_apache2"},
+        "SAPS II": {"name": "SAPS II - Simplified Acute Physiology Score", "desc": "Độ nặng bệnh nhân ICU", "status": "✅", "module": "saps2", "compute": "calculate_saps2"},
+        "MODS": {"name": "MODS - Multiple Organ Dysfunction Score", "desc": "Rối loạn đa cơ quan", "status": "✅", "module": "mods", "compute": "calculate_mods"},
+    },
+
+    "cardiology": {
+        "NYHA": {"name": "NYHA Classification", "desc": "Phân loại chức năng suy tim (DÙNG HÀNG NGÀY)", "status": "✅", "module": "nyha", "compute": "classify_nyha"},
+        "Killip": {"name": "Killip Classification", "desc": "Suy tim cấp trong AMI (DÙNG HÀNG NGÀY)", "status": "✅", "module": "killip", "compute": "classify_killip"},
+        "Duke": {"name": "Duke Criteria", "desc": "Chẩn đoán viêm nội tâm mạc", "status": "✅", "module": "duke", "compute": "evaluate_duke"},
+        "CHA2DS2-VASc": {"name": "CHA₂DS₂-VASc", "desc": "Nguy cơ đột quỵ trong rung nhĩ", "status": "✅", "module": "cha2ds2vasc", "compute": "calculate_cha2ds2vasc"},
+        "HAS-BLED": {"name": "HAS-BLED", "desc": "Nguy cơ chảy máu khi dùng kháng đông", "status": "✅", "module": "hasbled", "compute": "calculate_hasbled"},
+        "SCORE2": {"name": "SCORE2", "desc": "Nguy cơ tim mạch 10 năm (40-69 tuổi)", "status": "✅", "module": "score2", "compute": "calculate_score2_moderate_risk"},
+        "SCORE2-OP": {"name": "SCORE2-OP", "desc": "Nguy cơ tim mạch (≥70 tuổi)", "status": "✅", "module": "score2_op", "compute": "calculate_score2_op"},
+        "HEART Score": {"name": "HEART Score", "desc": "Đau ngực cấp - nguy cơ ACS", "status": "✅", "module": "heart", "compute": "calculate_heart_score"},
+        "TIMI Risk": {"name": "TIMI Risk Score", "desc": "Nguy cơ NSTEMI/STEMI", "status": "✅", "module": "timi", "compute": "calculate_timi"},
+        "GRACE Score": {"name": "GRACE Score", "desc": "Tiên lượng ACS", "status": "✅", "module": "grace", "compute": "calculate_grace"},
+        "Framingham": {"name": "Framingham Risk Score", "desc": "Nguy cơ tim mạch 10 năm", "status": "✅", "module": "framingham", "compute": "calculate_framingham"},
+        "Corrected QT": {"name": "QTc - Corrected QT Interval", "desc": "QT điều chỉnh theo nhịp tim", "status": "✅", "module": "qtc", "compute": "calculate_qtc_bazett"},
+    },
+
+    "respiratory": {
+        "PERC": {"name": "PERC Rule", "desc": "Loại trừ PE không cần D-dimer (DÙNG HÀNG NGÀY)", "status": "✅", "module": "perc", "compute": "calculate_perc"},
+        "CURB-65": {"name": "CURB-65", "desc": "Mức độ nặng viêm phổi", "status": "✅", "module": "curb65", "compute": "calculate_curb65"},
+        "PSI/PORT": {"name": "PSI/PORT Score", "desc": "Tiên lượng viêm phổi cộng đồng", "status": "✅", "module": "psi_port", "compute": "calculate_psi_port"},
+        "Wells PE": {"name": "Wells PE Score", "desc": "Nguy cơ thuyên tắc phổi", "status": "✅", "module": "wells_pe", "compute": "calculate_wells_pe"},
+        "SMART-COP": {"name": "SMART-COP", "desc": "Cần hỗ trợ hô hấp trong viêm phổi", "status": "✅", "module": "smartcop", "compute": "calculate_smartcop"},
+        "BODE Index": {"name": "BODE Index", "desc": "Tiên lượng COPD", "status": "✅", "module": "bode", "compute": "calculate_bode"},
+    },
+
+    "neurology": {
+        "GCS": {"name": "GCS - Glasgow Coma Scale", "desc": "Mức độ ý thức", "status": "✅", "module": "gcs", "compute": "calculate_gcs"},
+        "NIHSS": {"name": "NIHSS - NIH Stroke Scale", "desc": "Mức độ nặng đột quỵ", "status": "✅", "module": "nihss", "compute": "calculate_nihss"},
+        "ICH Score": {"name": "ICH Score", "desc": "Tiên lượng xuất huyết nội sọ", "status": "✅", "module": "ich_score", "compute": "calculate_ich_score"},
+        "Hunt & Hess": {"name": "Hunt & Hess Scale", "desc": "Phân loại xuất huyết dưới nhện", "status": "✅", "module": "hunt_hess", "compute": "adjust_hunt_hess_grade"},
+        "mRS": {"name": "mRS - Modified Rankin Scale", "desc": "Mức độ khuyết tật sau đột quỵ", "status": "✅", "module": "mrs", "compute": None},
+    },
+
+    "gi": {
+        "BISAP": {"name": "BISAP Score", "desc": "Tiên lượng viêm tụy cấp (DÙNG HÀNG NGÀY)", "status": "✅", "module": "bisap", "compute": "calculate_bisap"},
+        "Child-Pugh": {"name": "Child-Pugh Score", "desc": "Mức độ xơ gan", "status": "✅", "module": "child_pugh", "compute": "calculate_child_pugh"},
+        "MELD": {"name": "MELD Score", "desc": "Tiên lượng bệnh gan mạn & ghép gan", "status": "✅", "module": "meld", "compute": "calculate_meld"},
+        "Glasgow-Blatchford": {"name": "Glasgow-Blatchford Score", "desc": "UGIB - quyết định xuất viện", "status": "✅", "module": "glasgow_blatchford", "compute": "calculate_gbs"},
+        "Rockall Score": {"name": "Rockall Score", "desc": "UGIB - tiên lượng tử vong", "status": "✅", "module": "rockall", "compute": "get_rockall_risk"},
+        "MELD-Na": {"name": "MELD-Na", "desc": "MELD điều chỉnh theo Na", "status": "✅", "module": "meld_na", "compute": "calculate_meld_na"},
+        "Ranson": {"name": "Ranson Criteria", "desc": "Tiên lượng viêm tụy cấp", "status": "✅", "module": "ranson", "compute": "calculate_ranson"},
+    },
+
+    "hematology": {
+        "Padua": {"name": "Padua Prediction Score", "desc": "Nguy cơ VTE - Chỉ định prophylaxis (DÙNG HÀNG NGÀY)", "status": "✅", "module": "padua", "compute": "calculate_padua"},
+        "Wells DVT": {"name": "Wells DVT Score", "desc": "Nguy cơ huyết khối tĩnh mạch sâu", "status": "✅", "module": "wells_dvt", "compute": "calculate_wells_dvt"},
+        "4Ts Score": {"name": "4Ts Score - HIT", "desc": "Giảm tiểu cầu do heparin", "status": "✅", "module": "four_ts", "compute": "calculate_4ts_score"},
+        "DIC Score": {"name": "DIC Score (ISTH)", "desc": "Đông máu rải rác trong lòng mạch", "status": "✅", "module": "dic_score", "compute": "calculate_dic_score"},
+    },
+
+    "nephrology": {
+        "eGFR": {"name": "eGFR - CKD-EPI & MDRD", "desc": "Tính tốc độ lọc cầu thận (DÙNG HÀNG NGÀY)", "status": "✅", "module": "egfr", "compute": "calculate_ckd_epi"},
+        "KDIGO": {"name": "KDIGO Staging", "desc": "Giai đoạn AKI (Tiêu chuẩn hiện đại)", "status": "✅", "module": "kdigo", "compute": "calculate_kdigo"},
+        "RIFLE": {"name": "RIFLE Criteria", "desc": "Phân loại AKI (Historical)", "status": "✅", "module": "rifle", "compute": "calculate_rifle"},
+        "AKIN": {"name": "AKIN Criteria", "desc": "Suy thận cấp (Historical)", "status": "✅", "module": "akin", "compute": "calculate_akin"},
+    },
+
+    "trauma": {
+        "RTS": {"name": "RTS - Revised Trauma Score", "desc": "Tiên lượng chấn thương (sinh lý)", "status": "✅", "module": "rts", "compute": "calculate_rts"},
+        "ISS": {"name": "ISS - Injury Severity Score", "desc": "Mức độ nặng đa chấn thương (giải phẫu)", "status": "✅", "module": "iss", "compute": "calculate_iss"},
+        "NEXUS": {"name": "NEXUS C-Spine", "desc": "Cần chụp X-quang cột sống cổ", "status": "✅", "module": "nexus", "compute": "evaluate_nexus"},
+        "Canadian C-Spine": {"name": "Canadian C-Spine Rule", "desc": "Chỉ định chụp cột sống cổ", "status": "✅", "module": "canadian_cspine", "compute": "evaluate_canadian_cspine"},
+    },
+
+    "ent": {
+        "Epworth": {"name": "Epworth Sleepiness Scale", "desc": "Đánh giá buồn ngủ ban ngày", "status": "✅", "module": "epworth", "compute": "calculate_epworth"},
+        "STOP-BANG": {"name": "STOP-BANG Score", "desc": "Sàng lọc OSA", "status": "✅", "module": "stop_bang", "compute": "calculate_stop_bang"},
+    },
+
+    "pediatrics": {
+        "Westley Croup": {"name": "Westley Croup Score", "desc": "Mức độ nặng croup (DÙNG HÀNG NGÀY)", "status": "✅", "module": "westley_croup", "compute": "calculate_westley_croup"},
+        "PEWS": {"name": "PEWS - Pediatric Early Warning Score", "desc": "Cảnh báo sớm nhi", "status": "✅", "module": "pews", "compute": "calculate_pews"},
+        "APGAR": {"name": "APGAR Score", "desc": "Đánh giá trẻ sơ sinh", "status": "✅", "module": "apgar", "compute": "calculate_apgar"},
+        "Pediatric GCS": {"name": "Pediatric GCS", "desc": "Ý thức trẻ em", "status": "✅", "module": "pediatric_gcs", "compute": "calculate_pediatric_gcs"},
+    },
+
+    "obstetrics": {
+        "Preeclampsia": {"name": "Preeclampsia Severity", "desc": "Mức độ nặng tiền sản giật (DÙNG HÀNG NGÀY)", "status": "✅", "module": "preeclampsia", "compute": "get_severe_features"},
+        "Bishop Score": {"name": "Bishop Score", "desc": "Đánh giá cổ tử cung", "status": "✅", "module": "bishop", "compute": "calculate_bishop_score"},
+        "Modified Bishop": {"name": "Modified Bishop Score", "desc": "Dự đoán chuyển dạ", "status": "✅", "module": "modified_bishop", "compute": "calculate_modified_bishop"},
+    },
+
+    "metabolism": {
+        "CrCl": {"name": "CrCl - Cockcroft-Gault", "desc": "Độ thanh thải Creatinine - Điều chỉnh liều thuốc (DÙNG HÀNG NGÀY)", "status": "✅", "module": "crcl", "compute": "calculate_crcl"},
+        "BMI/IBW/BSA": {"name": "BMI | IBW | BSA", "desc": "Chỉ số cơ thể - BMI, Cân nặng lý tưởng, Diện tích da (DÙNG HÀNG NGÀY)", "status": "✅", "module": "bmi_ibw_bsa", "compute": "calculate_bmi"},
+        "Osmolality": {"name": "Serum Osmolality & Gap", "desc": "Độ thẩm thấu - Nghi ngờ ngộ độc (DÙNG HÀNG NGÀY)", "status": "✅", "module": "osmolality", "compute": "calculate_osmolality"},
+        "Anion Gap": {"name": "Anion Gap", "desc": "Khoảng trống anion - rối loạn acid-base", "status": "✅", "module": "anion_gap", "compute": "calculate_anion_gap"},
+        "Corrected Ca": {"name": "Corrected Calcium", "desc": "Canxi điều chỉnh theo albumin", "status": "✅", "module": "corrected_calcium", "compute": "calculate_corrected_calcium"},
+        "FENa": {"name": "FENa - Fractional Excretion of Sodium", "desc": "Phân biệt AKI tiền thận/thận", "status": "✅", "module": "fena", "compute": "calculate_fena"},
+        "HbA1c": {"name": "HbA1c - eAG Converter", "desc": "Chuyển đổi HbA1c sang đường huyết trung bình", "status": "✅", "module": "hba1c_eag", "compute": "calculate_eag_from_hba1c"},
+        "Winter Formula": {"name": "Winter Formula", "desc": "PCO2 dự đoán trong toan chuyển hóa", "status": "✅", "module": "winter_formula", "compute": "calculate_expected_pco2"},
+        "Free T4 Index": {"name": "Free T4 Index (FTI)", "desc": "Chỉ số T4 tự do", "status": "✅", "module": "free_t4_index", "compute": "calculate_fti"},
+    },
+
+    "rheumatology": {
+        "DAS28": {"name": "DAS28 - Disease Activity Score", "desc": "Hoạt động bệnh viêm khớp dạng thấp", "status": "✅", "module": "das28", "compute": "calculate_das28_esr"},
+        "CDAI": {"name": "CDAI - Clinical Disease Activity Index", "desc": "Chỉ số hoạt động lâm sàng RA", "status": "✅", "module": "cdai", "compute": "calculate_cdai"},
+        "SDAI": {"name": "SDAI - Simplified Disease Activity Index", "desc": "Chỉ số đơn giản hóa RA", "status": "✅", "module": "sdai", "compute": "calculate_sdai"},
+        "ACR Criteria": {"name": "ACR/EULAR RA Classification", "desc": "Tiêu chuẩn chẩn đoán viêm khớp dạng thấp", "status": "✅", "module": "acr_ra", "compute": "calculate_acr_ra"},
+        "SLICC": {"name": "SLICC Criteria", "desc": "Tiêu chuẩn lupus ban đỏ hệ thống", "status": "✅", "module": "slicc", "compute": "meets_slicc"},
+        "SLEDAI": {"name": "SLEDAI - SLE Disease Activity Index", "desc": "Hoạt động bệnh lupus", "status": "✅", "module": "sledai", "compute": "interpret_sledai"},
+        "Gout Diagnostic": {"name": "ACR/EULAR Gout Classification", "desc": "Chẩn đoán bệnh gout", "status": "✅", "module": "gout", "compute": "calculate_gout_score"},
+    },
+
+    "infectious": {
+        "SIRS": {"name": "SIRS - Systemic Inflammatory Response", "desc": "Hội chứng đáp ứng viêm toàn thân", "status": "✅", "module": "sirs", "compute": "calculate_sirs"},
+        "Pitt Bacteremia": {"name": "Pitt Bacteremia Score", "desc": "Tiên lượng nhiễm khuẩn huyết", "status": "✅", "module": "pitt_bacteremia", "compute": "calculate_pitt"},
+        "MASCC": {"name": "MASCC Risk Index", "desc": "Nguy cơ sốt giảm bạch cầu hạt", "status": "✅", "module": "mascc", "compute": "calculate_mascc"},
+        "Centor": {"name": "Centor Score", "desc": "Viêm họng do liên cầu", "status": "✅", "module": "centor", "compute": "calculate_centor"},
+        "FeverPAIN": {"name": "FeverPAIN Score", "desc": "Viêm amidan - cần kháng sinh", "status": "✅", "module": "feverpain", "compute": "calculate_feverpain"},
+    },
+
+    "dermatology": {
+        "PASI": {"name": "PASI - Psoriasis Area Severity Index", "desc": "Mức độ nặng vẩy nến", "status": "✅", "module": "pasi", "compute": "calculate_pasi"},
+        "SCORAD": {"name": "SCORAD - SCORing Atopic Dermatitis", "desc": "Điểm viêm da cơ địa", "status": "✅", "module": "scorad", "compute": "calculate_scorad"},
+        "DLQI": {"name": "DLQI - Dermatology Life Quality Index", "desc": "Chất lượng cuộc sống bệnh da", "status": "✅", "module": "dlqi", "compute": "calculate_dlqi"},
+        "Burn TBSA": {"name": "TBSA - Total Body Surface Area", "desc": "Diện tích bỏng (quy tắc số 9)", "status": "✅", "module": "burn_tbsa", "compute": "calculate_tbsa"},
+        "Parkland Formula": {"name": "Parkland Formula", "desc": "Truyền dịch ban đầu cho bỏng", "status": "✅", "module": "parkland", "compute": "calculate_parkland"},
+    },
+
+    "oncology": {
+        "ECOG": {"name": "ECOG Performance Status", "desc": "Trạng thái thể trạng bệnh nhân ung thư", "status": "✅", "module": "ecog", "compute": "get_ecog_criteria"},
+        "Karnofsky": {"name": "Karnofsky Performance Scale", "desc": "Thang đo thể trạng", "status": "✅", "module": "karnofsky", "compute": "interpret_karnofsky"},
+        "Palliative Performance": {"name": "PPS - Palliative Performance Scale", "desc": "Thể trạng chăm sóc giảm nhẹ", "status": "✅", "module": "pps", "compute": "interpret_pps"},
+        "CIPN Grading": {"name": "CIPN Grading", "desc": "Phân độ tổn thương thần kinh ngoại biên", "status": "✅", "module": "cipn", "compute": None},
+    },
+
+    "psychiatry": {
+        "PHQ-9": {"name": "PHQ-9 - Patient Health Questionnaire", "desc": "Sàng lọc trầm cảm", "status": "✅", "module": "phq9", "compute": "calculate_phq9"},
+        "GAD-7": {"name": "GAD-7 - Generalized Anxiety Disorder", "desc": "Rối loạn lo âu lan tỏa", "status": "✅", "module": "gad7", "compute": "calculate_gad7"},
+        "MMSE": {"name": "MMSE - Mini Mental State Exam", "desc": "Đánh giá nhận thức", "status": "✅", "module": "mmse", "compute": "calculate_mmse"},
+        "MoCA": {"name": "MoCA - Montreal Cognitive Assessment", "desc": "Đánh giá nhận thức Montreal", "status": "✅", "module": "moca", "compute": "calculate_moca"},
+        "CAM": {"name": "CAM - Confusion Assessment Method", "desc": "Đánh giá hôn mê lú lẫn", "status": "✅", "module": "cam", "compute": "evaluate_cam"},
+        "CIWA-Ar": {"name": "CIWA-Ar", "desc": "Cai rượu - mức độ nặng", "status": "✅", "module": "ciwa", "compute": "calculate_ciwa"},
+        "COWS": {"name": "COWS - Clinical Opiate Withdrawal", "desc": "Cai opioid", "status": "✅", "module": "cows", "compute": "calculate_cows"},
+    },
+
+    "surgery": {
+        "ASA": {"name": "ASA Physical Status", "desc": "Phân loại nguy cơ phẫu thuật", "status": "✅", "module": "asa", "compute": "get_asa_classification"},
+        "P-POSSUM": {"name": "P-POSSUM Score", "desc": "Nguy cơ tử vong phẫu thuật", "status": "✅", "module": "possum", "compute": "estimate_possum"},
+        "RCRI": {"name": "RCRI - Revised Cardiac Risk Index", "desc": "Nguy cơ tim mạch phẫu thuật", "status": "✅", "module": "rcri", "compute": "calculate_rcri"},
+        "Caprini": {"name": "Caprini VTE Risk Score", "desc": "Nguy cơ huyết khối sau phẫu thuật", "status": "✅", "module": "caprini", "compute": "calculate_caprini"},
+        "Aldrete Score": {"name": "Aldrete Score", "desc": "Hồi tỉnh sau gây mê", "status": "✅", "module": "aldrete", "compute": "calculate_aldrete"},
+        "Mallampati": {"name": "Mallampati Classification", "desc": "Đánh giá đường thở khó", "status": "✅", "module": "mallampati", "compute": "interpret_mallampati"},
+    },
+
+    "ophthalmology": {
+        "Intraocular Pressure": {"name": "IOP Correction", "desc": "Điều chỉnh nhãn áp theo CCT", "status": "✅", "module": "iop_correction", "compute": "calculate_corrected_iop"},
+    },
+}
+
+
+# ========== OTHER TOOLS ==========
+# Drugs, Labs, Ventilator and Protocols pages. "section" groups the sidebar,
+# "label" is the text shown in the page selector.
+
+TOOLS = {
+    # Antibiotics/Drugs
+    "crcl": {"name": "CrCl Calculator", "label": "🧮 Tính CrCl (Cockcroft-Gault)", "category": "Thuốc", "icon": "💊", "page": "Drugs",
+             "module": "antibiotics.crcl", "render": "render", "engine": "scores.engine.metabolism.crcl", "compute": "calculate_crcl"},
+    "vancomycin": {"name": "Vancomycin Dosing", "label": "💉 Vancomycin - Tính Liều", "category": "Thuốc", "icon": "💊", "page": "Drugs",
+                   "module": "antibiotics.vancomycin", "render": "render", "engine": "scores.engine.infectious.vancomycin_pk", "compute": "calculate_vancomycin_map"},
+    "aminoglycoside": {"name": "Aminoglycoside", "label": "💊 Aminoglycoside - Tính Liều", "category": "Thuốc", "icon": "💊", "page": "Drugs",
+                       "module": "antibiotics.aminoglycoside", "render": "render", "engine": "scores.engine.infectious.aminoglycoside_pk", "compute": "compare_regimens"},
+    "antibiotic_lookup": {"name": "Antibiotic Lookup", "label": "🔍 Tra Cứu Kháng Sinh", "category": "Thuốc", "icon": "💊", "page": "Drugs",
+                          "module": "antibiotics.database", "render": "render_antibiotic_lookup", "engine": "scores.engine.formulary", "compute": "get_renal_regimen"},
+    "antibiotic_database": {"name": "Antibiotic Database", "label": "📊 Cơ Sở Dữ Liệu", "category": "Thuốc", "icon": "💊", "page": "Drugs",
+                            "module": "antibiotics.database", "render": "render_database"},
+
+    # Labs
+    "cbc": {"name": "CBC", "label": "🩸 CBC - Complete Blood Count", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+            "module": "labs.cbc", "render": "render"},
+    "bmp": {"name": "BMP", "label": "🧪 BMP - Basic Metabolic Panel", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+            "module": "labs.bmp", "render": "render"},
+    "cmp": {"name": "CMP", "label": "🧪 CMP - Comprehensive Metabolic Panel", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+            "module": "labs.cmp", "render": "render"},
+    "lft": {"name": "LFT", "label": "🫀 LFT - Liver Function Tests", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+            "module": "labs.lft", "render": "render"},
+    "lipid": {"name": "Lipid Panel", "label": "💊 Lipid Panel", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+              "module": "labs.lipid", "render": "render"},
+    "cardiac_markers": {"name": "Cardiac Markers", "label": "❤️ Cardiac Markers", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+                        "module": "labs.cardiac", "render": "render"},
+    "coag": {"name": "Coagulation", "label": "🩸 Coagulation Panel", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+             "module": "labs.coag", "render": "render"},
+    "thyroid": {"name": "Thyroid", "label": "🦋 Thyroid Function Tests", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+                "module": "labs.thyroid", "render": "render"},
+    "abg": {"name": "ABG", "label": "💨 ABG - Arterial Blood Gas", "category": "Xét Nghiệm", "icon": "🔬", "page": "Labs",
+            "module": "labs.abg", "render": "render", "engine": "scores.engine.metabolism.abg", "compute": "calculate_abg"},
+
+    # Ventilator
+    "ardsnet": {"name": "ARDSNet Calculator", "label": "🫁 ARDSNet - Tidal Volume", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator",
+                "module": "ventilator.calculators", "render": "render_ardsnet"},
+    "initial_settings": {"name": "Initial Ventilator Settings", "label": "⚙️ Cài Đặt Ban Đầu", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator",
+                         "module": "ventilator.calculators", "render": "render_initial_settings"},
+    "waveforms": {"name": "Ventilator Waveform Analysis", "label": "📈 Phân Tích Dạng Sóng", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator",
+                  "module": "ventilator.calculators", "render": "render_waveform_analysis", "engine": "ventilator.waveforms", "compute": "analyze_waveform"},
+    "vent_compliance": {"name": "Ventilator Compliance Dashboard", "label": "🏥 Tuân Thủ Thở Máy (Khoa)", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator",
+                        "module": "ventilator.calculators", "render": "render_compliance_dashboard"},
+    "peep_fio2": {"name": "PEEP/FiO2 Table", "label": "📊 Bảng PEEP/FiO2", "category": "Thở Máy", "icon": "🫁", "page": "Ventilator",
+                  "module": "ventilator.tables", "render": "render_peep_fio2_table", "engine": "ventilator.peep_fio2", "compute": "next_peep_fio2_step"},
+
+    # Protocols
+    "sepsis": {"name": "Sepsis Bundle", "label": "🦠 Sepsis 1-Hour Bundle", "category": "Phác Đồ", "icon": "📋", "page": "Protocols",
+               "section": "🚨 Cấp Cứu (Emergency)", "module": "protocols.emergency", "render": "render_sepsis"},
+    "shock": {"name": "Shock Management", "label": "💔 Quản Lý Sốc", "category": "Phác Đồ", "icon": "📋", "page": "Protocols",
+              "section": "🚨 Cấp Cứu (Emergency)", "module": "protocols.emergency", "render": "render_shock"},
+    "copd": {"name": "COPD", "label": "🫁 COPD Exacerbation", "category": "Phác Đồ", "icon": "📋", "page": "Protocols",
+             "section": "🫁 Hô Hấp (Respiratory)", "module": "protocols.respiratory", "render": "render_copd"},
+    "asthma": {"name": "Asthma", "label": "🫁 Cơn Hen Cấp", "category": "Phác Đồ", "icon": "📋", "page": "Protocols",
+               "section": "🫁 Hô Hấp (Respiratory)", "module": "protocols.respiratory", "render": "render_asthma"},
+    "acs": {"name": "ACS", "label": "💔 ACS - Hội Chứng Vành Cấp", "category": "Phác Đồ", "icon": "📋", "page": "Protocols",
+            "section": "❤️ Tim Mạch (Cardiology)", "module": "protocols.cardiology", "render": "render_acs"},
+    "heart_failure": {"name": "Heart Failure", "label": "💔 Suy Tim Cấp", "category": "Phác Đồ", "icon": "📋", "page": "Protocols",
+                      "section": "❤️ Tim Mạch (Cardiology)", "module": "protocols.cardiology", "render": "render_hf"},
+}
+
+
+# Protocols defined in data/Protocols.csv, drawn by protocols.generic.render_protocol
+DATA_PROTOCOL_SECTION = "🗂️ Phác Đồ Dữ Liệu (Data-driven)"
+
+
+# ========== BUILD (once per process) ==========
+
+def _build_registry():
+    """
+    Flatten SCORES, TOOLS and data/Protocols.csv into one dict:
+    calculator_id -> entry
+
+    Every entry has the same keys: name, desc, status, label, category, icon,
+    page, section, specialty, module, render, engine, compute, topic (the
+    Protocols.csv topic_id passed to the render function, else None)
+    """
+    calculators = {}
+
+    for specialty, scores in SCORES.items():
+        spec = SPECIALTIES[specialty]
+        for calc_id, info in scores.items():
+            calculators[calc_id] = {
+                "name": info["name"],
+                "desc": info["desc"],
+                "status": info["status"],
+                "label": f"{info['status']} {info['name']}",
+                "category": spec["category"],
+                "icon": spec["icon"],
+                "page": "Scores",
+                "section": spec["label"],
+                "specialty": specialty,
+                "module": f"scores.{specialty}.{info['module']}",
+                "render": "render",
+                "engine": f"scores.engine.{specialty}.{info['module']}" if info["compute"] else None,
+                "compute": info["compute"],
+                "topic": None,
+            }
+
+    for calc_id, info in TOOLS.items():
+        if calc_id in calculators:
+            raise ValueError(f"Duplicate calculator id: {calc_id}")
+        calculators[calc_id] = {
+            "name": info["name"],
+            "desc": info.get("desc", ""),
+            "status": info.get("status", "✅"),
+            "label": info["label"],
+            "category": info["category"],
+            "icon": info["icon"],
+            "page": info["page"],
+            "section": info.get("section"),
+            "specialty": None,
+            "module": info["module"],
+            "render": info["render"],
+            "engine": info.get("engine"),
+            "compute": info.get("compute"),
+            "topic": None,
+        }
+
+    # Only topic_id / title are read here; steps are parsed on first render
+    for row in load_table("Protocols"):
+        if row["topic_id"] in calculators:
+            raise ValueError(f"Duplicate calculator id: {row['topic_id']}")
+        calculators[row["topic_id"]] = {
+            "name": row["title"],
+            "desc": row["summary_md"],
+            "status": "✅",
+            "label": f"📄 {row['title']}",
+            "category": "Phác Đồ",
+            "icon": "📋",
+            "page": "Protocols",
+            "section": DATA_PROTOCOL_SECTION,
+            "specialty": None,
+            "module": "protocols.generic",
+            "render": "render_protocol",
+            "engine": "scores.engine.data_protocols",
+            "compute": None,
+            "topic": row["topic_id"],
+        }
+
+    return calculators
+
+
+CALCULATORS = _build_registry()
+
+# Secondary indexes: page -> [ids], (page, section) -> [ids], in insertion order
+_BY_PAGE = {}
+_BY_SECTION = {}
+for _calc_id, _entry in CALCULATORS.items():
+    _BY_PAGE.setdefault(_entry["page"], []).append(_calc_id)
+    _BY_SECTION.setdefault((_entry["page"], _entry["section"]), []).append(_calc_id)
+
+# Lowercase text searched by search_calculators
+_SEARCH_TEXT = {
+    calc_id: f"{entry['name']} {entry['category']} {calc_id}".lower()
+    for calc_id, entry in CALCULATORS.items()
+}
+
+
+# ========== LOOKUP ==========
+
+def get_calculator(calculator_id):
+    """Return the registry entry for a calculator, or None"""
+    return CALCULATORS.get(calculator_id)
+
+
+def get_calculators(page=None, section=None):
+    """
+    List calculator ids, optionally filtered by page and sidebar section
+
+    Args:
+        page: "Scores", "Drugs", "Labs", "Ventilator" or "Protocols"
+        section: Sidebar group within the page (specialty label on Scores)
+
+    Returns:
+        List of calculator ids in display order
+    """
+    if page is None:
+        return list(CALCULATORS)
+    if section is None:
+        return list(_BY_PAGE.get(page, []))
+    return list(_BY_SECTION.get((page, section), []))
+
+
+def get_sections(page):
+    """Sidebar sections of a page, in display order"""
+    return [section for (p, section) in _BY_SECTION if p == page]
+
+
+def search_calculators(query):
+    """
+    Search calculators by name, category or id
+
+    Returns:
+        List of (calculator_id, entry) tuples
+    """
+    query = query.lower()
+    return [
+        (calc_id, CALCULATORS[calc_id])
+        for calc_id, text in _SEARCH_TEXT.items()
+        if query in text
+    ]
+
+
+# ========== DISPATCH (lazy import, cached per process) ==========
+
+@lru_cache(maxsize=None)
+def get_render_function(calculator_id):
+    """Import the calculator's UI module and return its render function, or None"""
+    entry = CALCULATORS.get(calculator_id)
+    if entry is None:
+        return None
+    module = importlib.import_module(entry["module"])
+    render = getattr(module, entry["render"])
+    return partial(render, entry["topic"]) if entry["topic"] else render
+
+
+@lru_cache(maxsize=None)
+def get_compute_function(calculator_id):
+    """
+    Import the calculator's headless engine module and return its main
+    compute function, or None if the calculator has no engine function
+    """
+    entry = CALCULATORS.get(calculator_id)
+    if entry is None or not entry["compute"]:
+        return None
+    module = importlib.import_module(entry["engine"])
+    return getattr(module, entry["compute"])
+
+
+@lru_cache(maxsize=None)
+def get_input_schema(calculator_id):
+    """
+    Input schema of a calculator, read from its compute function signature
+
+    Returns:
+        Tuple of dicts {"name", "required", "default"}; empty if the
+        calculator has no compute function
+    """
+    compute = get_compute_function(calculator_id)
+    if compute is None:
+        return ()
+
+    schema = []
+    for param in inspect.signature(compute).parameters.values():
+        required = param.default is inspect.Parameter.empty
+        schema.append({
+            "name": param.name,
+            "required": required,
+            "default": None if required else param.default,
+        })
+    return tuple(schema)
+
+
+def render_calculator(calculator_id):
+    """
+    Render a calculator by ID (used by every page router)
+
+    Args:
+        calculator_id: Key in CALCULATORS
+    """
+    render = get_render_function(calculator_id)
+    if render:
+        render()
+    else:
+        import streamlit as st
+        st.error(f"Calculator '{calculator_id}' not found!")
@@ -5,6 +5,8 @@ Stroke risk assessment in atrial fibrillation
 
 import streamlit as st
 
+from scores.engine.cardiology.cha2ds2vasc import calculate_cha2ds2vasc
+
 
 def render():
     """CHA₂DS₂-VASc Score Calculator"""
@@ -54,33 +56,10 @@ def render():
         )
         
         if st.button("🧮 Tính Điểm", type="primary", key="cha2ds2vasc_calc"):
-            score = 0
-            details = []
-            
-            if chf:
-                score += 1
-                details.append("✓ Suy tim (+1)")
-            if htn:
-                score += 1
-                details.append("✓ Tăng huyết áp (+1)")
-            if age_group == "65-74 tuổi":
-                score += 1
-                details.append("✓ Tuổi 65-74 (+1)")
-            elif age_group == "≥ 75 tuổi":
-                score += 2
-                details.append("✓ Tuổi ≥75 (+2)")
-            if dm:
-                score += 1
-                details.append("✓ Đái tháo đường (+1)")
-            if stroke:
-                score += 2
-                details.append("✓ Tiền sử đột quỵ/TIA (+2)")
-            if vasc:
-                score += 1
-                details.append("✓ Bệnh mạch máu (+1)")
-            if sex == "Nữ":
-                score += 1
-                details.append("✓ Giới tính nữ (+1)")
+            result = calculate_cha2ds2vasc(chf, htn, age_group, dm, stroke, vasc, sex)
+            score = result['score']
+            details = result['details']
+            risk = result['risk']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -88,22 +67,15 @@ def render():
                 if score == 0:
                     st.success(f"## CHA₂DS₂-VASc = {score}")
                     st.success("✅ Nguy cơ THẤP")
-                    risk = "0-0.2%/năm"
                 elif score == 1:
                     st.warning(f"## CHA₂DS₂-VASc = {score}")
                     st.warning("⚡ Nguy cơ TRUNG BÌNH")
-                    risk = "0.6-2.0%/năm"
                 elif score == 2:
                     st.warning(f"## CHA₂DS₂-VASc = {score}")
                     st.warning("⚠️ Nguy cơ TRUNG BÌNH-CAO")
-                    risk = "2.2%/năm"
                 else:
                     st.error(f"## CHA₂DS₂-VASc = {score}")
                     st.error("🚨 Nguy cơ CAO")
-                    if score <= 5:
-                        risk = f"{2.2 + (score-2)*1.5:.1f}%/năm"
-                    else:
-                        risk = ">10%/năm"
             
             st.markdown("### 💡 Giải Thích & Khuyến Cáo")
             st.markdown(f"**Nguy cơ đột quỵ hàng năm:** {risk}")
@@ -5,6 +5,8 @@ Tiêu chuẩn chẩn đoán viêm nội tâm mạc nhiễm khuẩn
 
 import streamlit as st
 
+from scores.engine.cardiology.duke import evaluate_duke
+
 
 def render():
     """Render Duke Criteria interface"""
@@ -149,22 +151,11 @@ def render():
     st.markdown("---")
     
     if st.button("📊 Đánh giá Duke Criteria", type="primary", use_container_width=True):
-        # Diagnosis
-        if (major_count >= 2) or (major_count >= 1 and minor_count >= 3) or (minor_count >= 5):
-            diagnosis = "DEFINITE IE"
-            color = "#dc3545"
-            icon = "🚨"
-            recommendation = "Chẩn đoán XÁC ĐỊNH viêm nội tâm mạc nhiễm khuẩn"
-        elif (major_count >= 1 and minor_count >= 1) or (minor_count >= 3):
-            diagnosis = "POSSIBLE IE"
-            color = "#ffc107"
-            icon = "⚠️"
-            recommendation = "NGHI NGỜ viêm nội tâm mạc - Cần theo dõi, xét nghiệm thêm"
-        else:
-            diagnosis = "REJECTED"
-            color = "#28a745"
-            icon = "✅"
-            recommendation = "Không đủ tiêu chí chẩn đoán IE"
+        result = evaluate_duke(major_count, minor_count)
+        diagnosis = result['diagnosis']
+        color = result['color']
+        icon = result['icon']
+        recommendation = result['recommendation']
         
         st.markdown("## 📊 Kết quả")
         
@@ -4,6 +4,8 @@ Framingham Risk Score Calculator
 
 import streamlit as st
 
+from scores.engine.cardiology.framingham import calculate_framingham
+
 
 def render():
     """Framingham Risk Score Calculator"""
@@ -117,183 +119,13 @@ def render():
         )
         
         if st.button("🧮 Tính Framingham Risk", type="primary", key="fram_calc"):
-            points = 0
-            
-            # Simplified Framingham calculation (point-based)
-            # This is a simplified version - real implementation would use precise coefficients
-            
-            # Age points
-            if sex == "Nam":
-                if age < 35:
-                    age_pts = -1
-                elif age < 40:
-                    age_pts = 0
-                elif age < 45:
-                    age_pts = 1
-                elif age < 50:
-                    age_pts = 2
-                elif age < 55:
-                    age_pts = 3
-                elif age < 60:
-                    age_pts = 4
-                elif age < 65:
-                    age_pts = 5
-                elif age < 70:
-                    age_pts = 6
-                else:
-                    age_pts = 7
-            else:  # Female
-                if age < 35:
-                    age_pts = -9
-                elif age < 40:
-                    age_pts = -4
-                elif age < 45:
-                    age_pts = 0
-                elif age < 50:
-                    age_pts = 3
-                elif age < 55:
-                    age_pts = 6
-                elif age < 60:
-                    age_pts = 7
-                elif age < 65:
-                    age_pts = 8
-                elif age < 70:
-                    age_pts = 8
-                else:
-                    age_pts = 8
-            
-            points += age_pts
-            
-            # Total Cholesterol points
-            if sex == "Nam":
-                if total_chol < 160:
-                    chol_pts = -3
-                elif total_chol < 200:
-                    chol_pts = 0
-                elif total_chol < 240:
-                    chol_pts = 1
-                elif total_chol < 280:
-                    chol_pts = 2
-                else:
-                    chol_pts = 3
-            else:
-                if total_chol < 160:
-                    chol_pts = -2
-                elif total_chol < 200:
-                    chol_pts = 0
-                elif total_chol < 240:
-                    chol_pts = 1
-                elif total_chol < 280:
-                    chol_pts = 2
-                else:
-                    chol_pts = 3
-            
-            points += chol_pts
-            
-            # HDL points
-            if hdl >= 60:
-                hdl_pts = -2
-            elif hdl >= 50:
-                hdl_pts = -1
-            elif hdl >= 45:
-                hdl_pts = 0
-            elif hdl >= 35:
-                hdl_pts = 1
-            else:
-                hdl_pts = 2
-            
-            points += hdl_pts
-            
-            # Blood pressure points
-            if bp_treated:
-                if sbp < 120:
-                    bp_pts = -1 if sex == "Nữ" else 0
-                elif sbp < 130:
-                    bp_pts = 2 if sex == "Nữ" else 1
-                elif sbp < 140:
-                    bp_pts = 3 if sex == "Nữ" else 2
-                elif sbp < 160:
-                    bp_pts = 5 if sex == "Nữ" else 3
-                else:
-                    bp_pts = 6 if sex == "Nữ" else 3
-            else:
-                if sbp < 120:
-                    bp_pts = -3 if sex == "Nữ" else 0
-                elif sbp < 130:
-                    bp_pts = 0
-                elif sbp < 140:
-                    bp_pts = 1
-                elif sbp < 160:
-                    bp_pts = 2
-                else:
-                    bp_pts = 3
-            
-            points += bp_pts
-            
-            # Smoking
-            if smoker:
-                smoke_pts = 3 if sex == "Nữ" else 4
-                points += smoke_pts
-            
-            # Diabetes
-            if diabetes:
-                dm_pts = 4 if sex == "Nữ" else 2
-                points += dm_pts
-            
-            # Calculate risk percentage (simplified)
-            if sex == "Nam":
-                if points < 0:
-                    risk_pct = 1
-                elif points <= 4:
-                    risk_pct = 2
-                elif points <= 6:
-                    risk_pct = 4
-                elif points <= 7:
-                    risk_pct = 7
-                elif points <= 8:
-                    risk_pct = 11
-                elif points <= 9:
-                    risk_pct = 14
-                elif points <= 10:
-                    risk_pct = 18
-                elif points <= 11:
-                    risk_pct = 22
-                elif points <= 12:
-                    risk_pct = 27
-                else:
-                    risk_pct = 35
-            else:  # Female
-                if points < -2:
-                    risk_pct = 1
-                elif points <= 2:
-                    risk_pct = 2
-                elif points <= 4:
-                    risk_pct = 3
-                elif points <= 5:
-                    risk_pct = 4
-                elif points <= 6:
-                    risk_pct = 5
-                elif points <= 7:
-                    risk_pct = 6
-                elif points <= 8:
-                    risk_pct = 8
-                elif points <= 9:
-                    risk_pct = 11
-                elif points <= 11:
-                    risk_pct = 13
-                else:
-                    risk_pct = 20
-            
-            # Risk category
-            if risk_pct < 10:
-                risk_cat = "thấp"
-                color = "success"
-            elif risk_pct < 20:
-                risk_cat = "trung bình"
-                color = "warning"
-            else:
-                risk_cat = "cao"
-                color = "error"
+            result = calculate_framingham(
+                sex, age, total_chol, hdl, bp_treated, sbp, smoker, diabetes
+            )
+            points = result['points']
+            risk_pct = result['risk_pct']
+            risk_cat = result['risk_cat']
+            color = result['color']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
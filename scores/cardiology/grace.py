@@ -4,6 +4,8 @@ GRACE Score Calculator
 
 import streamlit as st
 
+from scores.engine.cardiology.grace import calculate_grace
+
 
 def render():
     """GRACE Score Calculator"""
@@ -111,129 +113,16 @@ def render():
         )
         
         if st.button("🧮 Tính GRACE Score", type="primary", key="grace_calc"):
-            # Calculate points for each variable
-            points = 0
-            details = []
-            
-            # Age points
-            if age < 30:
-                age_pts = 0
-            elif age <= 39:
-                age_pts = 8
-            elif age <= 49:
-                age_pts = 25
-            elif age <= 59:
-                age_pts = 41
-            elif age <= 69:
-                age_pts = 58
-            elif age <= 79:
-                age_pts = 75
-            elif age <= 89:
-                age_pts = 91
-            else:
-                age_pts = 100
-            points += age_pts
-            details.append(f"Tuổi {age}: {age_pts} điểm")
-            
-            # Heart rate points
-            if hr < 50:
-                hr_pts = 0
-            elif hr <= 69:
-                hr_pts = 3
-            elif hr <= 89:
-                hr_pts = 9
-            elif hr <= 109:
-                hr_pts = 15
-            elif hr <= 149:
-                hr_pts = 24
-            elif hr <= 199:
-                hr_pts = 38
-            else:
-                hr_pts = 46
-            points += hr_pts
-            details.append(f"Nhịp tim {hr}: {hr_pts} điểm")
-            
-            # Systolic BP points
-            if sbp < 80:
-                sbp_pts = 58
-            elif sbp <= 99:
-                sbp_pts = 53
-            elif sbp <= 119:
-                sbp_pts = 43
-            elif sbp <= 139:
-                sbp_pts = 34
-            elif sbp <= 159:
-                sbp_pts = 24
-            elif sbp <= 199:
-                sbp_pts = 10
-            else:
-                sbp_pts = 0
-            points += sbp_pts
-            details.append(f"HA tâm thu {sbp}: {sbp_pts} điểm")
-            
-            # Creatinine points
-            if scr_mgdl < 0.4:
-                scr_pts = 1
-            elif scr_mgdl <= 0.79:
-                scr_pts = 4
-            elif scr_mgdl <= 1.19:
-                scr_pts = 7
-            elif scr_mgdl <= 1.59:
-                scr_pts = 10
-            elif scr_mgdl <= 1.99:
-                scr_pts = 13
-            elif scr_mgdl <= 3.99:
-                scr_pts = 21
-            else:
-                scr_pts = 28
-            points += scr_pts
-            details.append(f"Creatinine {scr_mgdl:.2f} mg/dL: {scr_pts} điểm")
-            
-            # Killip class points
-            killip_pts = (killip_class - 1) * 15 + (killip_class - 1) * 5 if killip_class > 1 else 0
-            if killip_class == 1:
-                killip_pts = 0
-            elif killip_class == 2:
-                killip_pts = 20
-            elif killip_class == 3:
-                killip_pts = 39
-            else:  # Class 4
-                killip_pts = 59
-            points += killip_pts
-            details.append(f"Killip Class {killip_class}: {killip_pts} điểm")
-            
-            # Cardiac arrest points
-            if cardiac_arrest:
-                points += 39
-                details.append("Ngừng tuần hoàn: 39 điểm")
-            
-            # ST deviation points
-            if st_deviation:
-                points += 28
-                details.append("ST chênh: 28 điểm")
-            
-            # Elevated enzymes points
-            if enzymes:
-                points += 14
-                details.append("Enzyme tăng: 14 điểm")
-            
-            # Risk calculation
-            # In-hospital mortality risk
-            if points <= 108:
-                risk_category = "thấp"
-                hospital_mort = "<1%"
-                six_month_mort = "<3%"
-                color_class = "success"
-            elif points <= 140:
-                risk_category = "trung bình"
-                hospital_mort = "1-3%"
-                six_month_mort = "3-8%"
-                color_class = "warning"
-            else:
-                risk_category = "cao"
-                hospital_mort = ">3%"
-                six_month_mort = ">8%"
-                color_class = "error"
+            result = calculate_grace(
+                age, hr, sbp, scr_mgdl, killip_class,
+                cardiac_arrest, st_deviation, enzymes
+            )
+            points = result['points']
+            details = result['details']
+            risk_category = result['risk_category']
+            hospital_mort = result['hospital_mort']
+            six_month_mort = result['six_month_mort']
+            color_class = result['color_class']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -5,6 +5,8 @@ Bleeding risk assessment in patients on anticoagulation
 
 import streamlit as st
 
+from scores.engine.cardiology.hasbled import calculate_hasbled
+
 
 def render():
     """HAS-BLED Score Calculator"""
@@ -48,36 +50,9 @@ def render():
         alcohol = st.checkbox("Lạm dụng rượu", help=">8 đơn vị/tuần")
         
         if st.button("🧮 Tính Điểm HAS-BLED", type="primary", key="hasbled_calc"):
-            score = 0
-            details = []
-            
-            if htn_uncontrolled:
-                score += 1
-                details.append("✓ THA không kiểm soát (+1)")
-            if renal:
-                score += 1
-                details.append("✓ Suy thận (+1)")
-            if liver:
-                score += 1
-                details.append("✓ Suy gan (+1)")
-            if stroke_bled:
-                score += 1
-                details.append("✓ Tiền sử đột quỵ (+1)")
-            if bleeding:
-                score += 1
-                details.append("✓ Tiền sử chảy máu (+1)")
-            if labile_inr:
-                score += 1
-                details.append("✓ INR không ổn định (+1)")
-            if age_hasbled:
-                score += 1
-                details.append("✓ Tuổi >65 (+1)")
-            if drugs:
-                score += 1
-                details.append("✓ Dùng chống tiểu cầu/NSAID (+1)")
-            if alcohol:
-                score += 1
-                details.append("✓ Lạm dụng rượu (+1)")
+            result = calculate_hasbled(htn_uncontrolled, renal, liver, stroke_bled, bleeding, labile_inr, age_hasbled, drugs, alcohol)
+            score = result['score']
+            details = result['details']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -4,6 +4,8 @@ HEART Score Calculator
 
 import streamlit as st
 
+from scores.engine.cardiology.heart import calculate_heart_score
+
 
 def render():
     """HEART Score Calculator"""
@@ -83,14 +85,6 @@ def render():
         if st.checkbox("Tiền sử bệnh mạch vành đã biết", key="rf_cad"):
             risk_factors.append("CAD")
         
-        num_rf = len(risk_factors)
-        if num_rf == 0 or (num_rf == 1 and "CAD" not in risk_factors):
-            risk = 0
-        elif num_rf >= 3 or "CAD" in risk_factors:
-            risk = 2
-        else:
-            risk = 1
-        
         # Troponin
         st.markdown("#### T - Troponin")
         troponin_score = st.radio(
@@ -105,7 +99,11 @@ def render():
         troponin = int(troponin_score[0])
         
         if st.button("🧮 Tính HEART Score", type="primary", key="heart_calc"):
-            total_score = history + ecg + age + risk + troponin
+            result = calculate_heart_score(history, ecg, age, risk_factors, troponin)
+            total_score = result['total_score']
+            risk = result['risk']
+            num_rf = result['num_rf']
+            mace_risk = result['mace_risk']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -113,18 +111,12 @@ def render():
                 if total_score <= 3:
                     st.success(f"## HEART = {total_score}")
                     st.success("✅ Nguy cơ THẤP")
-                    mace_risk = "0.9-1.7%"
-                    color = "success"
                 elif total_score <= 6:
                     st.warning(f"## HEART = {total_score}")
                     st.warning("⚠️ Nguy cơ TRUNG BÌNH")
-                    mace_risk = "12-16.6%"
-                    color = "warning"
                 else:
                     st.error(f"## HEART = {total_score}")
                     st.error("🚨 Nguy cơ CAO")
-                    mace_risk = "50-65%"
-                    color = "error"
             
             st.markdown("### 💡 Chi Tiết Điểm")
             st.write(f"- **H** (History): {history} điểm")
@@ -5,6 +5,8 @@ Phân loại chức năng suy tim theo New York Heart Association
 
 import streamlit as st
 
+from scores.engine.cardiology.nyha import classify_nyha
+
 
 def render():
     """Render NYHA Classification interface"""
@@ -95,75 +97,7 @@ def render():
     
     # Display results
     if st.button("📋 Xác định NYHA Class", type="primary", use_container_width=True):
-        # Determine class
-        classifications = {
-            "class1": {
-                "class": "Class I",
-                "roman": "I",
-                "description": "Không hạn chế hoạt động thể lực",
-                "details": """
-                - Hoạt động thể lực bình thường KHÔNG gây mệt, hồi hộp hoặc khó thở
-                - Không có triệu chứng với hoạt động hàng ngày
-                - Có thể leo cầu thang nhiều tầng không khó thở
-                - Có thể chơi thể thao nhẹ
-                """,
-                "color": "#28a745",
-                "icon": "✅",
-                "prognosis": "Tiên lượng tốt",
-                "mortality": "Tỷ lệ tử vong 1 năm: ~5%"
-            },
-            "class2": {
-                "class": "Class II",
-                "roman": "II",
-                "description": "Hạn chế nhẹ hoạt động thể lực",
-                "details": """
-                - Thoải mái khi nghỉ
-                - Hoạt động thể lực bình thường gây mệt, hồi hộp hoặc khó thở
-                - Khó thở khi leo cầu thang, đi nhanh, mang vác
-                - Có thể làm việc nhà nhẹ nhàng
-                - Có thể đi bộ khoảng cách vừa phải
-                """,
-                "color": "#ffc107",
-                "icon": "⚠️",
-                "prognosis": "Tiên lượng tương đối tốt",
-                "mortality": "Tỷ lệ tử vong 1 năm: ~10-15%"
-            },
-            "class3": {
-                "class": "Class III",
-                "roman": "III",
-                "description": "Hạn chế rõ rệt hoạt động thể lực",
-                "details": """
-                - Thoải mái khi nghỉ
-                - Hoạt động thể lực NHẸ HƠN bình thường gây triệu chứng
-                - Khó thở khi đi bộ bình thường, tắm rửa, thay quần áo
-                - Chỉ có thể làm việc nhà rất nhẹ
-                - Khó đi bộ quãng đường ngắn
-                """,
-                "color": "#fd7e14",
-                "icon": "🔶",
-                "prognosis": "Tiên lượng kém hơn",
-                "mortality": "Tỷ lệ tử vong 1 năm: ~20-30%"
-            },
-            "class4": {
-                "class": "Class IV",
-                "roman": "IV",
-                "description": "Không thể hoạt động thể lực không khó chịu",
-                "details": """
-                - Triệu chứng khi NGHỈ
-                - Khó chịu tăng lên với BẤT KỲ hoạt động nào
-                - Khó thở ngay cả khi nằm hoặc ngồi
-                - Cần nằm đầu cao
-                - Không thể tự chăm sóc bản thân
-                - Phụ thuộc hoàn toàn vào người khác
-                """,
-                "color": "#dc3545",
-                "icon": "🚨",
-                "prognosis": "Tiên lượng xấu",
-                "mortality": "Tỷ lệ tử vong 1 năm: ~40-60%"
-            }
-        }
-        
-        result = classifications[option]
+        result = classify_nyha(option)
         
         # Main result
         st.markdown("## 📊 Kết quả")
@@ -4,162 +4,16 @@ Tính QT điều chỉnh theo nhịp tim
 """
 
 import streamlit as st
-import math
 
-
-def calculate_qtc_bazett(qt_ms, hr):
-    """
-    Calculate QTc using Bazett's formula (most common)
-    QTc = QT / √RR
-    
-    Args:
-        qt_ms: QT interval in milliseconds
-        hr: Heart rate in bpm
-    
-    Returns:
-        float: QTc in milliseconds
-    """
-    rr_sec = 60 / hr
-    qtc = qt_ms / math.sqrt(rr_sec)
-    return qtc
-
-
-def calculate_qtc_fridericia(qt_ms, hr):
-    """
-    Calculate QTc using Fridericia's formula
-    QTc = QT / ∛RR
-    More accurate at extreme heart rates
-    
-    Args:
-        qt_ms: QT interval in milliseconds
-        hr: Heart rate in bpm
-    
-    Returns:
-        float: QTc in milliseconds
-    """
-    rr_sec = 60 / hr
-    qtc = qt_ms / (rr_sec ** (1/3))
-    return qtc
-
-
-def calculate_qtc_framingham(qt_ms, hr):
-    """
-    Calculate QTc using Framingham's formula
-    QTc = QT + 154 × (1 - RR)
-    
-    Args:
-        qt_ms: QT interval in milliseconds
-        hr: Heart rate in bpm
-    
-    Returns:
-        float: QTc in milliseconds
-    """
-    rr_sec = 60 / hr
-    qtc = qt_ms + 154 * (1 - rr_sec)
-    return qtc
-
-
-def calculate_qtc_hodges(qt_ms, hr):
-    """
-    Calculate QTc using Hodges' formula
-    QTc = QT + 1.75 × (HR - 60)
-    
-    Args:
-        qt_ms: QT interval in milliseconds
-        hr: Heart rate in bpm
-    
-    Returns:
-        float: QTc in milliseconds
-    """
-    qtc = qt_ms + 1.75 * (hr - 60)
-    return qtc
-
-
-def interpret_qtc(qtc, gender):
-    """
-    Interpret QTc based on gender-specific cutoffs
-    
-    Args:
-        qtc: QTc in milliseconds
-        gender: "Nam" or "Nữ"
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if gender == "Nam":
-        normal_upper = 450
-        borderline = 450
-        prolonged = 470
-    else:  # Nữ
-        normal_upper = 460
-        borderline = 460
-        prolonged = 480
-    
-    if qtc < normal_upper:
-        return {
-            "status": "Bình thường",
-            "color": "🟢",
-            "risk": "Nguy cơ thấp",
-            "recommendation": "Không cần can thiệp đặc biệt",
-            "severity": "normal"
-        }
-    elif qtc < prolonged:
-        return {
-            "status": "Giới hạn (Borderline)",
-            "color": "🟡",
-            "risk": "Nguy cơ trung bình rối loạn nhịp",
-            "recommendation": "Theo dõi, xem xét nguyên nhân, điều chỉnh thuốc gây kéo dài QT",
-            "severity": "borderline"
-        }
-    elif qtc < 500:
-        return {
-            "status": "Kéo dài",
-            "color": "🟠",
-            "risk": "Nguy cơ cao Torsades de Pointes",
-            "recommendation": "Cần can thiệp: Dừng thuốc gây kéo dài QT, điều chỉnh điện giải, theo dõi sát",
-            "severity": "prolonged"
-        }
-    else:
-        return {
-            "status": "Kéo dài nghiêm trọng",
-            "color": "🔴",
-            "risk": "Nguy cơ rất cao đột tử do rối loạn nhịp",
-            "recommendation": "CẤP CỨU: Dừng ngay thuốc gây kéo dài QT, điều chỉnh K+/Mg2+, cân nhắc pacing tạm thời",
-            "severity": "severe"
-        }
-
-
-def get_qtc_prolonging_drugs():
-    """Return common QT-prolonging drugs by category"""
-    return {
-        "Kháng sinh": [
-            "Macrolides (Azithromycin, Erythromycin, Clarithromycin)",
-            "Fluoroquinolones (Moxifloxacin, Levofloxacin)",
-            "Antifungals (Fluconazole, Voriconazole)"
-        ],
-        "Tim mạch": [
-            "Amiodarone, Sotalol, Dronedarone",
-            "Quinidine, Procainamide, Disopyramide",
-            "Dofetilide, Ibutilide"
-        ],
-        "Tâm thần": [
-            "Haloperidol, Droperidol",
-            "Citalopram, Escitalopram",
-            "Tricyclic antidepressants (Amitriptyline)",
-            "Quetiapine, Ziprasidone"
-        ],
-        "Khác": [
-            "Methadone, Cocaine",
-            "Ondansetron (liều cao)",
-            "Domperidone",
-            "Hydroxychloroquine, Chloroquine"
-        ]
-    }
-
-
-def calculate_rr_interval(hr):
-    """Calculate RR interval from heart rate"""
-    return 60 / hr
+from scores.engine.cardiology.qtc import (
+    calculate_qtc_bazett,
+    calculate_qtc_fridericia,
+    calculate_qtc_framingham,
+    calculate_qtc_hodges,
+    interpret_qtc,
+    get_qtc_prolonging_drugs,
+    calculate_rr_interval,
+)
 
 
 def render():
@@ -635,4 +489,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
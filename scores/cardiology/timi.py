@@ -4,6 +4,8 @@ TIMI Risk Score Calculator
 
 import streamlit as st
 
+from scores.engine.cardiology.timi import calculate_timi
+
 
 def render():
     """TIMI Risk Score Calculator"""
@@ -19,18 +21,12 @@ def render():
     with col1:
         st.markdown("### 📋 Tiêu Chí (7 Tiêu Chuẩn)")
         
-        score = 0
-        details = []
-        
         # Age >= 65
         age_65 = st.checkbox(
             "**Tuổi ≥ 65**",
             help="1 điểm nếu tuổi ≥65",
             key="timi_age"
         )
-        if age_65:
-            score += 1
-            details.append("✓ Tuổi ≥65 (+1)")
         
         # >= 3 CAD risk factors
         st.markdown("**≥ 3 Yếu tố nguy cơ mạch vành**")
@@ -51,19 +47,12 @@ def render():
             if st.checkbox("TSGĐ bệnh mạch vành", key="timi_fhx"):
                 rf_count += 1
         
-        if rf_count >= 3:
-            score += 1
-            details.append(f"✓ ≥3 yếu tố nguy cơ ({rf_count}) (+1)")
-        
         # Known CAD (stenosis >= 50%)
         known_cad = st.checkbox(
             "**Bệnh mạch vành đã biết** (hẹp ≥50%)",
             help="1 điểm nếu có tiền sử can thiệp hoặc hẹp mạch vành đã biết",
             key="timi_cad"
         )
-        if known_cad:
-            score += 1
-            details.append("✓ Bệnh mạch vành đã biết (+1)")
         
         # Aspirin use in past 7 days
         aspirin = st.checkbox(
@@ -71,9 +60,6 @@ def render():
             help="1 điểm - nghịch lý cho thấy nguy cơ cao hơn",
             key="timi_aspirin"
         )
-        if aspirin:
-            score += 1
-            details.append("✓ Dùng aspirin 7 ngày qua (+1)")
         
         # Severe angina (>= 2 episodes in 24h)
         severe_angina = st.checkbox(
@@ -81,9 +67,6 @@ def render():
             help="1 điểm nếu có ≥2 đợt đau trong 24h",
             key="timi_angina"
         )
-        if severe_angina:
-            score += 1
-            details.append("✓ Đau thắt ngực nặng (+1)")
         
         # ST changes >= 0.5mm
         st_changes = st.checkbox(
@@ -91,9 +74,6 @@ def render():
             help="ST chênh lên hoặc xuống ≥0.5mm",
             key="timi_st"
         )
-        if st_changes:
-            score += 1
-            details.append("✓ ST chênh ≥0.5mm (+1)")
         
         # Elevated cardiac markers
         elevated_markers = st.checkbox(
@@ -101,9 +81,13 @@ def render():
             help="1 điểm nếu troponin hoặc CK-MB tăng",
             key="timi_markers"
         )
-        if elevated_markers:
-            score += 1
-            details.append("✓ Marker tim tăng (+1)")
+        
+        result = calculate_timi(
+            age_65, rf_count, known_cad, aspirin,
+            severe_angina, st_changes, elevated_markers
+        )
+        score = result['score']
+        details = result['details']
         
         if st.button("🧮 Tính TIMI Risk Score", type="primary", key="timi_calc"):
             with col2:
@@ -122,18 +106,6 @@ def render():
                     st.error("🚨 Nguy cơ CAO")
                     risk_level = "cao"
             
-            # Risk percentages based on score
-            risk_data = {
-                0: "4.7%",
-                1: "8.3%",
-                2: "13.2%",
-                3: "19.9%",
-                4: "26.2%",
-                5: "40.9%",
-                6: "52.2%",
-                7: "65.0%"
-            }
-            
             st.markdown("### 💡 Chi Tiết Điểm")
             if details:
                 for d in details:
@@ -145,7 +117,7 @@ def render():
             st.markdown("### 📈 Nguy Cơ Tử Vong/MI/Tái Can Thiệp (14 Ngày)")
             st.metric(
                 label="Nguy cơ sự kiện bất lợi",
-                value=risk_data.get(score, ">65%"),
+                value=result['risk'],
                 delta=f"TIMI Score = {score}"
             )
             
@@ -153,7 +125,7 @@ def render():
             
             if score <= 2:
                 st.success(f"""
-                **Nguy cơ {risk_level} ({risk_data.get(score)})**
+                **Nguy cơ {risk_level} ({result['risk']})**
                 
                 **Chiến lược bảo tồn (Conservative):**
                 - ✅ Có thể xuất viện sớm nếu ổn định
@@ -166,7 +138,7 @@ def render():
             
             elif score <= 4:
                 st.warning(f"""
-                **Nguy cơ {risk_level} ({risk_data.get(score)})**
+                **Nguy cơ {risk_level} ({result['risk']})**
                 
                 **Chiến lược xâm lấn sớm (Early Invasive):**
                 - ⚠️ Nhập viện theo dõi
@@ -179,7 +151,7 @@ def render():
             
             else:
                 st.error(f"""
-                **Nguy cơ {risk_level} ({risk_data.get(score)})**
+                **Nguy cơ {risk_level} ({result['risk']})**
                 
                 **Chiến lược xâm lấn khẩn cấp (Urgent Invasive):**
                 - 🚨 Nhập viện ICU/CCU
@@ -3,38 +3,19 @@ Dermatology Scoring Systems
 Skin disease calculators
 """
 
-from .pasi import render as render_pasi
-from .scorad import render as render_scorad
-from .dlqi import render as render_dlqi
-from .burn_tbsa import render as render_burn_tbsa
-from .parkland import render as render_parkland
+from registry import render_calculator
 
 
 def render_dermatology_calculator(calculator_id):
     """
     Route to the correct dermatology calculator based on ID
-    
+
+    Calculator modules are looked up in registry.py and imported on first use.
+
     Args:
         calculator_id: The ID of the calculator to render
     """
-    import streamlit as st
-    
-    calculators = {
-        "PASI": render_pasi,
-        "SCORAD": render_scorad,
-        "DLQI": render_dlqi,
-        "Burn TBSA": render_burn_tbsa,
-        "Parkland Formula": render_parkland,
-    }
-    
-    calculator_func = calculators.get(calculator_id)
-    if calculator_func:
-        calculator_func()
-    else:
-        st.error(f"Calculator '{calculator_id}' not found!")
-
+    render_calculator(calculator_id)
 
-__all__ = [
-    'render_dermatology_calculator',
-]
 
+__all__ = ['render_dermatology_calculator']
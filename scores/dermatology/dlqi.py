@@ -5,22 +5,8 @@ Chỉ số chất lượng cuộc sống bệnh da
 
 import streamlit as st
 
-def calculate_dlqi(q1, q2, q3, q4, q5, q6, q7, q8, q9, q10):
-    """Tính DLQI"""
-    total = q1 + q2 + q3 + q4 + q5 + q6 + q7 + q8 + q9 + q10
-    
-    if total <= 1:
-        impact = "Không ảnh hưởng"; color = "green"
-    elif total <= 5:
-        impact = "Ảnh hưởng nhỏ"; color = "green"
-    elif total <= 10:
-        impact = "Ảnh hưởng trung bình"; color = "orange"
-    elif total <= 20:
-        impact = "Ảnh hưởng lớn"; color = "orange"
-    else:
-        impact = "Ảnh hưởng rất lớn"; color = "red"
-    
-    return {"total_score": total, "impact": impact, "color": color}
+from scores.engine.dermatology.dlqi import calculate_dlqi
+
 
 def render():
     st.markdown("<h2 style='text-align: center; color: #EC4899;'>🩹 DLQI</h2><p style='text-align: center;'><em>Chất lượng cuộc sống bệnh da</em></p>", unsafe_allow_html=True)
@@ -61,6 +47,6 @@ def render():
         - 21-30: Ảnh hưởng rất lớn
         """)
 
+
 if __name__ == "__main__":
     render()
-
@@ -5,26 +5,7 @@ Công thức truyền dịch cho bệnh nhân bỏng
 
 import streamlit as st
 
-
-def calculate_parkland(tbsa, weight):
-    """
-    Parkland Formula: 4 ml × TBSA% × Weight(kg) trong 24h
-    
-    50% trong 8h đầu, 50% trong 16h sau
-    """
-    total_24h = 4 * tbsa * weight
-    first_8h = total_24h / 2
-    next_16h = total_24h / 2
-    rate_first_8h = first_8h / 8
-    rate_next_16h = next_16h / 16
-    
-    return {
-        "total_24h": total_24h,
-        "first_8h": first_8h,
-        "next_16h": next_16h,
-        "rate_first_8h": rate_first_8h,
-        "rate_next_16h": rate_next_16h
-    }
+from scores.engine.dermatology.parkland import calculate_parkland
 
 
 def render():
@@ -148,4 +129,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -23,360 +23,8 @@ Clinical Utility:
 """
 
 import streamlit as st
-import math
 
-
-def get_temp_score(temp: float) -> int:
-    """Temperature score"""
-    if temp >= 41:
-        return 4
-    elif temp >= 39:
-        return 3
-    elif temp >= 38.5:
-        return 1
-    elif temp >= 36:
-        return 0
-    elif temp >= 34:
-        return 1
-    elif temp >= 32:
-        return 2
-    elif temp >= 30:
-        return 3
-    else:
-        return 4
-
-
-def get_map_score(map_val: float) -> int:
-    """Mean arterial pressure score"""
-    if map_val >= 160:
-        return 4
-    elif map_val >= 130:
-        return 3
-    elif map_val >= 110:
-        return 2
-    elif map_val >= 70:
-        return 0
-    elif map_val >= 50:
-        return 2
-    else:
-        return 4
-
-
-def get_hr_score(hr: float) -> int:
-    """Heart rate score"""
-    if hr >= 180:
-        return 4
-    elif hr >= 140:
-        return 3
-    elif hr >= 110:
-        return 2
-    elif hr >= 70:
-        return 0
-    elif hr >= 55:
-        return 2
-    elif hr >= 40:
-        return 3
-    else:
-        return 4
-
-
-def get_rr_score(rr: float) -> int:
-    """Respiratory rate score"""
-    if rr >= 50:
-        return 4
-    elif rr >= 35:
-        return 3
-    elif rr >= 25:
-        return 1
-    elif rr >= 12:
-        return 0
-    elif rr >= 10:
-        return 1
-    elif rr >= 6:
-        return 2
-    else:
-        return 4
-
-
-def get_oxygenation_score(fio2: float, pao2: float, paco2: float, ph: float) -> int:
-    """Oxygenation score - A-a gradient if FiO2≥0.5, else PaO2"""
-    if fio2 >= 50:  # Use A-a gradient
-        # A-a gradient = [(FiO2 × (Patm - PH2O)) - (PaCO2/0.8)] - PaO2
-        # Simplified: ≈ (FiO2 × 713) - (PaCO2/0.8) - PaO2
-        aa_gradient = (fio2 * 7.13) - (paco2 / 0.8) - pao2
-        if aa_gradient >= 500:
-            return 4
-        elif aa_gradient >= 350:
-            return 3
-        elif aa_gradient >= 200:
-            return 2
-        elif aa_gradient < 200:
-            return 0
-    else:  # Use PaO2
-        if pao2 < 55:
-            return 4
-        elif pao2 < 60:
-            return 3
-        elif pao2 < 70:
-            return 1
-        else:
-            return 0
-    return 0
-
-
-def get_ph_score(ph: float) -> int:
-    """Arterial pH score"""
-    if ph >= 7.7:
-        return 4
-    elif ph >= 7.6:
-        return 3
-    elif ph >= 7.5:
-        return 1
-    elif ph >= 7.33:
-        return 0
-    elif ph >= 7.25:
-        return 2
-    elif ph >= 7.15:
-        return 3
-    else:
-        return 4
-
-
-def get_na_score(na: float) -> int:
-    """Serum sodium score"""
-    if na >= 180:
-        return 4
-    elif na >= 160:
-        return 3
-    elif na >= 155:
-        return 2
-    elif na >= 150:
-        return 1
-    elif na >= 130:
-        return 0
-    elif na >= 120:
-        return 2
-    elif na >= 111:
-        return 3
-    else:
-        return 4
-
-
-def get_k_score(k: float) -> int:
-    """Serum potassium score"""
-    if k >= 7:
-        return 4
-    elif k >= 6:
-        return 3
-    elif k >= 5.5:
-        return 1
-    elif k >= 3.5:
-        return 0
-    elif k >= 3:
-        return 1
-    elif k >= 2.5:
-        return 2
-    else:
-        return 4
-
-
-def get_cr_score(cr: float, has_arf: bool) -> int:
-    """Serum creatinine score (double if acute renal failure)"""
-    if cr >= 3.5:
-        base_score = 4
-    elif cr >= 2:
-        base_score = 3
-    elif cr >= 1.5:
-        base_score = 2
-    elif cr >= 0.6:
-        base_score = 0
-    else:
-        base_score = 2
-    
-    return base_score * 2 if has_arf else base_score
-
-
-def get_hct_score(hct: float) -> int:
-    """Hematocrit score"""
-    if hct >= 60:
-        return 4
-    elif hct >= 50:
-        return 2
-    elif hct >= 46:
-        return 1
-    elif hct >= 30:
-        return 0
-    elif hct >= 20:
-        return 2
-    else:
-        return 4
-
-
-def get_wbc_score(wbc: float) -> int:
-    """White blood cell count score"""
-    if wbc >= 40:
-        return 4
-    elif wbc >= 20:
-        return 2
-    elif wbc >= 15:
-        return 1
-    elif wbc >= 3:
-        return 0
-    elif wbc >= 1:
-        return 2
-    else:
-        return 4
-
-
-def get_gcs_score(gcs: int) -> int:
-    """Glasgow Coma Scale score (15 - GCS)"""
-    return 15 - gcs
-
-
-def get_age_score(age: int) -> int:
-    """Age points"""
-    if age < 45:
-        return 0
-    elif age < 55:
-        return 2
-    elif age < 65:
-        return 3
-    elif age < 75:
-        return 5
-    else:
-        return 6
-
-
-def get_chronic_health_score(
-    has_chronic: bool,
-    is_post_emergency_surgery: bool,
-    is_nonsurgical: bool
-) -> int:
-    """Chronic health points"""
-    if not has_chronic:
-        return 0
-    
-    if is_nonsurgical or is_post_emergency_surgery:
-        return 5
-    else:  # Elective post-op
-        return 2
-
-
-def calculate_apache2(params: dict) -> dict:
-    """Calculate APACHE II score"""
-    
-    # Acute Physiology Score
-    aps = 0
-    details = []
-    
-    temp_score = get_temp_score(params['temperature'])
-    aps += temp_score
-    details.append(f"Nhiệt độ {params['temperature']:.1f}°C → {temp_score} điểm")
-    
-    map_score = get_map_score(params['map'])
-    aps += map_score
-    details.append(f"MAP {params['map']:.0f} mmHg → {map_score} điểm")
-    
-    hr_score = get_hr_score(params['heart_rate'])
-    aps += hr_score
-    details.append(f"Nhịp tim {params['heart_rate']:.0f} /min → {hr_score} điểm")
-    
-    rr_score = get_rr_score(params['respiratory_rate'])
-    aps += rr_score
-    details.append(f"Nhịp thở {params['respiratory_rate']:.0f} /min → {rr_score} điểm")
-    
-    oxy_score = get_oxygenation_score(
-        params['fio2'], params['pao2'], params['paco2'], params['ph']
-    )
-    aps += oxy_score
-    if params['fio2'] >= 50:
-        details.append(f"A-a gradient (FiO₂ ≥50%) → {oxy_score} điểm")
-    else:
-        details.append(f"PaO₂ {params['pao2']:.0f} mmHg → {oxy_score} điểm")
-    
-    ph_score = get_ph_score(params['ph'])
-    aps += ph_score
-    details.append(f"pH {params['ph']:.2f} → {ph_score} điểm")
-    
-    na_score = get_na_score(params['sodium'])
-    aps += na_score
-    details.append(f"Na {params['sodium']:.0f} mEq/L → {na_score} điểm")
-    
-    k_score = get_k_score(params['potassium'])
-    aps += k_score
-    details.append(f"K {params['potassium']:.1f} mEq/L → {k_score} điểm")
-    
-    cr_score = get_cr_score(params['creatinine'], params['has_arf'])
-    aps += cr_score
-    arf_note = " (×2 vì ARF)" if params['has_arf'] else ""
-    details.append(f"Creatinine {params['creatinine']:.1f} mg/dL → {cr_score} điểm{arf_note}")
-    
-    hct_score = get_hct_score(params['hematocrit'])
-    aps += hct_score
-    details.append(f"Hematocrit {params['hematocrit']:.1f}% → {hct_score} điểm")
-    
-    wbc_score = get_wbc_score(params['wbc'])
-    aps += wbc_score
-    details.append(f"WBC {params['wbc']:.1f} ×10³/μL → {wbc_score} điểm")
-    
-    gcs_score = get_gcs_score(params['gcs'])
-    aps += gcs_score
-    details.append(f"GCS {params['gcs']} → {gcs_score} điểm (15 - GCS)")
-    
-    # Age points
-    age_points = get_age_score(params['age'])
-    details.append(f"Tuổi {params['age']} → {age_points} điểm")
-    
-    # Chronic health points
-    chronic_points = get_chronic_health_score(
-        params['has_chronic_health'],
-        params['is_post_emergency_surgery'],
-        params['is_nonsurgical']
-    )
-    if chronic_points > 0:
-        details.append(f"Bệnh mạn tính → {chronic_points} điểm")
-    
-    # Total score
-    total_score = aps + age_points + chronic_points
-    
-    # Predicted mortality (from original APACHE II study)
-    # ln(R/(1-R)) = -3.517 + (APACHE II × 0.146)
-    logit = -3.517 + (total_score * 0.146)
-    predicted_mortality = 100 / (1 + math.exp(-logit))
-    
-    # Interpretation
-    if total_score < 10:
-        interpretation = "Mức độ nặng THẤP"
-        mortality_range = "<10%"
-        color = "🟢"
-    elif total_score < 15:
-        interpretation = "Mức độ nặng TRUNG BÌNH"
-        mortality_range = "10-25%"
-        color = "🟡"
-    elif total_score < 20:
-        interpretation = "Mức độ nặng CAO"
-        mortality_range = "25-40%"
-        color = "🟠"
-    elif total_score < 25:
-        interpretation = "Mức độ nặng RẤT CAO"
-        mortality_range = "40-55%"
-        color = "🟠"
-    else:
-        interpretation = "Mức độ nặng CỰC KỲ CAO"
-        mortality_range = ">55%"
-        color = "🔴"
-    
-    return {
-        'total_score': total_score,
-        'aps': aps,
-        'age_points': age_points,
-        'chronic_points': chronic_points,
-        'predicted_mortality': predicted_mortality,
-        'mortality_range': mortality_range,
-        'interpretation': interpretation,
-        'color': color,
-        'details': details
-    }
+from scores.engine.emergency.apache2 import calculate_apache2
 
 
 def render():
@@ -27,184 +27,7 @@ Clinical Utility:
 
 import streamlit as st
 
-
-def get_respiratory_score(pao2_fio2: float) -> int:
-    """Respiratory score based on PaO2/FiO2 ratio"""
-    if pao2_fio2 > 300:
-        return 0
-    elif pao2_fio2 > 226:
-        return 1
-    elif pao2_fio2 > 151:
-        return 2
-    elif pao2_fio2 > 76:
-        return 3
-    else:
-        return 4
-
-
-def get_renal_score(creatinine: float) -> int:
-    """Renal score based on serum creatinine"""
-    if creatinine <= 1.1:
-        return 0
-    elif creatinine <= 1.7:
-        return 1
-    elif creatinine <= 2.5:
-        return 2
-    elif creatinine <= 3.6:
-        return 3
-    else:
-        return 4
-
-
-def get_hepatic_score(bilirubin: float) -> int:
-    """Hepatic score based on serum bilirubin"""
-    if bilirubin <= 1.2:
-        return 0
-    elif bilirubin <= 3.5:
-        return 1
-    elif bilirubin <= 7.1:
-        return 2
-    elif bilirubin <= 10.6:
-        return 3
-    else:
-        return 4
-
-
-def get_cardiovascular_score(hr: float, map_val: float) -> int:
-    """Cardiovascular score based on PAR (Pressure-Adjusted Heart Rate)
-    PAR = HR × CVP / MAP (simplified: HR / MAP when CVP not available)
-    Using simplified version: HR × (Right Atrial Pressure / MAP)
-    Even more simplified: Just use HR and MAP relationship
-    """
-    # Simplified PAR calculation
-    if map_val > 0:
-        par = hr / map_val
-    else:
-        par = 10  # Default high value
-    
-    if par <= 10.0:
-        return 0
-    elif par <= 15.0:
-        return 1
-    elif par <= 20.0:
-        return 2
-    elif par <= 30.0:
-        return 3
-    else:
-        return 4
-
-
-def get_hematologic_score(platelets: float) -> int:
-    """Hematologic score based on platelet count"""
-    if platelets > 120:
-        return 0
-    elif platelets > 80:
-        return 1
-    elif platelets > 50:
-        return 2
-    elif platelets > 20:
-        return 3
-    else:
-        return 4
-
-
-def get_neurologic_score(gcs: int) -> int:
-    """Neurologic score based on Glasgow Coma Scale"""
-    if gcs >= 15:
-        return 0
-    elif gcs >= 13:
-        return 1
-    elif gcs >= 10:
-        return 2
-    elif gcs >= 7:
-        return 3
-    else:
-        return 4
-
-
-def calculate_mods(
-    pao2: float,
-    fio2: float,
-    creatinine: float,
-    bilirubin: float,
-    heart_rate: float,
-    map_value: float,
-    platelets: float,
-    gcs: int
-) -> dict:
-    """Calculate MODS score"""
-    
-    # Calculate PaO2/FiO2 ratio
-    pao2_fio2 = (pao2 / fio2) * 100 if fio2 > 0 else 500
-    
-    # Calculate subscores
-    subscores = {}
-    details = []
-    
-    resp_score = get_respiratory_score(pao2_fio2)
-    subscores['respiratory'] = resp_score
-    details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → {resp_score} điểm")
-    
-    renal_score = get_renal_score(creatinine)
-    subscores['renal'] = renal_score
-    details.append(f"**Thận:** Creatinine = {creatinine:.1f} mg/dL → {renal_score} điểm")
-    
-    hepatic_score = get_hepatic_score(bilirubin)
-    subscores['hepatic'] = hepatic_score
-    details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} mg/dL → {hepatic_score} điểm")
-    
-    cv_score = get_cardiovascular_score(heart_rate, map_value)
-    subscores['cardiovascular'] = cv_score
-    par = heart_rate / map_value if map_value > 0 else 0
-    details.append(f"**Tim mạch:** HR/MAP = {par:.1f} → {cv_score} điểm")
-    
-    hematologic_score = get_hematologic_score(platelets)
-    subscores['hematologic'] = hematologic_score
-    details.append(f"**Huyết học:** Tiểu cầu = {platelets:.0f} → {hematologic_score} điểm")
-    
-    neurologic_score = get_neurologic_score(gcs)
-    subscores['neurologic'] = neurologic_score
-    details.append(f"**Thần kinh:** GCS = {gcs} → {neurologic_score} điểm")
-    
-    # Total score
-    total_score = sum(subscores.values())
-    
-    # Interpretation (based on original Marshall study)
-    if total_score == 0:
-        interpretation = "Không có rối loạn cơ quan"
-        mortality = "<5%"
-        risk_class = "NONE"
-        color = "🟢"
-    elif total_score <= 4:
-        interpretation = "Rối loạn cơ quan nhẹ"
-        mortality = "5-10%"
-        risk_class = "MILD"
-        color = "🟡"
-    elif total_score <= 8:
-        interpretation = "Rối loạn cơ quan trung bình"
-        mortality = "10-25%"
-        risk_class = "MODERATE"
-        color = "🟡"
-    elif total_score <= 12:
-        interpretation = "Rối loạn cơ quan nặng"
-        mortality = "25-50%"
-        risk_class = "SEVERE"
-        color = "🟠"
-    else:
-        interpretation = "Rối loạn cơ quan rất nặng"
-        mortality = ">50%"
-        risk_class = "CRITICAL"
-        color = "🔴"
-    
-    return {
-        'total_score': total_score,
-        'subscores': subscores,
-        'interpretation': interpretation,
-        'mortality': mortality,
-        'risk_class': risk_class,
-        'color': color,
-        'details': details
-    }
+from scores.engine.emergency.mods import calculate_mods
 
 
 def render():
@@ -5,6 +5,8 @@ Sepsis-3 screening tool
 
 import streamlit as st
 
+from scores.engine.emergency.qsofa import calculate_qsofa
+
 
 def render():
     """qSOFA (Quick SOFA) Calculator"""
@@ -44,26 +46,9 @@ def render():
         )
         
         if st.button("🔢 Calculate qSOFA", type="primary"):
-            score = 0
-            details = []
-            
-            if rr >= 22:
-                score += 1
-                details.append("✓ Respiratory rate ≥22 /min (+1)")
-            else:
-                details.append("✗ Respiratory rate <22 /min (0)")
-            
-            if sbp <= 100:
-                score += 1
-                details.append("✓ Systolic BP ≤100 mmHg (+1)")
-            else:
-                details.append("✗ Systolic BP >100 mmHg (0)")
-            
-            if gcs < 15:
-                score += 1
-                details.append("✓ Altered mentation (GCS <15) (+1)")
-            else:
-                details.append("✗ GCS = 15 (0)")
+            result = calculate_qsofa(rr, sbp, gcs)
+            score = result['score']
+            details = result['details']
             
             with col2:
                 st.markdown("### Result")
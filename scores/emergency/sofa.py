@@ -29,217 +29,7 @@ Clinical Utility:
 
 import streamlit as st
 
-
-def calculate_sofa(
-    pao2_fio2: float,
-    platelets: float,
-    bilirubin: float,
-    map_value: float,
-    use_vasopressor: bool,
-    vasopressor_type: str,
-    vasopressor_dose: float,
-    gcs: int,
-    creatinine: float,
-    urine_output: float
-) -> dict:
-    """
-    Calculate SOFA Score
-    
-    Args:
-        pao2_fio2: PaO2/FiO2 ratio (mmHg)
-        platelets: Platelet count (×10³/μL)
-        bilirubin: Total bilirubin (mg/dL)
-        map_value: Mean arterial pressure (mmHg)
-        use_vasopressor: Whether patient is on vasopressors
-        vasopressor_type: Type of vasopressor (dopamine/dobutamine/epi/norepi)
-        vasopressor_dose: Vasopressor dose (mcg/kg/min)
-        gcs: Glasgow Coma Scale
-        creatinine: Serum creatinine (mg/dL)
-        urine_output: Urine output (mL/day)
-    
-    Returns:
-        Dictionary containing SOFA score, subscores, interpretation
-    """
-    
-    subscores = {}
-    details = []
-    
-    # 1. RESPIRATORY (PaO2/FiO2)
-    if pao2_fio2 >= 400:
-        subscores['respiratory'] = 0
-        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 0 điểm")
-    elif pao2_fio2 >= 300:
-        subscores['respiratory'] = 1
-        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 1 điểm")
-    elif pao2_fio2 >= 200:
-        subscores['respiratory'] = 2
-        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 2 điểm")
-    elif pao2_fio2 >= 100:
-        subscores['respiratory'] = 3
-        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 3 điểm")
-    else:
-        subscores['respiratory'] = 4
-        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 4 điểm")
-    
-    # 2. COAGULATION (Platelets)
-    if platelets >= 150:
-        subscores['coagulation'] = 0
-        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 0 điểm")
-    elif platelets >= 100:
-        subscores['coagulation'] = 1
-        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 1 điểm")
-    elif platelets >= 50:
-        subscores['coagulation'] = 2
-        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 2 điểm")
-    elif platelets >= 20:
-        subscores['coagulation'] = 3
-        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 3 điểm")
-    else:
-        subscores['coagulation'] = 4
-        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 4 điểm")
-    
-    # 3. LIVER (Bilirubin)
-    if bilirubin < 1.2:
-        subscores['liver'] = 0
-        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 0 điểm")
-    elif bilirubin < 2.0:
-        subscores['liver'] = 1
-        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 1 điểm")
-    elif bilirubin < 6.0:
-        subscores['liver'] = 2
-        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 2 điểm")
-    elif bilirubin < 12.0:
-        subscores['liver'] = 3
-        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 3 điểm")
-    else:
-        subscores['liver'] = 4
-        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 4 điểm")
-    
-    # 4. CARDIOVASCULAR
-    if use_vasopressor:
-        # On vasopressor
-        if vasopressor_type == "Dopamine" and vasopressor_dose < 5:
-            subscores['cardiovascular'] = 2
-            details.append(f"**Tim mạch:** Dopamine <5 mcg/kg/min → 2 điểm")
-        elif vasopressor_type == "Dopamine" and vasopressor_dose <= 15:
-            subscores['cardiovascular'] = 3
-            details.append(f"**Tim mạch:** Dopamine 5-15 mcg/kg/min → 3 điểm")
-        elif vasopressor_type == "Dopamine" and vasopressor_dose > 15:
-            subscores['cardiovascular'] = 4
-            details.append(f"**Tim mạch:** Dopamine >15 mcg/kg/min → 4 điểm")
-        elif vasopressor_type == "Dobutamine":
-            subscores['cardiovascular'] = 2
-            details.append(f"**Tim mạch:** Dobutamine (any dose) → 2 điểm")
-        elif vasopressor_type in ["Epinephrine", "Norepinephrine"]:
-            if vasopressor_dose <= 0.1:
-                subscores['cardiovascular'] = 3
-                details.append(f"**Tim mạch:** Epi/Norepi ≤0.1 mcg/kg/min → 3 điểm")
-            else:
-                subscores['cardiovascular'] = 4
-                details.append(f"**Tim mạch:** Epi/Norepi >0.1 mcg/kg/min → 4 điểm")
-    else:
-        # No vasopressor - use MAP
-        if map_value >= 70:
-            subscores['cardiovascular'] = 0
-            details.append(f"**Tim mạch:** MAP = {map_value:.0f} mmHg → 0 điểm")
-        else:
-            subscores['cardiovascular'] = 1
-            details.append(f"**Tim mạch:** MAP = {map_value:.0f} mmHg → 1 điểm")
-    
-    # 5. CENTRAL NERVOUS SYSTEM (GCS)
-    if gcs == 15:
-        subscores['cns'] = 0
-        details.append(f"**Thần kinh:** GCS = 15 → 0 điểm")
-    elif gcs >= 13:
-        subscores['cns'] = 1
-        details.append(f"**Thần kinh:** GCS = 13-14 → 1 điểm")
-    elif gcs >= 10:
-        subscores['cns'] = 2
-        details.append(f"**Thần kinh:** GCS = 10-12 → 2 điểm")
-    elif gcs >= 6:
-        subscores['cns'] = 3
-        details.append(f"**Thần kinh:** GCS = 6-9 → 3 điểm")
-    else:
-        subscores['cns'] = 4
-        details.append(f"**Thần kinh:** GCS = 3-5 → 4 điểm")
-    
-    # 6. RENAL
-    if creatinine < 1.2:
-        renal_by_cr = 0
-    elif creatinine < 2.0:
-        renal_by_cr = 1
-    elif creatinine < 3.5:
-        renal_by_cr = 2
-    elif creatinine < 5.0:
-        renal_by_cr = 3
-    else:
-        renal_by_cr = 4
-    
-    if urine_output >= 500:
-        renal_by_uo = 0
-    elif urine_output >= 200:
-        renal_by_uo = 3
-    else:
-        renal_by_uo = 4
-    
-    subscores['renal'] = max(renal_by_cr, renal_by_uo)
-    
-    if renal_by_uo > renal_by_cr:
-        details.append(f"**Thận:** UO = {urine_output:.0f} mL/24h → {subscores['renal']} điểm")
-    else:
-        details.append(f"**Thận:** Creatinine = {creatinine:.1f} mg/dL → {subscores['renal']} điểm")
-    
-    # Calculate total
-    total_score = sum(subscores.values())
-    
-    # Interpretation
-    if total_score == 0:
-        interpretation = "Không có suy cơ quan"
-        mortality = "<10%"
-        risk_class = "LOW"
-        color = "🟢"
-    elif total_score <= 6:
-        interpretation = "Suy cơ quan nhẹ"
-        mortality = "~10-20%"
-        risk_class = "MILD"
-        color = "🟡"
-    elif total_score <= 11:
-        interpretation = "Suy cơ quan trung bình"
-        mortality = "~20-40%"
-        risk_class = "MODERATE"
-        color = "🟠"
-    elif total_score <= 14:
-        interpretation = "Suy cơ quan nặng"
-        mortality = "~40-60%"
-        risk_class = "SEVERE"
-        color = "🔴"
-    else:
-        interpretation = "Suy cơ quan rất nặng"
-        mortality = ">60%"
-        risk_class = "CRITICAL"
-        color = "🔴"
-    
-    # Management based on score
-    if total_score >= 2:
-        sepsis_note = f"""
-        **⚠️ SOFA ≥2 điểm:**
-        - Đáp ứng tiêu chuẩn **SEPSIS-3** (nếu có nhiễm trùng/nghi ngờ nhiễm trùng)
-        - Cần đánh giá và xử trí nhiễm trùng huyết NGAY
-        - Xem xét Sepsis Bundle (SSC 2021)
-        """
-    else:
-        sepsis_note = ""
-    
-    return {
-        'total_score': total_score,
-        'subscores': subscores,
-        'interpretation': interpretation,
-        'mortality': mortality,
-        'risk_class': risk_class,
-        'color': color,
-        'details': details,
-        'sepsis_note': sepsis_note
-    }
+from scores.engine.emergency.sofa import calculate_sofa
 
 
 def render():
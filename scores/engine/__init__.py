@@ -0,0 +1,11 @@
+"""
+Scores Engine - Headless Clinical Calculators
+
+Pure compute functions for every calculator in scores/, organized by the same
+specialty packages. Nothing here imports Streamlit: each function takes plain
+values and returns plain values (usually a dict), and the render() functions
+in scores/<specialty>/ are thin UI wrappers around them.
+
+Usage:
+    from scores.engine.emergency.sofa import calculate_sofa
+"""
@@ -0,0 +1,3 @@
+"""
+Cardiology - headless compute functions
+"""
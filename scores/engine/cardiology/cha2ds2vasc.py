@@ -0,0 +1,70 @@
+"""
+CHA₂DS₂-VASc Score Calculator
+Stroke risk assessment in atrial fibrillation
+"""
+
+
+def calculate_cha2ds2vasc(
+    chf: bool,
+    htn: bool,
+    age_group: str,
+    dm: bool,
+    stroke: bool,
+    vasc: bool,
+    sex: str
+) -> dict:
+    """
+    Calculate CHA₂DS₂-VASc score
+
+    Args:
+        chf: Heart failure / LV dysfunction
+        htn: Hypertension
+        age_group: "< 65 tuổi", "65-74 tuổi" or "≥ 75 tuổi"
+        dm: Diabetes mellitus
+        stroke: Prior stroke / TIA / thromboembolism
+        vasc: Vascular disease
+        sex: "Nam" or "Nữ"
+
+    Returns:
+        dict: score, details and annual stroke risk
+    """
+    score = 0
+    details = []
+    
+    if chf:
+        score += 1
+        details.append("✓ Suy tim (+1)")
+    if htn:
+        score += 1
+        details.append("✓ Tăng huyết áp (+1)")
+    if age_group == "65-74 tuổi":
+        score += 1
+        details.append("✓ Tuổi 65-74 (+1)")
+    elif age_group == "≥ 75 tuổi":
+        score += 2
+        details.append("✓ Tuổi ≥75 (+2)")
+    if dm:
+        score += 1
+        details.append("✓ Đái tháo đường (+1)")
+    if stroke:
+        score += 2
+        details.append("✓ Tiền sử đột quỵ/TIA (+2)")
+    if vasc:
+        score += 1
+        details.append("✓ Bệnh mạch máu (+1)")
+    if sex == "Nữ":
+        score += 1
+        details.append("✓ Giới tính nữ (+1)")
+    
+    if score == 0:
+        risk = "0-0.2%/năm"
+    elif score == 1:
+        risk = "0.6-2.0%/năm"
+    elif score == 2:
+        risk = "2.2%/năm"
+    elif score <= 5:
+        risk = f"{2.2 + (score-2)*1.5:.1f}%/năm"
+    else:
+        risk = ">10%/năm"
+    
+    return {'score': score, 'details': details, 'risk': risk}
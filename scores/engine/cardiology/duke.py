@@ -0,0 +1,40 @@
+"""
+Duke Criteria for Infective Endocarditis
+Tiêu chuẩn chẩn đoán viêm nội tâm mạc nhiễm khuẩn
+"""
+
+
+def evaluate_duke(major_count: int, minor_count: int) -> dict:
+    """
+    Classify infective endocarditis by modified Duke criteria
+
+    Args:
+        major_count: Number of major criteria met
+        minor_count: Number of minor criteria met
+
+    Returns:
+        dict: diagnosis (DEFINITE IE / POSSIBLE IE / REJECTED) and display hints
+    """
+    # Diagnosis
+    if (major_count >= 2) or (major_count >= 1 and minor_count >= 3) or (minor_count >= 5):
+        diagnosis = "DEFINITE IE"
+        color = "#dc3545"
+        icon = "🚨"
+        recommendation = "Chẩn đoán XÁC ĐỊNH viêm nội tâm mạc nhiễm khuẩn"
+    elif (major_count >= 1 and minor_count >= 1) or (minor_count >= 3):
+        diagnosis = "POSSIBLE IE"
+        color = "#ffc107"
+        icon = "⚠️"
+        recommendation = "NGHI NGỜ viêm nội tâm mạc - Cần theo dõi, xét nghiệm thêm"
+    else:
+        diagnosis = "REJECTED"
+        color = "#28a745"
+        icon = "✅"
+        recommendation = "Không đủ tiêu chí chẩn đoán IE"
+    
+    return {
+        'diagnosis': diagnosis,
+        'color': color,
+        'icon': icon,
+        'recommendation': recommendation,
+    }
@@ -0,0 +1,161 @@
+"""
+GRACE Score Calculator
+"""
+
+
+def calculate_grace(
+    age: int,
+    hr: int,
+    sbp: int,
+    scr_mgdl: float,
+    killip_class: int,
+    cardiac_arrest: bool,
+    st_deviation: bool,
+    enzymes: bool
+) -> dict:
+    """
+    Calculate GRACE score (in-hospital / 6-month mortality after ACS)
+
+    Args:
+        age: Age (years)
+        hr: Heart rate (bpm)
+        sbp: Systolic BP (mmHg)
+        scr_mgdl: Serum creatinine (mg/dL)
+        killip_class: Killip class (1-4)
+        cardiac_arrest: Cardiac arrest at admission
+        st_deviation: ST-segment deviation
+        enzymes: Elevated cardiac enzymes
+
+    Returns:
+        dict: points, details, risk category and mortality estimates
+    """
+    points = 0
+    details = []
+
+    # Age points
+    if age < 30:
+        age_pts = 0
+    elif age <= 39:
+        age_pts = 8
+    elif age <= 49:
+        age_pts = 25
+    elif age <= 59:
+        age_pts = 41
+    elif age <= 69:
+        age_pts = 58
+    elif age <= 79:
+        age_pts = 75
+    elif age <= 89:
+        age_pts = 91
+    else:
+        age_pts = 100
+    points += age_pts
+    details.append(f"Tuổi {age}: {age_pts} điểm")
+
+    # Heart rate points
+    if hr < 50:
+        hr_pts = 0
+    elif hr <= 69:
+        hr_pts = 3
+    elif hr <= 89:
+        hr_pts = 9
+    elif hr <= 109:
+        hr_pts = 15
+    elif hr <= 149:
+        hr_pts = 24
+    elif hr <= 199:
+        hr_pts = 38
+    else:
+        hr_pts = 46
+    points += hr_pts
+    details.append(f"Nhịp tim {hr}: {hr_pts} điểm")
+
+    # Systolic BP points
+    if sbp < 80:
+        sbp_pts = 58
+    elif sbp <= 99:
+        sbp_pts = 53
+    elif sbp <= 119:
+        sbp_pts = 43
+    elif sbp <= 139:
+        sbp_pts = 34
+    elif sbp <= 159:
+        sbp_pts = 24
+    elif sbp <= 199:
+        sbp_pts = 10
+    else:
+        sbp_pts = 0
+    points += sbp_pts
+    details.append(f"HA tâm thu {sbp}: {sbp_pts} điểm")
+
+    # Creatinine points
+    if scr_mgdl < 0.4:
+        scr_pts = 1
+    elif scr_mgdl <= 0.79:
+        scr_pts = 4
+    elif scr_mgdl <= 1.19:
+        scr_pts = 7
+    elif scr_mgdl <= 1.59:
+        scr_pts = 10
+    elif scr_mgdl <= 1.99:
+        scr_pts = 13
+    elif scr_mgdl <= 3.99:
+        scr_pts = 21
+    else:
+        scr_pts = 28
+    points += scr_pts
+    details.append(f"Creatinine {scr_mgdl:.2f} mg/dL: {scr_pts} điểm")
+
+    # Killip class points
+    if killip_class == 1:
+        killip_pts = 0
+    elif killip_class == 2:
+        killip_pts = 20
+    elif killip_class == 3:
+        killip_pts = 39
+    else:  # Class 4
+        killip_pts = 59
+    points += killip_pts
+    details.append(f"Killip Class {killip_class}: {killip_pts} điểm")
+
+    # Cardiac arrest points
+    if cardiac_arrest:
+        points += 39
+        details.append("Ngừng tuần hoàn: 39 điểm")
+
+    # ST deviation points
+    if st_deviation:
+        points += 28
+        details.append("ST chênh: 28 điểm")
+
+    # Elevated enzymes points
+    if enzymes:
+        points += 14
+        details.append("Enzyme tăng: 14 điểm")
+
+    # Risk calculation
+    # In-hospital mortality risk
+    if points <= 108:
+        risk_category = "thấp"
+        hospital_mort = "<1%"
+        six_month_mort = "<3%"
+        color_class = "success"
+    elif points <= 140:
+        risk_category = "trung bình"
+        hospital_mort = "1-3%"
+        six_month_mort = "3-8%"
+        color_class = "warning"
+    else:
+        risk_category = "cao"
+        hospital_mort = ">3%"
+        six_month_mort = ">8%"
+        color_class = "error"
+    
+    return {
+        'points': points,
+        'details': details,
+        'risk_category': risk_category,
+        'hospital_mort': hospital_mort,
+        'six_month_mort': six_month_mort,
+        'color_class': color_class,
+    }
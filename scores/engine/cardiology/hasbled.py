@@ -0,0 +1,69 @@
+"""
+HAS-BLED Score Calculator
+Bleeding risk assessment in patients on anticoagulation
+"""
+
+
+def calculate_hasbled(
+    htn_uncontrolled: bool,
+    renal: bool,
+    liver: bool,
+    stroke_bled: bool,
+    bleeding: bool,
+    labile_inr: bool,
+    age_hasbled: bool,
+    drugs: bool,
+    alcohol: bool
+) -> dict:
+    """
+    Calculate HAS-BLED score (1 point per criterion)
+
+    Args:
+        htn_uncontrolled: Uncontrolled hypertension (SBP >160)
+        renal: Abnormal renal function
+        liver: Abnormal liver function
+        stroke_bled: Prior stroke
+        bleeding: Prior major bleeding or predisposition
+        labile_inr: Labile INR (TTR <60%)
+        age_hasbled: Age >65
+        drugs: Antiplatelet / NSAID use
+        alcohol: Alcohol ≥8 units/week
+
+    Returns:
+        dict: score and list of positive criteria
+    """
+    score = 0
+    details = []
+
+    if htn_uncontrolled:
+        score += 1
+        details.append("✓ THA không kiểm soát (+1)")
+    if renal:
+        score += 1
+        details.append("✓ Suy thận (+1)")
+    if liver:
+        score += 1
+        details.append("✓ Suy gan (+1)")
+    if stroke_bled:
+        score += 1
+        details.append("✓ Tiền sử đột quỵ (+1)")
+    if bleeding:
+        score += 1
+        details.append("✓ Tiền sử chảy máu (+1)")
+    if labile_inr:
+        score += 1
+        details.append("✓ INR không ổn định (+1)")
+    if age_hasbled:
+        score += 1
+        details.append("✓ Tuổi >65 (+1)")
+    if drugs:
+        score += 1
+        details.append("✓ Dùng chống tiểu cầu/NSAID (+1)")
+    if alcohol:
+        score += 1
+        details.append("✓ Lạm dụng rượu (+1)")
+    
+    return {
+        'score': score,
+        'details': details,
+    }
@@ -0,0 +1,64 @@
+"""
+HEART Score Calculator
+"""
+
+
+def get_heart_risk_factor_points(risk_factors: list) -> int:
+    """
+    Risk factor component (R) of the HEART score
+
+    Args:
+        risk_factors: Risk factor labels; "CAD" marks known coronary disease
+
+    Returns:
+        int: 0-2 points
+    """
+    num_rf = len(risk_factors)
+    if num_rf == 0 or (num_rf == 1 and "CAD" not in risk_factors):
+        return 0
+    elif num_rf >= 3 or "CAD" in risk_factors:
+        return 2
+    else:
+        return 1
+
+
+def calculate_heart_score(
+    history: int,
+    ecg: int,
+    age: int,
+    risk_factors: list,
+    troponin: int
+) -> dict:
+    """
+    Calculate HEART score
+
+    Args:
+        history: History points (0-2)
+        ecg: ECG points (0-2)
+        age: Age points (0-2)
+        risk_factors: Risk factor labels ("CAD" = known coronary disease)
+        troponin: Troponin points (0-2)
+
+    Returns:
+        dict: total_score, risk points, 6-week MACE risk and risk level
+    """
+    risk = get_heart_risk_factor_points(risk_factors)
+    total_score = history + ecg + age + risk + troponin
+    
+    if total_score <= 3:
+        mace_risk = "0.9-1.7%"
+        risk_level = "low"
+    elif total_score <= 6:
+        mace_risk = "12-16.6%"
+        risk_level = "moderate"
+    else:
+        mace_risk = "50-65%"
+        risk_level = "high"
+    
+    return {
+        'total_score': total_score,
+        'risk': risk,
+        'num_rf': len(risk_factors),
+        'mace_risk': mace_risk,
+        'risk_level': risk_level,
+    }
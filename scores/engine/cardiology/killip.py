@@ -0,0 +1,56 @@
+"""
+Killip Classification
+Phân loại suy tim cấp trong nhồi máu cơ tim
+"""
+
+KILLIP_CLASSES = {
+    "class1": {
+        "class": "I",
+        "name": "Class I",
+        "description": "Không suy tim",
+        "findings": "- Không ran ẩm\n- Không S3\n- Huyết động ổn định",
+        "mortality": "~5-6%",
+        "prevalence": "~40-50%",
+        "color": "#28a745"
+    },
+    "class2": {
+        "class": "II",
+        "name": "Class II",
+        "description": "Suy tim nhẹ-trung bình",
+        "findings": "- Ran ẩm ≤ ½ dưới phổi\n- S3 gallop\n- Tĩnh mạch cảnh nổi (JVP tăng)\n- Phù phổi nhẹ trên X-quang",
+        "mortality": "~15-20%",
+        "prevalence": "~30-40%",
+        "color": "#ffc107"
+    },
+    "class3": {
+        "class": "III",
+        "name": "Class III",
+        "description": "Phù phổi cấp",
+        "findings": "- Ran ẩm toàn bộ 2 phổi\n- Khó thở nặng\n- Ho bọt hồng\n- SpO₂ thấp",
+        "mortality": "~30-40%",
+        "prevalence": "~5-10%",
+        "color": "#fd7e14"
+    },
+    "class4": {
+        "class": "IV",
+        "name": "Class IV",
+        "description": "Shock tim",
+        "findings": "- HA tâm thu < 90 mmHg\n- Da lạnh, ẩm\n- Giảm nước tiểu (< 20 mL/h)\n- Lú lẫn\n- Lactate tăng",
+        "mortality": "~60-80%",
+        "prevalence": "~5-10%",
+        "color": "#dc3545"
+    }
+}
+
+
+def classify_killip(option: str) -> dict:
+    """
+    Look up Killip class details
+
+    Args:
+        option: "class1" ... "class4"
+
+    Returns:
+        dict: class, description, findings, in-hospital mortality, prevalence
+    """
+    return KILLIP_CLASSES[option]
@@ -0,0 +1,246 @@
+"""
+QTc - Corrected QT Interval Calculator
+Tính QT điều chỉnh theo nhịp tim
+"""
+
+import math
+
+import numpy as np
+
+
+# interpret_qtc() cut-offs (ms): (borderline from, prolonged from); ≥500 is severe
+QTC_CUTOFFS = {
+    "Nam": (450, 470),
+    "Nữ": (460, 480),
+}
+QTC_SEVERE = 500
+
+
+def calculate_qtc_bazett(qt_ms, hr):
+    """
+    Calculate QTc using Bazett's formula (most common)
+    QTc = QT / √RR
+    
+    Args:
+        qt_ms: QT interval in milliseconds
+        hr: Heart rate in bpm
+    
+    Returns:
+        float: QTc in milliseconds
+    """
+    rr_sec = 60 / hr
+    qtc = qt_ms / math.sqrt(rr_sec)
+    return qtc
+
+
+def calculate_qtc_fridericia(qt_ms, hr):
+    """
+    Calculate QTc using Fridericia's formula
+    QTc = QT / ∛RR
+    More accurate at extreme heart rates
+    
+    Args:
+        qt_ms: QT interval in milliseconds
+        hr: Heart rate in bpm
+    
+    Returns:
+        float: QTc in milliseconds
+    """
+    rr_sec = 60 / hr
+    qtc = qt_ms / (rr_sec ** (1/3))
+    return qtc
+
+
+def calculate_qtc_framingham(qt_ms, hr):
+    """
+    Calculate QTc using Framingham's formula
+    QTc = QT + 154 × (1 - RR)
+    
+    Args:
+        qt_ms: QT interval in milliseconds
+        hr: Heart rate in bpm
+    
+    Returns:
+        float: QTc in milliseconds
+    """
+    rr_sec = 60 / hr
+    qtc = qt_ms + 154 * (1 - rr_sec)
+    return qtc
+
+
+def calculate_qtc_hodges(qt_ms, hr):
+    """
+    Calculate QTc using Hodges' formula
+    QTc = QT + 1.75 × (HR - 60)
+    
+    Args:
+        qt_ms: QT interval in milliseconds
+        hr: Heart rate in bpm
+    
+    Returns:
+        float: QTc in milliseconds
+    """
+    qtc = qt_ms + 1.75 * (hr - 60)
+    return qtc
+
+
+def interpret_qtc(qtc, gender):
+    """
+    Interpret QTc based on gender-specific cutoffs
+    
+    Args:
+        qtc: QTc in milliseconds
+        gender: "Nam" or "Nữ"
+    
+    Returns:
+        dict: Interpretation results
+    """
+    normal_upper, prolonged = QTC_CUTOFFS["Nam" if gender == "Nam" else "Nữ"]
+    
+    if qtc < normal_upper:
+        return {
+            "status": "Bình thường",
+            "color": "🟢",
+            "risk": "Nguy cơ thấp",
+            "recommendation": "Không cần can thiệp đặc biệt",
+            "severity": "normal"
+        }
+    elif qtc < prolonged:
+        return {
+            "status": "Giới hạn (Borderline)",
+            "color": "🟡",
+            "risk": "Nguy cơ trung bình rối loạn nhịp",
+            "recommendation": "Theo dõi, xem xét nguyên nhân, điều chỉnh thuốc gây kéo dài QT",
+            "severity": "borderline"
+        }
+    elif qtc < QTC_SEVERE:
+        return {
+            "status": "Kéo dài",
+            "color": "🟠",
+            "risk": "Nguy cơ cao Torsades de Pointes",
+            "recommendation": "Cần can thiệp: Dừng thuốc gây kéo dài QT, điều chỉnh điện giải, theo dõi sát",
+            "severity": "prolonged"
+        }
+    else:
+        return {
+            "status": "Kéo dài nghiêm trọng",
+            "color": "🔴",
+            "risk": "Nguy cơ rất cao đột tử do rối loạn nhịp",
+            "recommendation": "CẤP CỨU: Dừng ngay thuốc gây kéo dài QT, điều chỉnh K+/Mg2+, cân nhắc pacing tạm thời",
+            "severity": "severe"
+        }
+
+
+def get_qtc_prolonging_drugs():
+    """Return common QT-prolonging drugs by category"""
+    return {
+        "Kháng sinh": [
+            "Macrolides (Azithromycin, Erythromycin, Clarithromycin)",
+            "Fluoroquinolones (Moxifloxacin, Levofloxacin)",
+            "Antifungals (Fluconazole, Voriconazole)"
+        ],
+        "Tim mạch": [
+            "Amiodarone, Sotalol, Dronedarone",
+            "Quinidine, Procainamide, Disopyramide",
+            "Dofetilide, Ibutilide"
+        ],
+        "Tâm thần": [
+            "Haloperidol, Droperidol",
+            "Citalopram, Escitalopram",
+            "Tricyclic antidepressants (Amitriptyline)",
+            "Quetiapine, Ziprasidone"
+        ],
+        "Khác": [
+            "Methadone, Cocaine",
+            "Ondansetron (liều cao)",
+            "Domperidone",
+            "Hydroxychloroquine, Chloroquine"
+        ]
+    }
+
+
+def calculate_rr_interval(hr):
+    """Calculate RR interval from heart rate"""
+    return 60 / hr
+
+
+QTC_FORMULAS = ['bazett', 'fridericia', 'framingham', 'hodges']
+
+
+def calculate_qtc_array(qt_ms, rr_ms) -> dict:
+    """
+    Beat-by-beat QTc for Holter/telemetry exports (all four formulas)
+    
+    Same formulas as calculate_qtc_bazett/fridericia/framingham/hodges, applied
+    to whole arrays in one pass. Beats with NaN or non-positive RR give NaN.
+    
+    Args:
+        qt_ms: Array of QT intervals in milliseconds
+        rr_ms: Array of RR intervals in milliseconds (same length)
+    
+    Returns:
+        dict: formula → QTc array (ms), plus 'hr' (bpm) and 'rr_sec'
+    """
+    qt_ms = np.asarray(qt_ms, dtype=float)
+    rr_sec = np.asarray(rr_ms, dtype=float) / 1000
+    rr_sec = np.where(rr_sec > 0, rr_sec, np.nan)
+    hr = 60 / rr_sec
+    
+    return {
+        'bazett': qt_ms / np.sqrt(rr_sec),
+        'fridericia': qt_ms / np.cbrt(rr_sec),
+        'framingham': qt_ms + 154 * (1 - rr_sec),
+        'hodges': qt_ms + 1.75 * (hr - 60),
+        'hr': hr,
+        'rr_sec': rr_sec
+    }
+
+
+def summarize_qtc(qtc, gender):
+    """
+    Summary statistics of a QTc array against the interpret_qtc() cut-offs
+    
+    Args:
+        qtc: QTc array in milliseconds (NaN beats are ignored)
+        gender: "Nam" or "Nữ"
+    
+    Returns:
+        dict: beats, median, mean, p95, max and % of beats borderline or
+            worse, prolonged or worse, and severe (≥500 ms)
+    """
+    qtc = np.asarray(qtc, dtype=float)
+    qtc = qtc[~np.isnan(qtc)]
+    normal_upper, prolonged = QTC_CUTOFFS["Nam" if gender == "Nam" else "Nữ"]
+    
+    beats = qtc.size
+    if beats == 0:
+        return {
+            "beats": 0, "median": None, "mean": None, "p95": None, "max": None,
+            "pct_borderline": 0.0, "pct_prolonged": 0.0, "pct_severe": 0.0
+        }
+    
+    median, p95 = np.percentile(qtc, [50, 95])
+    
+    return {
+        "beats": beats,
+        "median": float(median),
+        "mean": float(qtc.mean()),
+        "p95": float(p95),
+        "max": float(qtc.max()),
+        "pct_borderline": 100 * int(np.count_nonzero(qtc >= normal_upper)) / beats,
+        "pct_prolonged": 100 * int(np.count_nonzero(qtc >= prolonged)) / beats,
+        "pct_severe": 100 * int(np.count_nonzero(qtc >= QTC_SEVERE)) / beats
+    }
+
+
+def summarize_qtc_array(qt_ms, rr_ms, gender) -> dict:
+    """
+    QTc summary for a whole recording: formula → summarize_qtc() result
+    
+    Args:
+        qt_ms: Array of QT intervals in milliseconds
+        rr_ms: Array of RR intervals in milliseconds
+        gender: "Nam" or "Nữ"
+    """
+    qtc = calculate_qtc_array(qt_ms, rr_ms)
+    return {formula: summarize_qtc(qtc[formula], gender) for formula in QTC_FORMULAS}
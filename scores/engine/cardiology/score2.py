@@ -0,0 +1,189 @@
+"""
+SCORE2 Calculator
+==================
+
+10-year cardiovascular disease risk prediction (Ages 40-69)
+
+Reference:
+- SCORE2 working group and ESC Cardiovascular risk collaboration. 
+  SCORE2 risk prediction algorithms: new models to estimate 10-year risk of
+  cardiovascular disease in Europe. Eur Heart J. 2021;42(25):2439-2454.
+
+SCORE2 predicts 10-year risk of:
+- Fatal and non-fatal myocardial infarction
+- Fatal and non-fatal stroke
+
+Risk Factors:
+- Age (40-69 years)
+- Sex
+- Smoking status
+- Systolic blood pressure
+- Non-HDL cholesterol (or Total cholesterol)
+
+Risk Regions:
+- Low risk: e.g., France, Belgium, Spain
+- Moderate risk: e.g., Poland, Germany, Austria, UK  
+- High risk: e.g., Romania, Bulgaria, Russia
+- Very high risk: e.g., Some Eastern European countries
+
+Note: This is a simplified calculator. For precise calculation, use official ESC tools.
+Vietnam is typically considered MODERATE to HIGH risk region.
+"""
+
+import math
+
+
+def calculate_score2_moderate_risk(
+    age: int,
+    is_female: bool,
+    is_smoker: bool,
+    sbp: float,
+    total_chol: float,
+    hdl_chol: float = None
+) -> dict:
+    """
+    Calculate SCORE2 for MODERATE risk regions
+    
+    This is a simplified calculation. Official SCORE2 uses complex lookup tables.
+    
+    Args:
+        age: Age (40-69 years)
+        is_female: Female sex
+        is_smoker: Current smoker
+        sbp: Systolic blood pressure (mmHg)
+        total_chol: Total cholesterol (mmol/L)
+        hdl_chol: HDL cholesterol (mmol/L) - optional
+    
+    Returns:
+        Dictionary with risk percentage and category
+    """
+    
+    # Calculate non-HDL cholesterol
+    if hdl_chol is not None:
+        non_hdl = total_chol - hdl_chol
+    else:
+        # Estimate if HDL not available (assume average HDL ~1.3 mmol/L)
+        non_hdl = total_chol - 1.3
+    
+    # Simplified risk estimation based on SCORE2 moderate risk region
+    # This is an approximation - actual SCORE2 uses complex tables
+    
+    # Base risk increases exponentially with age
+    age_factor = math.exp((age - 40) * 0.1)
+    
+    # Sex factor (women have lower risk at same age)
+    sex_factor = 0.6 if is_female else 1.0
+    
+    # Smoking approximately doubles risk
+    smoking_factor = 2.0 if is_smoker else 1.0
+    
+    # SBP contribution (risk increases ~30% per 20 mmHg above 120)
+    sbp_factor = 1.0 + ((sbp - 120) / 20) * 0.3 if sbp > 120 else 1.0
+    
+    # Non-HDL cholesterol contribution (risk increases ~15% per mmol/L above 2.6)
+    chol_factor = 1.0 + ((non_hdl - 2.6) / 1) * 0.15 if non_hdl > 2.6 else 0.8
+    
+    # Baseline 10-year risk for moderate risk region
+    baseline_risk = 2.0  # 2% baseline
+    
+    # Calculate total risk
+    risk_10yr = baseline_risk * age_factor * sex_factor * smoking_factor * sbp_factor * chol_factor
+    
+    # Cap at reasonable maximum
+    risk_10yr = min(risk_10yr, 50.0)
+    
+    # Risk categories based on ESC 2021 guidelines
+    if risk_10yr < 2.5:
+        risk_category = "Nguy cơ THẤP"
+        risk_class = "LOW"
+        color = "🟢"
+        recommendation = """
+        **🟢 Nguy cơ Tim Mạch THẤP (<2.5%):**
+        
+        **Khuyến cáo:**
+        - Duy trì lối sống lành mạnh
+        - Không cần thuốc statin thường quy
+        - Theo dõi định kỳ mỗi 5 năm
+        - Tư vấn về chế độ ăn Địa Trung Hải
+        - Tập thể dục thường xuyên (150 phút/tuần)
+        """
+    elif risk_10yr < 7.5:
+        risk_category = "Nguy cơ TRUNG BÌNH"
+        risk_class = "MODERATE"
+        color = "🟡"
+        recommendation = """
+        **🟡 Nguy cơ Tim Mạch TRUNG BÌNH (2.5-7.5%):**
+        
+        **Khuyến cáo:**
+        - Thay đổi lối sống tích cực
+        - Xem xét statin nếu:
+          * LDL-C >3.0 mmol/L (116 mg/dL)
+          * Có yếu tố nguy cơ khác
+          * Risk enhancers (CAC score, gia đình, etc.)
+        - Kiểm soát huyết áp mục tiêu <140/90 mmHg
+        - Bỏ thuốc lá (nếu hút)
+        - Theo dõi mỗi 2-3 năm
+        
+        **Mục tiêu:**
+        - LDL-C <3.0 mmol/L (116 mg/dL)
+        - Non-HDL-C <3.8 mmol/L
+        """
+    elif risk_10yr < 10:
+        risk_category = "Nguy cơ CAO"
+        risk_class = "HIGH"
+        color = "🟠"
+        recommendation = """
+        **🟠 Nguy cơ Tim Mạch CAO (7.5-10%):**
+        
+        **Khuyến cáo:**
+        - **STATIN khuyến cáo** (moderate-high intensity)
+        - **Kiểm soát huyết áp** mục tiêu <130/80 mmHg
+        - **Bỏ thuốc lá** bắt buộc
+        - Xem xét thêm ezetimibe nếu không đạt mục tiêu
+        - Aspirin 75-100 mg nếu có chỉ định
+        - Theo dõi mỗi 6-12 tháng
+        
+        **Mục tiêu điều trị:**
+        - **LDL-C <1.8 mmol/L (70 mg/dL)** VÀ giảm ≥50%
+        - Non-HDL-C <2.6 mmol/L
+        - BP <130/80 mmHg
+        
+        **Thuốc:**
+        - Atorvastatin 20-40 mg hoặc Rosuvastatin 10-20 mg
+        """
+    else:
+        risk_category = "Nguy cơ RẤT CAO"
+        risk_class = "VERY_HIGH"
+        color = "🔴"
+        recommendation = """
+        **🔴 Nguy cơ Tim Mạch RẤT CAO (≥10%):**
+        
+        **Khuyến cáo:**
+        - **HIGH-INTENSITY STATIN bắt buộc**
+        - **Kiểm soát huyết áp chặt** <130/80 mmHg
+        - **Bỏ thuốc lá ngay**
+        - Thêm ezetimibe nếu chưa đạt mục tiêu
+        - Xem xét PCSK9 inhibitor nếu LDL vẫn cao
+        - Aspirin 75-100 mg (xem xét rủi ro/lợi ích)
+        - Theo dõi mỗi 3-6 tháng
+        
+        **Mục tiêu điều trị TÍCH CỰC:**
+        - **LDL-C <1.4 mmol/L (55 mg/dL)** VÀ giảm ≥50%
+        - Non-HDL-C <2.2 mmol/L
+        - BP <130/80 mmHg
+        - HbA1c <7% (nếu DM)
+        
+        **Thuốc:**
+        - Atorvastatin 40-80 mg hoặc Rosuvastatin 20-40 mg
+        - + Ezetimibe 10 mg
+        - ± PCSK9i nếu cần
+        """
+    
+    return {
+        'risk_10yr': risk_10yr,
+        'risk_category': risk_category,
+        'risk_class': risk_class,
+        'color': color,
+        'recommendation': recommendation,
+        'non_hdl': non_hdl
+    }
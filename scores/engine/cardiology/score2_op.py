@@ -0,0 +1,199 @@
+"""
+SCORE2-OP Calculator
+=====================
+
+5-10 year cardiovascular disease risk for older persons (≥70 years)
+
+Reference:
+- SCORE2-OP working group. SCORE2-OP risk prediction algorithms: 
+  estimated 10-year risk of cardiovascular disease in Europe in older persons.
+  Eur Heart J. 2021;42(25):2455-2467.
+
+SCORE2-OP predicts 5 and 10-year risk of CVD in people ≥70 years:
+- Fatal and non-fatal myocardial infarction
+- Fatal and non-fatal stroke
+
+Note: Shorter time horizons (5 years) more relevant for elderly with limited life expectancy.
+"""
+
+import math
+
+
+def calculate_score2_op(
+    age: int,
+    is_female: bool,
+    is_smoker: bool,
+    sbp: float,
+    total_chol: float,
+    hdl_chol: float = None,
+    time_horizon: int = 10
+) -> dict:
+    """
+    Calculate SCORE2-OP for older persons (≥70 years)
+    
+    Simplified estimation for moderate risk regions.
+    
+    Args:
+        age: Age (≥70 years)
+        is_female: Female sex
+        is_smoker: Current smoker
+        sbp: Systolic blood pressure
+        total_chol: Total cholesterol (mmol/L)
+        hdl_chol: HDL cholesterol (mmol/L)
+        time_horizon: 5 or 10 years
+    
+    Returns:
+        Dictionary with risk percentage and category
+    """
+    
+    # Cap age at 95 for calculation
+    age_calc = min(age, 95)
+    
+    # Calculate non-HDL
+    if hdl_chol is not None:
+        non_hdl = total_chol - hdl_chol
+    else:
+        non_hdl = total_chol - 1.3
+    
+    # Simplified risk calculation for elderly
+    # Risk is generally higher in elderly, but benefits of treatment need consideration
+    
+    # Age factor (exponential increase)
+    age_factor = math.exp((age_calc - 70) * 0.08)
+    
+    # Sex factor (converges in elderly)
+    sex_factor = 0.75 if is_female else 1.0
+    
+    # Smoking (smaller relative effect in elderly but still important)
+    smoking_factor = 1.6 if is_smoker else 1.0
+    
+    # SBP contribution
+    sbp_factor = 1.0 + ((sbp - 140) / 20) * 0.25 if sbp > 140 else 0.9
+    
+    # Cholesterol contribution (smaller effect in elderly)
+    chol_factor = 1.0 + ((non_hdl - 3.0) / 1) * 0.12 if non_hdl > 3.0 else 0.85
+    
+    # Baseline risk for elderly
+    baseline_risk = 8.0  # Higher baseline for elderly
+    
+    # Calculate risk
+    risk_calculated = baseline_risk * age_factor * sex_factor * smoking_factor * sbp_factor * chol_factor
+    
+    # Adjust for time horizon
+    if time_horizon == 5:
+        risk_calculated = risk_calculated * 0.55  # Approximately 55% of 10-year risk
+    
+    # Cap risk
+    risk_calculated = min(risk_calculated, 60.0)
+    
+    # Risk categories for elderly (more liberal given competing risks)
+    if risk_calculated < 7.5:
+        risk_category = "Nguy cơ THẤP-TRUNG BÌNH"
+        risk_class = "LOW_MODERATE"
+        color = "🟢"
+        recommendation = f"""
+        **🟢 Nguy cơ Tim Mạch THẤP-TRUNG BÌNH (<7.5% trong {time_horizon} năm):**
+        
+        **Khuyến cáo cho người cao tuổi:**
+        
+        1. **Lối sống:**
+           - Chế độ ăn lành mạnh (Địa Trung Hải)
+           - Hoạt động thể lực vừa phải (theo khả năng)
+           - Duy trì cân nặng hợp lý
+           - Giảm muối (<5g/ngày)
+        
+        2. **Thuốc:**
+           - **Statin:** Cân nhắc nếu đã dùng trước đó
+           - Không bắt đầu mới nếu tuổi thọ dự kiến <5 năm
+           - Ưu tiên điều trị các bệnh khác quan trọng hơn
+        
+        3. **Theo dõi:**
+           - Kiểm tra định kỳ mỗi 1-2 năm
+           - Đánh giá lại khi có thay đổi sức khỏe
+        
+        **Lưu ý:** Ở tuổi cao, chất lượng cuộc sống quan trọng hơn số lượng thuốc.
+        """
+    elif risk_calculated < 15:
+        risk_category = "Nguy cơ CAO"
+        risk_class = "HIGH"
+        color = "🟡"
+        recommendation = f"""
+        **🟡 Nguy cơ Tim Mạch CAO (7.5-15% trong {time_horizon} năm):**
+        
+        **Khuyến cáo:**
+        
+        1. **Statin:**
+           - Khuyến cáo nếu tuổi thọ dự kiến >5 năm
+           - Moderate intensity statin
+           - Cân nhắc rủi ro/lợi ích cá nhân
+           - Theo dõi tác dụng phụ (đau cơ, nhầm lẫn)
+        
+        2. **Huyết áp:**
+           - Mục tiêu <140/90 mmHg (linh hoạt hơn người trẻ)
+           - Tránh hạ BP quá thấp (nguy cơ ngã)
+           - Đo BP ngồi và đứng (loại trừ hypotension tư thế)
+        
+        3. **Bỏ thuốc lá:**
+           - Vẫn có lợi ngay cả ở tuổi cao
+           - Hỗ trợ cai thuốc
+        
+        4. **Theo dõi:**
+           - 6-12 tháng/lần
+           - Đánh giá chức năng nhận thức, ngã
+        
+        **Mục tiêu (linh hoạt):**
+        - LDL-C <2.6 mmol/L (100 mg/dL) nếu dung nạp được
+        - BP <140/90 mmHg
+        """
+    else:
+        risk_category = "Nguy cơ RẤT CAO"
+        risk_class = "VERY_HIGH"
+        color = "🟠"
+        recommendation = f"""
+        **🟠 Nguy cơ Tim Mạch RẤT CAO (≥15% trong {time_horizon} năm):**
+        
+        **Khuyến cáo (cân nhắc cá nhân hóa):**
+        
+        1. **Statin:**
+           - Moderate-intensity khuyến cáo
+           - High-intensity nếu dung nạp tốt
+           - Cân nhắc thêm ezetimibe nếu LDL cao
+           - **Lưu ý:** Ngừng nếu tác dụng phụ đáng kể
+        
+        2. **Huyết áp:**
+           - Mục tiêu <140/90 mmHg
+           - Có thể <130/80 nếu dung nạp tốt
+           - **TRÁNH** <120/70 (nguy cơ ngã, suy thận)
+        
+        3. **Aspirin:**
+           - Xem xét nếu không có chống chỉ định
+           - Cân nhắc nguy cơ chảy máu (đặc biệt nếu >80 tuổi)
+        
+        4. **Theo dõi sát:**
+           - 3-6 tháng/lần
+           - Đánh giá toàn diện: nhận thức, chức năng, ngã
+           - Tái đánh giá khi bệnh nền thay đổi
+        
+        5. **Cân nhắc quan trọng:**
+           - Tuổi thọ dự kiến
+           - Chất lượng cuộc sống
+           - Số lượng thuốc đang dùng (polypharmacy)
+           - Sở thích bệnh nhân
+           - Chi phí/lợi ích
+        
+        **Mục tiêu (cá nhân hóa):**
+        - LDL-C <1.8 mmol/L (70 mg/dL) nếu đạt được
+        - BP <140/90 (hoặc <130/80 nếu dung nạp)
+        
+        **⚠️ Quan trọng:** Tránh overtreatment ở người rất cao tuổi!
+        """
+    
+    return {
+        'risk': risk_calculated,
+        'risk_category': risk_category,
+        'risk_class': risk_class,
+        'color': color,
+        'recommendation': recommendation,
+        'non_hdl': non_hdl,
+        'time_horizon': time_horizon
+    }
@@ -0,0 +1,67 @@
+"""
+TIMI Risk Score for UA/NSTEMI
+"""
+
+# Score → 14-day risk of death, MI or urgent revascularization
+TIMI_RISK = {
+    0: "4.7%",
+    1: "8.3%",
+    2: "13.2%",
+    3: "19.9%",
+    4: "26.2%",
+    5: "40.9%",
+    6: "52.2%",
+    7: "65.0%"
+}
+
+
+def calculate_timi(
+    age_65: bool,
+    rf_count: int,
+    known_cad: bool,
+    aspirin: bool,
+    severe_angina: bool,
+    st_changes: bool,
+    elevated_markers: bool
+) -> dict:
+    """
+    Calculate TIMI Risk Score (UA/NSTEMI)
+
+    Args:
+        age_65: Age ≥65
+        rf_count: Number of CAD risk factors (HTN, DM, smoking, cholesterol, FHx)
+        known_cad: Known CAD (stenosis ≥50%)
+        aspirin: Aspirin use in past 7 days
+        severe_angina: ≥2 anginal episodes in 24h
+        st_changes: ST deviation ≥0.5mm
+        elevated_markers: Elevated troponin / CK-MB
+
+    Returns:
+        dict: score (0-7), details and 14-day event risk
+    """
+    score = 0
+    details = []
+    
+    if age_65:
+        score += 1
+        details.append("✓ Tuổi ≥65 (+1)")
+    if rf_count >= 3:
+        score += 1
+        details.append(f"✓ ≥3 yếu tố nguy cơ ({rf_count}) (+1)")
+    if known_cad:
+        score += 1
+        details.append("✓ Bệnh mạch vành đã biết (+1)")
+    if aspirin:
+        score += 1
+        details.append("✓ Dùng aspirin 7 ngày qua (+1)")
+    if severe_angina:
+        score += 1
+        details.append("✓ Đau thắt ngực nặng (+1)")
+    if st_changes:
+        score += 1
+        details.append("✓ ST chênh ≥0.5mm (+1)")
+    if elevated_markers:
+        score += 1
+        details.append("✓ Marker tim tăng (+1)")
+    
+    return {'score': score, 'details': details, 'risk': TIMI_RISK.get(score, ">65%")}
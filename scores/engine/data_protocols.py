@@ -0,0 +1,341 @@
+"""
+Data-driven Protocols - data/Protocols.csv
+==========================================
+
+One row per protocol: topic_id, title, summary_md, steps_json,
+red_flags_json, refs.
+
+The table is compiled once per Protocols_VERSION (data/Meta.csv): the JSON
+columns are parsed into a validated step graph and the markdown blocks
+(summary, red flags, numbered steps) are built, so page reruns only read
+the cached result.
+
+steps_json: list of steps, in display order:
+
+    {"step": "Oxygen", "details": "Titrate to 88–92%"}
+    {"id": "niv", "step": "NIV indicated?", "choices": {"Yes": "start_niv", "No": "ward"}}
+    {"id": "abx", "step": "Antibiotics", "optional": true, "next": ["reassess"]}
+
+- step (required): title; details: markdown
+- id: referenced by next / choices (default "step<n>", 1-based)
+- next: ids of the steps it unlocks (default: the following step, none for
+  the last; [] ends a branch)
+- choices: {label: id} - a decision; completing it unlocks only the
+  chosen step (decisions have no next and cannot be optional)
+- optional: the step may be skipped
+
+Steps must form a graph without cycles. red_flags_json: list of texts or
+{"flag": ..., "action": ...} objects.
+
+ProtocolChecklist runs one patient through a protocol. A step is
+available once every step pointing to it is resolved (done, skipped or
+excluded) and at least one of them led to it; a step that no resolved
+step led to is excluded (branch not taken).
+
+Usage:
+    from scores.engine.data_protocols import ProtocolChecklist, get_protocol
+
+    checklist = ProtocolChecklist("copd_exacerbation")
+    checklist.complete("oxygen")
+    checklist.available()
+"""
+
+import json
+import re
+from functools import lru_cache
+
+from data_loader import get_data_version, load_table
+
+
+STEP_STATUSES = ("locked", "available", "done", "skipped", "excluded")
+RESOLVED = ("done", "skipped", "excluded")
+_STEP_KEYS = {"id", "step", "details", "next", "choices", "optional"}
+_ID = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+
+def _load_json(text, field, topic_id):
+    try:
+        return json.loads(text or "[]")
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{topic_id}: invalid {field}: {error}") from None
+
+
+def parse_steps(steps, topic_id="") -> tuple:
+    """
+    Validate parsed steps_json and build the step graph
+
+    Returns:
+        tuple of step dicts in file order: id, index, title, details,
+        next (tuple of ids), choices (tuple of (label, id)), decision,
+        optional, prev (tuple of ids)
+
+    Raises:
+        ValueError: Bad step, unknown / duplicate id or a cycle (message
+        names the protocol)
+    """
+    if not isinstance(steps, list) or not steps:
+        raise ValueError(f"{topic_id}: steps_json must be a non-empty list")
+    ids = []
+    for index, step in enumerate(steps):
+        if not isinstance(step, dict) or not isinstance(step.get("step"), str) or not step["step"].strip():
+            raise ValueError(f"{topic_id}: step {index + 1} needs a 'step' title")
+        unknown = set(step) - _STEP_KEYS
+        if unknown:
+            raise ValueError(f"{topic_id}: step {index + 1} has unknown keys {sorted(unknown)}")
+        step_id = str(step.get("id") or f"step{index + 1}")
+        if not _ID.match(step_id) or step_id in ids:
+            raise ValueError(f"{topic_id}: invalid or duplicate step id '{step_id}'")
+        ids.append(step_id)
+
+    known = set(ids)
+    compiled = []
+    for index, (step_id, step) in enumerate(zip(ids, steps)):
+        choices = step.get("choices")
+        if choices is not None:
+            if not isinstance(choices, dict) or not choices or "next" in step or step.get("optional"):
+                raise ValueError(f"{topic_id}: decision '{step_id}' needs non-empty choices, "
+                                 "without next / optional")
+            choices = tuple((str(label), str(target)) for label, target in choices.items())
+            targets = tuple(dict.fromkeys(target for _, target in choices))
+        else:
+            choices = ()
+            targets = step.get("next")
+            if targets is None:
+                targets = [ids[index + 1]] if index + 1 < len(ids) else []
+            elif isinstance(targets, str):
+                targets = [targets]
+            targets = tuple(str(target) for target in targets)
+        for target in targets:
+            if target not in known:
+                raise ValueError(f"{topic_id}: step '{step_id}' points to unknown step '{target}'")
+        compiled.append({
+            "id": step_id,
+            "index": index,
+            "title": step["step"].strip(),
+            "details": str(step.get("details") or "").strip(),
+            "next": targets,
+            "choices": choices,
+            "decision": bool(choices),
+            "optional": bool(step.get("optional")),
+            "prev": (),
+        })
+
+    by_id = {step["id"]: step for step in compiled}
+    prev = {step_id: [] for step_id in ids}
+    for step in compiled:
+        for target in step["next"]:
+            prev[target].append(step["id"])
+    for step in compiled:
+        step["prev"] = tuple(prev[step["id"]])
+
+    # Kahn's algorithm: topological order, and cycle detection
+    waiting = {step_id: len(prev[step_id]) for step_id in ids}
+    queue = [step_id for step_id in ids if not waiting[step_id]]
+    order = []
+    while queue:
+        step_id = queue.pop(0)
+        order.append(step_id)
+        for target in by_id[step_id]["next"]:
+            waiting[target] -= 1
+            if not waiting[target]:
+                queue.append(target)
+    if len(order) != len(ids):
+        raise ValueError(f"{topic_id}: steps form a cycle through "
+                         f"{sorted(set(ids) - set(order))}")
+    return tuple(compiled), tuple(order)
+
+
+def parse_red_flags(flags, topic_id="") -> tuple:
+    """red_flags_json → tuple of {'flag', 'action'} dicts"""
+    if not isinstance(flags, list):
+        raise ValueError(f"{topic_id}: red_flags_json must be a list")
+    parsed = []
+    for flag in flags:
+        if isinstance(flag, str):
+            flag = {"flag": flag}
+        if not isinstance(flag, dict) or not str(flag.get("flag") or "").strip():
+            raise ValueError(f"{topic_id}: invalid red flag {flag!r}")
+        parsed.append({"flag": str(flag["flag"]).strip(), "action": str(flag.get("action") or "").strip()})
+    return tuple(parsed)
+
+
+def _steps_markdown(steps):
+    number_of = {step["id"]: step["index"] + 1 for step in steps}
+    lines = []
+    for number, step in enumerate(steps, 1):
+        optional = " _(tùy chọn)_" if step["optional"] else ""
+        lines.append(f"{number}. **{step['title']}**{optional}")
+        if step["details"]:
+            lines.append(f"   - {step['details']}")
+        for label, target in step["choices"]:
+            lines.append(f"   - {label} → bước {number_of[target]}")
+    return "\n".join(lines)
+
+
+def _red_flags_markdown(flags):
+    return "\n".join(f"- **{flag['flag']}**" + (f" → {flag['action']}" if flag["action"] else "")
+                     for flag in flags)
+
+
+def build_protocol(row: dict, version: str = None) -> dict:
+    """
+    Compile one Protocols.csv row
+
+    Returns:
+        dict: topic_id, title, summary_md, refs, version, steps (tuple),
+        by_id (id → step), order (topological ids), red_flags (tuple),
+        steps_md, red_flags_md
+
+    Raises:
+        ValueError: Invalid JSON or step graph
+    """
+    topic_id = row["topic_id"]
+    steps, order = parse_steps(_load_json(row.get("steps_json"), "steps_json", topic_id), topic_id)
+    red_flags = parse_red_flags(_load_json(row.get("red_flags_json"), "red_flags_json", topic_id), topic_id)
+    return {
+        "topic_id": topic_id,
+        "title": row.get("title") or topic_id,
+        "summary_md": row.get("summary_md") or "",
+        "refs": row.get("refs") or "",
+        "version": version,
+        "steps": steps,
+        "by_id": {step["id"]: step for step in steps},
+        "order": order,
+        "red_flags": red_flags,
+        "steps_md": _steps_markdown(steps),
+        "red_flags_md": _red_flags_markdown(red_flags),
+    }
+
+
+@lru_cache(maxsize=4)
+def _compile_protocols(version: str) -> dict:
+    return {row["topic_id"]: build_protocol(row, version) for row in load_table("Protocols")}
+
+
+def load_protocols() -> dict:
+    """All protocols in data/Protocols.csv compiled by build_protocol(), cached per Protocols_VERSION"""
+    return _compile_protocols(get_data_version("Protocols"))
+
+
+def get_protocol(topic_id: str) -> dict:
+    """Compiled protocol (KeyError if unknown)"""
+    protocols = load_protocols()
+    if topic_id not in protocols:
+        raise KeyError(f"Protocol '{topic_id}' not found in data/Protocols.csv")
+    return protocols[topic_id]
+
+
+class ProtocolChecklist:
+    """
+    Step-by-step state of one protocol for one patient
+
+    Args:
+        protocol: topic_id or a compiled protocol (build_protocol)
+    """
+
+    def __init__(self, protocol):
+        self.protocol = get_protocol(protocol) if isinstance(protocol, str) else protocol
+        self.done = {}          # step id → chosen label (None for non-decisions)
+        self.skipped = set()
+        self.flags = set()
+        self._update()
+
+    @property
+    def version(self):
+        return self.protocol["version"]
+
+    def _leads_to(self, source, target):
+        """Whether resolved step `source` unlocks `target`"""
+        if self.status[source] == "skipped":
+            return True
+        if self.status[source] != "done":
+            return False
+        step = self.protocol["by_id"][source]
+        if step["decision"]:
+            return dict(step["choices"]).get(self.done[source]) == target
+        return True
+
+    def _update(self):
+        status = self.status = {}
+        for step_id in self.protocol["order"]:
+            step = self.protocol["by_id"][step_id]
+            if step_id in self.done:
+                status[step_id] = "done"
+            elif step_id in self.skipped:
+                status[step_id] = "skipped"
+            elif not step["prev"]:
+                status[step_id] = "available"
+            elif all(status[source] in RESOLVED for source in step["prev"]):
+                status[step_id] = ("available" if any(self._leads_to(source, step_id) for source in step["prev"])
+                                   else "excluded")
+            else:
+                status[step_id] = "locked"
+
+    def available(self) -> list:
+        """Ids of the steps that can be done now, in display order"""
+        return [step["id"] for step in self.protocol["steps"] if self.status[step["id"]] == "available"]
+
+    def complete(self, step_id, choice=None):
+        """
+        Mark an available step done
+
+        Args:
+            choice: Label of the chosen branch (decisions only)
+
+        Raises:
+            KeyError: Unknown step; ValueError: step not available or
+            missing / unknown choice
+        """
+        step = self.protocol["by_id"][step_id]
+        if self.status[step_id] != "available":
+            raise ValueError(f"Step '{step_id}' is {self.status[step_id]}")
+        if step["decision"] != (choice is not None) or choice is not None and choice not in dict(step["choices"]):
+            raise ValueError(f"Step '{step_id}': choose one of {[label for label, _ in step['choices']]}"
+                             if step["decision"] else f"Step '{step_id}' is not a decision")
+        self.done[step_id] = choice
+        self._update()
+
+    def skip(self, step_id):
+        """Skip an available optional step (ValueError otherwise)"""
+        step = self.protocol["by_id"][step_id]
+        if self.status[step_id] != "available" or not step["optional"]:
+            raise ValueError(f"Step '{step_id}' cannot be skipped")
+        self.skipped.add(step_id)
+        self._update()
+
+    def undo(self, step_id):
+        """Reopen a done / skipped step and everything after it"""
+        reopen = [step_id]
+        while reopen:
+            current = reopen.pop()
+            if current in self.done or current in self.skipped:
+                self.done.pop(current, None)
+                self.skipped.discard(current)
+                reopen.extend(self.protocol["by_id"][current]["next"])
+        self._update()
+
+    def set_flag(self, flag, present=True):
+        """Record whether a red flag (its text) is present"""
+        if present:
+            self.flags.add(flag)
+        else:
+            self.flags.discard(flag)
+
+    def progress(self) -> dict:
+        """
+        Returns:
+            dict: done, skipped, total (steps not excluded), available (ids),
+            complete (nothing left to do), red_flags (present, in protocol
+            order)
+        """
+        counts = {name: 0 for name in STEP_STATUSES}
+        for status in self.status.values():
+            counts[status] += 1
+        return {
+            "done": counts["done"],
+            "skipped": counts["skipped"],
+            "total": len(self.status) - counts["excluded"],
+            "available": self.available(),
+            "complete": not counts["available"] and not counts["locked"],
+            "red_flags": [flag["flag"] for flag in self.protocol["red_flags"] if flag["flag"] in self.flags],
+        }
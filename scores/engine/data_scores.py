@@ -0,0 +1,274 @@
+"""
+Data-driven Scores - data/Scores.csv
+====================================
+
+Scores.csv describes a score as one row per input, with a SQL-style
+points_rule:
+
+    CASE WHEN val>=22 THEN 1 ELSE 0 END
+    CASE WHEN val<6 THEN 2 WHEN val>=6 AND val<9 THEN 1 ELSE 0 END
+
+Rules are parsed once per Scores_VERSION (data/Meta.csv) into:
+- a Python closure for single-patient scoring
+- a NumPy np.select kernel for batch scoring
+
+Grammar: WHEN clauses are tried in order, the first match wins. A condition
+is one or more `val <op> <number>` joined by AND (op: >=, <=, >, <, =, <>,
+!=), or `val BETWEEN a AND b`. ELSE is optional (defaults to 0). As in SQL,
+a missing value (None / NaN) matches no WHEN clause and scores the ELSE
+points.
+
+Usage:
+    from scores.engine.data_scores import calculate_data_score
+
+    result = calculate_data_score("qsofa", rr=24, systolic_bp=95, gcs=14)
+"""
+
+import operator
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from data_loader import get_data_version, load_table
+
+
+_OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "=": operator.eq,
+    "<>": operator.ne,
+    "!=": operator.ne,
+}
+
+_TOKEN = re.compile(r"\s*(>=|<=|<>|!=|[<>=]|-?\d+(?:\.\d+)?|[A-Za-z_]+)")
+
+
+def _tokenize(rule: str) -> list:
+    tokens = []
+    pos = 0
+    rule = rule.strip()
+    while pos < len(rule):
+        match = _TOKEN.match(rule, pos)
+        if not match:
+            raise ValueError(f"Invalid points_rule near '{rule[pos:]}': {rule}")
+        token = match.group(1)
+        tokens.append(token.upper() if token.isalpha() or "_" in token else token)
+        pos = match.end()
+    return tokens
+
+
+def _number(token: str, rule: str) -> float:
+    try:
+        value = float(token)
+    except (TypeError, ValueError):
+        raise ValueError(f"Expected a number, got '{token}': {rule}") from None
+    return int(value) if value.is_integer() else value
+
+
+def parse_points_rule(rule: str) -> dict:
+    """
+    Parse a CASE points_rule
+
+    Returns:
+        dict: 'clauses' (list of (conditions, points), conditions being a list
+        of (op, threshold)) and 'default' (ELSE points)
+
+    Raises:
+        ValueError: Rule is not a supported CASE expression
+    """
+    tokens = _tokenize(rule)
+    pos = 0
+
+    def expect(*words):
+        nonlocal pos
+        if pos >= len(tokens) or tokens[pos] not in words:
+            found = tokens[pos] if pos < len(tokens) else "end of rule"
+            raise ValueError(f"Expected {' or '.join(words)}, got '{found}': {rule}")
+        pos += 1
+        return tokens[pos - 1]
+
+    def take():
+        nonlocal pos
+        if pos >= len(tokens):
+            raise ValueError(f"Unexpected end of rule: {rule}")
+        pos += 1
+        return tokens[pos - 1]
+
+    expect("CASE")
+    clauses = []
+    while pos < len(tokens) and tokens[pos] == "WHEN":
+        pos += 1
+        conditions = []
+        while True:
+            expect("VAL")
+            if tokens[pos:pos + 1] == ["BETWEEN"]:
+                pos += 1
+                low = _number(take(), rule)
+                expect("AND")
+                high = _number(take(), rule)
+                conditions += [(">=", low), ("<=", high)]
+            else:
+                op = take()
+                if op not in _OPERATORS:
+                    raise ValueError(f"Unknown operator '{op}': {rule}")
+                conditions.append((op, _number(take(), rule)))
+            if tokens[pos:pos + 1] != ["AND"]:
+                break
+            pos += 1
+        expect("THEN")
+        clauses.append((conditions, _number(take(), rule)))
+
+    if not clauses:
+        raise ValueError(f"CASE without WHEN: {rule}")
+
+    default = 0
+    if tokens[pos:pos + 1] == ["ELSE"]:
+        pos += 1
+        default = _number(take(), rule)
+    expect("END")
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected '{tokens[pos]}' after END: {rule}")
+
+    return {"clauses": clauses, "default": default}
+
+
+def compile_points_rule(rule: str):
+    """
+    Compile a CASE points_rule into scoring functions
+
+    Returns:
+        tuple: (points, points_array)
+            points(val) → points for one value
+            points_array(values) → np.ndarray of points (np.select kernel)
+    """
+    parsed = parse_points_rule(rule)
+    default = parsed["default"]
+    clauses = [
+        ([(_OPERATORS[op], threshold) for op, threshold in conditions], points)
+        for conditions, points in parsed["clauses"]
+    ]
+
+    def points(val):
+        if val is None or val != val:  # NULL / NaN → ELSE
+            return default
+        for conditions, clause_points in clauses:
+            if all(compare(val, threshold) for compare, threshold in conditions):
+                return clause_points
+        return default
+
+    choices = [clause_points for _, clause_points in clauses]
+
+    def points_array(values):
+        values = np.asarray(values, dtype=float)
+        given = ~np.isnan(values)  # NaN → ELSE (NaN <> x would be True)
+        condlist = []
+        for conditions, _ in clauses:
+            mask = given
+            for compare, threshold in conditions:
+                mask = mask & compare(values, threshold)
+            condlist.append(mask)
+        return np.select(condlist, choices, default=default)
+
+    return points, points_array
+
+
+@lru_cache(maxsize=4)
+def _compile_scores(version: str) -> dict:
+    scores = {}
+    for row in load_table("Scores"):
+        score = scores.setdefault(row["score_id"], {
+            "name": row["name"],
+            "ref": row["ref"],
+            "version": version,
+            "inputs": [],
+        })
+        points, points_array = compile_points_rule(row["points_rule"])
+        score["inputs"].append({
+            "input_key": row["input_key"],
+            "label": row["label"],
+            "type": row["type"],
+            "unit": row["unit"],
+            "points_rule": row["points_rule"],
+            "points": points,
+            "points_array": points_array,
+        })
+    return scores
+
+
+def load_data_scores() -> dict:
+    """
+    All scores defined in data/Scores.csv, compiled
+
+    Returns:
+        dict: score_id → {'name', 'ref', 'version', 'inputs'}; each input has
+        input_key, label, type, unit, points_rule and the compiled 'points'
+        and 'points_array' functions. Cached per Scores_VERSION.
+    """
+    return _compile_scores(get_data_version("Scores"))
+
+
+def get_data_score(score_id: str) -> dict:
+    """Compiled definition of one data-driven score (KeyError if unknown)"""
+    scores = load_data_scores()
+    if score_id not in scores:
+        raise KeyError(f"Score '{score_id}' not found in data/Scores.csv")
+    return scores[score_id]
+
+
+def calculate_data_score(score_id: str, **values) -> dict:
+    """
+    Calculate a data-driven score for one patient
+
+    Args:
+        score_id: score_id in data/Scores.csv (e.g. "qsofa")
+        **values: One value per input_key
+
+    Returns:
+        dict: total_score, points (input_key → points), missing (input_keys
+        not supplied or NaN, scored with their ELSE points)
+    """
+    score = get_data_score(score_id)
+    points = {}
+    missing = []
+    for item in score["inputs"]:
+        key = item["input_key"]
+        value = values.get(key)
+        if value is None or value != value:
+            missing.append(key)
+        points[key] = item["points"](value)
+
+    return {
+        "score_id": score_id,
+        "name": score["name"],
+        "total_score": sum(points.values()),
+        "points": points,
+        "missing": missing,
+    }
+
+
+def calculate_data_score_batch(score_id: str, df) -> dict:
+    """
+    Vectorized data-driven score for many patients
+
+    Args:
+        score_id: score_id in data/Scores.csv
+        df: pandas DataFrame or dict of equal-length arrays with one column
+            per input_key (NaN = missing → ELSE points)
+
+    Returns:
+        dict: total_score (np.ndarray) and points (input_key → np.ndarray)
+    """
+    score = get_data_score(score_id)
+    points = {
+        item["input_key"]: item["points_array"](df[item["input_key"]])
+        for item in score["inputs"]
+    }
+    return {
+        "score_id": score_id,
+        "name": score["name"],
+        "total_score": sum(points.values()),
+        "points": points,
+    }
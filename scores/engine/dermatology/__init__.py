@@ -0,0 +1,3 @@
+"""
+Dermatology - headless compute functions
+"""
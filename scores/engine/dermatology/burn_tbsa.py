@@ -0,0 +1,30 @@
+"""
+Burn TBSA Calculator - Rule of Nines
+Tính diện tích bỏng theo Quy tắc số 9
+"""
+
+
+def calculate_tbsa(head, chest, abdomen, back_upper, back_lower, 
+                   arm_right, arm_left, leg_right, leg_left, genitalia):
+    """Tính % TBSA bỏng"""
+    total = (head + chest + abdomen + back_upper + back_lower + 
+             arm_right + arm_left + leg_right + leg_left + genitalia)
+    
+    if total < 10:
+        severity = "Nhẹ (Minor)"
+        management = "Điều trị ngoại trú nếu không bỏng sâu"
+        color = "green"
+    elif total < 20:
+        severity = "Trung bình (Moderate)"
+        management = "Cần nhập viện"
+        color = "orange"
+    else:
+        severity = "Nặng (Major)"
+        management = "Cần chuyển trung tâm bỏng, hồi sức tích cực"
+        color = "red"
+    
+    # Parkland formula
+    fluid_24h = total * 4  # ml/kg (will multiply by weight)
+    
+    return {"total_tbsa": total, "severity": severity, "management": management, 
+            "color": color, "fluid_factor": fluid_24h}
@@ -0,0 +1,22 @@
+"""
+DLQI - Dermatology Life Quality Index
+Chỉ số chất lượng cuộc sống bệnh da
+"""
+
+
+def calculate_dlqi(q1, q2, q3, q4, q5, q6, q7, q8, q9, q10):
+    """Tính DLQI"""
+    total = q1 + q2 + q3 + q4 + q5 + q6 + q7 + q8 + q9 + q10
+    
+    if total <= 1:
+        impact = "Không ảnh hưởng"; color = "green"
+    elif total <= 5:
+        impact = "Ảnh hưởng nhỏ"; color = "green"
+    elif total <= 10:
+        impact = "Ảnh hưởng trung bình"; color = "orange"
+    elif total <= 20:
+        impact = "Ảnh hưởng lớn"; color = "orange"
+    else:
+        impact = "Ảnh hưởng rất lớn"; color = "red"
+    
+    return {"total_score": total, "impact": impact, "color": color}
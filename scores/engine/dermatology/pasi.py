@@ -0,0 +1,29 @@
+"""PASI - Psoriasis Area Severity Index"""
+
+
+def calculate_pasi(head: tuple, trunk: tuple, upper: tuple, lower: tuple) -> dict:
+    """
+    Calculate PASI (0-72)
+    
+    Args:
+        head, trunk, upper, lower: (area 0-6, erythema 0-4, thickness 0-4, scaling 0-4)
+    
+    Returns:
+        dict: total, severity (< 10 mild, < 20 moderate, ≥ 20 severe), color
+    """
+    total = 0
+    for weight, (area, erythema, thickness, scaling) in zip((0.1, 0.3, 0.2, 0.4), (head, trunk, upper, lower)):
+        total += weight * area * (erythema + thickness + scaling)
+    
+    if total < 10:
+        severity = "Nhẹ"; color = "#28a745"
+    elif total < 20:
+        severity = "Trung bình"; color = "#fd7e14"
+    else:
+        severity = "Nặng"; color = "#dc3545"
+    
+    return {
+        'total': total,
+        'severity': severity,
+        'color': color,
+    }
@@ -0,0 +1,29 @@
+"""SCORAD - SCORing Atopic Dermatitis"""
+
+
+def calculate_scorad(extent: float, intensity: int, subjective: int) -> dict:
+    """
+    SCORAD = A/5 × 0.7 + 7B/2 + C
+    
+    Args:
+        extent: A - affected body surface area (%)
+        intensity: B - sum of 6 intensity items (0-18)
+        subjective: C - itch + sleep loss (0-20)
+    
+    Returns:
+        dict: total, severity (< 25 mild, < 50 moderate, ≥ 50 severe), color
+    """
+    total = extent/5 * 0.7 + intensity * 7/2 + subjective
+    
+    if total < 25:
+        severity = "Nhẹ"; color = "#28a745"
+    elif total < 50:
+        severity = "Trung bình"; color = "#fd7e14"
+    else:
+        severity = "Nặng"; color = "#dc3545"
+    
+    return {
+        'total': total,
+        'severity': severity,
+        'color': color,
+    }
@@ -0,0 +1,3 @@
+"""
+Emergency & Critical Care - headless compute functions
+"""
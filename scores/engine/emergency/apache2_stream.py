@@ -0,0 +1,195 @@
+"""
+APACHE II - Rolling 24h Worst-Value Stream
+==========================================
+
+APACHE II uses the worst value of each physiological variable over 24 hours.
+Apache2Stream ingests timestamped vitals/labs one observation at a time and
+returns an updated score after every observation, without rescanning history.
+
+Each parameter keeps a monotonic deque of (timestamp, points, value): points
+are non-increasing from front to back, so the front is always the worst value
+still inside the window. Every observation is pushed and evicted at most once
+→ O(1) amortized per observation.
+
+Points come from the same get_*_score() functions as calculate_apache2().
+
+Usage (one stream per bed):
+    stream = Apache2Stream(age=67, has_arf=False)
+    result = stream.add(timestamp, heart_rate=128, map=62)
+    result = stream.add(timestamp2, fio2=60, pao2=70, paco2=38, ph=7.28)
+"""
+
+from collections import deque
+from datetime import timedelta
+
+from scores.engine.emergency.apache2 import (
+    get_temp_score,
+    get_map_score,
+    get_hr_score,
+    get_rr_score,
+    get_oxygenation_score,
+    get_ph_score,
+    get_na_score,
+    get_k_score,
+    get_cr_score,
+    get_hct_score,
+    get_wbc_score,
+    get_gcs_score,
+    get_age_score,
+    get_chronic_health_score,
+    interpret_apache2,
+)
+
+
+# Acute Physiology Score parameters, named as in calculate_apache2() params
+APS_PARAMETERS = [
+    'temperature', 'map', 'heart_rate', 'respiratory_rate', 'oxygenation',
+    'ph', 'sodium', 'potassium', 'creatinine', 'hematocrit', 'wbc', 'gcs',
+]
+
+# Oxygenation is scored only from a blood gas reporting all three together
+OXYGENATION_KEYS = ('fio2', 'pao2', 'paco2')
+
+def _given(value):
+    """None / NaN = not measured"""
+    return value is not None and value == value
+
+
+_SCORE_FUNCTIONS = {
+    'temperature': get_temp_score,
+    'map': get_map_score,
+    'heart_rate': get_hr_score,
+    'respiratory_rate': get_rr_score,
+    'ph': get_ph_score,
+    'sodium': get_na_score,
+    'potassium': get_k_score,
+    'hematocrit': get_hct_score,
+    'wbc': get_wbc_score,
+    'gcs': get_gcs_score,
+}
+
+
+class Apache2Stream:
+    """
+    Rolling worst-value APACHE II for one patient
+
+    Args:
+        age: Age in years
+        has_chronic_health: Severe organ insufficiency / immunocompromised
+        is_post_emergency_surgery: Emergency post-operative admission
+        is_nonsurgical: Non-operative admission
+        has_arf: Acute renal failure (creatinine points doubled)
+        window: Window length (timedelta, or a number in the same unit as
+            numeric timestamps). Default 24 hours.
+    """
+
+    def __init__(
+        self,
+        age: int,
+        has_chronic_health: bool = False,
+        is_post_emergency_surgery: bool = False,
+        is_nonsurgical: bool = False,
+        has_arf: bool = False,
+        window=timedelta(hours=24)
+    ):
+        self.window = window
+        self.has_arf = has_arf
+        self.age_points = get_age_score(age)
+        self.chronic_points = get_chronic_health_score(
+            has_chronic_health, is_post_emergency_surgery, is_nonsurgical
+        )
+        self.last_timestamp = None
+        self.aps = 0
+        self._worst = {param: deque() for param in APS_PARAMETERS}
+
+    def _points(self, param, values):
+        """APACHE II points for one observation of a parameter"""
+        if param == 'oxygenation':
+            return get_oxygenation_score(
+                values['fio2'], values['pao2'], values['paco2'], values.get('ph')
+            )
+        if param == 'creatinine':
+            return get_cr_score(values['creatinine'], self.has_arf)
+        return _SCORE_FUNCTIONS[param](values[param])
+
+    def _push(self, param, timestamp, points, value):
+        window = self._worst[param]
+        before = window[0][1] if window else 0
+        # A newer value with at least as many points outlives older ones
+        while window and window[-1][1] <= points:
+            window.pop()
+        window.append((timestamp, points, value))
+        self.aps += window[0][1] - before
+
+    def _evict(self, cutoff):
+        for window in self._worst.values():
+            if window and window[0][0] <= cutoff:
+                before = window[0][1]
+                while window and window[0][0] <= cutoff:
+                    window.popleft()
+                self.aps += (window[0][1] if window else 0) - before
+
+    def add(self, timestamp, **values) -> dict:
+        """
+        Ingest one observation and return the updated score
+
+        Args:
+            timestamp: Observation time (non-decreasing across calls)
+            **values: Any of temperature, map, heart_rate, respiratory_rate,
+                ph, sodium, potassium, creatinine, hematocrit, wbc, gcs.
+                A blood gas with fio2 (%), pao2 and paco2 also scores
+                oxygenation; an observation missing any of the three (e.g.
+                a FiO2 change alone) leaves oxygenation unchanged. None /
+                NaN values are not measured and are skipped.
+
+        Returns:
+            Same dictionary as score()
+        """
+        if self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError("Observations must arrive in time order")
+        self.last_timestamp = timestamp
+
+        self._evict(timestamp - self.window)
+
+        for param in APS_PARAMETERS:
+            if param == 'oxygenation':
+                if not all(_given(values.get(key)) for key in OXYGENATION_KEYS):
+                    continue
+                value = tuple(values[key] for key in OXYGENATION_KEYS)
+            elif _given(values.get(param)):
+                value = values[param]
+            else:
+                continue
+            self._push(param, timestamp, self._points(param, values), value)
+
+        return self.score()
+
+    def score(self) -> dict:
+        """
+        Current APACHE II from the worst value of each parameter in the window
+
+        Returns:
+            Dictionary with total_score, aps, age_points, chronic_points,
+            interpretation fields from interpret_apache2(), 'worst'
+            (parameter → (value, points)) and 'missing' (parameters with no
+            observation in the window, counted as 0 points)
+        """
+        worst = {}
+        missing = []
+        for param, window in self._worst.items():
+            if window:
+                worst[param] = (window[0][2], window[0][1])
+            else:
+                missing.append(param)
+
+        total_score = self.aps + self.age_points + self.chronic_points
+
+        return {
+            'total_score': total_score,
+            'aps': self.aps,
+            'age_points': self.age_points,
+            'chronic_points': self.chronic_points,
+            **interpret_apache2(total_score),
+            'worst': worst,
+            'missing': missing
+        }
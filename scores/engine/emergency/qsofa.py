@@ -0,0 +1,40 @@
+"""
+qSOFA (Quick SOFA) Score
+Sepsis-3 screening tool
+"""
+
+
+def calculate_qsofa(rr: int, sbp: int, gcs: int) -> dict:
+    """
+    Calculate qSOFA score
+
+    Args:
+        rr: Respiratory rate (/min)
+        sbp: Systolic blood pressure (mmHg)
+        gcs: Glasgow Coma Scale (3-15)
+
+    Returns:
+        dict: score (0-3) and per-criterion details
+    """
+    score = 0
+    details = []
+    
+    if rr >= 22:
+        score += 1
+        details.append("✓ Respiratory rate ≥22 /min (+1)")
+    else:
+        details.append("✗ Respiratory rate <22 /min (0)")
+    
+    if sbp <= 100:
+        score += 1
+        details.append("✓ Systolic BP ≤100 mmHg (+1)")
+    else:
+        details.append("✗ Systolic BP >100 mmHg (0)")
+    
+    if gcs < 15:
+        score += 1
+        details.append("✓ Altered mentation (GCS <15) (+1)")
+    else:
+        details.append("✗ GCS = 15 (0)")
+    
+    return {'score': score, 'details': details}
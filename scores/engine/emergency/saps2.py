@@ -0,0 +1,344 @@
+"""
+SAPS II Score (Simplified Acute Physiology Score II)
+=====================================================
+
+Simplified ICU mortality prediction score
+
+Reference:
+- Le Gall JR, et al. A new Simplified Acute Physiology Score (SAPS II) based on a
+  European/North American multicenter study. JAMA. 1993;270(24):2957-2963.
+
+SAPS II Components:
+- 12 physiological variables
+- Age
+- Type of admission
+
+Total: 0-163 points (theoretical maximum, clinical max usually <100)
+
+Clinical Utility:
+- ICU mortality prediction
+- Simpler than APACHE II
+- Widely used in Europe
+- Quality improvement and research
+"""
+
+import math
+from bisect import bisect_right
+
+import numpy as np
+
+
+# ========== BREAKPOINT TABLES ==========
+# name → (ascending cut-offs, points). A value in [cutoffs[i-1], cutoffs[i])
+# gets points[i]; values below the first cut-off get points[0]. This is the
+# same "if x < cutoff" chain the score is defined with (NaN → last band).
+
+SAPS2_POINT_TABLES = {
+    'age': ([40, 60, 70, 75, 80], [0, 7, 12, 15, 16, 18]),
+    'heart_rate': ([40, 70, 120, 160], [11, 2, 0, 4, 7]),
+    'sbp': ([70, 100, 200], [13, 5, 0, 2]),
+    'temperature': ([39], [0, 3]),
+    'pao2_fio2': ([100, 200], [11, 9, 6]),
+    'urine_output': ([0.5, 1.0], [11, 4, 0]),
+    'bun': ([28, 84], [0, 6, 10]),
+    'wbc': ([1, 20], [12, 0, 3]),
+    'potassium': ([3, 5], [3, 0, 3]),
+    'sodium': ([125, 145], [5, 0, 1]),
+    'bicarbonate': ([15, 20], [6, 3, 0]),
+    'bilirubin': ([4, 6], [0, 4, 9]),
+    'gcs': ([6, 9, 11, 14], [26, 13, 7, 5, 0]),
+}
+
+ADMISSION_POINTS = {"Scheduled surgical": 0, "Medical": 6, "Unscheduled surgical": 8}
+CHRONIC_DISEASE_POINTS = {'has_aids': 17, 'has_hematologic_malignancy': 10, 'has_metastatic_cancer': 9}
+
+# Highest total this implementation can reach (chronic disease points add up)
+SAPS2_MAX_SCORE = (
+    sum(max(points) for _, points in SAPS2_POINT_TABLES.values())
+    + max(ADMISSION_POINTS.values()) + sum(CHRONIC_DISEASE_POINTS.values())
+)
+
+
+def _saps2_mortality(score: int) -> float:
+    """Logit(Death) = -7.7631 + 0.0737 × SAPS II + 0.9971 × ln(SAPS II + 1)"""
+    logit = -7.7631 + (0.0737 * score) + (0.9971 * math.log(score + 1))
+    return 100 / (1 + math.exp(-logit))
+
+
+# Predicted mortality (%) for every possible total, indexed by score
+SAPS2_MORTALITY = [_saps2_mortality(score) for score in range(SAPS2_MAX_SCORE + 1)]
+
+
+def _table_points(name: str, value: float) -> int:
+    """Points for a value from its breakpoint table"""
+    cutoffs, points = SAPS2_POINT_TABLES[name]
+    return points[bisect_right(cutoffs, value)]
+
+
+def get_age_points(age: int) -> int:
+    """Age points"""
+    return _table_points('age', age)
+
+
+def get_hr_points(hr: float) -> int:
+    """Heart rate points"""
+    return _table_points('heart_rate', hr)
+
+
+def get_sbp_points(sbp: float) -> int:
+    """Systolic blood pressure points"""
+    return _table_points('sbp', sbp)
+
+
+def get_temp_points(temp: float) -> int:
+    """Temperature points"""
+    return _table_points('temperature', temp)
+
+
+def get_pao2_fio2_points(pao2: float, fio2: float, is_ventilated: bool) -> int:
+    """PaO2/FiO2 points (only if ventilated or CPAP)"""
+    if not is_ventilated:
+        return 0
+    
+    ratio = (pao2 / fio2) * 100 if fio2 > 0 else 500
+    return _table_points('pao2_fio2', ratio)
+
+
+def get_urine_points(urine_output: float) -> int:
+    """Urine output points (L/day)"""
+    return _table_points('urine_output', urine_output)
+
+
+def get_bun_points(bun: float) -> int:
+    """Blood urea nitrogen points (mg/dL)"""
+    return _table_points('bun', bun)
+
+
+def get_wbc_points(wbc: float) -> int:
+    """White blood cell count points (×10³/μL)"""
+    return _table_points('wbc', wbc)
+
+
+def get_k_points(k: float) -> int:
+    """Serum potassium points (mEq/L)"""
+    return _table_points('potassium', k)
+
+
+def get_na_points(na: float) -> int:
+    """Serum sodium points (mEq/L)"""
+    return _table_points('sodium', na)
+
+
+def get_hco3_points(hco3: float) -> int:
+    """Serum bicarbonate points (mEq/L)"""
+    return _table_points('bicarbonate', hco3)
+
+
+def get_bilirubin_points(bilirubin: float) -> int:
+    """Serum bilirubin points (mg/dL)"""
+    return _table_points('bilirubin', bilirubin)
+
+
+def get_gcs_points(gcs: int) -> int:
+    """Glasgow Coma Scale points"""
+    return _table_points('gcs', gcs)
+
+
+def get_admission_points(admission_type: str, has_aids: bool, has_hematologic_malignancy: bool, has_metastatic_cancer: bool) -> int:
+    """Admission type and chronic disease points"""
+    points = ADMISSION_POINTS.get(admission_type, 0)
+    
+    # Chronic diseases
+    if has_aids:
+        points += CHRONIC_DISEASE_POINTS['has_aids']
+    if has_hematologic_malignancy:
+        points += CHRONIC_DISEASE_POINTS['has_hematologic_malignancy']
+    if has_metastatic_cancer:
+        points += CHRONIC_DISEASE_POINTS['has_metastatic_cancer']
+    
+    return points
+
+
+def calculate_saps2(params: dict) -> dict:
+    """Calculate SAPS II score"""
+    
+    score = 0
+    details = []
+    
+    # Age
+    age_pts = get_age_points(params['age'])
+    score += age_pts
+    details.append(f"Tuổi {params['age']} → {age_pts} điểm")
+    
+    # Heart rate
+    hr_pts = get_hr_points(params['heart_rate'])
+    score += hr_pts
+    details.append(f"Nhịp tim {params['heart_rate']:.0f} /min → {hr_pts} điểm")
+    
+    # Systolic BP
+    sbp_pts = get_sbp_points(params['sbp'])
+    score += sbp_pts
+    details.append(f"SBP {params['sbp']:.0f} mmHg → {sbp_pts} điểm")
+    
+    # Temperature
+    temp_pts = get_temp_points(params['temperature'])
+    score += temp_pts
+    details.append(f"Nhiệt độ {params['temperature']:.1f}°C → {temp_pts} điểm")
+    
+    # PaO2/FiO2 (if ventilated)
+    pf_pts = get_pao2_fio2_points(params['pao2'], params['fio2'], params['is_ventilated'])
+    score += pf_pts
+    if params['is_ventilated']:
+        ratio = (params['pao2'] / params['fio2']) * 100 if params['fio2'] > 0 else 500
+        details.append(f"PaO₂/FiO₂ = {ratio:.0f} (thở máy) → {pf_pts} điểm")
+    else:
+        details.append(f"Không thở máy → 0 điểm")
+    
+    # Urine output
+    urine_pts = get_urine_points(params['urine_output'])
+    score += urine_pts
+    details.append(f"Nước tiểu {params['urine_output']:.1f} L/24h → {urine_pts} điểm")
+    
+    # BUN
+    bun_pts = get_bun_points(params['bun'])
+    score += bun_pts
+    details.append(f"BUN {params['bun']:.0f} mg/dL → {bun_pts} điểm")
+    
+    # WBC
+    wbc_pts = get_wbc_points(params['wbc'])
+    score += wbc_pts
+    details.append(f"WBC {params['wbc']:.1f} ×10³/μL → {wbc_pts} điểm")
+    
+    # Potassium
+    k_pts = get_k_points(params['potassium'])
+    score += k_pts
+    details.append(f"K {params['potassium']:.1f} mEq/L → {k_pts} điểm")
+    
+    # Sodium
+    na_pts = get_na_points(params['sodium'])
+    score += na_pts
+    details.append(f"Na {params['sodium']:.0f} mEq/L → {na_pts} điểm")
+    
+    # Bicarbonate
+    hco3_pts = get_hco3_points(params['bicarbonate'])
+    score += hco3_pts
+    details.append(f"HCO₃ {params['bicarbonate']:.0f} mEq/L → {hco3_pts} điểm")
+    
+    # Bilirubin
+    bili_pts = get_bilirubin_points(params['bilirubin'])
+    score += bili_pts
+    details.append(f"Bilirubin {params['bilirubin']:.1f} mg/dL → {bili_pts} điểm")
+    
+    # GCS
+    gcs_pts = get_gcs_points(params['gcs'])
+    score += gcs_pts
+    details.append(f"GCS {params['gcs']} → {gcs_pts} điểm")
+    
+    # Admission type and chronic diseases
+    adm_pts = get_admission_points(
+        params['admission_type'],
+        params['has_aids'],
+        params['has_hematologic_malignancy'],
+        params['has_metastatic_cancer']
+    )
+    score += adm_pts
+    adm_str = params['admission_type']
+    if params['has_aids']:
+        adm_str += " + AIDS"
+    if params['has_hematologic_malignancy']:
+        adm_str += " + Hematologic malignancy"
+    if params['has_metastatic_cancer']:
+        adm_str += " + Metastatic cancer"
+    details.append(f"Loại nhập viện: {adm_str} → {adm_pts} điểm")
+    
+    # Predicted mortality (logistic regression from original study, precomputed)
+    predicted_mortality = SAPS2_MORTALITY[score]
+    
+    # Interpretation
+    if score < 30:
+        interpretation = "Mức độ nặng THẤP"
+        mortality_range = "<10%"
+        color = "🟢"
+    elif score < 40:
+        interpretation = "Mức độ nặng TRUNG BÌNH"
+        mortality_range = "10-25%"
+        color = "🟡"
+    elif score < 50:
+        interpretation = "Mức độ nặng CAO"
+        mortality_range = "25-40%"
+        color = "🟠"
+    elif score < 60:
+        interpretation = "Mức độ nặng RẤT CAO"
+        mortality_range = "40-60%"
+        color = "🟠"
+    else:
+        interpretation = "Mức độ nặng CỰC KỲ CAO"
+        mortality_range = ">60%"
+        color = "🔴"
+    
+    return {
+        'total_score': score,
+        'predicted_mortality': predicted_mortality,
+        'mortality_range': mortality_range,
+        'interpretation': interpretation,
+        'color': color,
+        'details': details
+    }
+
+
+def _table_points_array(name: str, values) -> np.ndarray:
+    """Vectorized _table_points (np.searchsorted with side='right' == bisect_right)"""
+    cutoffs, points = SAPS2_POINT_TABLES[name]
+    return np.asarray(points)[np.searchsorted(cutoffs, values, side='right')]
+
+
+def calculate_saps2_batch(df) -> dict:
+    """
+    Calculate SAPS II for a whole cohort at once (retrospective audit)
+    
+    Uses the same breakpoint tables and precomputed mortality curve as
+    calculate_saps2(), so results agree exactly row by row.
+    
+    Args:
+        df: DataFrame (or dict of arrays) with the calculate_saps2() params
+            keys as columns
+    
+    Returns:
+        Dictionary with 'total_score' and 'predicted_mortality' arrays and
+        'points' (component → int array)
+    """
+    def column(name, dtype=float):
+        return np.asarray(df[name], dtype=dtype)
+    
+    points = {
+        name: _table_points_array(name, column(name))
+        for name in SAPS2_POINT_TABLES if name != 'pao2_fio2'
+    }
+    
+    # PaO2/FiO2 - only if ventilated; FiO2 ≤ 0 counts as a ratio of 500
+    pao2 = column('pao2')
+    fio2 = column('fio2')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(fio2 > 0, (pao2 / fio2) * 100, 500)
+    points['pao2_fio2'] = np.where(
+        column('is_ventilated', bool), _table_points_array('pao2_fio2', ratio), 0
+    )
+    
+    # Admission type and chronic diseases
+    admission_type = df['admission_type']
+    if not hasattr(admission_type, 'shape'):
+        admission_type = np.asarray(admission_type, dtype=object)
+    admission = np.zeros(len(pao2), dtype=int)
+    for label, label_points in ADMISSION_POINTS.items():
+        admission[np.asarray(admission_type == label, dtype=bool)] = label_points
+    for flag, flag_points in CHRONIC_DISEASE_POINTS.items():
+        admission += np.where(column(flag, bool), flag_points, 0)
+    points['admission'] = admission
+    
+    total_score = sum(points.values())
+    
+    return {
+        'total_score': total_score,
+        'predicted_mortality': np.asarray(SAPS2_MORTALITY)[total_score],
+        'points': points
+    }
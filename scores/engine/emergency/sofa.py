@@ -0,0 +1,361 @@
+"""
+SOFA Score (Sequential Organ Failure Assessment)
+=================================================
+
+Multi-organ dysfunction assessment for ICU patients
+
+Reference:
+- Vincent JL, et al. The SOFA (Sepsis-related Organ Failure Assessment) score to
+  describe organ dysfunction/failure. Intensive Care Med. 1996;22(7):707-710.
+- Singer M, et al. The Third International Consensus Definitions for Sepsis and
+  Septic Shock (Sepsis-3). JAMA. 2016;315(8):801-810.
+
+SOFA Components (6 organ systems):
+1. Respiratory: PaO₂/FiO₂ ratio
+2. Coagulation: Platelets
+3. Liver: Bilirubin
+4. Cardiovascular: Mean arterial pressure (MAP) or vasopressors
+5. Central Nervous System: Glasgow Coma Scale
+6. Renal: Creatinine or urine output
+
+Score: 0-4 points per organ system → Total: 0-24 points
+
+Clinical Utility:
+- Assess organ dysfunction severity
+- Monitor disease progression
+- Predict mortality in ICU
+- Sepsis-3 definition: SOFA ≥2 = sepsis
+"""
+
+import numpy as np
+
+
+def calculate_sofa(
+    pao2_fio2: float,
+    platelets: float,
+    bilirubin: float,
+    map_value: float,
+    use_vasopressor: bool,
+    vasopressor_type: str,
+    vasopressor_dose: float,
+    gcs: int,
+    creatinine: float,
+    urine_output: float
+) -> dict:
+    """
+    Calculate SOFA Score
+    
+    Args:
+        pao2_fio2: PaO2/FiO2 ratio (mmHg)
+        platelets: Platelet count (×10³/μL)
+        bilirubin: Total bilirubin (mg/dL)
+        map_value: Mean arterial pressure (mmHg)
+        use_vasopressor: Whether patient is on vasopressors
+        vasopressor_type: Type of vasopressor (dopamine/dobutamine/epi/norepi)
+        vasopressor_dose: Vasopressor dose (mcg/kg/min)
+        gcs: Glasgow Coma Scale
+        creatinine: Serum creatinine (mg/dL)
+        urine_output: Urine output (mL/day)
+    
+    Returns:
+        Dictionary containing SOFA score, subscores, interpretation
+    """
+    
+    subscores = {}
+    details = []
+    
+    # 1. RESPIRATORY (PaO2/FiO2)
+    if pao2_fio2 >= 400:
+        subscores['respiratory'] = 0
+        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 0 điểm")
+    elif pao2_fio2 >= 300:
+        subscores['respiratory'] = 1
+        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 1 điểm")
+    elif pao2_fio2 >= 200:
+        subscores['respiratory'] = 2
+        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 2 điểm")
+    elif pao2_fio2 >= 100:
+        subscores['respiratory'] = 3
+        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 3 điểm")
+    else:
+        subscores['respiratory'] = 4
+        details.append(f"**Hô hấp:** PaO₂/FiO₂ = {pao2_fio2:.0f} → 4 điểm")
+    
+    # 2. COAGULATION (Platelets)
+    if platelets >= 150:
+        subscores['coagulation'] = 0
+        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 0 điểm")
+    elif platelets >= 100:
+        subscores['coagulation'] = 1
+        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 1 điểm")
+    elif platelets >= 50:
+        subscores['coagulation'] = 2
+        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 2 điểm")
+    elif platelets >= 20:
+        subscores['coagulation'] = 3
+        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 3 điểm")
+    else:
+        subscores['coagulation'] = 4
+        details.append(f"**Đông máu:** Tiểu cầu = {platelets:.0f} → 4 điểm")
+    
+    # 3. LIVER (Bilirubin)
+    if bilirubin < 1.2:
+        subscores['liver'] = 0
+        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 0 điểm")
+    elif bilirubin < 2.0:
+        subscores['liver'] = 1
+        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 1 điểm")
+    elif bilirubin < 6.0:
+        subscores['liver'] = 2
+        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 2 điểm")
+    elif bilirubin < 12.0:
+        subscores['liver'] = 3
+        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 3 điểm")
+    else:
+        subscores['liver'] = 4
+        details.append(f"**Gan:** Bilirubin = {bilirubin:.1f} → 4 điểm")
+    
+    # 4. CARDIOVASCULAR
+    if use_vasopressor:
+        # On vasopressor
+        if vasopressor_type == "Dopamine" and vasopressor_dose < 5:
+            subscores['cardiovascular'] = 2
+            details.append(f"**Tim mạch:** Dopamine <5 mcg/kg/min → 2 điểm")
+        elif vasopressor_type == "Dopamine" and vasopressor_dose <= 15:
+            subscores['cardiovascular'] = 3
+            details.append(f"**Tim mạch:** Dopamine 5-15 mcg/kg/min → 3 điểm")
+        elif vasopressor_type == "Dopamine" and vasopressor_dose > 15:
+            subscores['cardiovascular'] = 4
+            details.append(f"**Tim mạch:** Dopamine >15 mcg/kg/min → 4 điểm")
+        elif vasopressor_type == "Dobutamine":
+            subscores['cardiovascular'] = 2
+            details.append(f"**Tim mạch:** Dobutamine (any dose) → 2 điểm")
+        elif vasopressor_type in ["Epinephrine", "Norepinephrine"]:
+            if vasopressor_dose <= 0.1:
+                subscores['cardiovascular'] = 3
+                details.append(f"**Tim mạch:** Epi/Norepi ≤0.1 mcg/kg/min → 3 điểm")
+            else:
+                subscores['cardiovascular'] = 4
+                details.append(f"**Tim mạch:** Epi/Norepi >0.1 mcg/kg/min → 4 điểm")
+    else:
+        # No vasopressor - use MAP
+        if map_value >= 70:
+            subscores['cardiovascular'] = 0
+            details.append(f"**Tim mạch:** MAP = {map_value:.0f} mmHg → 0 điểm")
+        else:
+            subscores['cardiovascular'] = 1
+            details.append(f"**Tim mạch:** MAP = {map_value:.0f} mmHg → 1 điểm")
+    
+    # 5. CENTRAL NERVOUS SYSTEM (GCS)
+    if gcs == 15:
+        subscores['cns'] = 0
+        details.append(f"**Thần kinh:** GCS = 15 → 0 điểm")
+    elif gcs >= 13:
+        subscores['cns'] = 1
+        details.append(f"**Thần kinh:** GCS = 13-14 → 1 điểm")
+    elif gcs >= 10:
+        subscores['cns'] = 2
+        details.append(f"**Thần kinh:** GCS = 10-12 → 2 điểm")
+    elif gcs >= 6:
+        subscores['cns'] = 3
+        details.append(f"**Thần kinh:** GCS = 6-9 → 3 điểm")
+    else:
+        subscores['cns'] = 4
+        details.append(f"**Thần kinh:** GCS = 3-5 → 4 điểm")
+    
+    # 6. RENAL
+    if creatinine < 1.2:
+        renal_by_cr = 0
+    elif creatinine < 2.0:
+        renal_by_cr = 1
+    elif creatinine < 3.5:
+        renal_by_cr = 2
+    elif creatinine < 5.0:
+        renal_by_cr = 3
+    else:
+        renal_by_cr = 4
+    
+    if urine_output >= 500:
+        renal_by_uo = 0
+    elif urine_output >= 200:
+        renal_by_uo = 3
+    else:
+        renal_by_uo = 4
+    
+    subscores['renal'] = max(renal_by_cr, renal_by_uo)
+    
+    if renal_by_uo > renal_by_cr:
+        details.append(f"**Thận:** UO = {urine_output:.0f} mL/24h → {subscores['renal']} điểm")
+    else:
+        details.append(f"**Thận:** Creatinine = {creatinine:.1f} mg/dL → {subscores['renal']} điểm")
+    
+    # Calculate total
+    total_score = sum(subscores.values())
+    
+    # Interpretation
+    if total_score == 0:
+        interpretation = "Không có suy cơ quan"
+        mortality = "<10%"
+        risk_class = "LOW"
+        color = "🟢"
+    elif total_score <= 6:
+        interpretation = "Suy cơ quan nhẹ"
+        mortality = "~10-20%"
+        risk_class = "MILD"
+        color = "🟡"
+    elif total_score <= 11:
+        interpretation = "Suy cơ quan trung bình"
+        mortality = "~20-40%"
+        risk_class = "MODERATE"
+        color = "🟠"
+    elif total_score <= 14:
+        interpretation = "Suy cơ quan nặng"
+        mortality = "~40-60%"
+        risk_class = "SEVERE"
+        color = "🔴"
+    else:
+        interpretation = "Suy cơ quan rất nặng"
+        mortality = ">60%"
+        risk_class = "CRITICAL"
+        color = "🔴"
+    
+    # Management based on score
+    if total_score >= 2:
+        sepsis_note = f"""
+        **⚠️ SOFA ≥2 điểm:**
+        - Đáp ứng tiêu chuẩn **SEPSIS-3** (nếu có nhiễm trùng/nghi ngờ nhiễm trùng)
+        - Cần đánh giá và xử trí nhiễm trùng huyết NGAY
+        - Xem xét Sepsis Bundle (SSC 2021)
+        """
+    else:
+        sepsis_note = ""
+    
+    return {
+        'total_score': total_score,
+        'subscores': subscores,
+        'interpretation': interpretation,
+        'mortality': mortality,
+        'risk_class': risk_class,
+        'color': color,
+        'details': details,
+        'sepsis_note': sepsis_note
+    }
+
+
+SOFA_ORGANS = ['respiratory', 'coagulation', 'liver', 'cardiovascular', 'cns', 'renal']
+
+# risk_class for every possible total (0-24), same cut-offs as calculate_sofa()
+SOFA_RISK_BY_TOTAL = np.array(
+    ["LOW"] + ["MILD"] * 6 + ["MODERATE"] * 5 + ["SEVERE"] * 3 + ["CRITICAL"] * 10
+)
+
+
+def _band_points(values, thresholds, points, default):
+    """
+    Vectorized version of an if/elif threshold chain
+    
+    thresholds are ascending cut-offs; a value in [thresholds[i-1], thresholds[i])
+    gets points[i] (same bins as np.searchsorted(..., side='right')). NaN fails
+    every comparison in the scalar chain, so it gets the `else` points (default).
+    """
+    band = np.zeros(values.shape, dtype=np.intp)
+    for threshold in thresholds:
+        band += values >= threshold
+    band = np.take(points, band)
+    nan = np.isnan(values)
+    if nan.any():
+        band[nan] = default
+    return band
+
+
+def calculate_sofa_batch(df, explain: bool = False) -> dict:
+    """
+    Calculate SOFA Score for many patients at once (ICU census, batch jobs)
+    
+    Same thresholds as calculate_sofa(), applied to whole columns with
+    threshold counting. Results agree exactly with the scalar function row by row.
+    
+    Args:
+        df: DataFrame (or dict of arrays) with one column per calculate_sofa()
+            argument: pao2_fio2, platelets, bilirubin, map_value,
+            use_vasopressor, vasopressor_type, vasopressor_dose, gcs,
+            creatinine, urine_output
+        explain: Also build the per-row `details` strings (slow, off by default)
+    
+    Returns:
+        Dictionary with 'total_score' and 'risk_class' arrays, 'subscores'
+        (organ → int array) and 'details' (list of lists, or None)
+    
+    Note:
+        A vasopressor type calculate_sofa() does not recognise gives no
+        cardiovascular subscore there; here it counts as 0 (same total).
+    """
+    pao2_fio2 = np.asarray(df['pao2_fio2'], dtype=float)
+    platelets = np.asarray(df['platelets'], dtype=float)
+    bilirubin = np.asarray(df['bilirubin'], dtype=float)
+    map_value = np.asarray(df['map_value'], dtype=float)
+    use_vasopressor = np.asarray(df['use_vasopressor'], dtype=bool)
+    vasopressor_type = df['vasopressor_type']
+    vasopressor_dose = np.asarray(df['vasopressor_dose'], dtype=float)
+    gcs = np.asarray(df['gcs'], dtype=float)
+    creatinine = np.asarray(df['creatinine'], dtype=float)
+    urine_output = np.asarray(df['urine_output'], dtype=float)
+    
+    subscores = {}
+    
+    # 1. RESPIRATORY (PaO2/FiO2)
+    subscores['respiratory'] = _band_points(pao2_fio2, [100, 200, 300, 400], [4, 3, 2, 1, 0], default=4)
+    
+    # 2. COAGULATION (Platelets)
+    subscores['coagulation'] = _band_points(platelets, [20, 50, 100, 150], [4, 3, 2, 1, 0], default=4)
+    
+    # 3. LIVER (Bilirubin)
+    subscores['liver'] = _band_points(bilirubin, [1.2, 2.0, 6.0, 12.0], [0, 1, 2, 3, 4], default=4)
+    
+    # 4. CARDIOVASCULAR
+    if not hasattr(vasopressor_type, 'shape'):
+        vasopressor_type = np.asarray(vasopressor_type, dtype=object)
+    # Compare on the column itself (fast for pandas string columns)
+    dopamine = use_vasopressor & np.asarray(vasopressor_type == "Dopamine", dtype=bool)
+    dobutamine = use_vasopressor & np.asarray(vasopressor_type == "Dobutamine", dtype=bool)
+    epi_norepi = use_vasopressor & np.asarray(
+        (vasopressor_type == "Epinephrine") | (vasopressor_type == "Norepinephrine"), dtype=bool
+    )
+    cardiovascular = np.where(use_vasopressor, 0, _band_points(map_value, [70], [1, 0], default=1))
+    cardiovascular[dobutamine] = 2
+    cardiovascular[epi_norepi] = np.where(vasopressor_dose[epi_norepi] <= 0.1, 3, 4)
+    # Dopamine: <5 → 2, ≤15 → 3, >15 → 4 (NaN dose matches none of them → 0)
+    dopamine_dose = vasopressor_dose[dopamine]
+    cardiovascular[dopamine] = np.where(
+        dopamine_dose < 5, 2, np.where(dopamine_dose <= 15, 3, np.where(dopamine_dose > 15, 4, 0))
+    )
+    subscores['cardiovascular'] = cardiovascular
+    
+    # 5. CENTRAL NERVOUS SYSTEM (GCS) - only exactly 15 scores 0
+    subscores['cns'] = np.where(gcs == 15, 0, _band_points(gcs, [6, 10, 13], [4, 3, 2, 1], default=4))
+    
+    # 6. RENAL - worse of creatinine and urine output
+    renal_by_cr = _band_points(creatinine, [1.2, 2.0, 3.5, 5.0], [0, 1, 2, 3, 4], default=4)
+    renal_by_uo = _band_points(urine_output, [200, 500], [4, 3, 0], default=4)
+    subscores['renal'] = np.maximum(renal_by_cr, renal_by_uo)
+    
+    total_score = sum(subscores[organ] for organ in SOFA_ORGANS)
+    
+    risk_class = SOFA_RISK_BY_TOTAL[total_score]
+    
+    details = None
+    if explain:
+        columns = [pao2_fio2, platelets, bilirubin, map_value, use_vasopressor,
+                   np.asarray(vasopressor_type, dtype=object), vasopressor_dose, gcs,
+                   creatinine, urine_output]
+        details = [
+            calculate_sofa(*row)['details']
+            for row in zip(*(column.tolist() for column in columns))
+        ]
+    
+    return {
+        'total_score': total_score,
+        'subscores': subscores,
+        'risk_class': risk_class,
+        'details': details
+    }
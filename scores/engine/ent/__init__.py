@@ -0,0 +1,3 @@
+"""
+ENT - headless compute functions
+"""
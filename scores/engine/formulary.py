@@ -0,0 +1,332 @@
+"""
+Antibiotic Formulary - data/Antibiotics.csv
+===========================================
+
+One row per drug and indication: drug, indication, aware (WHO AWaRe class),
+adult_dose, renal_thr, renal_dose_lt_thr, pediatric, route, notes, refs.
+
+The table is compiled once per Antibiotics_VERSION (data/Meta.csv) into:
+- inverted indexes (token → row ids) over drug, indication, aware and route;
+  text queries match token prefixes by bisecting the sorted token list
+- renal rules parsed into CrCl breakpoints, so the regimen for a CrCl is one
+  bisect (get_renal_regimen) or one np.searchsorted for a whole column
+  (get_renal_regimen_array)
+
+renal_thr grammar: clauses separated by ';', each `CrCl <op> <number>` (op:
+<, <=, >, >=, ≤, ≥) or `CrCl <a>-<b>` (a ≤ CrCl ≤ b), optionally followed by
+`: <regimen>`. A clause without a regimen, or with 'adjust', uses
+renal_dose_lt_thr. The first clause matching a CrCl wins; outside every
+clause adult_dose applies.
+
+    CrCl<=60: adjust
+    CrCl 30-60: 2 g IV q12h; CrCl<30: 1 g IV q24h
+
+Usage:
+    from scores.engine.formulary import get_renal_regimen, search_formulary
+
+    search_formulary("cefe", aware="Watch")
+    get_renal_regimen("Cefepime (IV)", crcl=45)["regimen"]
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+from data_loader import get_data_version, load_table
+
+
+INDEXED_FIELDS = ("drug", "indication", "aware", "route")
+
+_CLAUSE = re.compile(
+    r"^\s*crcl\s*(?:(?P<op><=|>=|≤|≥|<|>)\s*(?P<value>\d+(?:\.\d+)?)"
+    r"|(?P<low>\d+(?:\.\d+)?)\s*-\s*(?P<high>\d+(?:\.\d+)?))\s*(?::\s*(?P<action>.*))?$",
+    re.IGNORECASE
+)
+_WORD = re.compile(r"[^\W_]+")
+_OPS = {"≤": "<=", "≥": ">="}
+
+
+def _below(value):
+    """Largest float < value: turns `x < value` into `x <= edge`"""
+    return float(np.nextafter(value, -np.inf))
+
+
+def parse_renal_rule(text: str) -> list:
+    """
+    Parse a renal_thr rule
+
+    Returns:
+        list of dicts: op ('<', '<=', '>', '>=' or 'between'), threshold
+        (float, or (low, high) for 'between'), action (regimen text, None =
+        renal_dose_lt_thr), low and high (band as low < CrCl ≤ high), text
+        (the clause as written)
+
+    Raises:
+        ValueError: A clause is not a supported CrCl condition
+    """
+    clauses = []
+    for part in filter(str.strip, (text or "").split(";")):
+        match = _CLAUSE.match(part)
+        if not match:
+            raise ValueError(f"Invalid renal rule clause '{part.strip()}': {text}")
+        action = (match.group("action") or "").strip()
+        if not action or action.lower() == "adjust":
+            action = None
+
+        if match.group("op"):
+            op = _OPS.get(match.group("op"), match.group("op"))
+            value = float(match.group("value"))
+            threshold = value
+            low, high = {
+                "<": (-np.inf, _below(value)),
+                "<=": (-np.inf, value),
+                ">": (value, np.inf),
+                ">=": (_below(value), np.inf),
+            }[op]
+        else:
+            op = "between"
+            threshold = (float(match.group("low")), float(match.group("high")))
+            low, high = _below(threshold[0]), threshold[1]
+        clauses.append({"op": op, "threshold": threshold, "action": action,
+                        "low": low, "high": high, "text": part.strip()})
+    return clauses
+
+
+def compile_renal_rule(clauses: list, adult_dose: str, renal_dose: str) -> dict:
+    """
+    CrCl breakpoints of a parsed rule
+
+    Returns:
+        dict: edges (sorted floats), regimens (one per segment: CrCl ≤
+        edges[0], edges[0] < CrCl ≤ edges[1], ..., CrCl > edges[-1]),
+        clause (index of the matching clause per segment, -1 = adult_dose)
+    """
+    edges = sorted({edge for clause in clauses for edge in (clause["low"], clause["high"])
+                    if np.isfinite(edge)})
+    bounds = [-np.inf] + edges + [np.inf]
+    regimens, matched = [], []
+    for seg_low, seg_high in zip(bounds[:-1], bounds[1:]):
+        index = next((i for i, clause in enumerate(clauses)
+                      if clause["low"] <= seg_low and seg_high <= clause["high"]), -1)
+        if index < 0:
+            regimens.append(adult_dose)
+        else:
+            regimens.append(clauses[index]["action"] or renal_dose)
+        matched.append(index)
+    return {"edges": edges, "regimens": regimens, "clause": matched}
+
+
+def _tokens(text: str) -> set:
+    return {word.lower() for word in _WORD.findall(text or "")}
+
+
+def build_formulary(rows: list, version: str = None) -> dict:
+    """
+    Compile formulary rows (dicts with the Antibiotics.csv columns)
+
+    Returns:
+        dict: version, rows (each row plus 'id', 'renal_rule' and 'renal'),
+        index (field → token → sorted row ids), tokens (field → sorted
+        tokens), by_drug (lower-cased drug name → row ids)
+
+    Raises:
+        ValueError: Invalid renal_thr rule (message names the drug)
+    """
+    compiled = []
+    index = {field: {} for field in INDEXED_FIELDS}
+    by_drug = {}
+    for row_id, row in enumerate(rows):
+        try:
+            clauses = parse_renal_rule(row.get("renal_thr", ""))
+        except ValueError as error:
+            raise ValueError(f"{row.get('drug')}: {error}") from None
+        entry = dict(row)
+        entry["id"] = row_id
+        entry["renal_rule"] = clauses
+        entry["renal"] = compile_renal_rule(clauses, row.get("adult_dose", ""),
+                                            row.get("renal_dose_lt_thr", ""))
+        compiled.append(entry)
+
+        for field in INDEXED_FIELDS:
+            for token in _tokens(row.get(field)):
+                index[field].setdefault(token, []).append(row_id)
+        by_drug.setdefault((row.get("drug") or "").strip().lower(), []).append(row_id)
+
+    return {
+        "version": version,
+        "rows": compiled,
+        "index": index,
+        "tokens": {field: sorted(tokens) for field, tokens in index.items()},
+        "by_drug": by_drug,
+    }
+
+
+@lru_cache(maxsize=4)
+def _compile_formulary(version: str) -> dict:
+    return build_formulary(load_table("Antibiotics"), version)
+
+
+def load_formulary() -> dict:
+    """data/Antibiotics.csv compiled by build_formulary(), cached per Antibiotics_VERSION"""
+    return _compile_formulary(get_data_version("Antibiotics"))
+
+
+def _match_prefix(formulary, field, prefix):
+    """Row ids with a token of `field` starting with `prefix`"""
+    tokens = formulary["tokens"][field]
+    postings = formulary["index"][field]
+    start = bisect_left(tokens, prefix)
+    end = bisect_right(tokens, prefix + "￿", start)
+    ids = set()
+    for token in tokens[start:end]:
+        ids.update(postings[token])
+    return ids
+
+
+def _match_field(formulary, field, text):
+    """Rows whose `field` has every word of `text` as a token prefix"""
+    ids = None
+    for word in _tokens(text):
+        found = _match_prefix(formulary, field, word)
+        ids = found if ids is None else ids & found
+        if not ids:
+            return set()
+    return set() if ids is None else ids
+
+
+def search_formulary(text=None, aware=None, route=None, indication=None, formulary=None) -> list:
+    """
+    Formulary rows matching every given filter
+
+    Args:
+        text: Words matched (as prefixes) against drug or indication
+        aware: AWaRe class (Access / Watch / Reserve)
+        route: Route (e.g. IV, PO)
+        indication: Words matched against indication only
+        formulary: Compiled formulary (default load_formulary())
+
+    Returns:
+        list of row dicts, in file order
+    """
+    formulary = formulary or load_formulary()
+    selected = None
+    filters = []
+    if text:
+        filters.append(lambda: _match_text(formulary, text))
+    if indication:
+        filters.append(lambda: _match_field(formulary, "indication", indication))
+    if aware:
+        filters.append(lambda: _match_field(formulary, "aware", aware))
+    if route:
+        filters.append(lambda: _match_field(formulary, "route", route))
+
+    for get_ids in filters:
+        ids = get_ids()
+        selected = ids if selected is None else selected & ids
+        if not selected:
+            return []
+    if selected is None:
+        return list(formulary["rows"])
+    return [formulary["rows"][i] for i in sorted(selected)]
+
+
+def _match_text(formulary, text):
+    """Rows where each word is a prefix of a drug or indication token"""
+    ids = None
+    for word in _tokens(text):
+        found = _match_prefix(formulary, "drug", word) | _match_prefix(formulary, "indication", word)
+        ids = found if ids is None else ids & found
+        if not ids:
+            return set()
+    return set() if ids is None else ids
+
+
+def _find_rows(drug, indication, formulary):
+    ids = formulary["by_drug"].get(drug.strip().lower())
+    if ids is None:
+        ids = sorted(_match_field(formulary, "drug", drug))
+    if indication:
+        wanted = _match_field(formulary, "indication", indication)
+        ids = [i for i in ids if i in wanted]
+    if not ids:
+        raise KeyError(f"Antibiotic '{drug}' not found in data/Antibiotics.csv")
+    return [formulary["rows"][i] for i in ids]
+
+
+def _find_row(drug, indication, formulary):
+    """The single row of a drug (+ indication); ValueError if several match"""
+    rows = _find_rows(drug, indication, formulary)
+    if len(rows) > 1 and indication:
+        exact = [row for row in rows if row["indication"].strip().lower() == indication.strip().lower()]
+        rows = exact or rows
+    if len(rows) > 1:
+        choices = "; ".join(f"{row['drug']} - {row['indication']}" for row in rows)
+        raise ValueError(f"'{drug}' matches several formulary rows, give the drug and indication: {choices}")
+    return rows[0]
+
+
+def get_renal_regimen(drug, crcl, indication=None, formulary=None) -> dict:
+    """
+    Regimen that applies at a CrCl
+
+    Args:
+        drug: Drug name as in the formulary (exact, case-insensitive) or
+            words of it (e.g. "cefepime")
+        crcl: Creatinine clearance (mL/min); None / NaN (not known) gives
+            the unadjusted adult_dose
+        indication: Words of the indication when a drug has several rows
+
+    Returns:
+        dict: drug, indication, crcl, regimen, adjusted (a renal clause
+        applied), rule (renal_thr clause text or None), route
+
+    Raises:
+        KeyError: Drug (and indication) not in the formulary
+        ValueError: Several rows match (give the indication)
+    """
+    formulary = formulary or load_formulary()
+    row = _find_row(drug, indication, formulary)
+    renal = row["renal"]
+    if crcl is None or crcl != crcl:
+        regimen, clause = row["adult_dose"], -1
+    else:
+        segment = bisect_left(renal["edges"], crcl)
+        regimen, clause = renal["regimens"][segment], renal["clause"][segment]
+    return {
+        "drug": row["drug"],
+        "indication": row["indication"],
+        "crcl": crcl,
+        "regimen": regimen,
+        "adjusted": clause >= 0,
+        "rule": row["renal_rule"][clause]["text"] if clause >= 0 else None,
+        "route": row["route"],
+    }
+
+
+def get_renal_regimen_array(drug, crcl, indication=None, formulary=None) -> dict:
+    """
+    get_renal_regimen() for a column of CrCl values of one drug
+
+    Returns:
+        dict: regimen, rule (object arrays) and adjusted (bool array); NaN
+        CrCl gives regimen None
+
+    Raises:
+        KeyError: Drug (and indication) not in the formulary
+        ValueError: Several rows match (give the indication)
+    """
+    formulary = formulary or load_formulary()
+    row = _find_row(drug, indication, formulary)
+    renal = row["renal"]
+    crcl = np.asarray(crcl, dtype=float)
+    segment = np.searchsorted(np.asarray(renal["edges"], dtype=float), crcl, side="left")
+    segment = np.where(np.isnan(crcl), len(renal["regimens"]), segment)
+    clause = np.array(renal["clause"] + [-1])[segment]
+    rules = np.array([clause["text"] for clause in row["renal_rule"]] + [None], dtype=object)
+    return {
+        "regimen": np.array(renal["regimens"] + [None], dtype=object)[segment],
+        "rule": rules[clause],
+        "adjusted": clause >= 0,
+    }
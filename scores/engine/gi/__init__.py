@@ -0,0 +1,3 @@
+"""
+Gastroenterology & Hepatology - headless compute functions
+"""
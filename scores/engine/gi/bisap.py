@@ -0,0 +1,70 @@
+"""
+BISAP Score (Bedside Index for Severity in Acute Pancreatitis)
+Tiên lượng viêm tụy cấp - đơn giản, nhanh chóng
+"""
+
+
+def calculate_bisap(
+    bun_positive: bool,
+    mental_impaired: bool,
+    gcs: int,
+    sirs_positive: bool,
+    age_positive: bool,
+    pleural: bool
+) -> dict:
+    """
+    Calculate BISAP score for acute pancreatitis
+
+    Args:
+        bun_positive: BUN >25 mg/dL
+        mental_impaired: Impaired mental status
+        gcs: Glasgow Coma Scale (GCS <15 counts as impaired)
+        sirs_positive: ≥2 SIRS criteria
+        age_positive: Age >60
+        pleural: Pleural effusion on imaging
+
+    Returns:
+        dict: score (0-5), mortality and severity
+    """
+    # Calculate total score
+    bisap_score = sum([
+        bun_positive,
+        mental_impaired or (gcs < 15),
+        sirs_positive,
+        age_positive,
+        pleural
+    ])
+
+    # Mortality risk
+    mortality_rates = {
+        0: "<1%",
+        1: "~2%",
+        2: "~10-15%",
+        3: "~20-25%",
+        4: "~40-50%",
+        5: ">50%"
+    }
+
+    mortality = mortality_rates[bisap_score]
+
+    # Severity classification
+    if bisap_score == 0:
+        severity = "Nhẹ"
+        color = "#28a745"
+        icon = "✅"
+    elif bisap_score <= 2:
+        severity = "Trung bình"
+        color = "#ffc107"
+        icon = "⚠️"
+    else:
+        severity = "Nặng"
+        color = "#dc3545"
+        icon = "🚨"
+    
+    return {
+        'bisap_score': bisap_score,
+        'mortality': mortality,
+        'severity': severity,
+        'color': color,
+        'icon': icon,
+    }
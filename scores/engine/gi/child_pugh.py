@@ -0,0 +1,113 @@
+"""
+Child-Pugh Score for Cirrhosis Severity
+Đánh giá mức độ nặng xơ gan
+
+Scoring Components:
+1. Total Bilirubin
+2. Serum Albumin
+3. INR
+4. Ascites
+5. Hepatic Encephalopathy
+
+Total score: 5-15 points
+- Class A (5-6): Well-compensated
+- Class B (7-9): Significant functional compromise
+- Class C (10-15): Decompensated disease
+
+Reference:
+Pugh RN, et al. Transection of the oesophagus for bleeding oesophageal varices.
+Br J Surg. 1973;60(8):646-9.
+"""
+
+
+def get_bilirubin_points(bili_mgdl: float) -> tuple:
+    """Bilirubin (mg/dL) → (points, band label)"""
+    if bili_mgdl < 2:
+        return 1, "<2 mg/dL"
+    elif bili_mgdl <= 3:
+        return 2, "2-3 mg/dL"
+    else:
+        return 3, ">3 mg/dL"
+
+
+def get_albumin_points(albumin: float) -> tuple:
+    """Albumin (g/dL) → (points, band label)"""
+    if albumin > 3.5:
+        return 1, ">3.5 g/dL"
+    elif albumin >= 2.8:
+        return 2, "2.8-3.5 g/dL"
+    else:
+        return 3, "<2.8 g/dL"
+
+
+def get_inr_points(inr: float) -> tuple:
+    """INR → (points, band label)"""
+    if inr < 1.7:
+        return 1, "<1.7"
+    elif inr <= 2.3:
+        return 2, "1.7-2.3"
+    else:
+        return 3, ">2.3"
+
+
+def calculate_child_pugh(
+    bili_mgdl: float,
+    albumin: float,
+    inr: float,
+    ascites_points: int,
+    enceph_points: int
+) -> dict:
+    """
+    Calculate Child-Pugh score and class
+
+    Args:
+        bili_mgdl: Total bilirubin (mg/dL)
+        albumin: Serum albumin (g/dL)
+        inr: INR
+        ascites_points: 1 = none, 2 = mild, 3 = moderate-severe
+        enceph_points: 1 = none, 2 = grade 1-2, 3 = grade 3-4
+
+    Returns:
+        dict: total_score, breakdown, class and survival estimates
+    """
+    score_breakdown = {
+        "Bilirubin": get_bilirubin_points(bili_mgdl)[0],
+        "Albumin": get_albumin_points(albumin)[0],
+        "INR": get_inr_points(inr)[0],
+        "Ascites": ascites_points,
+        "Encephalopathy": enceph_points,
+    }
+    total_score = sum(score_breakdown.values())
+    
+    if total_score <= 6:
+        cp_class = "A"
+        severity = "XƠ GAN BÙ TRỪ TỐT"
+        color = "green"
+        survival_1yr = "100%"
+        survival_2yr = "85%"
+        periop_mortality = "10%"
+    elif total_score <= 9:
+        cp_class = "B"
+        severity = "SUY CHỨC NĂNG GAN ĐÁNG KỂ"
+        color = "orange"
+        survival_1yr = "81%"
+        survival_2yr = "57%"
+        periop_mortality = "30%"
+    else:
+        cp_class = "C"
+        severity = "XƠ GAN MẤT BÙ"
+        color = "red"
+        survival_1yr = "45%"
+        survival_2yr = "35%"
+        periop_mortality = "82%"
+    
+    return {
+        'total_score': total_score,
+        'score_breakdown': score_breakdown,
+        'cp_class': cp_class,
+        'severity': severity,
+        'color': color,
+        'survival_1yr': survival_1yr,
+        'survival_2yr': survival_2yr,
+        'periop_mortality': periop_mortality,
+    }
@@ -0,0 +1,73 @@
+"""
+Glasgow-Blatchford Score (GBS)
+Đánh giá nguy cơ cần can thiệp trong xuất huyết tiêu hóa trên
+
+Used to identify low-risk patients who can be safely discharged
+Score 0 = Very low risk, can discharge
+Score ≥1 = Consider admission
+
+Reference:
+Blatchford O, et al. A risk score to predict need for treatment for upper-gastrointestinal haemorrhage.
+Lancet. 2000;356(9238):1318-21.
+"""
+
+
+def calculate_gbs(
+    bun_mgdl, hgb, sbp, hr, melena, syncope, liver_disease, heart_failure, gender
+):
+    """Calculate Glasgow-Blatchford Score"""
+    score = 0
+    
+    # BUN (Blood Urea Nitrogen)
+    if bun_mgdl >= 150:  # ≥25 mg/dL
+        score += 6
+    elif bun_mgdl >= 100:  # 18.2-24.9 mg/dL
+        score += 4
+    elif bun_mgdl >= 70:  # 12.7-18.1 mg/dL
+        score += 3
+    elif bun_mgdl >= 39:  # 6.5-12.6 mg/dL
+        score += 2
+    
+    # Hemoglobin
+    if gender == "Nam":
+        if hgb < 10.0:
+            score += 6
+        elif hgb < 12.0:
+            score += 3
+        elif hgb < 13.0:
+            score += 1
+    else:  # Nữ
+        if hgb < 10.0:
+            score += 6
+        elif hgb < 12.0:
+            score += 1
+    
+    # Systolic BP
+    if sbp < 90:
+        score += 3
+    elif sbp < 100:
+        score += 2
+    elif sbp < 110:
+        score += 1
+    
+    # Heart Rate
+    if hr >= 100:
+        score += 1
+    
+    # Melena
+    if melena:
+        score += 1
+    
+    # Syncope
+    if syncope:
+        score += 2
+    
+    # Liver disease
+    if liver_disease:
+        score += 2
+    
+    # Heart failure
+    if heart_failure:
+        score += 2
+    
+    return score
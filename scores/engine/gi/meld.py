@@ -0,0 +1,56 @@
+"""
+MELD Score (Model for End-Stage Liver Disease)
+Dự đoán tử vong 3 tháng ở bệnh nhân xơ gan
+
+Formula:
+MELD = 3.78×ln[bilirubin(mg/dL)] + 11.2×ln[INR] + 9.57×ln[creatinine(mg/dL)] + 6.43
+
+Score range: 6-40
+- Higher score = Higher 3-month mortality
+- Used for liver transplant prioritization
+
+Reference:
+Kamath PS, et al. A model to predict survival in patients with end-stage liver disease.
+Hepatology. 2001;33(2):464-70.
+"""
+
+import math
+
+
+def calculate_meld(bilirubin, inr, creatinine, dialysis=False):
+    """
+    Calculate MELD Score
+    
+    Args:
+        bilirubin: Total bilirubin in mg/dL
+        inr: INR value
+        creatinine: Serum creatinine in mg/dL
+        dialysis: Whether patient had dialysis twice in past week
+    
+    Returns:
+        MELD score (6-40)
+    """
+    # Apply minimums
+    bili = max(bilirubin, 1.0)
+    inr_val = max(inr, 1.0)
+    cr = max(creatinine, 1.0)
+    
+    # If on dialysis or Cr > 4, cap creatinine at 4
+    if dialysis or cr > 4.0:
+        cr = 4.0
+    
+    # MELD formula
+    meld = (
+        3.78 * math.log(bili) +
+        11.2 * math.log(inr_val) +
+        9.57 * math.log(cr) +
+        6.43
+    )
+    
+    # Round to nearest integer
+    meld = round(meld)
+    
+    # Cap between 6 and 40
+    meld = max(6, min(40, meld))
+    
+    return meld
@@ -0,0 +1,122 @@
+"""
+MELD-Na (Model for End-Stage Liver Disease with Sodium)
+Tiên lượng bệnh gan giai đoạn cuối với điều chỉnh theo Na
+"""
+
+import math
+
+
+def calculate_meld_na(creatinine, bilirubin, inr, sodium, dialysis_twice=False):
+    """
+    Calculate MELD-Na score
+    
+    Args:
+        creatinine: Serum creatinine (mg/dL or µmol/L based on user selection)
+        bilirubin: Total bilirubin (mg/dL or µmol/L based on user selection)
+        inr: INR
+        sodium: Serum sodium (mEq/L or mmol/L)
+        dialysis_twice: Received dialysis ≥2 times in past week
+    
+    Returns:
+        dict: MELD-Na score and interpretation
+    """
+    # Apply constraints
+    creatinine = max(1.0, min(creatinine, 4.0))
+    bilirubin = max(1.0, bilirubin)
+    inr = max(1.0, inr)
+    sodium = max(125, min(sodium, 137))  # Cap between 125-137
+    
+    # If dialysis twice in past week, creatinine = 4.0
+    if dialysis_twice:
+        creatinine = 4.0
+    
+    # Calculate original MELD score
+    meld = (
+        9.57 * math.log(creatinine) +
+        3.78 * math.log(bilirubin) +
+        11.2 * math.log(inr) +
+        6.43
+    )
+    
+    # Round to nearest integer
+    meld = round(meld)
+    
+    # Apply floor and ceiling
+    meld = max(6, min(meld, 40))
+    
+    # Calculate MELD-Na
+    # If MELD ≥ 12, adjust for sodium
+    if meld >= 12:
+        meld_na = meld + 1.32 * (137 - sodium) - (0.033 * meld * (137 - sodium))
+        meld_na = round(meld_na)
+        meld_na = max(meld, min(meld_na, 40))  # MELD-Na should be ≥ MELD and ≤ 40
+    else:
+        meld_na = meld
+    
+    return {
+        "meld": meld,
+        "meld_na": meld_na,
+        "creatinine_used": creatinine,
+        "bilirubin_used": bilirubin,
+        "inr_used": inr,
+        "sodium_used": sodium,
+        "dialysis_applied": dialysis_twice
+    }
+
+
+def interpret_meld_na(meld_na_score):
+    """
+    Interpret MELD-Na score
+    
+    Returns mortality risk and transplant priority
+    """
+    if meld_na_score < 10:
+        return {
+            "severity": "Rất thấp",
+            "color": "🟢",
+            "mortality_3mo": "< 2%",
+            "mortality_1yr": "< 10%",
+            "transplant_priority": "Rất thấp - Thường không list transplant",
+            "management": "Điều trị nội khoa. Theo dõi định kỳ.",
+            "level": "minimal"
+        }
+    elif meld_na_score < 15:
+        return {
+            "severity": "Thấp",
+            "color": "🟡",
+            "mortality_3mo": "2-6%",
+            "mortality_1yr": "10-20%",
+            "transplant_priority": "Thấp - Cân nhắc list transplant",
+            "management": "Điều trị tối ưu biến chứng. Đánh giá transplant nếu tiến triển.",
+            "level": "low"
+        }
+    elif meld_na_score < 20:
+        return {
+            "severity": "Trung bình",
+            "color": "🟠",
+            "mortality_3mo": "6-20%",
+            "mortality_1yr": "20-50%",
+            "transplant_priority": "Trung bình - NÊN list transplant",
+            "management": "Đánh giá transplant gan. Điều trị tích cực biến chứng.",
+            "level": "moderate"
+        }
+    elif meld_na_score < 30:
+        return {
+            "severity": "Cao",
+            "color": "🔴",
+            "mortality_3mo": "20-50%",
+            "mortality_1yr": "> 50%",
+            "transplant_priority": "Cao - Ưu tiên transplant",
+            "management": "Transplant gan GẤP. Điều trị tích cực, theo dõi sát.",
+            "level": "high"
+        }
+    else:  # ≥ 30
+        return {
+            "severity": "Rất cao",
+            "color": "🔴",
+            "mortality_3mo": "> 50%",
+            "mortality_1yr": "> 70%",
+            "transplant_priority": "Rất cao - CẦN transplant KHẨN CẤP",
+            "management": "Transplant gan KHẨN CẤP. Hỗ trợ tích cực ICU. Xem xét MARS/ECLS.",
+            "level": "critical"
+        }
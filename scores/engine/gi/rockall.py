@@ -0,0 +1,103 @@
+"""
+Rockall Score for Upper GI Bleeding
+Predicts mortality and rebleeding risk in UGIB
+
+Two versions:
+1. Pre-endoscopy Rockall (Clinical): Age + Shock + Comorbidities (0-7)
+2. Complete Rockall: Add Diagnosis + Stigmata (0-11)
+
+Reference:
+Rockall TA, et al. Risk assessment after acute upper gastrointestinal haemorrhage.
+Gut. 1996;38(3):316-21.
+"""
+
+
+def get_rockall_age_points(age: int) -> int:
+    """Age → Rockall points (0-2)"""
+    if age < 60:
+        return 0
+    elif age < 80:
+        return 1
+    else:
+        return 2
+
+
+def get_rockall_shock_points(sbp: int, hr: int) -> tuple:
+    """SBP / HR → (Rockall shock points, shock label)"""
+    if sbp >= 100 and hr < 100:
+        return 0, "Không shock"
+    elif sbp >= 100 and hr >= 100:
+        return 1, "Tachycardia"
+    else:  # SBP < 100
+        return 2, "Hạ huyết áp (shock)"
+
+
+def get_rockall_risk(is_complete: bool, total_score: int) -> dict:
+    """
+    Mortality and rebleeding risk for a Rockall score
+
+    Args:
+        is_complete: True for Complete (post-endoscopy) Rockall, False for
+            Clinical (pre-endoscopy) Rockall
+        total_score: Rockall score
+
+    Returns:
+        dict: mortality, rebleeding rate and risk level
+    """
+    # Determine risk
+    if not is_complete:
+        # Pre-endoscopy Rockall
+        if total_score == 0:
+            mortality = "0.2%"
+            rebleed = "4.9%"
+            risk = "RẤT THẤP"
+            color = "green"
+        elif total_score <= 2:
+            mortality = "0.2-0.5%"
+            rebleed = "5-11%"
+            risk = "THẤP"
+            color = "green"
+        elif total_score <= 4:
+            mortality = "3-5%"
+            rebleed = "14%"
+            risk = "TRUNG BÌNH"
+            color = "orange"
+        else:
+            mortality = "11-25%"
+            rebleed = "24%"
+            risk = "CAO"
+            color = "red"
+    else:
+        # Complete Rockall
+        if total_score <= 2:
+            mortality = "0.2%"
+            rebleed = "5%"
+            risk = "RẤT THẤP"
+            color = "green"
+        elif total_score <= 3:
+            mortality = "2.9%"
+            rebleed = "11%"
+            risk = "THẤP"
+            color = "green"
+        elif total_score <= 5:
+            mortality = "5.3%"
+            rebleed = "14%"
+            risk = "TRUNG BÌNH"
+            color = "orange"
+        elif total_score <= 7:
+            mortality = "10.8%"
+            rebleed = "24%"
+            risk = "CAO"
+            color = "red"
+        else:
+            mortality = "26.7%"
+            rebleed = "42%"
+            risk = "RẤT CAO"
+            color = "red"
+    
+    return {
+        'mortality': mortality,
+        'rebleed': rebleed,
+        'risk': risk,
+        'color': color,
+    }
@@ -0,0 +1,3 @@
+"""
+Hematology - headless compute functions
+"""
@@ -0,0 +1,239 @@
+"""
+4Ts Score for Heparin-Induced Thrombocytopenia (HIT)
+=====================================================
+
+Clinical prediction rule to estimate the probability of HIT
+
+Reference:
+- Lo GK, et al. Evaluation of pretest clinical score (4 T's) for the diagnosis of 
+  heparin-induced thrombocytopenia in two clinical settings. J Thromb Haemost. 2006;4(4):759-765.
+- Cuker A, et al. American Society of Hematology 2018 guidelines for management of 
+  venous thromboembolism: heparin-induced thrombocytopenia. Blood Adv. 2018;2(22):3360-3392.
+
+Four T's Categories:
+1. Thrombocytopenia (severity and timing)
+2. Timing of platelet count fall
+3. Thrombosis or other sequelae
+4. oTher causes of thrombocytopenia
+
+Interpretation:
+- 6-8 points: High probability (≥50-80% chance of HIT)
+- 4-5 points: Intermediate probability (~10-30% chance of HIT)
+- 0-3 points: Low probability (<5% chance of HIT)
+
+Clinical Utility:
+- High NPV (negative predictive value) for low scores
+- Guides HIT antibody testing
+- Informs decision to stop heparin and start alternative anticoagulant
+"""
+
+
+def calculate_4ts_score(
+    thrombocytopenia_category: int,
+    timing_category: int,
+    thrombosis_category: int,
+    other_causes_category: int
+) -> dict:
+    """
+    Calculate 4Ts Score for HIT
+    
+    Args:
+        thrombocytopenia_category: Score for thrombocytopenia severity (0-2)
+        timing_category: Score for timing of platelet fall (0-2)
+        thrombosis_category: Score for thrombosis/sequelae (0-2)
+        other_causes_category: Score for other causes (0-2)
+    
+    Returns:
+        Dictionary containing score, probability, recommendations, and details
+    """
+    score = (thrombocytopenia_category + timing_category + 
+             thrombosis_category + other_causes_category)
+    
+    # Determine probability and recommendations
+    if score >= 6:
+        probability = "XÁC SUẤT CAO (High Probability)"
+        probability_range = "50-80%"
+        risk_class = "HIGH"
+        color = "🔴"
+        recommendation = """
+        **🔴 Xử Trí Khuyến Cáo - HIGH PROBABILITY:**
+        
+        1. **DỪNG Heparin NGAY LẬP TỨC:**
+           - Dừng TẤT CẢ heparin (UFH, LMWH, heparin flush)
+           - Kiểm tra tất cả thuốc/dịch truyền có chứa heparin
+           - Không dùng heparin cho bất kỳ mục đích nào
+        
+        2. **Bắt Đầu Kháng Đông Thay Thế:**
+           - **Argatroban** (DTI - direct thrombin inhibitor):
+             * Liều: 2 mcg/kg/min IV (giảm 0.5-1 mcg/kg/min nếu suy gan)
+             * Theo dõi aPTT (mục tiêu: 1.5-3× baseline)
+           - **HOẶC Fondaparinux** (nếu có):
+             * <50 kg: 5 mg SC q24h
+             * 50-100 kg: 7.5 mg SC q24h
+             * >100 kg: 10 mg SC q24h
+           - **HOẶC Danaparoid** (nếu có)
+        
+        3. **XÉT NGHIỆM Xác Định:**
+           - **HIT antibody ELISA** (PF4/heparin antibodies)
+           - **Serotonin Release Assay (SRA)** - functional assay (gold standard)
+           - Đợi kết quả nhưng KHÔNG trì hoãn điều trị
+        
+        4. **KHÔNG Dùng:**
+           - ❌ Warfarin cho đến khi tiểu cầu >150,000/μL (nguy cơ hoại tử da, gangrene)
+           - ❌ Truyền tiểu cầu (trừ khi chảy máu đe dọa tính mạng)
+        
+        5. **Theo Dõi:**
+           - Đếm tiểu cầu hàng ngày cho đến khi >150,000
+           - Đánh giá huyết khối mới (DVT, PE, động mạch)
+           - Siêu âm doppler chi dưới nếu chưa làm
+        
+        6. **Chuyển Đổi Sang Warfarin:**
+           - Chờ tiểu cầu >150,000/μL × 2 ngày
+           - Overlap ≥5 ngày + INR 2-3 trong 24h
+           - Duy trì kháng đông ≥3 tháng
+        """
+        
+        education = """
+        **💡 Diễn Giải - High Probability:**
+        - 4Ts ≥6 → HIT có khả năng cao (50-80%)
+        - PPV ~70-90% (tùy population)
+        - PHẢI dừng heparin và bắt đầu kháng đông thay thế NGAY
+        - Đợi xét nghiệm xác nhận nhưng KHÔNG trì hoãn điều trị
+        - Nguy cơ huyết khối cao (~30-50%) nếu không điều trị
+        """
+        
+    elif score >= 4:
+        probability = "XÁC SUẤT TRUNG BÌNH (Intermediate Probability)"
+        probability_range = "10-30%"
+        risk_class = "INTERMEDIATE"
+        color = "🟡"
+        recommendation = """
+        **🟡 Xử Trí Khuyến Cáo - INTERMEDIATE PROBABILITY:**
+        
+        1. **Đánh Giá Kỹ & Quyết Định:**
+           - Xem xét DỪNG heparin (khuyến cáo mạnh nếu điểm 5)
+           - Nếu điểm = 4 → cân nhắc rủi ro/lợi ích
+           - Nếu không thể dừng → giám sát sát tiểu cầu
+        
+        2. **XÉT NGHIỆM Khẩn:**
+           - **HIT antibody ELISA** NGAY
+           - Nếu ELISA dương tính → làm functional assay (SRA)
+           - Quyết định dựa trên kết quả xét nghiệm
+        
+        3. **Nếu Quyết Định Dừng Heparin:**
+           - Bắt đầu kháng đông thay thế (argatroban/fondaparinux)
+           - Theo dõi tiểu cầu hàng ngày
+           - Đánh giá huyết khối
+        
+        4. **Nếu Tiếp Tục Heparin:**
+           - Đếm tiểu cầu ít nhất 2 lần/ngày
+           - Nếu tiểu cầu giảm >50% hoặc <100,000 → DỪNG NGAY
+           - Theo dõi sát triệu chứng huyết khối
+        
+        5. **Khi Có Kết Quả ELISA:**
+           - **Dương tính (OD >1.0):** Xử trí như HIGH probability
+           - **Âm tính hoặc yếu (OD <0.4):** Có thể an toàn tiếp tục heparin
+           - **Borderline (OD 0.4-1.0):** Cần functional assay
+        
+        6. **Theo Dõi:**
+           - Tiểu cầu hàng ngày cho đến khi có kết quả xét nghiệm
+           - Tái đánh giá 4Ts nếu có thay đổi lâm sàng
+        """
+        
+        education = """
+        **💡 Diễn Giải - Intermediate Probability:**
+        - 4Ts = 4-5 → HIT có thể có (10-30%)
+        - Không thể loại trừ hoàn toàn
+        - Cần xét nghiệm ELISA để quyết định
+        - Nếu ELISA dương tính → xử trí như HIGH
+        - Nếu ELISA âm tính → an toàn tiếp tục heparin
+        """
+        
+    else:  # score 0-3
+        probability = "XÁC SUẤT THẤP (Low Probability)"
+        probability_range = "<5%"
+        risk_class = "LOW"
+        color = "🟢"
+        recommendation = """
+        **🟢 Xử Trí Khuyến Cáo - LOW PROBABILITY:**
+        
+        1. **Đánh Giá:**
+           - HIT rất ít có khả năng (NPV ~95-99%)
+           - Có thể AN TOÀN tiếp tục heparin
+           - Tìm nguyên nhân KHÁC của giảm tiểu cầu
+        
+        2. **Xét Nghiệm:**
+           - Xét nghiệm HIT antibody KHÔNG khuyến cáo (trừ khi nghi ngờ đặc biệt)
+           - Nếu vẫn lo lắng → có thể làm ELISA (thường âm tính)
+           - Tìm nguyên nhân khác: sepsis, thuốc, DIC, etc.
+        
+        3. **Nguyên Nhân Khác Cần Xem Xét:**
+           - **Sepsis/Infection** (phổ biến nhất)
+           - **Thuốc khác:** Vancomycin, linezolid, valproate, H2-blockers, etc.
+           - **DIC** (Disseminated Intravascular Coagulation)
+           - **TTP/HUS** (Thrombotic Thrombocytopenic Purpura)
+           - **Giảm tiểu cầu sau phẫu thuật** (dilutional, consumption)
+           - **ITP** (Immune Thrombocytopenic Purpura)
+           - **Giảm tiểu cầu do gan/lách to**
+        
+        4. **Theo Dõi:**
+           - Đếm tiểu cầu theo clinical indication
+           - Tái đánh giá 4Ts nếu có thay đổi lâm sàng
+           - Nếu tiểu cầu tiếp tục giảm → xem xét lại
+        
+        5. **Lưu Ý:**
+           - 4Ts <4 có NPV rất cao → an toàn loại trừ HIT
+           - NHƯNG nếu có thay đổi lâm sàng → tính lại 4Ts
+           - Không dừng heparin chỉ dựa trên điểm thấp
+        """
+        
+        education = """
+        **💡 Diễn Giải - Low Probability:**
+        - 4Ts ≤3 → HIT rất ít có khả năng (<5%)
+        - NPV ~95-99% → an toàn loại trừ
+        - Không cần xét nghiệm HIT antibody
+        - Có thể tiếp tục heparin an toàn
+        - Tìm nguyên nhân khác của giảm tiểu cầu
+        """
+    
+    # Map categories to descriptions
+    category_descriptions = {
+        'thrombocytopenia': [
+            "0 điểm: Giảm tiểu cầu <30% hoặc nadir <10,000/μL",
+            "1 điểm: Giảm 30-50% hoặc nadir 10,000-19,000/μL",
+            "2 điểm: Giảm >50% và nadir ≥20,000/μL"
+        ],
+        'timing': [
+            "0 điểm: ≤4 ngày không tiếp xúc heparin gần đây, hoặc không rõ, hoặc >100 ngày",
+            "1 điểm: >10 ngày HOẶC ≤1 ngày với tiếp xúc heparin trong 30-100 ngày",
+            "2 điểm: 5-10 ngày HOẶC ≤1 ngày với tiếp xúc heparin trong 30 ngày"
+        ],
+        'thrombosis': [
+            "0 điểm: Không có huyết khối, hoại tử da, phản ứng cấp",
+            "1 điểm: Huyết khối tiến triển/tái phát, hoặc tổn thương đỏ da không hoại tử, hoặc nghi ngờ huyết khối",
+            "2 điểm: Huyết khối MỚI xác định, hoặc hoại tử da, hoặc phản ứng cấp sau bolus heparin"
+        ],
+        'other_causes': [
+            "0 điểm: Có nguyên nhân rõ ràng khác",
+            "1 điểm: Có thể có nguyên nhân khác",
+            "2 điểm: Không có nguyên nhân nào khác rõ ràng"
+        ]
+    }
+    
+    selected_descriptions = [
+        category_descriptions['thrombocytopenia'][thrombocytopenia_category],
+        category_descriptions['timing'][timing_category],
+        category_descriptions['thrombosis'][thrombosis_category],
+        category_descriptions['other_causes'][other_causes_category]
+    ]
+    
+    return {
+        'score': score,
+        'probability': probability,
+        'probability_range': probability_range,
+        'risk_class': risk_class,
+        'recommendation': recommendation,
+        'education': education,
+        'color': color,
+        'details': selected_descriptions
+    }
@@ -0,0 +1,111 @@
+"""
+Padua Prediction Score
+Nguy cơ VTE ở bệnh nhân nội khoa - Chỉ định thromboprophylaxis
+"""
+
+
+def calculate_padua(
+    cancer: bool,
+    prev_vte: bool,
+    mobility: bool,
+    thrombophilia: bool,
+    trauma: bool,
+    age: int,
+    hf_rf: bool,
+    ami_stroke: bool,
+    infection: bool,
+    bmi: float,
+    hormone: bool
+) -> dict:
+    """
+    Calculate Padua Prediction Score (VTE risk in medical inpatients)
+
+    Args:
+        cancer: Active cancer
+        prev_vte: Previous VTE
+        mobility: Reduced mobility ≥3 days
+        thrombophilia: Known thrombophilic condition
+        trauma: Recent trauma and/or surgery (≤1 month)
+        age: Age (years)
+        hf_rf: Heart and/or respiratory failure
+        ami_stroke: Acute MI and/or ischemic stroke
+        infection: Acute infection and/or rheumatologic disorder
+        bmi: BMI (kg/m²)
+        hormone: Ongoing hormonal treatment
+
+    Returns:
+        dict: score, positive components, risk level and recommendation
+    """
+    score = 0
+    components = []
+    
+    age_70 = age >= 70
+    obesity = bmi >= 30
+    
+    if cancer:
+        score += 3
+        components.append("Ung thư hoạt động (+3)")
+    
+    if prev_vte:
+        score += 3
+        components.append("Tiền sử VTE (+3)")
+    
+    if mobility:
+        score += 3
+        components.append("Giảm vận động (+3)")
+    
+    if thrombophilia:
+        score += 3
+        components.append("Thrombophilia (+3)")
+    
+    if trauma:
+        score += 2
+        components.append("Chấn thương/PT gần đây (+2)")
+    
+    if age_70:
+        score += 1
+        components.append("Tuổi ≥ 70 (+1)")
+    
+    if hf_rf:
+        score += 1
+        components.append("Suy tim/hô hấp (+1)")
+    
+    if ami_stroke:
+        score += 1
+        components.append("AMI/Đột quỵ (+1)")
+    
+    if infection:
+        score += 1
+        components.append("Nhiễm khuẩn/Thấp khớp (+1)")
+    
+    if obesity:
+        score += 1
+        components.append(f"Béo phì BMI {bmi:.1f} (+1)")
+    
+    if hormone:
+        score += 1
+        components.append("Điều trị hormone (+1)")
+    
+    # Risk level
+    if score >= 4:
+        risk = "CAO"
+        color = "#dc3545"
+        icon = "🚨"
+        vte_risk = "~11%"
+        recommendation = "NÊN DỰ PHÒNG"
+    else:
+        risk = "THẤP"
+        color = "#28a745"
+        icon = "✅"
+        vte_risk = "~0.3%"
+        recommendation = "KHÔNG cần dự phòng thường quy"
+    
+    return {
+        'score': score,
+        'components': components,
+        'risk': risk,
+        'color': color,
+        'icon': icon,
+        'vte_risk': vte_risk,
+        'recommendation': recommendation,
+    }
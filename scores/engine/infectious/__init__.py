@@ -0,0 +1,3 @@
+"""
+Infectious Disease - headless compute functions
+"""
@@ -0,0 +1,203 @@
+"""
+Aminoglycoside Multi-Dose PK Simulator
+Mô phỏng nồng độ - thời gian aminoglycoside qua nhiều liều + Hartford nomogram
+
+One-compartment model, repeated short infusions superposed in closed form:
+
+    C(t) = Σ R / (k·V) × (1 - e^(-k·t_in)) × e^(-k·t_after)
+
+Patient parameters:
+- k (h⁻¹) = 0.00293 × CrCl + 0.014  (Dettli / Sarubbi-Hull)
+- V (L) = 0.3 L/kg × dosing weight (IBW, or ABW if obese)
+
+Every candidate regimen is evaluated on one shared time grid, so
+simulate_aminoglycoside() returns a (regimens x time points) array and
+comparing dozens of regimens is a single vectorized call.
+
+Hartford nomogram (Nicolau 1995, 7 mg/kg gentamicin/tobramycin): a random
+level 6-14 h after the start of the infusion selects q24h / q36h / q48h. The
+zone boundaries are straight lines between the 6 h and 14 h values in
+HARTFORD_LINES; amikacin (15 mg/kg) uses the same lines scaled x3.
+"""
+
+import numpy as np
+
+# np.trapz was renamed np.trapezoid in NumPy 2.0
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+AMINOGLYCOSIDES = {
+    "Gentamicin": {"peak_target": (16, 24), "trough_max": 1.0, "mic": 1.0,
+                   "mg_per_kg": (5, 6, 7), "dose_step": 10, "nomogram_scale": 1.0},
+    "Tobramycin": {"peak_target": (16, 24), "trough_max": 1.0, "mic": 1.0,
+                   "mg_per_kg": (5, 6, 7), "dose_step": 10, "nomogram_scale": 1.0},
+    "Amikacin": {"peak_target": (56, 64), "trough_max": 5.0, "mic": 4.0,
+                 "mg_per_kg": (15, 20), "dose_step": 50, "nomogram_scale": 3.0},
+}
+
+V_PER_KG = 0.3                     # L/kg
+DEFAULT_INFUSION = 0.5             # h
+
+# Hartford nomogram: (level at 6 h, level at 14 h) of the q24/q36 and q36/q48 lines
+HARTFORD_WINDOW = (6, 14)
+HARTFORD_LINES = ((3.5, 1.5), (6.0, 3.5))
+HARTFORD_INTERVALS = (24, 36, 48)
+
+
+def elimination_rate(crcl):
+    """Elimination rate constant k (h⁻¹) from CrCl (mL/min)"""
+    return 0.00293 * np.clip(np.asarray(crcl, dtype=float), 0, None) + 0.014
+
+
+def volume_of_distribution(dosing_weight):
+    """Volume of distribution (L) from dosing weight (kg)"""
+    return V_PER_KG * np.asarray(dosing_weight, dtype=float)
+
+
+def time_grid(horizon=72, step=0.1):
+    """Shared time grid (h) from 0 to horizon inclusive"""
+    return np.linspace(0, horizon, int(round(horizon / step)) + 1)
+
+
+def simulate_aminoglycoside(dose, interval, k, v, infusion=DEFAULT_INFUSION,
+                            horizon=72, step=0.1, mic=1.0) -> dict:
+    """
+    Concentration-time curves of repeated infusions, one row per regimen
+
+    Args:
+        dose: Dose (mg), scalar or array of R regimens
+        interval: Dosing interval (h), scalar or array (R,)
+        k, v: Elimination rate (h⁻¹) and volume (L), scalar or array (R,)
+            (one patient, or one patient per regimen)
+        infusion: Infusion duration (h)
+        horizon: Simulated time (h); doses are given at 0, interval, ... < horizon
+        step: Grid step (h)
+        mic: MIC (mg/L) for time below MIC
+
+    Returns:
+        dict: time (T,), concentration (R, T) and per-regimen arrays (R,):
+        peak (highest end-of-infusion level), trough (level before the last
+        dose), time_below_mic (h), time_below_mic_pct, auc24 (mg·h/L per 24 h)
+    """
+    dose, interval, k, v = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(x, dtype=float)) for x in (dose, interval, k, v))
+    )
+    time = time_grid(horizon, step)
+
+    # Dose start times, padded with +inf (no contribution) to the longest schedule
+    n_doses = np.ceil(horizon / interval).astype(int)
+    index = np.arange(n_doses.max())
+    starts = np.where(index < n_doses[:, None], index * interval[:, None], np.inf)
+
+    kk = k[:, None, None]
+    elapsed = time[None, None, :] - starts[:, :, None]                     # (R, N, T)
+    during = np.clip(elapsed, 0, infusion)
+    after = np.maximum(elapsed - infusion, 0)
+    rate = (dose / infusion)[:, None, None]
+    concentration = (rate / (kk * v[:, None, None])
+                     * -np.expm1(-kk * during) * np.exp(-kk * after)).sum(axis=1)
+
+    # Peak at the end of each infusion, trough just before the last dose
+    peak_times = np.where(np.isfinite(starts), starts + infusion, np.nan)
+    peak = _sample(concentration, time, peak_times)
+    last_start = (n_doses - 1) * interval
+    trough = np.where(n_doses > 1, _sample(concentration, time, last_start[:, None])[:, 0], np.nan)
+
+    below = concentration < mic
+    time_below_mic = below[:, 1:].sum(axis=1) * (time[1] - time[0])
+    auc = _trapezoid(concentration, time, axis=1)
+
+    return {
+        "time": time,
+        "concentration": concentration,
+        "peak": np.nanmax(peak, axis=1),
+        "trough": trough,
+        "time_below_mic": time_below_mic,
+        "time_below_mic_pct": 100 * time_below_mic / horizon,
+        "auc24": auc * 24 / horizon,
+    }
+
+
+def _sample(concentration, time, at):
+    """Concentration (R, T) read at times `at` (R, M), linear interpolation"""
+    position = np.clip(np.nan_to_num(at, nan=0.0) / (time[1] - time[0]), 0, len(time) - 1)
+    low = np.floor(position).astype(int)
+    high = np.minimum(low + 1, len(time) - 1)
+    fraction = position - low
+    rows = np.arange(len(concentration))[:, None]
+    value = concentration[rows, low] * (1 - fraction) + concentration[rows, high] * fraction
+    return np.where(np.isnan(at), np.nan, value)
+
+
+def hartford_interval_array(level, hours, drug="Gentamicin"):
+    """
+    Vectorized Hartford nomogram
+
+    Args:
+        level: Random level (mg/L)
+        hours: Time of the level after the start of the infusion (h)
+
+    Returns:
+        np.ndarray (float): 24 / 36 / 48, NaN outside the 6-14 h window
+    """
+    level = np.asarray(level, dtype=float)
+    hours = np.asarray(hours, dtype=float)
+    scale = AMINOGLYCOSIDES[drug]["nomogram_scale"]
+    start, end = HARTFORD_WINDOW
+    fraction = (hours - start) / (end - start)
+    zone = np.zeros(np.broadcast(level, hours).shape, dtype=int)
+    for at_start, at_end in HARTFORD_LINES:
+        boundary = scale * (at_start + (at_end - at_start) * fraction)
+        zone += level > boundary
+    interval = np.take(np.array(HARTFORD_INTERVALS, dtype=float), zone)
+    return np.where((hours >= start) & (hours <= end), interval, np.nan)
+
+
+def hartford_interval(level, hours, drug="Gentamicin") -> dict:
+    """
+    Hartford nomogram interval from one random level
+
+    Returns:
+        dict: interval (24 / 36 / 48, None outside 6-14 h), in_window,
+        boundaries (q24/q36 and q36/q48 levels at that time, mg/L)
+    """
+    interval = float(hartford_interval_array(level, hours, drug))
+    scale = AMINOGLYCOSIDES[drug]["nomogram_scale"]
+    fraction = (hours - HARTFORD_WINDOW[0]) / (HARTFORD_WINDOW[1] - HARTFORD_WINDOW[0])
+    return {
+        "interval": None if interval != interval else int(interval),
+        "in_window": interval == interval,
+        "boundaries": tuple(scale * (a + (b - a) * fraction) for a, b in HARTFORD_LINES),
+    }
+
+
+def compare_regimens(drug, dosing_weight, crcl, mg_per_kg=None, intervals=(24, 36, 48),
+                     infusion=DEFAULT_INFUSION, horizon=96, step=0.1) -> dict:
+    """
+    Simulate every mg/kg x interval combination for one patient
+
+    mg_per_kg defaults to the drug's usual extended-interval doses.
+
+    Returns:
+        simulate_aminoglycoside() dict plus dose, interval, mg_per_kg and
+        meets_target (peak in the drug's target range, trough below its
+        maximum) per regimen; doses rounded to the drug's dose step
+    """
+    info = AMINOGLYCOSIDES[drug]
+    mg_per_kg = info["mg_per_kg"] if mg_per_kg is None else mg_per_kg
+    per_kg, interval = (a.ravel() for a in np.meshgrid(
+        np.asarray(mg_per_kg, dtype=float), np.asarray(intervals, dtype=float), indexing="ij"
+    ))
+    dose = np.round(per_kg * dosing_weight / info["dose_step"]) * info["dose_step"]
+    result = simulate_aminoglycoside(
+        dose, interval, elimination_rate(crcl), volume_of_distribution(dosing_weight),
+        infusion=infusion, horizon=horizon, step=step, mic=info["mic"]
+    )
+    low, high = info["peak_target"]
+    result.update({
+        "dose": dose,
+        "interval": interval,
+        "mg_per_kg": per_kg,
+        "meets_target": ((result["peak"] >= low) & (result["peak"] <= high)
+                         & (result["trough"] < info["trough_max"])),
+    })
+    return result
@@ -0,0 +1,130 @@
+"""
+Centor Score (Modified Centor / McIsaac Score)
+Đánh giá viêm họng do liên cầu khuẩn nhóm A (Streptococcus pyogenes)
+"""
+
+
+def calculate_centor(fever, exudate, nodes, no_cough, age):
+    """
+    Calculate Modified Centor (McIsaac) Score
+    
+    Args:
+        fever: Fever > 38°C (0-1)
+        exudate: Tonsillar exudate (0-1)
+        nodes: Tender anterior cervical lymphadenopathy (0-1)
+        no_cough: Absence of cough (0-1)
+        age: Age in years for age modifier
+    
+    Returns:
+        int: Total Centor score (-1 to 5)
+    """
+    score = fever + exudate + nodes + no_cough
+    
+    # Age modifier (McIsaac modification)
+    if age < 15:
+        score += 1
+    elif age >= 45:
+        score -= 1
+    
+    return score
+
+
+def interpret_centor(score):
+    """
+    Interpret Centor score
+    
+    Args:
+        score: Centor score (-1 to 5)
+    
+    Returns:
+        dict: Interpretation results
+    """
+    if score <= 0:
+        return {
+            "risk": "Rất thấp",
+            "color": "🟢",
+            "probability": "< 2.5%",
+            "recommendation": "KHÔNG cần test hoặc kháng sinh",
+            "action": "Điều trị triệu chứng (giảm đau, hạ sốt). Theo dõi tại nhà.",
+            "testing": "Không test",
+            "antibiotics": "Không kháng sinh",
+            "level": "very_low"
+        }
+    elif score == 1:
+        return {
+            "risk": "Thấp",
+            "color": "🟡",
+            "probability": "5-10%",
+            "recommendation": "KHÔNG cần test hoặc kháng sinh (trừ dịch tễ đặc biệt)",
+            "action": "Điều trị triệu chứng. Tái khám nếu không đỡ sau 3-5 ngày.",
+            "testing": "Không test thường quy",
+            "antibiotics": "Không kháng sinh",
+            "level": "low"
+        }
+    elif score == 2:
+        return {
+            "risk": "Trung bình",
+            "color": "🟠",
+            "probability": "10-17%",
+            "recommendation": "XEM XÉT test (Rapid Antigen hoặc throat culture)",
+            "action": "Test nếu có sẵn. Điều trị dựa trên kết quả test. Nếu không test → Triệu chứng + theo dõi.",
+            "testing": "Rapid Antigen Test (RADT) hoặc throat culture",
+            "antibiotics": "Kháng sinh CHỈ nếu test dương tính",
+            "level": "moderate"
+        }
+    elif score == 3:
+        return {
+            "risk": "Trung bình-cao",
+            "color": "🟠",
+            "probability": "28-35%",
+            "recommendation": "NÊN test (Rapid Antigen hoặc throat culture)",
+            "action": "Test để xác định. Kháng sinh nếu test (+). Nếu không test → Xem xét điều trị kinh nghiệm.",
+            "testing": "Khuyến cáo test (RADT hoặc culture)",
+            "antibiotics": "Kháng sinh nếu test (+) hoặc xem xét empiric",
+            "level": "moderate_high"
+        }
+    else:  # score >= 4
+        return {
+            "risk": "Cao",
+            "color": "🔴",
+            "probability": "51-53%",
+            "recommendation": "Test hoặc điều trị kinh nghiệm",
+            "action": "Test nhanh (RADT). Nếu (+) → Kháng sinh. Nếu (-) → Throat culture xác nhận. HOẶC điều trị kinh nghiệm nếu không test được.",
+            "testing": "RADT + culture nếu (-)",
+            "antibiotics": "Xem xét điều trị kinh nghiệm (đặc biệt nếu không test)",
+            "level": "high"
+        }
+
+
+def get_antibiotic_regimen():
+    """Get antibiotic treatment regimens for strep pharyngitis"""
+    return {
+        "first_line": {
+            "name": "Penicillin / Amoxicillin",
+            "regimens": [
+                "**Penicillin V:** 500 mg PO 2-3 lần/ngày × 10 ngày",
+                "**Amoxicillin:** 500 mg PO 2 lần/ngày × 10 ngày (hoặc 1000 mg 1 lần/ngày)",
+                "**Benzathine Penicillin G:** 1.2 triệu units IM × 1 lần (tuân thủ 100%, tiện cho người khó uống thuốc)"
+            ],
+            "notes": "Lựa chọn đầu tay. Chi phí thấp, hiệu quả cao, phổ hẹp (không làm rối loạn vi sinh vật)."
+        },
+        "allergy": {
+            "name": "Dị ứng Penicillin (không nặng)",
+            "regimens": [
+                "**Cephalexin:** 500 mg PO 2 lần/ngày × 10 ngày",
+                "**Cefadroxil:** 1 g PO 1 lần/ngày × 10 ngày",
+                "**Azithromycin:** 500 mg ngày 1, sau đó 250 mg ngày 2-5 (5 ngày)",
+                "**Clarithromycin:** 250 mg PO 2 lần/ngày × 10 ngày"
+            ],
+            "notes": "Cephalosporin: < 1% cross-reactivity với penicillin. Macrolides: Kháng thuốc tăng (10-15%), nên dùng nếu thật sự dị ứng penicillin."
+        },
+        "severe_allergy": {
+            "name": "Dị ứng Penicillin nặng (anaphylaxis)",
+            "regimens": [
+                "**Azithromycin:** 500 mg ngày 1, sau đó 250 mg ngày 2-5",
+                "**Clarithromycin:** 250 mg PO 2 lần/ngày × 10 ngày",
+                "**Clindamycin:** 300 mg PO 3 lần/ngày × 10 ngày"
+            ],
+            "notes": "TRÁNH cephalosporin. Macrolides/Clindamycin là lựa chọn."
+        }
+    }
@@ -0,0 +1,51 @@
+"""
+FeverPAIN Score Calculator
+Đánh giá viêm amidan - Quyết định có cần kháng sinh
+"""
+
+
+def calculate_feverpain(fever, purulence, attend_rapidly, inflamed_tonsils, no_cough):
+    """
+    Tính điểm FeverPAIN
+    
+    Parameters: Mỗi thành phần = 1 nếu có, 0 nếu không
+    - fever: Sốt trong 24h qua (≥ 38°C)
+    - purulence: Có mủ trên amidan
+    - attend_rapidly: Đến khám trong 3 ngày từ khi khởi phát
+    - inflamed_tonsils: Amidan sưng/viêm rất nặng
+    - no_cough_cold: Không ho hoặc viêm mũi
+    
+    Returns:
+    - dict với total_score và interpretation
+    """
+    # Fever = 1 point, others = 1 point each
+    total = fever + purulence + attend_rapidly + inflamed_tonsils + no_cough
+    
+    # Phân loại
+    if total <= 1:
+        risk = "Rất thấp"
+        strep_probability = "13-18%"
+        recommendation = "Không cần kháng sinh. Tư vấn điều trị triệu chứng"
+        color = "green"
+        antibiotic_advice = "KHÔNG khuyến cáo"
+    elif total <= 3:
+        risk = "Thấp-Trung bình"
+        strep_probability = "34-40%"
+        recommendation = "Cân nhắc kháng sinh hoặc đợi-quan sát (delayed prescription)"
+        color = "orange"
+        antibiotic_advice = "Cân nhắc hoặc kê đơn chờ"
+    else:  # >= 4
+        risk = "Cao"
+        strep_probability = "62-65%"
+        recommendation = "Khả năng cao nhiễm liên cầu. Nên dùng kháng sinh ngay"
+        color = "red"
+        antibiotic_advice = "KHUYẾN CÁO dùng"
+    
+    return {
+        "total_score": total,
+        "risk_level": risk,
+        "strep_probability": strep_probability,
+        "recommendation": recommendation,
+        "antibiotic_advice": antibiotic_advice,
+        "color": color
+    }
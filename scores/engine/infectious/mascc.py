@@ -0,0 +1,22 @@
+"""
+MASCC Risk Index Calculator
+Nguy cơ biến chứng trong sốt giảm bạch cầu hạt
+"""
+
+
+def calculate_mascc(burden, hypotension, copd, solid_tumor_fungal, dehydration, outpatient, age):
+    """Tính MASCC Risk Index"""
+    total = burden + hypotension + copd + solid_tumor_fungal + dehydration + outpatient + age
+    
+    if total >= 21:
+        risk = "Thấp"
+        mortality = "< 1-5%"
+        management = "Có thể điều trị ngoại trú với kháng sinh uống"
+        color = "green"
+    else:
+        risk = "Cao"
+        mortality = "> 10-20%"
+        management = "Cần nhập viện, kháng sinh tĩnh mạch"
+        color = "red"
+    
+    return {"total_score": total, "risk_level": risk, "mortality": mortality, "management": management, "color": color}
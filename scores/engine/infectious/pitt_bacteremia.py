@@ -0,0 +1,35 @@
+"""
+Pitt Bacteremia Score Calculator
+Tiên lượng nhiễm khuẩn huyết
+"""
+
+
+def calculate_pitt(temp, hypotension, ventilator, cardiac_arrest, mental_status):
+    """
+    Tính Pitt Bacteremia Score
+    
+    Parameters: Các thành phần điểm
+    Returns: dict với total_score và interpretation
+    """
+    total = temp + hypotension + ventilator + cardiac_arrest + mental_status
+    
+    # Phân loại
+    if total <= 1:
+        risk = "Thấp"
+        mortality = "1-5%"
+        color = "green"
+    elif total <= 3:
+        risk = "Trung bình"
+        mortality = "6-20%"
+        color = "orange"
+    else:  # >= 4
+        risk = "Cao"
+        mortality = "> 20%"
+        color = "red"
+    
+    return {
+        "total_score": total,
+        "risk_level": risk,
+        "mortality": mortality,
+        "color": color
+    }
@@ -0,0 +1,50 @@
+"""
+SIRS - Systemic Inflammatory Response Syndrome Calculator
+Hội chứng đáp ứng viêm toàn thân
+"""
+
+
+def calculate_sirs(temp_abnormal, hr_high, rr_high_pco2_low, wbc_abnormal):
+    """
+    Tính số tiêu chuẩn SIRS
+    
+    Parameters: Mỗi tiêu chuẩn = 1 nếu có, 0 nếu không
+    - temp_abnormal: Nhiệt độ < 36°C hoặc > 38°C
+    - hr_high: Nhịp tim > 90 lần/phút
+    - rr_high_pco2_low: Nhịp thở > 20 hoặc PaCO₂ < 32 mmHg
+    - wbc_abnormal: WBC bất thường
+    
+    Returns:
+    - dict với số tiêu chuẩn SIRS và interpretation
+    """
+    total = temp_abnormal + hr_high + rr_high_pco2_low + wbc_abnormal
+    
+    # Phân loại
+    if total < 2:
+        status = "Không SIRS"
+        interpretation = "< 2 tiêu chuẩn - không đáp ứng tiêu chuẩn SIRS"
+        color = "green"
+        recommendation = "Theo dõi lâm sàng thường quy"
+    elif total == 2:
+        status = "SIRS"
+        interpretation = "≥ 2 tiêu chuẩn - Hội chứng đáp ứng viêm toàn thân"
+        color = "orange"
+        recommendation = "Tìm nguyên nhân, xét nghiệm thêm nếu cần"
+    elif total == 3:
+        status = "SIRS"
+        interpretation = "≥ 2 tiêu chuẩn - SIRS rõ ràng"
+        color = "orange"
+        recommendation = "Đánh giá nhiễm trùng, xem xét nuôi cấy"
+    else:  # 4
+        status = "SIRS (4/4 tiêu chuẩn)"
+        interpretation = "Tất cả 4 tiêu chuẩn - SIRS nặng"
+        color = "red"
+        recommendation = "Nghi ngờ nhiễm trùng nặng/sepsis, xử trí tích cực"
+    
+    return {
+        "total_criteria": total,
+        "status": status,
+        "interpretation": interpretation,
+        "color": color,
+        "recommendation": recommendation
+    }
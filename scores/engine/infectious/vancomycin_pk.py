@@ -0,0 +1,327 @@
+"""
+Vancomycin Bayesian AUC Estimator
+Ước tính AUC vancomycin từ 1-2 nồng độ đo được (MAP Bayesian)
+
+One-compartment model with intermittent infusions. Concentrations are the
+closed-form superposition of every infusion given so far:
+
+    C(t) = Σ R_i / CL × (1 - e^(-k·t_in)) × e^(-k·t_after),  k = CL / V
+
+Individual CL and V are the maximum a posteriori (MAP) estimates: the
+minimum of the measured-level residuals plus the lognormal population prior
+penalty. The objective is evaluated on a grid of (log CL, log V) deviations
+at once and the grid is zoomed around the best point, so there is no
+iterative optimizer and no starting-value sensitivity.
+
+Population prior (VANCOMYCIN_PRIOR), one-compartment, after Buelga et al.
+Antimicrob Agents Chemother 2005;49:4934:
+    CL (L/h) = 1.08 × CrCl (L/h),   V (L) = 0.98 × body weight
+
+AUC24 at steady state = daily dose / CL. Target 400-600 mg·h/L (Rybak 2020).
+
+calculate_vancomycin_map() fits one patient; calculate_vancomycin_map_batch()
+fits a whole ward in the same vectorized pass.
+"""
+
+import numpy as np
+
+
+VANCOMYCIN_PRIOR = {
+    "cl_per_crcl": 1.08 * 0.06,   # L/h per mL/min of CrCl
+    "v_per_kg": 0.98,             # L/kg
+    "omega_cl": 0.28,             # SD of log CL between patients
+    "omega_v": 0.37,              # SD of log V
+    "sigma_add": 1.5,             # residual error, mg/L
+    "sigma_prop": 0.10,           # residual error, fraction of prediction
+    "crcl_range": (5, 150),       # CrCl clipped to this range (mL/min)
+}
+
+AUC_TARGET = (400, 600)           # mg·h/L
+DOSE_STEP = 250                   # mg
+MAX_SINGLE_DOSE = 3000            # mg
+PEAK_LIMIT = 40                   # mg/L, steady-state peak ceiling for the proposal
+DOSE_INTERVALS = (8, 12, 24, 48)  # h, candidate regimens
+
+# Grid search in units of the prior SD: a coarse pass over ±4 SD, then zooms
+_COARSE_POINTS = 33
+_COARSE_SPAN = 4.0
+_ZOOM_POINTS = 11
+_ZOOMS = 3
+_CHUNK = 128                      # patients per vectorized pass
+
+
+def infusion_hours(dose):
+    """Infusion time: 1 h per 1000 mg, at least 1 h"""
+    return np.maximum(1.0, np.asarray(dose, dtype=float) / 1000)
+
+
+def predict_concentrations(cl, v, dose_times, amounts, infusions, times):
+    """
+    Concentrations (mg/L) at `times` after a series of infusions
+
+    Args:
+        cl, v: Clearance (L/h) and volume (L); any shape S
+        dose_times, amounts, infusions: Start (h), dose (mg) and infusion
+            duration (h) of each infusion, shape (D,)
+        times: Sample times (h, same clock as dose_times), shape (L,)
+
+    Returns:
+        np.ndarray, shape S + (L,)
+    """
+    cl = np.asarray(cl, dtype=float)[..., None, None]
+    k = cl / np.asarray(v, dtype=float)[..., None, None]
+    infusions = np.asarray(infusions, dtype=float)
+    elapsed = np.asarray(times, dtype=float)[:, None] - np.asarray(dose_times, dtype=float)
+    during = np.clip(elapsed, 0, infusions)
+    after = np.maximum(elapsed - infusions, 0)
+    rate = np.asarray(amounts, dtype=float) / infusions
+    return (rate / cl * -np.expm1(-k * during) * np.exp(-k * after)).sum(axis=-1)
+
+
+def steady_state_levels(cl, v, dose, interval, infusion=None):
+    """
+    Steady-state peak (end of infusion) and trough (before next dose), mg/L
+    """
+    infusion = infusion_hours(dose) if infusion is None else infusion
+    k = np.asarray(cl, dtype=float) / v
+    peak = (dose / infusion) / cl * -np.expm1(-k * infusion) / -np.expm1(-k * interval)
+    trough = peak * np.exp(-k * (interval - infusion))
+    return peak, trough
+
+
+def population_parameters(weight, crcl, prior=VANCOMYCIN_PRIOR):
+    """Typical CL (L/h) and V (L) for a patient's weight (kg) and CrCl (mL/min)"""
+    crcl = np.clip(np.asarray(crcl, dtype=float), *prior["crcl_range"])
+    return prior["cl_per_crcl"] * crcl, prior["v_per_kg"] * np.asarray(weight, dtype=float)
+
+
+def _objective(eta_cl, eta_v, cl_pop, v_pop, doses, levels, prior):
+    """
+    MAP objective (-2 log posterior + const) for grids of (eta_cl, eta_v)
+
+    eta_*: (P, G); cl_pop, v_pop: (P,); doses: (P, D, 3) as time, amount,
+    infusion; levels: (P, L, 2) as time, concentration (NaN = padding).
+    """
+    cl = cl_pop[:, None] * np.exp(eta_cl)
+    v = v_pop[:, None] * np.exp(eta_v)
+    k = (cl / v)[:, :, None, None]
+    elapsed = levels[:, None, :, 0, None] - doses[:, None, None, :, 0]
+    infusions = doses[:, None, None, :, 2]
+    during = np.clip(elapsed, 0, infusions)
+    after = np.maximum(elapsed - infusions, 0)
+    rate = doses[:, None, None, :, 1] / infusions
+    predicted = (rate / cl[:, :, None, None] * -np.expm1(-k * during)
+                 * np.exp(-k * after)).sum(axis=-1)
+
+    variance = prior["sigma_add"] ** 2 + (prior["sigma_prop"] * predicted) ** 2
+    residual = (levels[:, None, :, 1] - predicted) ** 2 / variance + np.log(variance)
+    residual = np.where(np.isnan(residual), 0.0, residual).sum(axis=-1)
+    return (residual + (eta_cl / prior["omega_cl"]) ** 2
+            + (eta_v / prior["omega_v"]) ** 2)
+
+
+def _map_fit(cl_pop, v_pop, doses, levels, prior):
+    """(eta_cl, eta_v, objective) per patient, by grid search and zoom"""
+    n = len(cl_pop)
+    unit = np.array([prior["omega_cl"], prior["omega_v"]])
+    axis = np.linspace(-_COARSE_SPAN, _COARSE_SPAN, _COARSE_POINTS)
+    step = axis[1] - axis[0]
+    grid = np.stack(np.meshgrid(axis, axis, indexing="ij"), -1).reshape(-1, 2)
+    centre = np.zeros((n, 2))
+
+    for zoom in range(_ZOOMS + 1):
+        points = (centre[:, None, :] + grid[None, :, :]) * unit
+        objective = _objective(points[..., 0], points[..., 1], cl_pop, v_pop,
+                               doses, levels, prior)
+        best = objective.argmin(axis=1)
+        centre = points[np.arange(n), best] / unit
+        if zoom < _ZOOMS:
+            axis = np.linspace(-step, step, _ZOOM_POINTS)
+            step = axis[1] - axis[0]
+            grid = np.stack(np.meshgrid(axis, axis, indexing="ij"), -1).reshape(-1, 2)
+
+    return centre[:, 0] * unit[0], centre[:, 1] * unit[1], objective[np.arange(n), best]
+
+
+def propose_regimen(cl, v, target=AUC_TARGET, intervals=DOSE_INTERVALS):
+    """
+    Dose (rounded to DOSE_STEP) and interval reaching the AUC24 target
+
+    Per interval the dose aiming at the middle of the target is rounded; the
+    longest interval whose AUC24 is in range, single dose ≤ MAX_SINGLE_DOSE
+    and steady-state peak ≤ PEAK_LIMIT is chosen. If none qualifies, the
+    candidate closest to the middle of the target is returned.
+
+    Args:
+        cl, v: Arrays (P,) of clearance (L/h) and volume (L)
+
+    Returns:
+        dict of arrays (P,): dose, interval, infusion, auc24, peak, trough,
+        in_target
+    """
+    cl = np.asarray(cl, dtype=float)
+    v = np.asarray(v, dtype=float)
+    middle = (target[0] + target[1]) / 2
+    interval = np.asarray(intervals, dtype=float)[:, None]               # (I, 1)
+    dose = np.round(middle * cl * interval / 24 / DOSE_STEP) * DOSE_STEP
+    dose = np.clip(dose, DOSE_STEP, None)
+    infusion = infusion_hours(dose)
+    auc24 = dose * 24 / interval / cl
+    peak, trough = steady_state_levels(cl, v, dose, interval, infusion)
+
+    in_target = (auc24 >= target[0]) & (auc24 <= target[1])
+    acceptable = in_target & (dose <= MAX_SINGLE_DOSE) & (peak <= PEAK_LIMIT)
+    # Longest acceptable interval, else closest AUC
+    longest = len(intervals) - 1 - acceptable[::-1].argmax(axis=0)
+    closest = np.abs(auc24 - middle).argmin(axis=0)
+    choice = np.where(acceptable.any(axis=0), longest, closest)
+
+    columns = np.arange(len(cl))
+    return {
+        "dose": dose[choice, columns],
+        "interval": np.broadcast_to(interval, dose.shape)[choice, columns],
+        "infusion": infusion[choice, columns],
+        "auc24": auc24[choice, columns],
+        "peak": peak[choice, columns],
+        "trough": trough[choice, columns],
+        "in_target": in_target[choice, columns],
+    }
+
+
+def _pad(rows, width, fill):
+    out = np.full((len(rows), max(width, 1), len(fill)), fill, dtype=float)
+    for i, row in enumerate(rows):
+        if len(row):
+            out[i, :len(row)] = row
+    return out
+
+
+def _dose_array(doses):
+    """Dose records (time, amount[, infusion]) → (D, 3), default infusion time"""
+    doses = [tuple(dose) for dose in doses]
+    return [(d[0], d[1], d[2] if len(d) > 2 and d[2] else infusion_hours(d[1]))
+            for d in doses]
+
+
+def _current_regimen(doses):
+    """(last dose mg, interval h) of a dose history; interval None if one dose"""
+    if not doses:
+        return None, None
+    last = doses[-1]
+    interval = last[0] - doses[-2][0] if len(doses) > 1 else None
+    return last[1], interval
+
+
+def calculate_vancomycin_map_batch(patients, prior=VANCOMYCIN_PRIOR, target=AUC_TARGET) -> dict:
+    """
+    Bayesian CL/V, AUC24 and a new regimen for many patients (ward re-dosing)
+
+    Args:
+        patients: Sequence of dicts with weight (kg), crcl (mL/min), doses
+            (list of (start h, mg[, infusion h])), levels (list of
+            (time h, mg/L)); optional 'interval' (h) of the current regimen
+            and 'patient' id. Times share one clock per patient.
+
+    Returns:
+        dict of arrays aligned with patients: patient, cl, v, k, half_life,
+        cl_pop, v_pop, auc24 (current regimen at steady state, NaN if no
+        interval), objective, n_levels and proposed_* (see propose_regimen)
+    """
+    patients = list(patients)
+    n = len(patients)
+    dose_rows = [_dose_array(p.get("doses", ())) for p in patients]
+    level_rows = [[tuple(level) for level in p.get("levels", ())] for p in patients]
+    cl_pop, v_pop = population_parameters(
+        [p["weight"] for p in patients], [p["crcl"] for p in patients], prior
+    )
+
+    eta_cl = np.zeros(n)
+    eta_v = np.zeros(n)
+    objective = np.zeros(n)
+    for start in range(0, n, _CHUNK):
+        part = slice(start, start + _CHUNK)
+        doses = _pad(dose_rows[part], max(map(len, dose_rows[part])), (0.0, 0.0, 1.0))
+        levels = _pad(level_rows[part], max(map(len, level_rows[part])), (0.0, np.nan))
+        eta_cl[part], eta_v[part], objective[part] = _map_fit(
+            cl_pop[part], v_pop[part], doses, levels, prior
+        )
+
+    cl = cl_pop * np.exp(eta_cl)
+    v = v_pop * np.exp(eta_v)
+    k = cl / v
+
+    auc24 = np.full(n, np.nan)
+    for i, (p, doses) in enumerate(zip(patients, dose_rows)):
+        dose, interval = _current_regimen(doses)
+        interval = p.get("interval") or interval
+        if dose and interval:
+            auc24[i] = dose * 24 / interval / cl[i]
+
+    proposal = propose_regimen(cl, v, target)
+    result = {
+        "patient": np.array([p.get("patient", i) for i, p in enumerate(patients)], dtype=object),
+        "cl": cl,
+        "v": v,
+        "k": k,
+        "half_life": np.log(2) / k,
+        "cl_pop": cl_pop,
+        "v_pop": v_pop,
+        "auc24": auc24,
+        "objective": objective,
+        "n_levels": np.array([len(levels) for levels in level_rows]),
+    }
+    result.update({f"proposed_{key}": value for key, value in proposal.items()})
+    return result
+
+
+def calculate_vancomycin_map(weight, crcl, doses, levels, interval=None,
+                             prior=VANCOMYCIN_PRIOR, target=AUC_TARGET) -> dict:
+    """
+    Bayesian (MAP) vancomycin estimate for one patient
+
+    Args:
+        weight: Body weight (kg)
+        crcl: Creatinine clearance (mL/min), e.g. calculate_crcl()
+        doses: List of (start h, dose mg[, infusion h]); infusion defaults
+            to 1 h per 1000 mg
+        levels: List of (sample time h, concentration mg/L), 1-2 levels
+        interval: Current dosing interval (h); default from the last two doses
+
+    Returns:
+        dict: cl, v, k, half_life, cl_pop, v_pop, auc24 (current regimen),
+        auc_status ('low' / 'target' / 'high'), predicted_levels, proposal
+        (dose, interval, infusion, auc24, peak, trough, in_target)
+    """
+    batch = calculate_vancomycin_map_batch(
+        [{"weight": weight, "crcl": crcl, "doses": doses, "levels": levels, "interval": interval}],
+        prior, target
+    )
+    cl, v = float(batch["cl"][0]), float(batch["v"][0])
+    dose_rows = np.array(_dose_array(doses)).reshape(-1, 3)
+    level_times = [level[0] for level in levels]
+    predicted = predict_concentrations(cl, v, dose_rows[:, 0], dose_rows[:, 1],
+                                       dose_rows[:, 2], level_times)
+
+    auc24 = float(batch["auc24"][0])
+    if auc24 != auc24:
+        auc24 = auc_status = None
+    elif auc24 < target[0]:
+        auc_status = "low"
+    elif auc24 > target[1]:
+        auc_status = "high"
+    else:
+        auc_status = "target"
+
+    return {
+        "cl": cl,
+        "v": v,
+        "k": float(batch["k"][0]),
+        "half_life": float(batch["half_life"][0]),
+        "cl_pop": float(batch["cl_pop"][0]),
+        "v_pop": float(batch["v_pop"][0]),
+        "auc24": auc24,
+        "auc_status": auc_status,
+        "predicted_levels": [(t, float(c)) for t, c in zip(level_times, predicted)],
+        "proposal": {key[len("proposed_"):]: value[0].item()
+                     for key, value in batch.items() if key.startswith("proposed_")},
+    }
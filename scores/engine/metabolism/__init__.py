@@ -0,0 +1,3 @@
+"""
+Metabolism & Endocrinology - headless compute functions
+"""
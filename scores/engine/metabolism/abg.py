@@ -0,0 +1,300 @@
+"""
+ABG Interpretation Engine - Arterial Blood Gas
+Phân tích khí máu động mạch: rối loạn nguyên phát, bù trừ, anion gap, P/F
+
+Steps:
+1. pH → acidemia / alkalemia / normal
+2. PaCO2 and HCO3 → primary (or mixed) disorder
+3. Expected compensation:
+   - Metabolic acidosis: Winter's formula, PCO2 = 1.5 × HCO3 + 8 (± 2)
+   - Metabolic alkalosis: PCO2 = 0.7 × HCO3 + 21 (± 2)
+   - Respiratory acidosis: HCO3 rises 0.1 (acute) to 0.35 (chronic) per mmHg PCO2 above 40 (± 2)
+   - Respiratory alkalosis: HCO3 falls 0.2 (acute) to 0.5 (chronic) per mmHg PCO2 below 40 (± 2)
+4. Anion gap and delta-delta ratio (when Na and Cl are given)
+5. P/F ratio (when PaO2 and FiO2 are given)
+
+calculate_abg() interprets one sample; calculate_abg_batch() applies the same
+rules to whole columns of a blood-gas analyzer export.
+"""
+
+import numpy as np
+
+from scores.engine.metabolism.anion_gap import (
+    calculate_anion_gap,
+    calculate_anion_gap_array,
+    calculate_delta_ratio,
+    calculate_delta_ratio_array,
+)
+from scores.engine.metabolism.winter_formula import (
+    calculate_expected_pco2,
+    interpret_compensation,
+)
+
+
+PH_RANGE = (7.35, 7.45)
+PCO2_RANGE = (35, 45)
+HCO3_RANGE = (22, 26)
+AG_UPPER = 12
+
+# Primary disorder labels, indexed by the codes of calculate_abg_batch()
+DISORDERS = (
+    "Normal",
+    "Respiratory Acidosis",
+    "Metabolic Acidosis",
+    "Mixed Respiratory + Metabolic Acidosis",
+    "Respiratory Alkalosis",
+    "Metabolic Alkalosis",
+    "Mixed Respiratory + Metabolic Alkalosis",
+    "Normal pH - Compensated or Mixed",
+    "Acidemia - PaCO2/HCO3 not consistent",
+    "Alkalemia - PaCO2/HCO3 not consistent",
+    "Incomplete - pH/PaCO2/HCO3 not measured",
+)
+INCOMPLETE = 10
+
+# Disorder added when compensation is below / above the expected range
+_SECONDARY = {
+    1: ("Metabolic Acidosis", "Metabolic Alkalosis"),      # judged on HCO3
+    2: ("Respiratory Alkalosis", "Respiratory Acidosis"),  # judged on PCO2
+    4: ("Metabolic Acidosis", "Metabolic Alkalosis"),
+    5: ("Respiratory Alkalosis", "Respiratory Acidosis"),
+}
+
+PF_CATEGORIES = (
+    (400, "Normal oxygenation"),
+    (300, "Mild hypoxemia"),
+    (200, "Moderate hypoxemia (Mild ARDS)"),
+    (100, "Severe hypoxemia (Moderate ARDS)"),
+    (float("-inf"), "Very severe hypoxemia (Severe ARDS)"),
+)
+
+DELTA_RATIO_LABELS = (
+    "HAGMA + Non-AG metabolic acidosis",   # < 1
+    "Pure high-AG metabolic acidosis",     # 1-2
+    "HAGMA + Metabolic alkalosis",         # > 2
+)
+
+
+def _missing(value):
+    return value is None or value != value
+
+
+def _disorder_code(ph, pco2, hco3):
+    if _missing(ph) or _missing(pco2) or _missing(hco3):
+        return INCOMPLETE
+    if ph < PH_RANGE[0]:
+        respiratory, metabolic = pco2 > PCO2_RANGE[1], hco3 < HCO3_RANGE[0]
+        if respiratory and metabolic:
+            return 3
+        return 1 if respiratory else 2 if metabolic else 8
+    if ph > PH_RANGE[1]:
+        respiratory, metabolic = pco2 < PCO2_RANGE[0], hco3 > HCO3_RANGE[1]
+        if respiratory and metabolic:
+            return 6
+        return 4 if respiratory else 5 if metabolic else 9
+    if PCO2_RANGE[0] <= pco2 <= PCO2_RANGE[1] and HCO3_RANGE[0] <= hco3 <= HCO3_RANGE[1]:
+        return 0
+    return 7
+
+
+def _expected_range(code, pco2, hco3):
+    """Expected (low, high) of the compensating variable, or None"""
+    if code == 2:
+        _, low, high = calculate_expected_pco2(hco3)
+        return low, high
+    if code == 5:
+        expected = 0.7 * hco3 + 21
+        return expected - 2, expected + 2
+    if code == 1:
+        rise = pco2 - 40
+        return 24 + 0.1 * rise - 2, 24 + 0.35 * rise + 2
+    if code == 4:
+        fall = 40 - pco2
+        return 24 - 0.5 * fall - 2, 24 - 0.2 * fall + 2
+    return None
+
+
+def classify_pf_ratio(pf_ratio):
+    """Oxygenation category for a P/F ratio"""
+    for lower, label in PF_CATEGORIES:
+        if pf_ratio >= lower:
+            return label
+
+
+def calculate_abg(ph, pco2, hco3, pao2=None, fio2=None, na=None, cl=None, albumin=None) -> dict:
+    """
+    Interpret one arterial blood gas
+
+    Args:
+        ph: Arterial pH
+        pco2: PaCO2 (mmHg)
+        hco3: HCO3 (mEq/L)
+        pao2: PaO2 (mmHg), optional
+        fio2: FiO2 (%), optional
+        na, cl: Sodium, chloride (mEq/L), optional - for anion gap
+        albumin: Albumin (g/dL), optional - AG correction
+
+    Returns:
+        dict: ph_status, disorder, disorder_code (INCOMPLETE when pH,
+        PaCO2 or HCO3 is missing), expected_range (compensating variable:
+        PCO2 for metabolic, HCO3 for respiratory disorders), compensation
+        ('appropriate' / 'below' / 'above'), secondary_disorder, winter
+        (interpret_compensation() for metabolic acidosis), anion_gap,
+        ag_high, delta_ratio, delta_interpretation, pf_ratio, oxygenation
+    """
+    if _missing(ph):
+        ph_status = "Not measured"
+    elif ph < PH_RANGE[0]:
+        ph_status = "Acidemia"
+    elif ph > PH_RANGE[1]:
+        ph_status = "Alkalemia"
+    else:
+        ph_status = "Normal"
+
+    code = _disorder_code(ph, pco2, hco3)
+    expected_range = _expected_range(code, pco2, hco3)
+    compensation = secondary_disorder = winter = None
+    if expected_range is not None:
+        actual = hco3 if code in (1, 4) else pco2
+        if actual < expected_range[0]:
+            compensation, secondary_disorder = "below", _SECONDARY[code][0]
+        elif actual > expected_range[1]:
+            compensation, secondary_disorder = "above", _SECONDARY[code][1]
+        else:
+            compensation = "appropriate"
+    if code == 2:
+        expected_pco2, lower, upper = calculate_expected_pco2(hco3)
+        winter = interpret_compensation(pco2, expected_pco2, lower, upper)
+
+    anion_gap = ag_high = delta_ratio = delta_interpretation = None
+    if na is not None and cl is not None and not _missing(hco3):
+        anion_gap = calculate_anion_gap(na, cl, hco3, albumin)['ag_display']
+        ag_high = anion_gap > AG_UPPER
+        if ag_high and hco3 < 24:
+            delta_ratio = calculate_delta_ratio(anion_gap, hco3)
+            if delta_ratio < 1:
+                delta_interpretation = DELTA_RATIO_LABELS[0]
+            elif delta_ratio <= 2:
+                delta_interpretation = DELTA_RATIO_LABELS[1]
+            else:
+                delta_interpretation = DELTA_RATIO_LABELS[2]
+
+    pf_ratio = oxygenation = None
+    if pao2 is not None and fio2:
+        pf_ratio = pao2 / (fio2 / 100)
+        oxygenation = classify_pf_ratio(pf_ratio)
+
+    return {
+        'ph_status': ph_status,
+        'disorder': DISORDERS[code],
+        'disorder_code': code,
+        'expected_range': expected_range,
+        'compensation': compensation,
+        'secondary_disorder': secondary_disorder,
+        'winter': winter,
+        'anion_gap': anion_gap,
+        'ag_high': ag_high,
+        'delta_ratio': delta_ratio,
+        'delta_interpretation': delta_interpretation,
+        'pf_ratio': pf_ratio,
+        'oxygenation': oxygenation,
+    }
+
+
+# ========== BATCH (blood-gas analyzer exports) ==========
+
+def _column(df, name):
+    if name not in df:
+        return None
+    return np.asarray(df[name], dtype=float)
+
+
+def calculate_abg_batch(df) -> dict:
+    """
+    Vectorized calculate_abg() for many samples
+
+    Args:
+        df: DataFrame or dict of arrays with ph, pco2, hco3 and optionally
+            pao2, fio2 (%), na, cl, albumin (NaN = not measured)
+
+    Returns:
+        dict of arrays: disorder_code (index into DISORDERS; INCOMPLETE
+        when ph, pco2 or hco3 is NaN), disorder,
+        expected_low, expected_high, compensation (-1 below, 0 appropriate,
+        1 above, NaN not applicable), anion_gap, delta_ratio, pf_ratio,
+        oxygenation (index into PF_CATEGORIES, -1 if not computed)
+    """
+    ph = _column(df, 'ph')
+    pco2 = _column(df, 'pco2')
+    hco3 = _column(df, 'hco3')
+    n = len(ph)
+
+    acidemia = ph < PH_RANGE[0]
+    alkalemia = ph > PH_RANGE[1]
+    resp_acid = pco2 > PCO2_RANGE[1]
+    meta_acid = hco3 < HCO3_RANGE[0]
+    resp_alk = pco2 < PCO2_RANGE[0]
+    meta_alk = hco3 > HCO3_RANGE[1]
+    code = np.select(
+        [
+            np.isnan(ph) | np.isnan(pco2) | np.isnan(hco3),
+            acidemia & resp_acid & meta_acid, acidemia & resp_acid, acidemia & meta_acid, acidemia,
+            alkalemia & resp_alk & meta_alk, alkalemia & resp_alk, alkalemia & meta_alk, alkalemia,
+            ~(resp_acid | resp_alk | meta_acid | meta_alk),
+        ],
+        [INCOMPLETE, 3, 1, 2, 8, 6, 4, 5, 9, 0],
+        default=7
+    ).astype(np.int8)
+
+    # Expected range of the compensating variable per primary disorder
+    _, winter_low, winter_high = calculate_expected_pco2(hco3)
+    rise, fall = pco2 - 40, 40 - pco2
+    nan = np.full(n, np.nan)
+    expected_low = np.select(
+        [code == 2, code == 5, code == 1, code == 4],
+        [winter_low, 0.7 * hco3 + 19, 24 + 0.1 * rise - 2, 24 - 0.5 * fall - 2],
+        default=nan
+    )
+    expected_high = np.select(
+        [code == 2, code == 5, code == 1, code == 4],
+        [winter_high, 0.7 * hco3 + 23, 24 + 0.35 * rise + 2, 24 - 0.2 * fall + 2],
+        default=nan
+    )
+    actual = np.where((code == 1) | (code == 4), hco3, pco2)
+    compensation = np.where(
+        np.isnan(expected_low), np.nan,
+        np.where(actual < expected_low, -1.0, np.where(actual > expected_high, 1.0, 0.0))
+    )
+
+    anion_gap = nan
+    delta_ratio = nan
+    na, cl = _column(df, 'na'), _column(df, 'cl')
+    if na is not None and cl is not None:
+        anion_gap = calculate_anion_gap_array(na, cl, hco3, _column(df, 'albumin'))
+        delta_ratio = np.where(
+            (anion_gap > AG_UPPER) & (hco3 < 24),
+            calculate_delta_ratio_array(anion_gap, hco3),
+            np.nan
+        )
+
+    pf_ratio = nan
+    oxygenation = np.full(n, -1, dtype=np.int8)
+    pao2, fio2 = _column(df, 'pao2'), _column(df, 'fio2')
+    if pao2 is not None and fio2 is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pf_ratio = np.where(fio2 > 0, pao2 / (fio2 / 100), np.nan)
+        bounds = np.array([lower for lower, _ in PF_CATEGORIES[:-1]][::-1])
+        category = len(PF_CATEGORIES) - 1 - np.searchsorted(bounds, pf_ratio, side="right")
+        oxygenation = np.where(np.isnan(pf_ratio), -1, category).astype(np.int8)
+
+    return {
+        'disorder_code': code,
+        'disorder': np.take(np.array(DISORDERS, dtype=object), code),
+        'expected_low': expected_low,
+        'expected_high': expected_high,
+        'compensation': compensation,
+        'anion_gap': anion_gap,
+        'delta_ratio': delta_ratio,
+        'pf_ratio': pf_ratio,
+        'oxygenation': oxygenation,
+    }
@@ -0,0 +1,102 @@
+"""
+Anion Gap Calculator
+Đánh giá rối loạn acid-base
+
+Formula:
+Anion Gap = Na - (Cl + HCO3)
+
+Normal: 8-12 mEq/L (if albumin normal)
+High AG: MUDPILES (Metabolic acidosis with high anion gap)
+
+Reference:
+Winter SD, Pearson JR, Gabow PA, et al. The fall of the serum anion gap.
+Arch Intern Med. 1990;150(2):311-3.
+"""
+
+import numpy as np
+
+
+def calculate_anion_gap(na: float, cl: float, hco3: float, albumin: float = None) -> dict:
+    """
+    Calculate Anion Gap (optionally albumin-corrected)
+    
+    Args:
+        na: Sodium (mEq/L)
+        cl: Chloride (mEq/L)
+        hco3: Bicarbonate (mEq/L)
+        albumin: Albumin (g/dL), None to skip albumin correction
+    
+    Returns:
+        dict: ag, ag_corrected (None if not adjusted), ag_display,
+              interpretation, color
+    """
+    # Calculate AG
+    ag = na - (cl + hco3)
+    
+    # Adjust for albumin if needed
+    if albumin is not None:
+        ag_corrected = ag + (2.5 * (4.0 - albumin))
+        ag_display = ag_corrected
+    else:
+        ag_corrected = None
+        ag_display = ag
+    
+    # Interpret
+    if ag_display < 8:
+        interpretation = "THẤP"
+        color = "info"
+    elif ag_display <= 12:
+        interpretation = "BÌNH THƯỜNG"
+        color = "success"
+    elif ag_display <= 16:
+        interpretation = "TĂNG NHẸ"
+        color = "warning"
+    else:
+        interpretation = "TĂNG CAO"
+        color = "error"
+    
+    return {
+        'ag': ag,
+        'ag_corrected': ag_corrected,
+        'ag_display': ag_display,
+        'interpretation': interpretation,
+        'color': color,
+    }
+
+
+def calculate_delta_ratio(ag: float, hco3: float) -> float:
+    """
+    Delta-Delta ratio = (AG - 12) / (24 - HCO3)
+    
+    Returns 0 when HCO3 = 24 (ratio undefined)
+    """
+    return (ag - 12) / (24 - hco3) if (24 - hco3) != 0 else 0
+
+
+# ========== ARRAY VERSIONS (blood-gas analyzer exports) ==========
+
+def calculate_anion_gap_array(na, cl, hco3, albumin=None):
+    """
+    Vectorized anion gap (albumin-corrected where albumin is given)
+    
+    Args:
+        na, cl, hco3: Array-likes (mEq/L)
+        albumin: None or array-like (g/dL); NaN rows are not corrected
+    
+    Returns:
+        np.ndarray: AG used for interpretation (ag_display of calculate_anion_gap)
+    """
+    ag = np.asarray(na, dtype=float) - (np.asarray(cl, dtype=float) + np.asarray(hco3, dtype=float))
+    if albumin is None:
+        return ag
+    albumin = np.asarray(albumin, dtype=float)
+    return np.where(np.isnan(albumin), ag, ag + 2.5 * (4.0 - albumin))
+
+
+def calculate_delta_ratio_array(ag, hco3):
+    """Vectorized delta-delta ratio (0 where HCO3 = 24, as the scalar version)"""
+    ag = np.asarray(ag, dtype=float)
+    hco3 = np.asarray(hco3, dtype=float)
+    denominator = 24 - hco3
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator != 0, (ag - 12) / denominator, 0.0)
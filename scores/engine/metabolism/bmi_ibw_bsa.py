@@ -0,0 +1,41 @@
+"""
+BMI, IBW, BSA Calculator
+Body Mass Index, Ideal Body Weight, Body Surface Area
+"""
+
+import math
+
+
+def calculate_bmi(weight, height_cm):
+    """Calculate BMI"""
+    height_m = height_cm / 100
+    bmi = weight / (height_m ** 2)
+    return bmi
+
+
+def calculate_ibw(height_cm, gender):
+    """Calculate Ideal Body Weight (Devine formula)"""
+    if gender == "male":
+        ibw = 50 + 0.91 * (height_cm - 152.4)
+    else:  # female
+        ibw = 45.5 + 0.91 * (height_cm - 152.4)
+    
+    return max(ibw, 0)  # Ensure non-negative
+
+
+def calculate_abw(actual_weight, ibw):
+    """Calculate Adjusted Body Weight"""
+    abw = ibw + 0.4 * (actual_weight - ibw)
+    return abw
+
+
+def calculate_bsa_mosteller(weight, height_cm):
+    """Calculate BSA using Mosteller formula (most commonly used)"""
+    bsa = math.sqrt((weight * height_cm) / 3600)
+    return bsa
+
+
+def calculate_bsa_dubois(weight, height_cm):
+    """Calculate BSA using DuBois formula"""
+    bsa = 0.007184 * (weight ** 0.425) * (height_cm ** 0.725)
+    return bsa
@@ -0,0 +1,55 @@
+"""
+Corrected Calcium Calculator
+Điều chỉnh Calcium theo Albumin
+
+Formula:
+Corrected Ca = Measured Ca + 0.8 × (4.0 - Albumin)
+
+Why? 40% of calcium is bound to albumin.
+Low albumin → Low measured Ca but normal ionized Ca
+
+Reference:
+Payne RB, et al. Interpretation of serum calcium in patients with abnormal serum proteins.
+Br Med J. 1973;4(5893):643-6.
+"""
+
+
+def calculate_corrected_calcium(ca_mgdl: float, albumin: float) -> dict:
+    """
+    Calculate albumin-corrected calcium
+
+    Args:
+        ca_mgdl: Measured total calcium (mg/dL)
+        albumin: Serum albumin (g/dL)
+
+    Returns:
+        dict: corrected Ca (mg/dL, mmol/L), correction_needed, interpretation, color
+    """
+    # Calculate corrected calcium
+    ca_corrected_mgdl = ca_mgdl + 0.8 * (4.0 - albumin)
+    ca_corrected_mmol = ca_corrected_mgdl / 4
+
+    # Determine if correction needed
+    if abs(ca_corrected_mgdl - ca_mgdl) < 0.3:
+        correction_needed = False
+    else:
+        correction_needed = True
+
+    # Interpret corrected calcium
+    if ca_corrected_mgdl < 8.5:
+        interpretation = "THẤP (Hypocalcemia)"
+        color = "error"
+    elif ca_corrected_mgdl <= 10.5:
+        interpretation = "BÌNH THƯỜNG"
+        color = "success"
+    else:
+        interpretation = "CAO (Hypercalcemia)"
+        color = "warning"
+    
+    return {
+        'ca_corrected_mgdl': ca_corrected_mgdl,
+        'ca_corrected_mmol': ca_corrected_mmol,
+        'correction_needed': correction_needed,
+        'interpretation': interpretation,
+        'color': color,
+    }
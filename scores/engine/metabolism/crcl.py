@@ -0,0 +1,99 @@
+"""
+Creatinine Clearance (Cockcroft-Gault)
+Tính độ thanh thải creatinine - Quan trọng cho điều chỉnh liều thuốc
+"""
+
+import numpy as np
+
+from scores.engine.nephrology.egfr import (
+    _is_value,
+    calculate_ckd_epi_array,
+    calculate_mdrd_array,
+    creatinine_factor,
+    normalize_creatinine,
+)
+
+
+def calculate_crcl(age, weight, creatinine, gender, creatinine_unit="µmol/L"):
+    """
+    Cockcroft-Gault formula for Creatinine Clearance
+    
+    Returns CrCl in mL/min
+    """
+    # Convert creatinine to mg/dL if needed
+    creatinine_mg = creatinine * creatinine_factor(creatinine_unit)
+    
+    # Cockcroft-Gault formula
+    # CrCl (male) = [(140 - age) × weight] / (72 × SCr)
+    # CrCl (female) = CrCl (male) × 0.85
+    
+    crcl = ((140 - age) * weight) / (72 * creatinine_mg)
+    
+    if gender == "female":
+        crcl = crcl * 0.85
+    
+    return crcl
+
+
+def calculate_crcl_array(age, weight, creatinine, gender, creatinine_unit="µmol/L"):
+    """
+    Cockcroft-Gault for whole columns - same formula and same default
+    creatinine unit (µmol/L) as calculate_crcl()
+    
+    Returns CrCl array in mL/min
+    """
+    creatinine_mg = normalize_creatinine(creatinine, creatinine_unit)
+    age = np.asarray(age, dtype=float)
+    weight = np.asarray(weight, dtype=float)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crcl = ((140 - age) * weight) / (72 * creatinine_mg)
+    return np.where(_is_value(gender, "female"), crcl * 0.85, crcl)
+
+
+def calculate_renal_function(df, creatinine_unit="mg/dL") -> dict:
+    """
+    eGFR (CKD-EPI, MDRD) and CrCl for a lab extract
+    
+    Args:
+        df: DataFrame (or dict of arrays) with creatinine, age, gender columns;
+            race and weight are optional (missing → non-black / no CrCl)
+        creatinine_unit: Unit string for the whole column (default mg/dL),
+            or the name of a per-row unit column in df (unknown / missing
+            unit → NaN)
+    
+    Returns:
+        Dictionary with 'ckd_epi', 'mdrd' and 'crcl' arrays ('crcl' is None
+        without a weight column)
+    """
+    if creatinine_unit in df:
+        creatinine_unit = df[creatinine_unit]
+    creatinine_mg = normalize_creatinine(df['creatinine'], creatinine_unit)
+    race = df['race'] if 'race' in df else np.full(len(creatinine_mg), "")
+    
+    return {
+        'ckd_epi': calculate_ckd_epi_array(creatinine_mg, df['age'], df['gender'], race),
+        'mdrd': calculate_mdrd_array(creatinine_mg, df['age'], df['gender'], race),
+        'crcl': calculate_crcl_array(
+            df['age'], df['weight'], creatinine_mg, df['gender'], creatinine_unit="mg/dL"
+        ) if 'weight' in df else None
+    }
+
+
+def calculate_renal_function_chunked(chunks, creatinine_unit="mg/dL"):
+    """
+    Memory-bounded calculate_renal_function() over an extract read in chunks
+    
+    Only one chunk is held in memory at a time, e.g.:
+        for result in calculate_renal_function_chunked(pd.read_csv(path, chunksize=200_000)):
+            ...
+    
+    Args:
+        chunks: Iterable of DataFrames (or dicts of arrays)
+        creatinine_unit: As in calculate_renal_function()
+    
+    Yields:
+        calculate_renal_function() result for each chunk
+    """
+    for chunk in chunks:
+        yield calculate_renal_function(chunk, creatinine_unit)
@@ -0,0 +1,59 @@
+"""
+FENa - Fractional Excretion of Sodium
+Phân biệt AKI tiền thận (prerenal) vs thận (intrinsic renal)
+
+Formula:
+FENa (%) = (U-Na × P-Cr) / (P-Na × U-Cr) × 100
+
+Interpretation:
+- FENa < 1%: Prerenal AKI (hypovolemia, decreased effective circulating volume)
+- FENa > 2%: Intrinsic renal AKI (ATN, AIN)
+- FENa 1-2%: Indeterminate
+
+Reference:
+Espinel CH. The FENa test. Use in the differential diagnosis of acute renal failure.
+JAMA. 1976;236(6):579-81.
+"""
+
+
+def calculate_fena(
+    u_na: float,
+    p_cr_mgdl: float,
+    p_na: float,
+    u_cr_mgdl: float
+) -> dict:
+    """
+    Calculate Fractional Excretion of Sodium (FENa)
+
+    Args:
+        u_na: Urine sodium (mEq/L)
+        p_cr_mgdl: Plasma creatinine (mg/dL)
+        p_na: Plasma sodium (mEq/L)
+        u_cr_mgdl: Urine creatinine (mg/dL)
+
+    Returns:
+        dict: fena (%), interpretation, color, cause
+    """
+    # Calculate FENa
+    fena = ((u_na * p_cr_mgdl) / (p_na * u_cr_mgdl)) * 100
+
+    # Interpret
+    if fena < 1.0:
+        interpretation = "PRERENAL AKI"
+        color = "info"
+        cause = "Thiếu tưới máu thận"
+    elif fena <= 2.0:
+        interpretation = "KHÔNG RÕ RÀNG"
+        color = "warning"
+        cause = "Cần thêm thông tin lâm sàng"
+    else:
+        interpretation = "INTRINSIC RENAL AKI"
+        color = "error"
+        cause = "Tổn thương nhu mô thận"
+    
+    return {
+        'fena': fena,
+        'interpretation': interpretation,
+        'color': color,
+        'cause': cause,
+    }
@@ -0,0 +1,45 @@
+"""
+Free T4 Index (FTI) Calculator
+Chỉ số T4 tự do - ước tính T4 tự do từ T4 toàn phần và T3 uptake
+"""
+
+
+def calculate_fti(total_t4, t3_uptake):
+    """
+    Tính Free T4 Index
+    
+    FTI = Total T4 × (T3 uptake / 100)
+    
+    Parameters:
+    - total_t4: T4 toàn phần (µg/dL)
+    - t3_uptake: T3 uptake (%)
+    
+    Returns:
+    - dict với fti, interpretation
+    """
+    fti = total_t4 * (t3_uptake / 100)
+    
+    # Phân loại
+    if fti < 1.0:
+        status = "Suy giáp (Hypothyroidism)"
+        interpretation = "FTI thấp → Giảm hormone giáp"
+        color = "blue"
+        recommendation = "Xem xét suy giáp, cần TSH để xác nhận"
+    elif fti <= 4.0:
+        status = "Bình thường (Euthyroid)"
+        interpretation = "FTI trong giới hạn bình thường"
+        color = "green"
+        recommendation = "Chức năng giáp bình thường"
+    else:
+        status = "Cường giáp (Hyperthyroidism)"
+        interpretation = "FTI cao → Tăng hormone giáp"
+        color = "red"
+        recommendation = "Xem xét cường giáp, cần TSH và xét nghiệm bổ sung"
+    
+    return {
+        "fti": fti,
+        "status": status,
+        "interpretation": interpretation,
+        "color": color,
+        "recommendation": recommendation
+    }
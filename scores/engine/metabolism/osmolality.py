@@ -0,0 +1,65 @@
+"""
+Serum Osmolality Calculator
+Tính độ thẩm thấu huyết thanh và osmolal gap
+"""
+
+
+def calculate_osmolality(na: float, glucose_mg: float, bun_mg: float) -> dict:
+    """
+    Calculate serum osmolality = 2×Na + Glucose/18 + BUN/2.8
+    
+    Args:
+        na: Sodium (mEq/L)
+        glucose_mg: Glucose (mg/dL)
+        bun_mg: BUN (mg/dL)
+    
+    Returns:
+        dict: calc_osm (mOsm/kg), osm_status, osm_color
+    """
+    calc_osm = 2 * na + glucose_mg/18 + bun_mg/2.8
+    
+    if calc_osm < 275:
+        osm_status = "Thấp"
+        osm_color = "#ffc107"
+    elif calc_osm <= 295:
+        osm_status = "Bình thường"
+        osm_color = "#28a745"
+    else:
+        osm_status = "Cao"
+        osm_color = "#dc3545"
+    
+    return {
+        'calc_osm': calc_osm,
+        'osm_status': osm_status,
+        'osm_color': osm_color,
+    }
+
+
+def calculate_osmolal_gap(measured_osm: float, calc_osm: float) -> dict:
+    """
+    Calculate osmolal gap = measured - calculated osmolality
+    
+    Returns:
+        dict: osm_gap, gap_status, gap_color, gap_icon
+    """
+    osm_gap = measured_osm - calc_osm
+    
+    if osm_gap < 10:
+        gap_status = "Bình thường"
+        gap_color = "#28a745"
+        gap_icon = "✅"
+    elif osm_gap < 20:
+        gap_status = "Tăng nhẹ"
+        gap_color = "#ffc107"
+        gap_icon = "⚠️"
+    else:
+        gap_status = "Tăng rõ rệt"
+        gap_color = "#dc3545"
+        gap_icon = "🚨"
+    
+    return {
+        'osm_gap': osm_gap,
+        'gap_status': gap_status,
+        'gap_color': gap_color,
+        'gap_icon': gap_icon,
+    }
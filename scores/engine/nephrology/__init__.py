@@ -0,0 +1,3 @@
+"""
+Nephrology - headless compute functions
+"""
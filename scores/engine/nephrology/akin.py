@@ -0,0 +1,85 @@
+"""
+AKIN Criteria for Acute Kidney Injury
+======================================
+
+Acute Kidney Injury Network classification (2007)
+Modified from RIFLE, now superseded by KDIGO
+
+Reference:
+- Mehta RL, et al. Acute Kidney Injury Network: report of an initiative to improve
+  outcomes in acute kidney injury. Crit Care. 2007;11(2):R31.
+
+AKIN Stages:
+- Stage 1: SCr increase ≥0.3 mg/dL or 1.5-2× baseline; UO <0.5 mL/kg/h × 6h
+- Stage 2: SCr 2-3× baseline; UO <0.5 mL/kg/h × 12h
+- Stage 3: SCr >3× baseline or ≥4 mg/dL or RRT; UO <0.3 mL/kg/h × 24h or anuria × 12h
+
+Note: AKIN was a refinement of RIFLE and has been incorporated into KDIGO (2012),
+which is now the international standard.
+"""
+
+
+def calculate_akin(
+    scr_baseline: float,
+    scr_current: float,
+    scr_increase_48h: float,
+    urine_output_6h: float,
+    urine_output_12h: float,
+    urine_output_24h: float,
+    weight: float,
+    on_rrt: bool
+) -> dict:
+    """Calculate AKIN stage"""
+    
+    # Calculate creatinine fold increase
+    if scr_baseline > 0:
+        scr_fold = scr_current / scr_baseline
+    else:
+        scr_fold = 0
+    
+    # Calculate UO rates
+    uo_6h_rate = (urine_output_6h / 6 / weight) if weight > 0 and urine_output_6h >= 0 else None
+    uo_12h_rate = (urine_output_12h / 12 / weight) if weight > 0 and urine_output_12h >= 0 else None
+    uo_24h_rate = (urine_output_24h / 24 / weight) if weight > 0 and urine_output_24h >= 0 else None
+    
+    # Determine stage
+    stage_by_scr = 0
+    stage_by_uo = 0
+    
+    # SCr criteria
+    if on_rrt or scr_current >= 4.0 or scr_fold >= 3.0:
+        stage_by_scr = 3
+    elif scr_fold >= 2.0:
+        stage_by_scr = 2
+    elif scr_fold >= 1.5 or scr_increase_48h >= 0.3:
+        stage_by_scr = 1
+    
+    # UO criteria
+    if uo_24h_rate is not None:
+        if uo_24h_rate < 0.3 or urine_output_24h == 0:
+            stage_by_uo = 3
+    
+    if uo_12h_rate is not None:
+        if uo_12h_rate < 0.5 and stage_by_uo < 2:
+            stage_by_uo = 2
+        elif uo_12h_rate == 0:
+            stage_by_uo = 3
+    
+    if uo_6h_rate is not None and stage_by_uo < 1:
+        if uo_6h_rate < 0.5:
+            stage_by_uo = 1
+    
+    final_stage = max(stage_by_scr, stage_by_uo)
+    
+    stage_names = ["Không AKI", "Stage 1", "Stage 2", "Stage 3"]
+    colors = ["🟢", "🟡", "🟠", "🔴"]
+    
+    return {
+        'stage': final_stage,
+        'stage_name': stage_names[final_stage],
+        'color': colors[final_stage],
+        'scr_fold': scr_fold,
+        'uo_6h_rate': uo_6h_rate,
+        'uo_12h_rate': uo_12h_rate,
+        'uo_24h_rate': uo_24h_rate
+    }
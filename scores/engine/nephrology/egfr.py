@@ -0,0 +1,186 @@
+"""
+eGFR Calculator - CKD-EPI & MDRD
+Tính tốc độ lọc cầu thận ước tính
+"""
+
+import numpy as np
+
+
+CREATININE_UMOL_PER_MG = 88.4  # µmol/L per mg/dL
+
+# Creatinine unit (lower case, µ/μ written as u, no spaces) → factor to mg/dL
+CREATININE_UNIT_FACTORS = {
+    "mg/dl": 1.0,
+    "mg%": 1.0,
+    "umol/l": 1 / CREATININE_UMOL_PER_MG,
+    "mcmol/l": 1 / CREATININE_UMOL_PER_MG,
+    "micromol/l": 1 / CREATININE_UMOL_PER_MG,
+    "mmol/l": 1000 / CREATININE_UMOL_PER_MG,
+}
+
+
+def creatinine_factor(unit) -> float:
+    """Factor converting a creatinine unit to mg/dL (µmol/L, μmol/L, umol/L... ; NaN if unknown)"""
+    if not isinstance(unit, str):
+        return np.nan
+    key = unit.strip().lower().replace("µ", "u").replace("μ", "u").replace(" ", "")
+    return CREATININE_UNIT_FACTORS.get(key, np.nan)
+
+
+def calculate_ckd_epi(creatinine_mg, age, gender, race, creatinine_unit="mg/dL"):
+    """
+    CKD-EPI 2009 formula (the most accurate current formula)
+    
+    Returns eGFR in mL/min/1.73m²
+    """
+    # Convert to mg/dL if needed
+    creatinine_mg = creatinine_mg * creatinine_factor(creatinine_unit)
+    
+    # Gender-specific parameters
+    kappa = 0.7 if gender == "female" else 0.9
+    alpha = -0.329 if gender == "female" else -0.411
+    gender_factor = 1.018 if gender == "female" else 1.0
+    
+    # Race factor
+    race_factor = 1.159 if race == "black" else 1.0
+    
+    # Calculate
+    min_val = min(creatinine_mg / kappa, 1)
+    max_val = max(creatinine_mg / kappa, 1)
+    
+    egfr = 141 * (min_val ** alpha) * (max_val ** -1.209) * (0.993 ** age) * gender_factor * race_factor
+    
+    return egfr
+
+
+def calculate_mdrd(creatinine_mg, age, gender, race, creatinine_unit="mg/dL"):
+    """
+    MDRD formula (older, less accurate but still used)
+    
+    Returns eGFR in mL/min/1.73m²
+    """
+    # Convert to mg/dL if needed
+    creatinine_mg = creatinine_mg * creatinine_factor(creatinine_unit)
+    
+    # Gender factor
+    gender_factor = 0.742 if gender == "female" else 1.0
+    
+    # Race factor
+    race_factor = 1.212 if race == "black" else 1.0
+    
+    # Calculate
+    egfr = 175 * (creatinine_mg ** -1.154) * (age ** -0.203) * gender_factor * race_factor
+    
+    return egfr
+
+
+def interpret_egfr(egfr):
+    """Interpret eGFR according to CKD stages"""
+    
+    if egfr >= 90:
+        stage = "G1 - Bình thường hoặc cao"
+        description = "Chức năng thận bình thường (nếu không có bằng chứng tổn thương thận khác)"
+        color = "green"
+        action = "Theo dõi thường quy nếu có yếu tố nguy cơ"
+    elif egfr >= 60:
+        stage = "G2 - Giảm nhẹ"
+        description = "Giảm GFR nhẹ (có thể bình thường ở người cao tuổi)"
+        color = "green"
+        action = "Theo dõi, kiểm soát yếu tố nguy cơ"
+    elif egfr >= 45:
+        stage = "G3a - Giảm nhẹ-trung bình"
+        description = "Suy thận mạn giai đoạn 3a"
+        color = "orange"
+        action = "Theo dõi 6-12 tháng, điều chỉnh liều thuốc, kiểm soát ĐTĐ/THA"
+    elif egfr >= 30:
+        stage = "G3b - Giảm trung bình-nặng"
+        description = "Suy thận mạn giai đoạn 3b"
+        color = "orange"
+        action = "Theo dõi 3-6 tháng, chuẩn bị điều trị thận, hội chẩn chuyên khoa"
+    elif egfr >= 15:
+        stage = "G4 - Giảm nặng"
+        description = "Suy thận mạn giai đoạn 4"
+        color = "red"
+        action = "⚠️ Theo dõi 1-3 tháng, chuẩn bị lọc máu/ghép thận, hội chẩn thận"
+    else:
+        stage = "G5 - Suy thận giai đoạn cuối"
+        description = "Suy thận giai đoạn cuối (ESRD)"
+        color = "red"
+        action = "🚨 Cần lọc máu hoặc ghép thận"
+    
+    return {
+        "stage": stage,
+        "description": description,
+        "color": color,
+        "action": action
+    }
+
+
+# ========== ARRAY VERSIONS (registries, lab extracts) ==========
+
+def normalize_creatinine(creatinine, creatinine_unit="mg/dL"):
+    """
+    Creatinine column → float array in mg/dL (conversion done once per column)
+    
+    Args:
+        creatinine: Array-like of creatinine values
+        creatinine_unit: Unit for the whole column (e.g. "mg/dL", "µmol/L",
+            "umol/L"), or an array-like of per-row unit strings. Unknown or
+            missing units give NaN, never a guess.
+    """
+    creatinine = np.asarray(creatinine, dtype=float)
+    if isinstance(creatinine_unit, str):
+        return creatinine * creatinine_factor(creatinine_unit)
+    # Look up each distinct unit once
+    units = np.asarray(creatinine_unit, dtype=object)
+    units = np.where([isinstance(unit, str) for unit in units.ravel()], units.ravel(), "").astype(str)
+    distinct, inverse = np.unique(units, return_inverse=True)
+    factors = np.array([creatinine_factor(unit) for unit in distinct])
+    return creatinine * factors[inverse].reshape(creatinine.shape)
+
+
+def _is_value(column, value):
+    """Boolean mask column == value (works for pandas and NumPy columns)"""
+    if not hasattr(column, 'shape'):
+        column = np.asarray(column, dtype=object)
+    return np.asarray(column == value, dtype=bool)
+
+
+def calculate_ckd_epi_array(creatinine, age, gender, race, creatinine_unit="mg/dL"):
+    """
+    CKD-EPI 2009 for whole columns - same formula as calculate_ckd_epi()
+    
+    Returns eGFR array in mL/min/1.73m²
+    """
+    creatinine_mg = normalize_creatinine(creatinine, creatinine_unit)
+    age = np.asarray(age, dtype=float)
+    female = _is_value(gender, "female")
+    black = _is_value(race, "black")
+    
+    kappa = np.where(female, 0.7, 0.9)
+    alpha = np.where(female, -0.329, -0.411)
+    
+    ratio = creatinine_mg / kappa
+    min_val = np.minimum(ratio, 1)
+    max_val = np.maximum(ratio, 1)
+    
+    egfr = 141 * (min_val ** alpha) * (max_val ** -1.209) * (0.993 ** age)
+    egfr *= np.where(female, 1.018, 1.0)
+    egfr *= np.where(black, 1.159, 1.0)
+    return egfr
+
+
+def calculate_mdrd_array(creatinine, age, gender, race, creatinine_unit="mg/dL"):
+    """
+    MDRD for whole columns - same formula as calculate_mdrd()
+    
+    Returns eGFR array in mL/min/1.73m²
+    """
+    creatinine_mg = normalize_creatinine(creatinine, creatinine_unit)
+    age = np.asarray(age, dtype=float)
+    
+    with np.errstate(divide='ignore'):
+        egfr = 175 * (creatinine_mg ** -1.154) * (age ** -0.203)
+    egfr *= np.where(_is_value(gender, "female"), 0.742, 1.0)
+    egfr *= np.where(_is_value(race, "black"), 1.212, 1.0)
+    return egfr
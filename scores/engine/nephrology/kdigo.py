@@ -0,0 +1,359 @@
+"""
+KDIGO Criteria for Acute Kidney Injury (AKI)
+=============================================
+
+Current gold standard for AKI classification and staging
+
+Reference:
+- KDIGO Clinical Practice Guideline for Acute Kidney Injury. 
+  Kidney Int Suppl. 2012;2(1):1-138.
+- Kellum JA, et al. Diagnosis, evaluation, and management of acute kidney injury: 
+  a KDIGO summary (Part 1). Crit Care. 2013;17(1):204.
+
+Definition of AKI (ANY of the following):
+1. Serum creatinine increase ≥0.3 mg/dL (≥26.5 μmol/L) within 48 hours
+2. Serum creatinine increase ≥1.5× baseline within 7 days
+3. Urine output <0.5 mL/kg/h for 6 hours
+
+KDIGO Stages:
+- Stage 1: SCr 1.5-1.9× baseline OR ≥0.3 mg/dL increase; UO <0.5 mL/kg/h for 6-12h
+- Stage 2: SCr 2.0-2.9× baseline; UO <0.5 mL/kg/h for ≥12h
+- Stage 3: SCr ≥3× baseline OR ≥4.0 mg/dL OR initiation of RRT; UO <0.3 mL/kg/h for ≥24h OR anuria ≥12h
+
+Clinical Utility:
+- Internationally accepted standard
+- Combines and improves upon RIFLE and AKIN
+- Guides management and prognosis
+"""
+
+
+def calculate_kdigo(
+    scr_baseline: float,
+    scr_current: float,
+    scr_increase_48h: float,
+    urine_output_6h: float,
+    urine_output_12h: float,
+    urine_output_24h: float,
+    weight: float,
+    on_rrt: bool
+) -> dict:
+    """
+    Calculate KDIGO AKI stage
+    
+    Args:
+        scr_baseline: Baseline serum creatinine (mg/dL)
+        scr_current: Current serum creatinine (mg/dL)
+        scr_increase_48h: SCr increase within 48h (mg/dL)
+        urine_output_6h: Total urine output in 6 hours (mL, None if not measured)
+        urine_output_12h: Total urine output in 12 hours (mL, None if not measured)
+        urine_output_24h: Total urine output in 24 hours (mL, None if not measured)
+        weight: Body weight (kg)
+        on_rrt: Patient on renal replacement therapy
+    
+    Returns:
+        Dictionary containing stage, interpretation, recommendations
+    """
+    
+    # Calculate fold increase
+    if scr_baseline > 0:
+        scr_fold = scr_current / scr_baseline
+    else:
+        scr_fold = 0
+    
+    # Calculate hourly urine output (mL/kg/h)
+    uo_6h_rate = (urine_output_6h / 6 / weight) if weight > 0 and urine_output_6h is not None and urine_output_6h >= 0 else None
+    uo_12h_rate = (urine_output_12h / 12 / weight) if weight > 0 and urine_output_12h is not None and urine_output_12h >= 0 else None
+    uo_24h_rate = (urine_output_24h / 24 / weight) if weight > 0 and urine_output_24h is not None and urine_output_24h >= 0 else None
+    
+    # Determine stage based on creatinine
+    stage_by_scr = 0
+    scr_criteria = []
+    
+    if on_rrt:
+        stage_by_scr = 3
+        scr_criteria.append("Đang chạy thận nhân tạo (RRT) → Giai đoạn 3")
+    elif scr_current >= 4.0:
+        stage_by_scr = 3
+        scr_criteria.append(f"SCr ≥4.0 mg/dL (hiện tại: {scr_current:.2f}) → Giai đoạn 3")
+    elif scr_fold >= 3.0:
+        stage_by_scr = 3
+        scr_criteria.append(f"SCr tăng ≥3× baseline ({scr_fold:.1f}×) → Giai đoạn 3")
+    elif scr_fold >= 2.0:
+        stage_by_scr = 2
+        scr_criteria.append(f"SCr tăng 2.0-2.9× baseline ({scr_fold:.1f}×) → Giai đoạn 2")
+    elif scr_fold >= 1.5:
+        stage_by_scr = 1
+        scr_criteria.append(f"SCr tăng 1.5-1.9× baseline ({scr_fold:.1f}×) → Giai đoạn 1")
+    elif scr_increase_48h >= 0.3:
+        stage_by_scr = 1
+        scr_criteria.append(f"SCr tăng ≥0.3 mg/dL trong 48h (+{scr_increase_48h:.2f}) → Giai đoạn 1")
+    
+    # Determine stage based on urine output
+    stage_by_uo = 0
+    uo_criteria = []
+    
+    if uo_24h_rate is not None:
+        if uo_24h_rate < 0.3:
+            stage_by_uo = 3
+            uo_criteria.append(f"Nước tiểu <0.3 mL/kg/h × 24h ({uo_24h_rate:.2f} mL/kg/h) → Giai đoạn 3")
+        elif uo_24h_rate < 0.5 and urine_output_24h >= 0:
+            # Check if <0.5 for 24h (Stage 3) or just 12h (Stage 2)
+            if uo_12h_rate is not None and uo_12h_rate < 0.5:
+                stage_by_uo = max(stage_by_uo, 2)
+                uo_criteria.append(f"Nước tiểu <0.5 mL/kg/h × 12h ({uo_12h_rate:.2f} mL/kg/h) → Giai đoạn 2")
+    
+    if uo_12h_rate is not None and uo_12h_rate < 0.5 and stage_by_uo < 2:
+        stage_by_uo = max(stage_by_uo, 2)
+        uo_criteria.append(f"Nước tiểu <0.5 mL/kg/h × 12h ({uo_12h_rate:.2f} mL/kg/h) → Giai đoạn 2")
+    
+    if uo_6h_rate is not None and uo_6h_rate < 0.5 and stage_by_uo == 0:
+        stage_by_uo = 1
+        uo_criteria.append(f"Nước tiểu <0.5 mL/kg/h × 6-12h ({uo_6h_rate:.2f} mL/kg/h) → Giai đoạn 1")
+    
+    # Check for anuria
+    if uo_12h_rate is not None and uo_12h_rate == 0:
+        stage_by_uo = 3
+        uo_criteria.append(f"Vô niệu (anuria) ≥12h → Giai đoạn 3")
+    
+    # Final stage is the higher of the two
+    final_stage = max(stage_by_scr, stage_by_uo)
+    
+    # Generate interpretation
+    if final_stage == 0:
+        stage_text = "KHÔNG CÓ AKI"
+        stage_color = "🟢"
+        risk_class = "NO_AKI"
+        interpretation = """
+        **🟢 Không đủ tiêu chuẩn chẩn đoán AKI**
+        
+        Bệnh nhân hiện tại không đáp ứng tiêu chuẩn KDIGO cho AKI.
+        
+        **Lưu ý:**
+        - Tiếp tục theo dõi chức năng thận
+        - Tránh các yếu tố nguy cơ AKI
+        - Nếu có nghi ngờ lâm sàng → tái đánh giá
+        """
+    elif final_stage == 1:
+        stage_text = "AKI GIAI ĐOẠN 1 (Mild)"
+        stage_color = "🟡"
+        risk_class = "STAGE_1"
+        interpretation = """
+        **🟡 AKI Giai Đoạn 1 - Nhẹ**
+        
+        **Tỷ Lệ Tử Vong:**
+        - Trong bệnh viện: ~5-10%
+        - Nếu tiến triển sang Stage 2-3: nguy cơ tăng đáng kể
+        
+        **Tiên Lượng:**
+        - Hầu hết hồi phục hoàn toàn nếu điều trị sớm
+        - Nguy cơ chuyển thành CKD: thấp (~5-10%)
+        - Cần theo dõi sát để phát hiện tiến triển
+        """
+    elif final_stage == 2:
+        stage_text = "AKI GIAI ĐOẠN 2 (Moderate)"
+        stage_color = "🟠"
+        risk_class = "STAGE_2"
+        interpretation = """
+        **🟠 AKI Giai Đoạn 2 - Trung Bình**
+        
+        **Tỷ Lệ Tử Vong:**
+        - Trong bệnh viện: ~15-25%
+        - Nguy cơ tiến triển sang Stage 3: ~30-40%
+        
+        **Tiên Lượng:**
+        - Hồi phục: ~60-70% nếu điều trị kịp thời
+        - Nguy cơ chuyển thành CKD: trung bình (~15-25%)
+        - Cần can thiệp tích cực và theo dõi sát
+        """
+    else:  # stage == 3
+        stage_text = "AKI GIAI ĐOẠN 3 (Severe)"
+        stage_color = "🔴"
+        risk_class = "STAGE_3"
+        interpretation = """
+        **🔴 AKI Giai Đoạn 3 - Nặng**
+        
+        **Tỷ Lệ Tử Vong:**
+        - Trong bệnh viện: ~30-60%
+        - Nếu cần RRT: tử vong ~50-70%
+        
+        **Tiên Lượng:**
+        - Hồi phục hoàn toàn: ~40-50%
+        - Nguy cơ chuyển thành CKD: cao (~25-40%)
+        - Nguy cơ cần RRT lâu dài: ~10-15%
+        - Cần can thiệp tích cực NGAY, xem xét RRT
+        """
+    
+    # Management recommendations
+    if final_stage == 0:
+        management = """
+        **Quản Lý - Không AKI:**
+        
+        1. **Dự Phòng:**
+           - Duy trì euvolemia
+           - Tránh thuốc độc thận (NSAIDs, aminoglycosides, contrast)
+           - Điều chỉnh liều thuốc theo chức năng thận
+        
+        2. **Theo Dõi:**
+           - SCr, BUN định kỳ nếu có yếu tố nguy cơ
+           - Theo dõi cân nặng, cân bằng dịch
+           - Đánh giá nước tiểu
+        """
+    elif final_stage == 1:
+        management = """
+        **Xử Trí Khuyến Cáo - Stage 1:**
+        
+        1. **TÌM VÀ XỬ TRÍ NGUYÊN NHÂN:**
+           - **Tiền thận (Pre-renal):** Giảm thể tích, giảm CO, thuốc giãn mạch
+             → Truyền dịch, ngừng ACEI/ARB, vasopressor nếu cần
+           - **Thận (Intrinsic):** ATN, AIN, GN, rhabdomyolysis
+             → Điều trị specific (corticosteroid cho AIN, hydration cho rhabdo)
+           - **Sau thận (Post-renal):** Tắc nghẽn
+             → Đặt catheter, nephrostomy, xử lý tắc nghẽn
+        
+        2. **HỒI SỨC DỊCH:**
+           - Đánh giá tình trạng dịch (CVP, echo, passive leg raise)
+           - Nếu giảm thể tích → NS/LR 500-1000 mL bolus, đánh giá lại
+           - Tránh truyền dịch quá mức (nguy cơ phù phổi)
+        
+        3. **ĐIỀU CHỈNH THUỐC:**
+           - **DỪNG:** NSAIDs, ACEI/ARB, aminoglycosides, contrast agents
+           - **Điều chỉnh liều:** Vancomycin, metformin, digoxin, LMWH
+           - Xem lại TẤT CẢ thuốc - adjust theo GFR
+        
+        4. **THEO DÕI:**
+           - SCr, BUN: Hàng ngày hoặc 2 lần/ngày
+           - Điện giải (K, Na, Mg, PO4): Hàng ngày
+           - Nước tiểu: Mỗi 4-6 giờ
+           - Cân nặng: Hàng ngày
+           - Cân bằng dịch: Chặt chẽ
+        
+        5. **XÉT NGHIỆM BỔ SUNG:**
+           - Urinalysis, urine microscopy (tìm casts, cells)
+           - FENa / FEUrea (phân biệt tiền thận vs thận)
+           - Siêu âm thận (loại trừ tắc nghẽn, hydronephrosis)
+           - Consider: ANA, ANCA, complement (nếu nghi GN)
+        """
+    elif final_stage == 2:
+        management = """
+        **Xử Trí Khuyến Cáo - Stage 2:**
+        
+        1. **CẤP CỨU & TÌM NGUYÊN NHÂN:**
+           - Đánh giá NGAY: Pre-renal vs Intrinsic vs Post-renal
+           - Siêu âm thận CẤP (loại trừ tắc nghẽn)
+           - Xem xét tư vấn Thận sớm
+        
+        2. **HỒI SỨC DỊCH TÍCH CỰC:**
+           - Đánh giá hemodynamic toàn diện
+           - Nếu hypovolemic → NS/LR 1000-2000 mL, theo dõi đáp ứng
+           - Nếu shock → vasopressor (norepinephrine ưu tiên)
+           - Mục tiêu: MAP ≥65 mmHg, CVP 8-12 mmHg, UO >0.5 mL/kg/h
+        
+        3. **ĐIỀU CHỈNH THUỐC TRIỆT ĐỂ:**
+           - **DỪNG NGAY:** Tất cả thuốc độc thận
+           - **Điều chỉnh liều:** Tất cả thuốc bài tiết qua thận
+           - **Tránh:** Contrast agents (trừ khi cực kỳ cần thiết)
+        
+        4. **QUẢN LÝ BIẾN CHỨNG:**
+           - **Tăng kali:** Mục tiêu K <5.5 mEq/L
+             * Calcium gluconate 10% 10 mL IV (nếu K >6.5 hoặc ECG thay đổi)
+             * Insulin 10 U + D50 50 mL IV
+             * Salbutamol nebulizer 10-20 mg
+             * Kayexalate hoặc patiromer
+           - **Tăng phosphate:** Phosphate binder
+           - **Toan chuyển hóa:** Sodium bicarbonate (nếu pH <7.2)
+           - **Phù:** Furosemide (nếu còn đáp ứng); cân nhắc RRT nếu phù phổi
+        
+        5. **THEO DÕI SÁT:**
+           - SCr, BUN: 2 lần/ngày
+           - Điện giải: 2-3 lần/ngày
+           - Nước tiểu: Mỗi 1-2 giờ
+           - ABG: Nếu acidosis
+           - Cân nặng: 2 lần/ngày
+        
+        6. **CHUẨN BỊ RRT:**
+           - Sẵn sàng cho RRT nếu tiến triển
+           - Bảo vệ tĩnh mạch cánh tay (cho fistula sau này)
+        """
+    else:  # stage == 3
+        management = """
+        **Xử Trí Khuyến Cáo - Stage 3:**
+        
+        1. **TƯ VẤN THẬN NGAY LẬP TỨC:**
+           - Đây là cấp cứu thận học
+           - Xem xét RRT (chạy thận nhân tạo)
+        
+        2. **CHỈ ĐỊNH RRT (Renal Replacement Therapy):**
+           
+           **Chỉ định TUYỆT ĐỐI:**
+           - **A**cidosis: pH <7.1, không đáp ứng bicarbonate
+           - **E**lectrolyte: Hyperkalemia (K >6.5) không đáp ứng điều trị
+           - **I**ntoxication: Methanol, ethylene glycol, lithium, salicylates
+           - **O**verload: Phù phổi không đáp ứng lợi tiểu
+           - **U**remia: BUN >100 mg/dL + triệu chứng (pericarditis, encephalopathy, bleeding)
+           
+           **Chỉ định TƯƠNG ĐỐI:**
+           - Oliguria (<200 mL/12h) không đáp ứng
+           - BUN >80-100 mg/dL
+           - Không thể cung cấp dinh dưỡng do hạn chế dịch
+        
+        3. **LOẠI HÌNH RRT:**
+           - **CRRT (Continuous RRT):** Ưu tiên nếu hemodynamic không ổn định
+           - **IHD (Intermittent Hemodialysis):** Nếu hemodynamic ổn định
+           - **SLED (Sustained Low-Efficiency Dialysis):** Thỏa hiệp giữa CRRT và IHD
+        
+        4. **HỒI SỨC TÍCH CỰC:**
+           - ICU monitoring
+           - Hỗ trợ hemodynamic (vasopressor/inotrope)
+           - Điều trị nhiễm trùng nếu có (sepsis thường gặp)
+           - Điều trị nguyên nhân gốc
+        
+        5. **QUẢN LÝ BIẾN CHỨNG:**
+           - **Hyperkalemia (K >6.5):**
+             * Calcium gluconate 10% 10-20 mL IV STAT
+             * Insulin 10 U + D50 50 mL IV
+             * Salbutamol nebulizer 10-20 mg
+             * RRT nếu không đáp ứng
+           - **Phù phổi:**
+             * O2, NIPPV/intubation nếu cần
+             * Furosemide 40-200 mg IV (có thể không hiệu quả)
+             * RRT khẩn cấp
+           - **Toan nặng (pH <7.2):**
+             * Sodium bicarbonate 1-2 amps IV
+             * RRT nếu không đáp ứng
+           - **Uremic pericarditis:**
+             * RRT NGAY
+           - **Rối loạn đông máu:**
+             * Tránh thủ thuật xâm lấn
+             * Xem xét DDAVP, cryoprecipitate
+        
+        6. **DINH DƯỠNG:**
+           - Năng lượng: 25-30 kcal/kg/day
+           - Protein: 1.2-1.5 g/kg/day (nếu trên RRT)
+           - Hạn chế K, PO4
+        
+        7. **THEO DÕI:**
+           - SCr, BUN: 2-3 lần/ngày
+           - Điện giải: 3-4 lần/ngày
+           - ABG: Khi cần (nếu acidosis)
+           - Nước tiểu: Liên tục
+        
+        8. **DỰ PHÒNG BIẾN CHỨNG:**
+           - DVT prophylaxis (LMWH dose-adjusted hoặc SCDs)
+           - Stress ulcer prophylaxis (PPI)
+           - Avoid nephrotoxins TUYỆT ĐỐI
+        """
+    
+    return {
+        'stage': final_stage,
+        'stage_text': stage_text,
+        'stage_color': stage_color,
+        'risk_class': risk_class,
+        'interpretation': interpretation,
+        'management': management,
+        'scr_criteria': scr_criteria,
+        'uo_criteria': uo_criteria,
+        'scr_fold': scr_fold,
+        'uo_6h_rate': uo_6h_rate,
+        'uo_12h_rate': uo_12h_rate,
+        'uo_24h_rate': uo_24h_rate
+    }
@@ -0,0 +1,167 @@
+"""
+KDIGO AKI - Streaming Surveillance
+==================================
+
+KdigoStream consumes raw timestamped serum creatinine and hourly urine output
+for one patient and re-stages AKI after every event, for whole-hospital lab
+feed replay.
+
+Rolling-window state (O(1) amortized per event):
+- Baseline SCr: minimum over the last 7 days (monotonic min-deque)
+- 48h rise: current SCr minus the minimum over the last 48 hours (min-deque)
+- Urine output: running 6h/12h/24h totals (deque + running sum per window);
+  a window is reported only while the urine chart covers all of it
+  (contiguous hourly samples, the last one less than an hour old)
+
+Staging itself is calculate_kdigo(), so the criteria match the calculator.
+
+Usage (one stream per patient):
+    stream = KdigoStream(weight=70)
+    result = stream.add_creatinine(timestamp, 1.4)
+    result = stream.add_urine(timestamp, 25)    # mL in the hour ending at timestamp
+"""
+
+from collections import deque
+from datetime import timedelta
+
+from scores.engine.nephrology.kdigo import calculate_kdigo
+
+
+URINE_WINDOW_HOURS = [6, 12, 24]
+
+
+class _RollingMin:
+    """Minimum over a sliding time window (monotonic deque)"""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()  # (timestamp, value), values increasing
+
+    def push(self, timestamp, value):
+        while self.values and self.values[-1][1] >= value:
+            self.values.pop()
+        self.values.append((timestamp, value))
+
+    def evict(self, now):
+        cutoff = now - self.window
+        while self.values and self.values[0][0] <= cutoff:
+            self.values.popleft()
+
+    def min(self):
+        return self.values[0][1] if self.values else None
+
+
+class _RollingSum:
+    """Sum over a sliding time window"""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()  # (timestamp, value)
+        self.total = 0.0
+
+    def push(self, timestamp, value):
+        self.values.append((timestamp, value))
+        self.total += value
+
+    def evict(self, now):
+        cutoff = now - self.window
+        while self.values and self.values[0][0] <= cutoff:
+            self.total -= self.values.popleft()[1]
+
+
+class KdigoStream:
+    """
+    Incremental KDIGO staging for one patient
+
+    Args:
+        weight: Body weight (kg) for mL/kg/h urine rates
+        on_rrt: Patient on renal replacement therapy (can be changed later)
+        hour: One hour in timestamp units (timedelta for datetimes, or 1 / 3600
+            etc. for numeric timestamps). Windows are multiples of it.
+    """
+
+    def __init__(self, weight: float, on_rrt: bool = False, hour=timedelta(hours=1)):
+        self.weight = weight
+        self.on_rrt = on_rrt
+        self.hour = hour
+        self.last_timestamp = None
+        self.scr_current = None
+        self.urine_from = None      # start of the current contiguous urine chart
+        self.last_urine = None
+        self._baseline = _RollingMin(7 * 24 * hour)
+        self._min_48h = _RollingMin(48 * hour)
+        self._urine = {hours: _RollingSum(hours * hour) for hours in URINE_WINDOW_HOURS}
+
+    def _advance(self, timestamp):
+        if self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError("Events must arrive in time order")
+        self.last_timestamp = timestamp
+        self._baseline.evict(timestamp)
+        self._min_48h.evict(timestamp)
+        for window in self._urine.values():
+            window.evict(timestamp)
+
+    def add_creatinine(self, timestamp, scr: float) -> dict:
+        """Ingest a serum creatinine result (mg/dL) and return the new stage"""
+        self._advance(timestamp)
+        self._baseline.push(timestamp, scr)
+        self._min_48h.push(timestamp, scr)
+        self.scr_current = scr
+        return self.stage()
+
+    def add_urine(self, timestamp, volume: float) -> dict:
+        """Ingest urine output (mL) for the hour ending at timestamp"""
+        self._advance(timestamp)
+        if self.last_urine is None or timestamp - self.hour > self.last_urine:
+            self.urine_from = timestamp - self.hour
+        self.last_urine = timestamp
+        for window in self._urine.values():
+            window.push(timestamp, volume)
+        return self.stage()
+
+    def urine_totals(self) -> dict:
+        """
+        Urine output over the last 6/12/24 hours (mL)
+
+        A window is None unless the urine chart covers all of it: hourly
+        samples without gaps back to its start, and the last sample less
+        than an hour old. A short, interrupted or stopped chart never looks
+        like oliguria / anuria.
+        """
+        current = self.last_urine is not None and self.last_timestamp - self.last_urine < self.hour
+        totals = {}
+        for hours, window in self._urine.items():
+            covered = current and self.last_timestamp - self.urine_from >= hours * self.hour
+            totals[hours] = window.total if covered else None
+        return totals
+
+    def stage(self) -> dict:
+        """
+        Current KDIGO stage from the rolling state
+
+        Returns:
+            calculate_kdigo() result plus 'scr_baseline', 'scr_increase_48h'
+            and 'urine_totals' (hours → mL or None)
+        """
+        if self.scr_current is None:
+            scr_current = scr_baseline = scr_increase_48h = 0
+        else:
+            scr_current = self.scr_current
+            scr_baseline = self._baseline.min()
+            scr_increase_48h = scr_current - self._min_48h.min()
+
+        totals = self.urine_totals()
+        result = calculate_kdigo(
+            scr_baseline=scr_baseline,
+            scr_current=scr_current,
+            scr_increase_48h=scr_increase_48h,
+            urine_output_6h=totals[6],
+            urine_output_12h=totals[12],
+            urine_output_24h=totals[24],
+            weight=self.weight,
+            on_rrt=self.on_rrt
+        )
+        result['scr_baseline'] = scr_baseline if self.scr_current is not None else None
+        result['scr_increase_48h'] = scr_increase_48h if self.scr_current is not None else None
+        result['urine_totals'] = totals
+        return result
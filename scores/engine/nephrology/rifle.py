@@ -0,0 +1,79 @@
+"""
+RIFLE Criteria for Acute Kidney Injury
+========================================
+
+One of the first standardized classification systems for AKI (now superseded by KDIGO)
+
+Reference:
+- Bellomo R, et al. Acute renal failure - definition, outcome measures, animal models,
+  fluid therapy and information technology needs: the Second International Consensus
+  Conference of the Acute Dialysis Quality Initiative (ADQI) Group. Crit Care. 2004;8(4):R204-212.
+
+RIFLE Categories (increasing severity):
+- Risk
+- Injury
+- Failure
+- Loss (of kidney function)
+- ESRD (End-Stage Renal Disease)
+
+Note: KDIGO has largely replaced RIFLE in modern practice, but RIFLE is still used in some
+settings and has extensive historical validation data.
+"""
+
+
+def calculate_rifle(
+    scr_baseline: float,
+    scr_current: float,
+    gfr_decrease_percent: float,
+    urine_output_6h: float,
+    urine_output_12h: float,
+    weight: float
+) -> dict:
+    """Calculate RIFLE classification"""
+    
+    # Calculate creatinine fold increase
+    if scr_baseline > 0:
+        scr_fold = scr_current / scr_baseline
+    else:
+        scr_fold = 0
+    
+    # Calculate UO rate
+    uo_6h_rate = (urine_output_6h / 6 / weight) if weight > 0 and urine_output_6h >= 0 else None
+    uo_12h_rate = (urine_output_12h / 12 / weight) if weight > 0 and urine_output_12h >= 0 else None
+    
+    # Determine category
+    category_by_scr = 0  # 0=none, 1=Risk, 2=Injury, 3=Failure
+    category_by_uo = 0
+    
+    # SCr/GFR criteria
+    if scr_fold >= 3.0 or gfr_decrease_percent >= 75 or scr_current >= 4.0:
+        category_by_scr = 3  # Failure
+    elif scr_fold >= 2.0 or gfr_decrease_percent >= 50:
+        category_by_scr = 2  # Injury
+    elif scr_fold >= 1.5 or gfr_decrease_percent >= 25:
+        category_by_scr = 1  # Risk
+    
+    # UO criteria
+    if uo_12h_rate is not None:
+        if uo_12h_rate < 0.3 or urine_output_12h == 0:
+            category_by_uo = 3  # Failure
+        elif uo_12h_rate < 0.5:
+            category_by_uo = 2  # Injury
+    
+    if uo_6h_rate is not None and category_by_uo < 1:
+        if uo_6h_rate < 0.5:
+            category_by_uo = 1  # Risk
+    
+    final_category = max(category_by_scr, category_by_uo)
+    
+    categories = ["Không AKI", "Risk", "Injury", "Failure"]
+    colors = ["🟢", "🟡", "🟠", "🔴"]
+    
+    return {
+        'category': final_category,
+        'category_name': categories[final_category],
+        'color': colors[final_category],
+        'scr_fold': scr_fold,
+        'uo_6h_rate': uo_6h_rate,
+        'uo_12h_rate': uo_12h_rate
+    }
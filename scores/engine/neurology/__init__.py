@@ -0,0 +1,3 @@
+"""
+Neurology - headless compute functions
+"""
@@ -0,0 +1,31 @@
+"""
+Glasgow Coma Scale (GCS)
+Consciousness level assessment
+"""
+
+
+def calculate_gcs(eye_score: int, verbal_score: int, motor_score: int) -> dict:
+    """
+    Calculate Glasgow Coma Scale
+    
+    Args:
+        eye_score: Eye opening (1-4)
+        verbal_score: Verbal response (1-5)
+        motor_score: Motor response (1-6)
+    
+    Returns:
+        dict: total_score (3-15) and TBI severity
+    """
+    total_score = eye_score + verbal_score + motor_score
+    
+    if total_score >= 14:
+        severity = "Mild TBI"
+    elif total_score >= 9:
+        severity = "Moderate TBI"
+    else:
+        severity = "Severe TBI"
+    
+    return {
+        'total_score': total_score,
+        'severity': severity,
+    }
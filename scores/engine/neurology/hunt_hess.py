@@ -0,0 +1,20 @@
+"""
+Hunt & Hess Scale - Classification of Subarachnoid Hemorrhage (SAH)
+Predicts mortality and outcome in patients with aneurysmal subarachnoid hemorrhage
+
+Grades 1-5 based on clinical features
+- Higher grade = Higher mortality risk
+
+Reference:
+Hunt WE, Hess RM. Surgical risk as related to time of intervention in the repair of intracranial aneurysms.
+J Neurosurg. 1968;28(1):14-20.
+"""
+
+
+def adjust_hunt_hess_grade(grade_number: int, serious_disease: bool) -> int:
+    """
+    Final Hunt & Hess grade: +1 for serious systemic disease (max grade 5)
+    """
+    if serious_disease:
+        return min(grade_number + 1, 5)  # Max grade 5
+    return grade_number
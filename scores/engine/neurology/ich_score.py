@@ -0,0 +1,53 @@
+"""
+ICH Score - Intracerebral Hemorrhage Score
+Predicts 30-day mortality in patients with intracerebral hemorrhage
+
+Score Components:
+1. GCS score (Glasgow Coma Scale)
+2. ICH volume (≥30 cm³)
+3. Intraventricular hemorrhage
+4. Infratentorial origin of ICH
+5. Age ≥80 years
+
+Total score: 0-6 points
+- Higher score = Higher mortality risk
+
+Reference:
+Hemphill JC 3rd, et al. The ICH score: a simple, reliable grading scale for intracerebral hemorrhage. 
+Stroke. 2001;32(4):891-7.
+"""
+
+
+# ICH Score → 30-day mortality (Hemphill 2001)
+ICH_MORTALITY = {
+    0: {"rate": "0%", "desc": "Rất thấp", "color": "🟢"},
+    1: {"rate": "13%", "desc": "Thấp", "color": "🟡"},
+    2: {"rate": "26%", "desc": "Trung bình", "color": "🟠"},
+    3: {"rate": "72%", "desc": "Cao", "color": "🔴"},
+    4: {"rate": "97%", "desc": "Rất cao", "color": "🔴"},
+    5: {"rate": "100%", "desc": "Cực cao", "color": "⚫"},
+    6: {"rate": "100%", "desc": "Cực cao", "color": "⚫"}
+}
+
+
+def calculate_ich_score(gcs_score: int, volume_score: int, ivh_score: int,
+                        location_score: int, age_score: int) -> dict:
+    """
+    Calculate ICH Score
+    
+    Args:
+        gcs_score: GCS 13-15 = 0, 5-12 = 1, 3-4 = 2
+        volume_score: ICH volume ≥ 30 cm³ = 1
+        ivh_score: Intraventricular hemorrhage = 1
+        location_score: Infratentorial origin = 1
+        age_score: Age ≥ 80 = 1
+    
+    Returns:
+        dict: total_score (0-6) and 30-day mortality
+    """
+    total_score = gcs_score + volume_score + ivh_score + location_score + age_score
+    
+    return {
+        'total_score': total_score,
+        'mortality': ICH_MORTALITY[total_score],
+    }
@@ -0,0 +1,70 @@
+"""
+NIHSS - NIH Stroke Scale
+Đánh giá mức độ nặng của đột quỵ
+"""
+
+
+def calculate_nihss(
+    loc_score: int,
+    loc_q_score: int,
+    loc_c_score: int,
+    gaze_score: int,
+    visual_score: int,
+    facial_score: int,
+    arm_l_score: int,
+    arm_r_score: int,
+    leg_l_score: int,
+    leg_r_score: int,
+    ataxia_score: int,
+    sensory_score: int,
+    language_score: int,
+    dysarthria_score: int,
+    neglect_score: int
+) -> dict:
+    """
+    Calculate NIH Stroke Scale total and severity
+
+    Args:
+        15 NIHSS item scores (1a, 1b, 1c, 2, 3, 4, 5a, 5b, 6a, 6b, 7, 8, 9, 10, 11)
+
+    Returns:
+        dict: total_score, severity, color, thrombolysis recommendation
+    """
+    # Calculate total
+    total_score = (
+        loc_score + loc_q_score + loc_c_score +
+        gaze_score + visual_score + facial_score +
+        arm_l_score + arm_r_score +
+        leg_l_score + leg_r_score +
+        ataxia_score + sensory_score +
+        language_score + dysarthria_score + neglect_score
+    )
+
+    # Determine severity
+    if total_score == 0:
+        severity = "KHÔNG CÓ ĐỘT QUỴ"
+        color = "success"
+        thrombolysis = "Không"
+    elif total_score <= 4:
+        severity = "ĐỘT QUỴ NHẸ"
+        color = "info"
+        thrombolysis = "Cân nhắc (nếu triệu chứng disabling)"
+    elif total_score <= 15:
+        severity = "ĐỘT QUỴ TRUNG BÌNH"
+        color = "warning"
+        thrombolysis = "Có chỉ định (nếu trong thời gian vàng)"
+    elif total_score <= 20:
+        severity = "ĐỘT QUỴ TRUNG BÌNH - NẶNG"
+        color = "warning"
+        thrombolysis = "Có chỉ định cao"
+    else:
+        severity = "ĐỘT QUỴ NẶNG"
+        color = "error"
+        thrombolysis = "Có chỉ định cao + xem xét thrombectomy"
+    
+    return {
+        'total_score': total_score,
+        'severity': severity,
+        'color': color,
+        'thrombolysis': thrombolysis,
+    }
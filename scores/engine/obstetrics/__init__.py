@@ -0,0 +1,3 @@
+"""
+Obstetrics - headless compute functions
+"""
@@ -0,0 +1,109 @@
+"""
+Modified Bishop Score
+Phiên bản cải tiến của Bishop Score với thêm yếu tố lâm sàng
+"""
+
+
+def calculate_modified_bishop(dilation, effacement, station, consistency, position,
+                               has_preeclampsia=False, has_prom=False):
+    """
+    Calculate Modified Bishop Score
+    
+    Args:
+        dilation: Cervical dilation (cm)
+        effacement: Cervical effacement (%)
+        station: Fetal station
+        consistency: Cervical consistency
+        position: Cervical position
+        has_preeclampsia: Presence of preeclampsia (+1 point)
+        has_prom: Premature rupture of membranes (+1 point)
+    
+    Returns:
+        dict: Score breakdown
+    """
+    # Original Bishop components (same scoring)
+    if dilation == 0:
+        dilation_score = 0
+    elif dilation <= 2:
+        dilation_score = 1
+    elif dilation <= 4:
+        dilation_score = 2
+    else:
+        dilation_score = 3
+    
+    if effacement <= 30:
+        effacement_score = 0
+    elif effacement <= 50:
+        effacement_score = 1
+    elif effacement <= 80:
+        effacement_score = 2
+    else:
+        effacement_score = 3
+    
+    if station <= -3:
+        station_score = 0
+    elif station == -2:
+        station_score = 1
+    elif station in [-1, 0]:
+        station_score = 2
+    else:
+        station_score = 3
+    
+    consistency_scores = {"firm": 0, "medium": 1, "soft": 2}
+    consistency_score = consistency_scores.get(consistency, 0)
+    
+    position_scores = {"posterior": 0, "mid": 1, "anterior": 2}
+    position_score = position_scores.get(position, 0)
+    
+    # Modified Bishop additions
+    preeclampsia_score = 1 if has_preeclampsia else 0
+    prom_score = 1 if has_prom else 0
+    
+    base_score = (dilation_score + effacement_score + station_score + 
+                  consistency_score + position_score)
+    
+    modifier_score = preeclampsia_score + prom_score
+    
+    total = base_score + modifier_score
+    
+    return {
+        "total": total,
+        "base_score": base_score,
+        "dilation_score": dilation_score,
+        "effacement_score": effacement_score,
+        "station_score": station_score,
+        "consistency_score": consistency_score,
+        "position_score": position_score,
+        "preeclampsia_score": preeclampsia_score,
+        "prom_score": prom_score,
+        "modifier_score": modifier_score
+    }
+
+
+def interpret_modified_bishop(total_score, is_nulliparous=True):
+    """Interpret Modified Bishop Score (cutoffs adjusted for 0-15 scale)"""
+    
+    if total_score <= 5:
+        return {
+            "favorability": "KHÔNG THUẬN LỢI",
+            "color": "🔴",
+            "recommendation": "Cần cervical ripening",
+            "success_rate": "30-50% (nullip), 60-70% (multip)",
+            "severity": "unfavorable"
+        }
+    elif total_score <= 8:
+        return {
+            "favorability": "TRUNG BÌNH",
+            "color": "🟡",
+            "recommendation": "Xem xét ripening (đặc biệt nulliparous)",
+            "success_rate": "60-75% (nullip), 80-90% (multip)",
+            "severity": "intermediate"
+        }
+    else:  # > 8
+        return {
+            "favorability": "THUẬN LỢI",
+            "color": "🟢",
+            "recommendation": "Induction khả năng thành công cao",
+            "success_rate": "80-95% (nullip), 95-98% (multip)",
+            "severity": "favorable"
+        }
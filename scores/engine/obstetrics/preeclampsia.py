@@ -0,0 +1,71 @@
+"""
+Preeclampsia Severity Classification
+Phân loại mức độ nặng của tiền sản giật
+"""
+
+
+def get_severe_features(
+    severe_htn: bool,
+    headache: bool,
+    visual: bool,
+    plt: float,
+    creat: float,
+    alt: float,
+    epigastric_pain: bool,
+    pulmonary_edema: bool,
+    fetal_growth: bool
+) -> list:
+    """
+    List preeclampsia severe features (≥1 → preeclampsia nặng)
+    
+    Args:
+        severe_htn: BP ≥ 160/110 mmHg
+        headache: Severe persistent headache
+        visual: Visual disturbances
+        plt: Platelets (×10³/µL)
+        creat: Creatinine (µmol/L)
+        alt: ALT/AST (U/L)
+        epigastric_pain: Epigastric/RUQ pain
+        pulmonary_edema: Pulmonary edema
+        fetal_growth: Fetal growth restriction (IUGR)
+    
+    Returns:
+        list: Descriptions of positive severe features
+    """
+    severe_features = []
+    
+    if severe_htn:
+        severe_features.append("THA nặng (≥160/110)")
+    if headache:
+        severe_features.append("Đau đầu dữ dội")
+    if visual:
+        severe_features.append("Rối loạn thị giác")
+    if plt < 100:
+        severe_features.append(f"Tiểu cầu < 100 ({plt})")
+    if creat > 97:  # >1.1 mg/dL
+        severe_features.append(f"Creatinine tăng ({creat} µmol/L)")
+    if alt > 70:  # 2x bình thường
+        severe_features.append(f"Men gan tăng (>2x BT)")
+    if epigastric_pain:
+        severe_features.append("Đau thượng vị/hạ sườn phải")
+    if pulmonary_edema:
+        severe_features.append("Phù phổi")
+    if fetal_growth:
+        severe_features.append("Thai chậm phát triển (IUGR)")
+    
+    return severe_features
+
+
+def get_hellp_features(plt: float, alt: float, ldh: float) -> list:
+    """
+    List HELLP syndrome criteria present (≥2 → nghi ngờ HELLP)
+    """
+    hellp_features = []
+    if plt < 100:
+        hellp_features.append("Thrombocytopenia")
+    if alt > 70:
+        hellp_features.append("Elevated Liver enzymes")
+    if ldh > 600:
+        hellp_features.append("Hemolysis (LDH cao)")
+    
+    return hellp_features
@@ -0,0 +1,3 @@
+"""
+Oncology - headless compute functions
+"""
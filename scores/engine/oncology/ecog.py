@@ -0,0 +1,111 @@
+"""
+ECOG Performance Status (Eastern Cooperative Oncology Group)
+Đánh giá thể trạng bệnh nhân ung thư
+"""
+
+
+def get_ecog_criteria():
+    """Get ECOG performance status criteria"""
+    return {
+        0: {
+            "status": "Hoàn toàn hoạt động",
+            "description": "Có thể thực hiện tất cả các hoạt động như trước khi mắc bệnh mà không bị hạn chế",
+            "details": "Không có triệu chứng, có thể làm việc bình thường",
+            "color": "🟢",
+            "prognosis": "Tiên lượng tốt nhất",
+            "treatment": "Phù hợp với tất cả các phác đồ điều trị, kể cả thử nghiệm lâm sàng",
+            "survival": "Thời gian sống thêm dài nhất"
+        },
+        1: {
+            "status": "Hạn chế hoạt động nặng",
+            "description": "Có triệu chứng nhưng vẫn đi lại được. Có thể làm công việc nhẹ hoặc công việc văn phòng",
+            "details": "Không thể làm việc nặng nhưng vẫn tự chăm sóc bản thân",
+            "color": "🟡",
+            "prognosis": "Tiên lượng tốt",
+            "treatment": "Phù hợp với hầu hết các phác đồ điều trị tiêu chuẩn",
+            "survival": "Thời gian sống thêm tốt"
+        },
+        2: {
+            "status": "Tự chăm sóc được nhưng không thể làm việc",
+            "description": "Đi lại được và tự chăm sóc bản thân nhưng không thể làm việc. Thức dậy > 50% thời gian trong ngày",
+            "details": "Có thể đi lại nhưng cần nghỉ ngơi nhiều",
+            "color": "🟠",
+            "prognosis": "Tiên lượng trung bình",
+            "treatment": "Có thể điều trị nhưng cần cân nhắc độc tính. Một số phác đồ có thể không phù hợp",
+            "survival": "Thời gian sống thêm trung bình"
+        },
+        3: {
+            "status": "Chỉ tự chăm sóc hạn chế",
+            "description": "Chỉ tự chăm sóc bản thân hạn chế. Nằm giường hoặc ngồi ghế > 50% thời gian thức",
+            "details": "Cần hỗ trợ đáng kể trong sinh hoạt hàng ngày",
+            "color": "🔴",
+            "prognosis": "Tiên lượng kém",
+            "treatment": "Điều trị hạn chế. Chỉ dùng phác đồ nhẹ hoặc best supportive care",
+            "survival": "Thời gian sống thêm ngắn"
+        },
+        4: {
+            "status": "Hoàn toàn không thể tự chăm sóc",
+            "description": "Hoàn toàn tàn tật. Không thể tự chăm sóc bản thân. Nằm liệt giường hoàn toàn",
+            "details": "Cần chăm sóc toàn diện",
+            "color": "🔴",
+            "prognosis": "Tiên lượng rất kém",
+            "treatment": "Chỉ best supportive care / chăm sóc giảm nhẹ. Không phù hợp với hóa trị tích cực",
+            "survival": "Thời gian sống thêm rất ngắn (thường < 3 tháng)"
+        }
+    }
+
+
+def get_treatment_recommendations(ecog_score):
+    """
+    Get treatment recommendations based on ECOG score
+    
+    Args:
+        ecog_score: ECOG performance status (0-4)
+    
+    Returns:
+        dict: Treatment recommendations
+    """
+    recommendations = {
+        0: {
+            "chemotherapy": "✅ Phù hợp với tất cả phác đồ, kể cả liều cao",
+            "clinical_trials": "✅ Phù hợp tham gia thử nghiệm lâm sàng",
+            "surgery": "✅ Phù hợp phẫu thuật lớn",
+            "radiation": "✅ Phù hợp xạ trị tích cực",
+            "immunotherapy": "✅ Phù hợp điều trị miễn dịch",
+            "monitoring": "Theo dõi định kỳ, đánh giá đáp ứng"
+        },
+        1: {
+            "chemotherapy": "✅ Phù hợp hầu hết phác đồ điều trị",
+            "clinical_trials": "✅ Có thể tham gia nhiều thử nghiệm",
+            "surgery": "✅ Phù hợp phẫu thuật",
+            "radiation": "✅ Phù hợp xạ trị",
+            "immunotherapy": "✅ Phù hợp điều trị miễn dịch",
+            "monitoring": "Theo dõi sát, đánh giá thể trạng thường xuyên"
+        },
+        2: {
+            "chemotherapy": "⚠️ Cân nhắc liều giảm hoặc phác đồ ít độc tính",
+            "clinical_trials": "⚠️ Chỉ một số thử nghiệm chấp nhận",
+            "surgery": "⚠️ Xem xét kỹ nguy cơ-lợi ích",
+            "radiation": "✅ Có thể xạ trị giảm nhẹ",
+            "immunotherapy": "⚠️ Xem xét cẩn thận",
+            "monitoring": "Theo dõi sát, hỗ trợ dinh dưỡng và phục hồi chức năng"
+        },
+        3: {
+            "chemotherapy": "❌ Thường không phù hợp với phác đồ tích cực. Chỉ xem xét phác đồ nhẹ đơn thuốc",
+            "clinical_trials": "❌ Không phù hợp hầu hết thử nghiệm",
+            "surgery": "❌ Không phù hợp phẫu thuật lớn",
+            "radiation": "⚠️ Chỉ xạ trị giảm nhẹ triệu chứng",
+            "immunotherapy": "❌ Thường không phù hợp",
+            "monitoring": "Chăm sóc hỗ trợ tích cực, kiểm soát triệu chứng"
+        },
+        4: {
+            "chemotherapy": "❌ Không phù hợp hóa trị",
+            "clinical_trials": "❌ Không phù hợp thử nghiệm",
+            "surgery": "❌ Không phù hợp phẫu thuật",
+            "radiation": "❌ Chỉ xạ trị giảm nhẹ nếu cần thiết",
+            "immunotherapy": "❌ Không phù hợp",
+            "monitoring": "Best supportive care, chăm sóc giảm nhẹ, hospice care"
+        }
+    }
+    
+    return recommendations.get(ecog_score, recommendations[4])
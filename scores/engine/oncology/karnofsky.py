@@ -0,0 +1,32 @@
+"""
+Karnofsky Performance Scale Calculator
+Thang đo thể trạng bệnh nhân ung thư
+"""
+
+
+def interpret_karnofsky(score):
+    """Interpret Karnofsky score"""
+    
+    if score >= 80:
+        status = "Tốt - Tự chăm sóc được"
+        care = "Tự chăm sóc, hoạt động bình thường"
+        prognosis = "Tiên lượng tốt, có thể điều trị tích cực"
+        color = "green"
+    elif score >= 50:
+        status = "Trung bình - Cần hỗ trợ"
+        care = "Cần hỗ trợ nhưng chưa cần chăm sóc liên tục"
+        prognosis = "Có thể điều trị, cần theo dõi chặt"
+        color = "orange"
+    else:
+        status = "Kém - Cần chăm sóc nhiều"
+        care = "Cần chăm sóc y tế liên tục"
+        prognosis = "Tiên lượng xấu, cân nhắc chăm sóc giảm nhẹ"
+        color = "red"
+    
+    return {
+        "score": score,
+        "status": status,
+        "care": care,
+        "prognosis": prognosis,
+        "color": color
+    }
@@ -0,0 +1,38 @@
+"""
+PPS - Palliative Performance Scale Calculator
+Thang đo thể trạng chăm sóc giảm nhẹ
+"""
+
+
+def interpret_pps(pps_score: int) -> dict:
+    """
+    Interpret Palliative Performance Scale (PPS)
+
+    Args:
+        pps_score: PPS (0-100%, steps of 10)
+
+    Returns:
+        dict: prognosis, color, care setting
+    """
+    if pps_score >= 70:
+        prognosis = "Tuần/tháng"
+        color = "green"
+        care = "Chăm sóc giảm nhẹ ngoại trú"
+    elif pps_score >= 50:
+        prognosis = "Tuần"
+        color = "orange"
+        care = "Chăm sóc tại nhà với hỗ trợ"
+    elif pps_score >= 20:
+        prognosis = "Ngày/tuần"
+        color = "orange"
+        care = "Chăm sóc tại nhà hoặc hospice"
+    else:
+        prognosis = "Giờ/ngày"
+        color = "red"
+        care = "Hospice, chăm sóc end-of-life"
+    
+    return {
+        'prognosis': prognosis,
+        'color': color,
+        'care': care,
+    }
@@ -0,0 +1,3 @@
+"""
+Ophthalmology - headless compute functions
+"""
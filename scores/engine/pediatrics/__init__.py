@@ -0,0 +1,3 @@
+"""
+Pediatrics - headless compute functions
+"""
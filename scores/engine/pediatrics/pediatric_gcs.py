@@ -0,0 +1,44 @@
+"""
+Pediatric GCS - Pediatric Glasgow Coma Scale Calculator
+Đánh giá mức độ ý thức ở trẻ em
+"""
+
+
+def calculate_pediatric_gcs(eye, verbal, motor, age_group):
+    """
+    Tính điểm Pediatric GCS
+    
+    Parameters:
+    - eye: Điểm mở mắt (1-4)
+    - verbal: Điểm đáp ứng lời nói (1-5)
+    - motor: Điểm vận động (1-6)
+    - age_group: Nhóm tuổi ("infant" < 2 tuổi, "child" >= 2 tuổi)
+    
+    Returns:
+    - dict với total_score, severity và interpretation
+    """
+    total = eye + verbal + motor
+    
+    # Phân loại mức độ
+    if total >= 13:
+        severity = "Nhẹ (Mild)"
+        interpretation = "Tình trạng ổn định, tiên lượng tốt"
+        color = "green"
+    elif total >= 9:
+        severity = "Trung bình (Moderate)"
+        interpretation = "Cần theo dõi chặt chẽ, có nguy cơ suy giảm"
+        color = "orange"
+    else:  # 3-8
+        severity = "Nặng (Severe)"
+        interpretation = "⚠️ Nguy cơ cao, cần hồi sức tích cực"
+        color = "red"
+    
+    return {
+        "total_score": total,
+        "eye_score": eye,
+        "verbal_score": verbal,
+        "motor_score": motor,
+        "severity": severity,
+        "interpretation": interpretation,
+        "color": color
+    }
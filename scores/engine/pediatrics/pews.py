@@ -0,0 +1,44 @@
+"""
+PEWS - Pediatric Early Warning Score Calculator
+Cảnh báo sớm suy giảm trạng thái lâm sàng ở trẻ em
+"""
+
+
+def calculate_pews(behavior, cardiovascular, respiratory):
+    """
+    Tính điểm PEWS
+    
+    Parameters:
+    - behavior: Điểm hành vi (0-3)
+    - cardiovascular: Điểm tim mạch (0-3)
+    - respiratory: Điểm hô hấp (0-3)
+    
+    Returns:
+    - dict với total_score và interpretation
+    """
+    total = behavior + cardiovascular + respiratory
+    
+    # Phân loại mức độ nguy cơ
+    if total == 0:
+        risk = "Thấp"
+        action = "Tiếp tục theo dõi thường quy"
+        color = "green"
+    elif total <= 2:
+        risk = "Thấp - Trung bình"
+        action = "Tăng cường theo dõi, thông báo bác sĩ"
+        color = "orange"
+    elif total <= 4:
+        risk = "Trung bình"
+        action = "Gọi bác sĩ khám ngay, theo dõi chặt chẽ"
+        color = "orange"
+    else:  # >= 5
+        risk = "Cao"
+        action = "⚠️ KHẨN CẤP: Kích hoạt đội cấp cứu nhi khoa ngay"
+        color = "red"
+    
+    return {
+        "total_score": total,
+        "risk_level": risk,
+        "action": action,
+        "color": color
+    }
@@ -0,0 +1,43 @@
+"""
+Westley Croup Score
+Đánh giá mức độ nặng của viêm후두khí quản cấp (croup) ở trẻ em
+"""
+
+
+def calculate_westley_croup(consciousness: int, cyanosis: int, stridor: int,
+                            air_entry: int, retractions: int) -> dict:
+    """
+    Calculate Westley Croup Score
+    
+    Args:
+        consciousness: 0 (normal) or 5 (disoriented)
+        cyanosis: 0, 4 (with agitation) or 5 (at rest)
+        stridor: 0-2
+        air_entry: 0-2
+        retractions: 0-3
+    
+    Returns:
+        dict: score (0-17), severity, color, icon
+    """
+    score = consciousness + cyanosis + stridor + air_entry + retractions
+    
+    # Severity
+    if score < 3:
+        severity = "Nhẹ"
+        color = "#28a745"
+        icon = "✅"
+    elif score <= 7:
+        severity = "Trung bình"
+        color = "#ffc107"
+        icon = "⚠️"
+    else:
+        severity = "Nặng"
+        color = "#dc3545"
+        icon = "🚨"
+    
+    return {
+        'score': score,
+        'severity': severity,
+        'color': color,
+        'icon': icon,
+    }
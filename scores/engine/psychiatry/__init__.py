@@ -0,0 +1,3 @@
+"""
+Psychiatry & Psychology - headless compute functions
+"""
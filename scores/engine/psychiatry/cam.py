@@ -0,0 +1,11 @@
+"""
+CAM - Confusion Assessment Method
+Đánh giá hôn mê lú lẫn (Delirium)
+"""
+
+
+def evaluate_cam(feature1: bool, feature2: bool, feature3: bool, feature4: bool) -> bool:
+    """
+    CAM positive (delirium) = Feature 1 AND Feature 2 AND (Feature 3 OR Feature 4)
+    """
+    return feature1 and feature2 and (feature3 or feature4)
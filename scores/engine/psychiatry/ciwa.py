@@ -0,0 +1,18 @@
+"""
+CIWA-Ar - Clinical Institute Withdrawal Assessment for Alcohol
+Đánh giá mức độ nặng cai rượu
+"""
+
+
+def calculate_ciwa(nausea, tremor, sweating, anxiety, agitation, tactile, auditory, visual, headache, orientation):
+    """Tính CIWA-Ar score"""
+    total = nausea + tremor + sweating + anxiety + agitation + tactile + auditory + visual + headache + orientation
+    
+    if total < 8:
+        severity = "Nhẹ"; management = "Theo dõi, không cần thuốc"; color = "green"
+    elif total <= 15:
+        severity = "Trung bình"; management = "Cân nhắc benzodiazepine"; color = "orange"
+    else:
+        severity = "Nặng"; management = "Benzodiazepine ngay, theo dõi ICU"; color = "red"
+    
+    return {"total_score": total, "severity": severity, "management": management, "color": color}
@@ -0,0 +1,20 @@
+"""
+COWS - Clinical Opiate Withdrawal Scale
+Đánh giá cai opioid
+"""
+
+
+def calculate_cows(pulse, sweating, restlessness, pupil, bone_pain, runny, gi, tremor, yawning, anxiety, gooseflesh):
+    """Tính COWS score"""
+    total = pulse + sweating + restlessness + pupil + bone_pain + runny + gi + tremor + yawning + anxiety + gooseflesh
+    
+    if total <= 4:
+        severity = "Nhẹ"; management = "Hỗ trợ triệu chứng"; color = "green"
+    elif total <= 12:
+        severity = "Trung bình"; management = "Clonidine, hỗ trợ triệu chứng"; color = "orange"
+    elif total <= 24:
+        severity = "Trung bình-Nặng"; management = "Buprenorphine/Methadone"; color = "orange"
+    else:
+        severity = "Nặng"; management = "Điều trị tích cực, Buprenorphine/Methadone"; color = "red"
+    
+    return {"total_score": total, "severity": severity, "management": management, "color": color}
@@ -0,0 +1,31 @@
+"""MMSE - Mini Mental State Exam"""
+
+
+def calculate_mmse(orientation: int, registration: int, attention: int,
+                   recall: int, language: int) -> dict:
+    """
+    Calculate MMSE total (0-30) and severity
+    
+    Returns:
+        dict: total, status, color
+    """
+    total = orientation + registration + attention + recall + language
+    
+    if total >= 27:
+        status = "Bình thường"
+        color = "#28a745"
+    elif total >= 21:
+        status = "Suy giảm nhẹ"
+        color = "#fd7e14"
+    elif total >= 10:
+        status = "Suy giảm trung bình"
+        color = "#fd7e14"
+    else:
+        status = "Suy giảm nặng"
+        color = "#dc3545"
+    
+    return {
+        'total': total,
+        'status': status,
+        'color': color,
+    }
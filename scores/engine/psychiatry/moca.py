@@ -0,0 +1,28 @@
+"""MoCA - Montreal Cognitive Assessment"""
+
+
+def calculate_moca(visuospatial: int, naming: int, attention: int, language: int,
+                   abstraction: int, memory: int, orientation: int, education: bool) -> dict:
+    """
+    Calculate MoCA total (+1 if ≤12 years of education, max 30)
+    
+    Returns:
+        dict: total, status, color
+    """
+    total = visuospatial + naming + attention + language + abstraction + memory + orientation
+    if education:
+        total += 1
+    total = min(total, 30)
+    
+    if total >= 26:
+        status = "Bình thường"
+        color = "#28a745"
+    else:
+        status = "Suy giảm nhận thức"
+        color = "#fd7e14"
+    
+    return {
+        'total': total,
+        'status': status,
+        'color': color,
+    }
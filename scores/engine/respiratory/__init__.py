@@ -0,0 +1,3 @@
+"""
+Respiratory - headless compute functions
+"""
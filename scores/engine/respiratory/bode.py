@@ -0,0 +1,233 @@
+"""
+BODE Index
+==========
+
+Multidimensional grading system for COPD prognosis
+
+Reference:
+- Celli BR, et al. The body-mass index, airflow obstruction, dyspnea, and exercise
+  capacity index in chronic obstructive pulmonary disease. N Engl J Med. 2004;350(10):1005-1012.
+
+BODE Components:
+- B: Body mass index (BMI)
+- O: Airflow Obstruction (FEV1% predicted)
+- D: Dyspnea (mMRC scale)
+- E: Exercise capacity (6-minute walk distance)
+
+Total: 0-10 points
+
+Clinical Utility:
+- Predict mortality in COPD
+- Better than FEV1 alone
+- Guide management decisions
+- Monitor disease progression
+"""
+
+
+def calculate_bode(
+    bmi: float,
+    fev1_percent: float,
+    mmrc_dyspnea: int,
+    walk_distance: int
+) -> dict:
+    """
+    Calculate BODE Index
+    
+    Args:
+        bmi: Body Mass Index
+        fev1_percent: FEV1 % predicted
+        mmrc_dyspnea: Modified MRC dyspnea scale (0-4)
+        walk_distance: 6-minute walk distance (meters)
+    
+    Returns:
+        Dictionary with BODE score, mortality risk, recommendations
+    """
+    
+    score = 0
+    details = []
+    
+    # BMI points
+    if bmi <= 21:
+        bmi_points = 1
+        details.append(f"BMI = {bmi:.1f} → 1 điểm (≤21)")
+    else:
+        bmi_points = 0
+        details.append(f"BMI = {bmi:.1f} → 0 điểm (>21)")
+    score += bmi_points
+    
+    # FEV1 points
+    if fev1_percent >= 65:
+        fev1_points = 0
+        details.append(f"FEV1 = {fev1_percent:.0f}% → 0 điểm (≥65%)")
+    elif fev1_percent >= 50:
+        fev1_points = 1
+        details.append(f"FEV1 = {fev1_percent:.0f}% → 1 điểm (50-64%)")
+    elif fev1_percent >= 36:
+        fev1_points = 2
+        details.append(f"FEV1 = {fev1_percent:.0f}% → 2 điểm (36-49%)")
+    else:
+        fev1_points = 3
+        details.append(f"FEV1 = {fev1_percent:.0f}% → 3 điểm (≤35%)")
+    score += fev1_points
+    
+    # mMRC dyspnea points
+    mmrc_descriptions = [
+        "0: Khó thở khi gắng sức nặng",
+        "1: Khó thở khi đi nhanh/lên dốc",
+        "2: Đi chậm hơn người cùng tuổi",
+        "3: Dừng lại sau đi ~100m",
+        "4: Quá khó thở để ra khỏi nhà"
+    ]
+    
+    if mmrc_dyspnea <= 1:
+        dyspnea_points = 0
+        details.append(f"mMRC = {mmrc_dyspnea} → 0 điểm")
+    elif mmrc_dyspnea == 2:
+        dyspnea_points = 1
+        details.append(f"mMRC = {mmrc_dyspnea} → 1 điểm")
+    elif mmrc_dyspnea == 3:
+        dyspnea_points = 2
+        details.append(f"mMRC = {mmrc_dyspnea} → 2 điểm")
+    else:  # mmrc_dyspnea == 4
+        dyspnea_points = 3
+        details.append(f"mMRC = {mmrc_dyspnea} → 3 điểm")
+    score += dyspnea_points
+    
+    # 6-minute walk distance points
+    if walk_distance >= 350:
+        walk_points = 0
+        details.append(f"6MWD = {walk_distance}m → 0 điểm (≥350m)")
+    elif walk_distance >= 250:
+        walk_points = 1
+        details.append(f"6MWD = {walk_distance}m → 1 điểm (250-349m)")
+    elif walk_distance >= 150:
+        walk_points = 2
+        details.append(f"6MWD = {walk_distance}m → 2 điểm (150-249m)")
+    else:
+        walk_points = 3
+        details.append(f"6MWD = {walk_distance}m → 3 điểm (≤149m)")
+    score += walk_points
+    
+    # Mortality risk interpretation
+    if score <= 2:
+        quartile = "Quartile 1"
+        mortality_4yr = "~20%"
+        risk_class = "LOW"
+        color = "🟢"
+        interpretation = "Nguy cơ THẤP"
+        management = """
+        **🟢 BODE 0-2 (Nguy cơ Thấp):**
+        
+        **Điều Trị:**
+        - LAMA hoặc LABA đơn độc
+        - Bỏ thuốc lá (quan trọng nhất!)
+        - Vaccine: Flu hàng năm, Pneumococcal
+        - Phục hồi chức năng phổi
+        - Tập thể dục thường xuyên
+        
+        **Theo Dõi:**
+        - FEV1 mỗi 6-12 tháng
+        - Tái đánh giá BODE hàng năm
+        - Đánh giá đợt cấp
+        """
+    elif score <= 4:
+        quartile = "Quartile 2"
+        mortality_4yr = "~30%"
+        risk_class = "MODERATE"
+        color = "🟡"
+        interpretation = "Nguy cơ TRUNG BÌNH"
+        management = """
+        **🟡 BODE 3-4 (Nguy cơ Trung Bình):**
+        
+        **Điều Trị:**
+        - **LAMA + LABA combination**
+        - ICS nếu có đợt cấp tái phát
+        - Bỏ thuốc lá
+        - Vaccine
+        - **Phục hồi chức năng phổi BẮT BUỘC**
+        - Dinh dưỡng (nếu BMI thấp)
+        - Oxy liệu pháp nếu hypoxemia
+        
+        **Theo Dõi:**
+        - FEV1 mỗi 3-6 tháng
+        - Đánh giá đợt cấp thường xuyên
+        - Tái đánh giá BODE 6 tháng
+        - Xem xét chương trình phục hồi
+        """
+    elif score <= 6:
+        quartile = "Quartile 3"
+        mortality_4yr = "~40-50%"
+        risk_class = "HIGH"
+        color = "🟠"
+        interpretation = "Nguy cơ CAO"
+        management = """
+        **🟠 BODE 5-6 (Nguy cơ Cao):**
+        
+        **Điều Trị:**
+        - **Triple therapy: LAMA + LABA + ICS**
+        - PDE4 inhibitor (Roflumilast) xem xét
+        - Macrolide dài hạn nếu đợt cấp tái phát
+        - **Oxy liệu pháp dài hạn** (LTOT) nếu:
+          * PaO2 ≤55 mmHg
+          * PaO2 56-59 + polycythemia/cor pulmonale
+        - **Phục hồi chức năng tích cực**
+        - Hỗ trợ dinh dưỡng
+        - NIV nếu hypercapnia
+        
+        **Xem Xét:**
+        - Phẫu thuật giảm thể tích phổi (LVRS) nếu phù hợp
+        - Ghép phổi (nếu tuổi <65, không hút thuốc)
+        
+        **Theo Dõi:**
+        - FEV1 mỗi 3 tháng
+        - ABG định kỳ
+        - Đánh giá hypoxemia, hypercapnia
+        - Tái đánh giá BODE 3-6 tháng
+        """
+    else:  # score 7-10
+        quartile = "Quartile 4"
+        mortality_4yr = ">60%"
+        risk_class = "VERY_HIGH"
+        color = "🔴"
+        interpretation = "Nguy cơ RẤT CAO"
+        management = """
+        **🔴 BODE 7-10 (Nguy cơ Rất Cao):**
+        
+        **Điều Trị Tích Cực:**
+        - **Triple therapy LAMA + LABA + ICS**
+        - PDE4 inhibitor
+        - Macrolide dài hạn
+        - **LTOT bắt buộc** (>15h/ngày)
+        - **NIV ban đêm** nếu hypercapnia mạn
+        - Morphine liều thấp cho dyspnea nặng
+        - Hỗ trợ dinh dưỡng tích cực
+        - Phục hồi chức năng (nếu có thể)
+        
+        **Xem Xét Tích Cực:**
+        - **Ghép phổi** (nếu đủ tiêu chuẩn)
+        - LVRS (một số trường hợp chọn lọc)
+        - Pacer hoặc phẫu thuật giảm thể tích nội soi
+        
+        **Chăm Sóc Giảm Nhẹ:**
+        - Thảo luận mục tiêu điều trị
+        - Advance care planning
+        - Hỗ trợ tâm lý
+        - Chăm sóc giảm nhẹ triệu chứng
+        
+        **Theo Dõi Sát:**
+        - FEV1 mỗi 1-3 tháng
+        - ABG thường xuyên
+        - Đánh giá chất lượng cuộc sống
+        - Hospitalization risk cao
+        """
+    
+    return {
+        'total_score': score,
+        'quartile': quartile,
+        'mortality_4yr': mortality_4yr,
+        'risk_class': risk_class,
+        'color': color,
+        'interpretation': interpretation,
+        'management': management,
+        'details': details
+    }
@@ -0,0 +1,67 @@
+"""
+CURB-65 Score
+Community-Acquired Pneumonia severity assessment
+"""
+
+# Score → (30-day mortality, recommendation)
+CURB65_RISK = {
+    0: ("0.7%", "Điều trị ngoại trú"),
+    1: ("2.1%", "Điều trị ngoại trú hoặc theo dõi ngắn"),
+    2: ("9.2%", "Cân nhắc nhập viện"),
+    3: ("14.5%", "Nhập viện, ICU nếu cần"),
+}
+
+
+def calculate_curb65(
+    confusion: bool,
+    urea_mmol: float,
+    rr: int,
+    sbp: int,
+    dbp: int,
+    age: int
+) -> dict:
+    """
+    Calculate CURB-65 score
+
+    Args:
+        confusion: New-onset confusion (AMT ≤8)
+        urea_mmol: Urea (mmol/L)
+        rr: Respiratory rate (/min)
+        sbp: Systolic BP (mmHg)
+        dbp: Diastolic BP (mmHg)
+        age: Age (years)
+
+    Returns:
+        dict: score, details, mortality, recommendation
+    """
+    score = 0
+    details = []
+    
+    if confusion:
+        score += 1
+        details.append("✓ Confusion - Lú lẫn (+1)")
+    
+    if urea_mmol > 7.0:  # >7 mmol/L (>20 mg/dL)
+        score += 1
+        details.append(f"✓ Urea >7 mmol/L ({urea_mmol:.1f}) (+1)")
+    
+    if rr >= 30:
+        score += 1
+        details.append(f"✓ RR ≥30/phút ({rr}) (+1)")
+    
+    if sbp < 90 or dbp <= 60:
+        score += 1
+        details.append(f"✓ BP thấp (SBP<90 hoặc DBP≤60) (+1)")
+    
+    if age >= 65:
+        score += 1
+        details.append(f"✓ Tuổi ≥65 ({age}) (+1)")
+    
+    mortality, recommendation = CURB65_RISK.get(score, ("40%", "Nhập ICU ngay"))
+    
+    return {
+        'score': score,
+        'details': details,
+        'mortality': mortality,
+        'recommendation': recommendation,
+    }
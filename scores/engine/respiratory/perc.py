@@ -0,0 +1,68 @@
+"""
+PERC Rule (Pulmonary Embolism Rule-out Criteria)
+Loại trừ thuyên tắc phổi mà không cần D-dimer
+"""
+
+
+def calculate_perc(
+    age_50: bool,
+    hr_100: bool,
+    spo2_95: bool,
+    leg_swelling: bool,
+    hemoptysis: bool,
+    surgery_trauma: bool,
+    prior_vte: bool,
+    hormone: bool
+) -> dict:
+    """
+    Apply PERC Rule (8 criteria, all negative → PE can be ruled out)
+    
+    Args:
+        age_50: Age ≥ 50
+        hr_100: Heart rate ≥ 100
+        spo2_95: SpO₂ < 95% on room air
+        leg_swelling: Unilateral leg swelling
+        hemoptysis: Hemoptysis
+        surgery_trauma: Recent surgery or trauma (≤4 weeks)
+        prior_vte: Prior PE or DVT
+        hormone: Hormone use
+    
+    Returns:
+        dict: perc_score (number of positive criteria), positive_criteria
+    """
+    # Count positive criteria
+    criteria = [
+        age_50,
+        hr_100,
+        spo2_95,
+        leg_swelling,
+        hemoptysis,
+        surgery_trauma,
+        prior_vte,
+        hormone
+    ]
+    
+    perc_score = sum(criteria)
+    
+    positive_criteria = []
+    if age_50:
+        positive_criteria.append("✓ Tuổi ≥ 50")
+    if hr_100:
+        positive_criteria.append("✓ Nhịp tim ≥ 100 nhịp/phút")
+    if spo2_95:
+        positive_criteria.append("✓ SpO₂ < 95%")
+    if leg_swelling:
+        positive_criteria.append("✓ Phù chân một bên")
+    if hemoptysis:
+        positive_criteria.append("✓ Ho ra máu")
+    if surgery_trauma:
+        positive_criteria.append("✓ Phẫu thuật/chấn thương gần đây")
+    if prior_vte:
+        positive_criteria.append("✓ Tiền sử PE/DVT")
+    if hormone:
+        positive_criteria.append("✓ Dùng hormone")
+    
+    return {
+        'perc_score': perc_score,
+        'positive_criteria': positive_criteria,
+    }
@@ -0,0 +1,91 @@
+"""
+Wells Score for Pulmonary Embolism
+Đánh giá xác suất tắc mạch phổi
+"""
+
+
+def calculate_wells_pe(
+    dvt_signs: bool,
+    pe_likely: bool,
+    hr: int,
+    immobilization: bool,
+    previous_vte: bool,
+    hemoptysis: bool,
+    malignancy: bool
+) -> dict:
+    """
+    Calculate Wells Score for Pulmonary Embolism
+
+    Args:
+        dvt_signs: Clinical signs of DVT
+        pe_likely: PE is the most likely diagnosis
+        hr: Heart rate (bpm)
+        immobilization: Immobilization ≥3 days or surgery in previous 4 weeks
+        previous_vte: Previous DVT/PE
+        hemoptysis: Hemoptysis
+        malignancy: Active malignancy
+
+    Returns:
+        dict: score, details, probability, PE prevalence, color, recommendation
+    """
+    # Calculate score
+    score = 0.0
+    details = []
+
+    if dvt_signs:
+        score += 3.0
+        details.append("Dấu hiệu DVT: +3")
+
+    if pe_likely:
+        score += 3.0
+        details.append("PE khả năng nhất: +3")
+
+    if hr > 100:
+        score += 1.5
+        details.append(f"Nhịp tim >100 ({hr}): +1.5")
+
+    if immobilization:
+        score += 1.5
+        details.append("Nằm bất động/Phẫu thuật: +1.5")
+
+    if previous_vte:
+        score += 1.5
+        details.append("Tiền sử DVT/PE: +1.5")
+
+    if hemoptysis:
+        score += 1.0
+        details.append("Ho ra máu: +1")
+
+    if malignancy:
+        score += 1.0
+        details.append("Ung thư: +1")
+
+    # Determine probability
+    if score < 2:
+        probability = "THẤP"
+        pe_prevalence = "3.6%"
+        color = "success"
+        recommendation = "Xét nghiệm D-dimer"
+        detail = "D-dimer âm tính → Loại trừ PE (không cần CTPA)"
+    elif score <= 6:
+        probability = "TRUNG BÌNH"
+        pe_prevalence = "20.5%"
+        color = "warning"
+        recommendation = "Xét nghiệm D-dimer"
+        detail = "D-dimer dương tính → Chụp CTPA"
+    else:
+        probability = "CAO"
+        pe_prevalence = "66.7%"
+        color = "error"
+        recommendation = "Chụp CTPA ngay"
+        detail = "Không cần D-dimer - chụp CTPA trực tiếp"
+    
+    return {
+        'score': score,
+        'details': details,
+        'probability': probability,
+        'pe_prevalence': pe_prevalence,
+        'color': color,
+        'recommendation': recommendation,
+        'detail': detail,
+    }
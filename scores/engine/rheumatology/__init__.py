@@ -0,0 +1,3 @@
+"""
+Rheumatology - headless compute functions
+"""
@@ -0,0 +1,14 @@
+"""ACR/EULAR RA Classification Criteria 2010"""
+
+
+def calculate_acr_ra(joint: int, serology: int, duration: int, acute_phase: int) -> int:
+    """
+    ACR/EULAR 2010 total (0-10); ≥ 6 classifies as RA
+    
+    Args:
+        joint: Joint involvement (0, 1, 2, 3, 5)
+        serology: RF/ACPA (0, 2, 3)
+        duration: Symptom duration ≥ 6 weeks (0, 1)
+        acute_phase: Abnormal CRP/ESR (0, 1)
+    """
+    return joint + serology + duration + acute_phase
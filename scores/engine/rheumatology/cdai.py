@@ -0,0 +1,28 @@
+"""CDAI - Clinical Disease Activity Index for RA"""
+
+
+def calculate_cdai(tjc: int, sjc: int, pga: float, ega: float) -> dict:
+    """
+    CDAI = TJC + SJC + PGA + EGA
+    
+    Activity: ≤ 2.8 remission, ≤ 10 low, ≤ 22 moderate, > 22 high
+    
+    Returns:
+        dict: cdai, status, color
+    """
+    cdai = tjc + sjc + pga + ega
+    
+    if cdai <= 2.8:
+        status = "Thuyên giảm"; color = "#28a745"
+    elif cdai <= 10:
+        status = "Hoạt động thấp"; color = "#28a745"
+    elif cdai <= 22:
+        status = "Hoạt động trung bình"; color = "#fd7e14"
+    else:
+        status = "Hoạt động cao"; color = "#dc3545"
+    
+    return {
+        'cdai': cdai,
+        'status': status,
+        'color': color,
+    }
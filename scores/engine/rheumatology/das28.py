@@ -0,0 +1,35 @@
+"""DAS28 - Disease Activity Score for Rheumatoid Arthritis"""
+
+import math
+
+
+def calculate_das28_esr(tjc: int, sjc: int, esr: float, pga: float) -> float:
+    """DAS28-ESR = 0.56√TJC + 0.28√SJC + 0.70 ln(ESR+1) + 0.014 PGA"""
+    return 0.56 * math.sqrt(tjc) + 0.28 * math.sqrt(sjc) + 0.70 * math.log(esr + 1) + 0.014 * pga
+
+
+def calculate_das28_crp(tjc: int, sjc: int, crp: float, pga: float) -> float:
+    """DAS28-CRP = 0.56√TJC + 0.28√SJC + 0.36 ln(CRP+1) + 0.014 PGA + 0.96"""
+    return 0.56 * math.sqrt(tjc) + 0.28 * math.sqrt(sjc) + 0.36 * math.log(crp + 1) + 0.014 * pga + 0.96
+
+
+def interpret_das28(das28: float) -> dict:
+    """
+    DAS28 disease activity: < 2.6 remission, < 3.2 low, < 5.1 moderate, ≥ 5.1 high
+    
+    Returns:
+        dict: status, color
+    """
+    if das28 < 2.6:
+        status = "Thuyên giảm"; color = "#28a745"
+    elif das28 < 3.2:
+        status = "Hoạt động thấp"; color = "#28a745"
+    elif das28 < 5.1:
+        status = "Hoạt động trung bình"; color = "#fd7e14"
+    else:
+        status = "Hoạt động cao"; color = "#dc3545"
+    
+    return {
+        'status': status,
+        'color': color,
+    }
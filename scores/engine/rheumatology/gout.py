@@ -0,0 +1,21 @@
+"""ACR/EULAR Gout Classification Criteria"""
+
+
+def calculate_gout_score(pattern: int, location: bool, time_course: int, tophi: bool,
+                         uric_acid: int, imaging: bool) -> int:
+    """
+    Simplified ACR/EULAR 2015 clinical score (≥ 8 → gout) when no crystals found
+    
+    Args:
+        pattern: Joint pattern (0-3)
+        location: Prior 1st MTP involvement (+1)
+        time_course: Typical episode time course (0-2)
+        tophi: Clinical tophus (+4)
+        uric_acid: Serum urate (0, 2, 3, 4)
+        imaging: Imaging evidence of gout (+4)
+    """
+    score = pattern + time_course + uric_acid
+    score += 1 if location else 0
+    score += 4 if tophi else 0
+    score += 4 if imaging else 0
+    return score
@@ -0,0 +1,28 @@
+"""SDAI - Simplified Disease Activity Index for RA"""
+
+
+def calculate_sdai(tjc: int, sjc: int, pga: float, ega: float, crp: float) -> dict:
+    """
+    SDAI = TJC + SJC + PGA + EGA + CRP (mg/dL)
+    
+    Activity: ≤ 3.3 remission, ≤ 11 low, ≤ 26 moderate, > 26 high
+    
+    Returns:
+        dict: sdai, status, color
+    """
+    sdai = tjc + sjc + pga + ega + crp
+    
+    if sdai <= 3.3:
+        status = "Thuyên giảm"; color = "#28a745"
+    elif sdai <= 11:
+        status = "Hoạt động thấp"; color = "#28a745"
+    elif sdai <= 26:
+        status = "Hoạt động trung bình"; color = "#fd7e14"
+    else:
+        status = "Hoạt động cao"; color = "#dc3545"
+    
+    return {
+        'sdai': sdai,
+        'status': status,
+        'color': color,
+    }
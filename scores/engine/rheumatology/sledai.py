@@ -0,0 +1,23 @@
+"""SLEDAI - SLE Disease Activity Index"""
+
+
+def interpret_sledai(score: int) -> dict:
+    """
+    SLEDAI activity: 0 none, 1-5 mild, 6-11 moderate, ≥ 12 high
+    
+    Returns:
+        dict: status, color
+    """
+    if score == 0:
+        status = "Không hoạt động"; color = "#28a745"
+    elif score <= 5:
+        status = "Hoạt động nhẹ"; color = "#28a745"
+    elif score <= 11:
+        status = "Hoạt động trung bình"; color = "#fd7e14"
+    else:
+        status = "Hoạt động cao"; color = "#dc3545"
+    
+    return {
+        'status': status,
+        'color': color,
+    }
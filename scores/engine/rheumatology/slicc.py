@@ -0,0 +1,11 @@
+"""SLICC Classification Criteria for SLE"""
+
+
+def meets_slicc(clinical_score: int, immuno_score: int, renal: bool, ana: bool, anti_dsdna: bool) -> bool:
+    """
+    SLICC 2012: ≥4 criteria with ≥1 clinical and ≥1 immunologic,
+    OR lupus nephritis with ANA/anti-dsDNA
+    """
+    total = clinical_score + immuno_score
+    lupus_nephritis_positive = renal and (ana or anti_dsdna)
+    return (total >= 4 and clinical_score >= 1 and immuno_score >= 1) or lupus_nephritis_positive
@@ -0,0 +1,3 @@
+"""
+Surgery & Anesthesia - headless compute functions
+"""
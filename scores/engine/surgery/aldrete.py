@@ -0,0 +1,42 @@
+"""
+Aldrete Score Calculator
+Đánh giá hồi tỉnh sau gây mê
+"""
+
+
+def calculate_aldrete(activity, respiration, circulation, consciousness, color):
+    """
+    Tính điểm Aldrete
+    
+    Parameters: Mỗi thành phần 0-2 điểm
+    - activity: Hoạt động vận động
+    - respiration: Hô hấp
+    - circulation: Tuần hoàn (BP)
+    - consciousness: Ý thức
+    - color: Màu sắc da/SpO₂
+    
+    Returns:
+    - dict với total_score và interpretation
+    """
+    total = activity + respiration + circulation + consciousness + color
+    
+    # Phân loại
+    if total >= 9:
+        status = "Đủ tiêu chuẩn xuất phòng hồi tỉnh"
+        recommendation = "Có thể chuyển về phòng/xuất viện (nếu phẫu thuật ngoại trú)"
+        color_display = "green"
+    elif total >= 7:
+        status = "Cần theo dõi thêm"
+        recommendation = "Tiếp tục theo dõi tại phòng hồi tỉnh"
+        color_display = "orange"
+    else:
+        status = "Chưa đủ tiêu chuẩn"
+        recommendation = "Tiếp tục hồi sức, đánh giá lại"
+        color_display = "red"
+    
+    return {
+        "total_score": total,
+        "status": status,
+        "recommendation": recommendation,
+        "color": color_display
+    }
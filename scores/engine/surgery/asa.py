@@ -0,0 +1,120 @@
+"""
+ASA Physical Status Classification
+Phân loại nguy cơ phẫu thuật của Hội Gây mê Hoa Kỳ
+"""
+
+
+def get_asa_classification():
+    """Get ASA physical status classification criteria"""
+    return {
+        "ASA I": {
+            "status": "Bệnh nhân khỏe mạnh hoàn toàn",
+            "description": "Không có bệnh lý toàn thân. Không hút thuốc. Không hoặc uống rượu tối thiểu.",
+            "examples": [
+                "Người khỏe mạnh, tập thể dục đều đặn",
+                "Không có bệnh mạn tính",
+                "BMI < 30",
+                "Không thuốc men thường xuyên"
+            ],
+            "color": "🟢",
+            "mortality": "< 0.1%",
+            "risk": "Nguy cơ thấp nhất"
+        },
+        "ASA II": {
+            "status": "Bệnh lý toàn thân nhẹ",
+            "description": "Bệnh lý toàn thân nhẹ, không hạn chế hoạt động. Kiểm soát tốt.",
+            "examples": [
+                "Hút thuốc hiện tại (không COPD)",
+                "Uống rượu nhiều thường xuyên",
+                "Thai kỳ",
+                "BMI 30-40",
+                "DM/THA kiểm soát tốt",
+                "Bệnh phổi nhẹ (asthma, COPD nhẹ)",
+                "Tuổi rất trẻ hoặc rất cao"
+            ],
+            "color": "🟡",
+            "mortality": "0.1-0.2%",
+            "risk": "Nguy cơ thấp"
+        },
+        "ASA III": {
+            "status": "Bệnh lý toàn thân nặng",
+            "description": "Bệnh lý toàn thân nặng. Hạn chế hoạt động đáng kể nhưng không mất khả năng hoạt động.",
+            "examples": [
+                "DM hoặc THA kiểm soát kém",
+                "COPD trung bình-nặng",
+                "BMI ≥ 40",
+                "Suy thận mạn",
+                "Suy tim CHF (NYHA II-III)",
+                "Nhồi máu cơ tim > 3 tháng trước",
+                "Đột quỵ > 3 tháng trước, không di chứng",
+                "Bệnh gan mạn",
+                "Lọc máu thường xuyên",
+                "Rối loạn đông máu vừa"
+            ],
+            "color": "🟠",
+            "mortality": "1.8-5.4%",
+            "risk": "Nguy cơ trung bình-cao"
+        },
+        "ASA IV": {
+            "status": "Bệnh lý toàn thân nặng đe dọa tính mạng",
+            "description": "Bệnh lý toàn thân nặng, đe dọa tính mạng thường xuyên. Không thể tự chăm sóc.",
+            "examples": [
+                "Nhồi máu cơ tim < 3 tháng",
+                "Đột quỵ < 3 tháng",
+                "TIA < 3 tháng",
+                "Suy tim tiến triển (NYHA IV)",
+                "Sepsis",
+                "DIC",
+                "ARDS",
+                "Suy thận cấp",
+                "Suy gan cấp",
+                "Không phẫu thuật sẽ tử vong"
+            ],
+            "color": "🔴",
+            "mortality": "7.8-25.9%",
+            "risk": "Nguy cơ rất cao"
+        },
+        "ASA V": {
+            "status": "Hấp hối",
+            "description": "Bệnh nhân hấp hối, không mong đợi sống sót mà không phẫu thuật. Phẫu thuật là nỗ lực cuối cùng cứu sống.",
+            "examples": [
+                "Vỡ phình động mạch chủ bụng",
+                "Chấn thương đa cơ quan nặng",
+                "Xuất huyết nội sọ với mass effect",
+                "Tắc ruột hoại tử với septic shock",
+                "Suy đa cơ quan"
+            ],
+            "color": "🔴",
+            "mortality": "> 50%",
+            "risk": "Nguy cơ cực cao"
+        },
+        "ASA VI": {
+            "status": "Tử vong não - Hiến tặng cơ quan",
+            "description": "Bệnh nhân tử vong não đang được hiến tặng cơ quan.",
+            "examples": [
+                "Tử vong não đã xác định",
+                "Được duy trì để lấy cơ quan",
+                "Phẫu thuật lấy cơ quan"
+            ],
+            "color": "⚫",
+            "mortality": "N/A",
+            "risk": "Chỉ áp dụng cho hiến tặng cơ quan"
+        }
+    }
+
+
+def get_emergency_modifier_info():
+    """Get information about emergency modifier (E)"""
+    return {
+        "definition": "Phẫu thuật cấp cứu - Không thể trì hoãn > 6 giờ",
+        "notation": "Thêm chữ 'E' sau ASA (ví dụ: ASA III-E)",
+        "impact": "Nguy cơ tử vong tăng 1.5-3 lần so với phẫu thuật chương trình",
+        "examples": [
+                "Vỡ tạng trong ổ bụng",
+                "Tắc ruột có thiếu máu",
+                "Chấn thương nặng cần phẫu thuật ngay",
+                "Nhiễm trùng nặng cần dẫn lưu",
+                "ACS cần can thiệp",
+                "Đẻ mổ cấp cứu"
+        ]
+    }
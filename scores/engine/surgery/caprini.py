@@ -0,0 +1,54 @@
+"""
+Caprini VTE Risk Score
+Nguy cơ huyết khối tĩnh mạch sau phẫu thuật
+"""
+
+
+def calculate_caprini(
+    age_40_60: bool,
+    minor_surgery: bool,
+    bmi_25_30: bool,
+    varicose: bool,
+    age_60_74: bool,
+    laparoscopic: bool,
+    malignancy: bool,
+    bed_rest: bool,
+    age_75: bool,
+    dvt_history: bool,
+    family_history: bool,
+    stroke: bool,
+    major_surgery: bool
+) -> dict:
+    """
+    Calculate Caprini VTE Risk Score
+    
+    1 point: age 41-60, minor surgery, BMI > 25, varicose veins
+    2 points: age 61-74, laparoscopy > 45 min, malignancy, bed rest > 72h
+    3 points: age ≥ 75, history of DVT/PE, family history of DVT/PE
+    5 points: stroke < 1 month, major surgery > 45 min
+    
+    Returns:
+        dict: score, risk, prophylaxis, color
+    """
+    score = (
+        age_40_60 + minor_surgery + bmi_25_30 + varicose +
+        2 * (age_60_74 + laparoscopic + malignancy + bed_rest) +
+        3 * (age_75 + dvt_history + family_history) +
+        5 * (stroke + major_surgery)
+    )
+    
+    if score <= 1:
+        risk = "Rất thấp"; prophylaxis = "Vận động sớm"; color = "green"
+    elif score <= 2:
+        risk = "Thấp"; prophylaxis = "Vận động sớm, tất chống huyết khối"; color = "green"
+    elif score <= 4:
+        risk = "Trung bình"; prophylaxis = "Heparin liều thấp hoặc LMWH"; color = "orange"
+    else:
+        risk = "Cao"; prophylaxis = "LMWH liều cao + tất chống huyết khối"; color = "red"
+    
+    return {
+        'score': score,
+        'risk': risk,
+        'prophylaxis': prophylaxis,
+        'color': color,
+    }
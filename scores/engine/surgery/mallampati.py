@@ -0,0 +1,37 @@
+"""
+Mallampati Classification Calculator
+Đánh giá đường thở khó - Dự đoán đặt nội khí quản khó
+"""
+
+
+def interpret_mallampati(class_num):
+    """Interpret Mallampati class"""
+    
+    if class_num == 1:
+        difficulty = "Dễ"
+        description = "Nhìn thấy toàn bộ khẩu cái mềm, lưỡi gà, trụ amidan"
+        risk = "Rất thấp"
+        color = "green"
+    elif class_num == 2:
+        difficulty = "Tương đối dễ"
+        description = "Nhìn thấy khẩu cái mềm, lưỡi gà, phần trên trụ amidan"
+        risk = "Thấp"
+        color = "green"
+    elif class_num == 3:
+        difficulty = "Có thể khó"
+        description = "Nhìn thấy khẩu cái mềm, một phần lưỡi gà"
+        risk = "Trung bình"
+        color = "orange"
+    else:  # class 4
+        difficulty = "Khó"
+        description = "Chỉ nhìn thấy khẩu cái cứng"
+        risk = "Cao"
+        color = "red"
+    
+    return {
+        "class": class_num,
+        "difficulty": difficulty,
+        "description": description,
+        "risk": risk,
+        "color": color
+    }
@@ -0,0 +1,31 @@
+"""P-POSSUM - Portsmouth Physiological and Operative Severity Score"""
+
+
+def estimate_possum(age: int, cardiac: str, respiratory: str, bp: int,
+                    gcs_score: int, operation_severity: str) -> dict:
+    """
+    Simplified P-POSSUM risk estimate (not the full 18-variable model)
+    
+    Returns:
+        dict: risk_score, risk, color
+    """
+    risk_score = 0
+    risk_score += max(0, (age - 60) // 5)
+    risk_score += 1 if cardiac != "Bình thường" else 0
+    risk_score += 1 if respiratory != "Bình thường" else 0
+    risk_score += 1 if bp < 100 else 0
+    risk_score += 1 if gcs_score < 15 else 0
+    risk_score += {"Nhỏ": 0, "Trung bình": 1, "Lớn": 2, "Lớn+": 3}[operation_severity]
+    
+    if risk_score <= 2:
+        risk = "Thấp (<5%)"; color = "#28a745"
+    elif risk_score <= 4:
+        risk = "Trung bình (5-15%)"; color = "#fd7e14"
+    else:
+        risk = "Cao (>15%)"; color = "#dc3545"
+    
+    return {
+        'risk_score': risk_score,
+        'risk': risk,
+        'color': color,
+    }
@@ -0,0 +1,3 @@
+"""
+Trauma - headless compute functions
+"""
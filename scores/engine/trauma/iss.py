@@ -0,0 +1,198 @@
+"""
+Injury Severity Score (ISS)
+============================
+
+Anatomical scoring system for multiple trauma
+
+Reference:
+- Baker SP, et al. The injury severity score: a method for describing patients with
+  multiple injuries and evaluating emergency care. J Trauma. 1974;14(3):187-196.
+- Copes WS, et al. The Injury Severity Score revisited. J Trauma. 1988;28(1):69-77.
+
+ISS Calculation:
+- Based on Abbreviated Injury Scale (AIS)
+- 6 body regions assessed
+- ISS = sum of squares of 3 highest AIS scores (from different regions)
+- Range: 1-75 (ISS of 75 automatically given if any region has AIS 6)
+
+Body Regions:
+1. Head/Neck
+2. Face
+3. Chest
+4. Abdomen/Pelvic Contents
+5. Extremities/Pelvic Girdle
+6. External
+
+Clinical Utility:
+- Mortality prediction
+- Triage decisions
+- Research and quality improvement
+- Part of TRISS score
+"""
+
+
+def calculate_iss(ais_scores: dict) -> dict:
+    """
+    Calculate Injury Severity Score
+    
+    Args:
+        ais_scores: Dictionary of AIS scores for each body region
+        
+    Returns:
+        Dictionary containing ISS, mortality estimate, and recommendations
+    """
+    
+    # Check if any AIS is 6 (unsurvivable injury)
+    if 6 in ais_scores.values():
+        iss = 75
+        mortality = ">90%"
+        risk_class = "UNSURVIVABLE"
+        color = "🔴"
+        interpretation = "UNSURVIVABLE INJURY (AIS 6 trong ít nhất 1 vùng)"
+    else:
+        # Get the three highest scores from DIFFERENT regions
+        sorted_scores = sorted(ais_scores.values(), reverse=True)
+        top_three = sorted_scores[:3]
+        
+        # Calculate ISS as sum of squares of top 3
+        iss = sum(score ** 2 for score in top_three)
+        
+        # Estimate mortality based on ISS
+        if iss >= 50:
+            mortality = ">50%"
+            risk_class = "CRITICAL"
+            color = "🔴"
+            interpretation = "CHẤNthượng CỰC NẶNG"
+        elif iss >= 25:
+            mortality = "20-50%"
+            risk_class = "SEVERE"
+            color = "🟠"
+            interpretation = "CHẤN THƯƠNG NẶNG"
+        elif iss >= 16:
+            mortality = "5-20%"
+            risk_class = "MODERATE"
+            color = "🟡"
+            interpretation = "CHẤN THƯƠNG TRUNG BÌNH"
+        else:
+            mortality = "<5%"
+            risk_class = "MINOR"
+            color = "🟢"
+            interpretation = "CHẤN THƯƠNG NHẸ"
+    
+    # Management recommendations
+    if risk_class == "UNSURVIVABLE" or risk_class == "CRITICAL":
+        management = """
+        **🔴 Xử Trí - Chấn Thương Nguy Kịch:**
+        
+        1. **HỒI SỨC TÍCH CỰC:**
+           - Activate Trauma Team NGAY
+           - ABC assessment và resuscitation
+           - Massive Transfusion Protocol
+           - Damage Control Resuscitation
+        
+        2. **CHUYỂN VIỆN:**
+           - Trauma Center Level I NGAY LẬP TỨC
+           - Pre-notification
+           - Sẵn sàng phẫu thuật cấp cứu
+        
+        3. **PHẪU THUẬT:**
+           - Damage Control Surgery
+           - Kiểm soát chảy máu
+           - Kiểm soát nhiễm trùng
+           - Đóng tạm thời
+        
+        4. **HỖ TRỢ TOÀN DIỆN:**
+           - ICU monitoring
+           - Ventilator support
+           - Hemodynamic support
+           - Renal support nếu cần
+        
+        5. **DỰ PHÒNG BIẾN CHỨNG:**
+           - DVT prophylaxis
+           - Stress ulcer prophylaxis
+           - Infection control
+           - Nutrition support
+        """
+    elif risk_class == "SEVERE":
+        management = """
+        **🟠 Xử Trí - Chấn Thương Nặng:**
+        
+        1. **ĐÁnh GIÁ TOÀN DIỆN:**
+           - Primary survey (ABC)
+           - Secondary survey (head to toe)
+           - FAST exam / CT scan
+        
+        2. **HỒI SỨC:**
+           - IV access × 2
+           - Fluid resuscitation
+           - Blood products sẵn sàng
+        
+        3. **CHUYỂN VIỆN:**
+           - Trauma Center Level I/II
+           - Đội ngũ chuyên khoa đầy đủ
+        
+        4. **XÉT NGHIỆM:**
+           - CBC, chemistry, coags
+           - Type & cross
+           - Imaging đầy đủ
+        
+        5. **THEO DÕI SÁT:**
+           - Vital signs q15-30min
+           - Serial exams
+           - Re-assessment liên tục
+        """
+    elif risk_class == "MODERATE":
+        management = """
+        **🟡 Xử Trí - Chấn Thương Trung Bình:**
+        
+        1. **ĐÁNH GIÁ:**
+           - Complete trauma assessment
+           - Imaging phù hợp
+           - Xét nghiệm cơ bản
+        
+        2. **XỬ TRÍ:**
+           - Điều trị các tổn thương cụ thể
+           - Phẫu thuật nếu cần
+           - Theo dõi chặt chẽ
+        
+        3. **XEM XÉT:**
+           - Chuyển trauma center nếu cần
+           - Tư vấn chuyên khoa
+        
+        4. **DỰ PHÒNG:**
+           - Tetanus prophylaxis
+           - Antibiotic nếu cần
+           - Pain management
+        """
+    else:  # MINOR
+        management = """
+        **🟢 Xử Trí - Chấn Thương Nhẹ:**
+        
+        1. **ĐÁNH GIÁ:**
+           - Khám lâm sàng kỹ
+           - Imaging selective
+           - Xét nghiệm theo chỉ định
+        
+        2. **XỬ TRÍ:**
+           - Điều trị triệu chứng
+           - Chăm sóc vết thương
+           - Pain control
+        
+        3. **THEO DÕI:**
+           - Tái khám nếu cần
+           - Hướng dẫn dấu hiệu cảnh báo
+        
+        4. **RA VIỆN:**
+           - Có thể xuất viện nếu ổn định
+           - Follow-up phù hợp
+        """
+    
+    return {
+        'iss': iss,
+        'mortality': mortality,
+        'risk_class': risk_class,
+        'color': color,
+        'interpretation': interpretation,
+        'management': management,
+        'ais_scores': ais_scores
+    }
@@ -0,0 +1,48 @@
+"""
+NEXUS C-Spine Rule
+Quy tắc đánh giá cần chụp X-quang cột sống cổ sau chấn thương
+"""
+
+
+def evaluate_nexus(midline_tenderness, altered_mental_status, intoxication, 
+                    neurological_deficit, distracting_injury):
+    """
+    Evaluate NEXUS C-Spine criteria
+    
+    Args:
+        midline_tenderness: Posterior midline C-spine tenderness (True/False)
+        altered_mental_status: Altered level of consciousness (True/False)
+        intoxication: Evidence of intoxication (True/False)
+        neurological_deficit: Focal neurological deficit (True/False)
+        distracting_injury: Distracting painful injury (True/False)
+    
+    Returns:
+        dict: Evaluation results
+    """
+    # If ANY criterion is present → Imaging required
+    imaging_required = any([
+        midline_tenderness,
+        altered_mental_status,
+        intoxication,
+        neurological_deficit,
+        distracting_injury
+    ])
+    
+    if imaging_required:
+        return {
+            "imaging": "CẦN CHỤP",
+            "recommendation": "Chỉ định chụp X-quang/CT cột sống cổ",
+            "reason": "Có ≥ 1 tiêu chí NEXUS dương tính",
+            "sensitivity": "Độ nhạy 99.6% (tin cậy loại trừ tổn thương)",
+            "color": "🔴",
+            "safe_to_clear": False
+        }
+    else:
+        return {
+            "imaging": "KHÔNG CẦN CHỤP",
+            "recommendation": "Có thể loại trừ lâm sàng (clinical clearance)",
+            "reason": "TẤT CẢ 5 tiêu chí NEXUS âm tính",
+            "sensitivity": "Độ nhạy 99.6% - An toàn loại trừ tổn thương C-spine",
+            "color": "🟢",
+            "safe_to_clear": True
+        }
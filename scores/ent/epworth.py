@@ -5,125 +5,12 @@ Epworth Sleepiness Scale (ESS)
 
 import streamlit as st
 
-
-def calculate_epworth(scores):
-    """
-    Calculate Epworth Sleepiness Scale score
-    
-    Args:
-        scores: List of 8 situation scores (0-3 each)
-    
-    Returns:
-        int: Total ESS score (0-24)
-    """
-    return sum(scores)
-
-
-def interpret_epworth(total_score):
-    """
-    Interpret Epworth Sleepiness Scale score
-    
-    Args:
-        total_score: Total ESS score
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if total_score <= 5:
-        return {
-            "level": "Bình thường thấp",
-            "color": "🟢",
-            "description": "Mức độ buồn ngủ ban ngày trong giới hạn bình thường thấp",
-            "recommendation": "Không có dấu hiệu buồn ngủ quá mức ban ngày",
-            "action": "Không cần can thiệp",
-            "osa_risk": "Nguy cơ thấp OSA",
-            "severity": "normal_low"
-        }
-    elif total_score <= 10:
-        return {
-            "level": "Bình thường cao",
-            "color": "🟡",
-            "description": "Mức độ buồn ngủ ban ngày trong giới hạn bình thường cao",
-            "recommendation": "Theo dõi. Đánh giá vệ sinh giấc ngủ.",
-            "action": "Cải thiện thói quen ngủ. Tái đánh giá nếu có triệu chứng.",
-            "osa_risk": "Nguy cơ trung bình OSA",
-            "severity": "normal_high"
-        }
-    elif total_score <= 15:
-        return {
-            "level": "Buồn ngủ vừa phải",
-            "color": "🟠",
-            "description": "Buồn ngủ ban ngày mức độ vừa phải - cần đánh giá thêm",
-            "recommendation": "Xem xét nguyên nhân. Sàng lọc rối loạn giấc ngủ (OSA, narcolepsy).",
-            "action": "Đánh giá tiền sử chi tiết. Xem xét nghiên cứu giấc ngủ (polysomnography) nếu có yếu tố nguy cơ OSA.",
-            "osa_risk": "Nguy cơ cao OSA",
-            "severity": "moderate"
-        }
-    else:  # > 15
-        return {
-            "level": "Buồn ngủ nặng",
-            "color": "🔴",
-            "description": "Buồn ngủ ban ngày mức độ nặng - BẤT THƯỜNG",
-            "recommendation": "CẦN đánh giá chuyên khoa. Nghi ngờ cao rối loạn giấc ngủ.",
-            "action": "Chuyển chuyên khoa giấc ngủ/ENT. Polysomnography. Đánh giá OSA, narcolepsy, và các rối loạn giấc ngủ khác.",
-            "osa_risk": "Nguy cơ rất cao OSA",
-            "severity": "severe"
-        }
-
-
-def get_osa_screening_questions():
-    """Get additional OSA screening questions (STOP-BANG components)"""
-    return {
-        "questions": [
-            "Ngáy to có người khác nghe thấy?",
-            "Thường cảm thấy mệt/buồn ngủ ban ngày?",
-            "Có ai thấy bạn ngừng thở khi ngủ?",
-            "Có tăng huyết áp?"
-        ],
-        "high_risk_factors": [
-            "BMI > 35",
-            "Tuổi > 50",
-            "Vòng cổ to (Nam > 43 cm, Nữ > 41 cm)",
-            "Nam giới"
-        ]
-    }
-
-
-# ESS Situations in Vietnamese
-ESS_SITUATIONS = [
-    {
-        "situation": "Ngồi đọc sách",
-        "description": "Đọc sách, báo, tài liệu"
-    },
-    {
-        "situation": "Xem TV",
-        "description": "Xem tivi, phim"
-    },
-    {
-        "situation": "Ngồi yên tại nơi công cộng",
-        "description": "Ví dụ: rạp hát, cuộc họp, hội nghị"
-    },
-    {
-        "situation": "Ngồi trên xe > 1 giờ (không lái)",
-        "description": "Là hành khách trên xe ô tô, xe bus"
-    },
-    {
-        "situation": "Nằm nghỉ buổi chiều",
-        "description": "Khi hoàn cảnh cho phép nghỉ ngơi"
-    },
-    {
-        "situation": "Ngồi nói chuyện với người khác",
-        "description": "Trò chuyện, trao đổi bình thường"
-    },
-    {
-        "situation": "Ngồi yên sau bữa trưa (không uống rượu)",
-        "description": "Sau bữa trưa, không có uống đồ có cồn"
-    },
-    {
-        "situation": "Ngồi trong xe khi dừng vài phút do tắc đường",
-        "description": "Đang lái xe, dừng đèn đỏ hoặc kẹt xe"
-    }
-]
+from scores.engine.ent.epworth import (
+    calculate_epworth,
+    interpret_epworth,
+    get_osa_screening_questions,
+    ESS_SITUATIONS,
+)
 
 
 def render():
@@ -559,4 +446,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
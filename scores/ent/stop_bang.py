@@ -5,51 +5,7 @@ Sàng lọc nguy cơ Obstructive Sleep Apnea (OSA)
 
 import streamlit as st
 
-
-def calculate_stop_bang(snoring, tired, observed, pressure, bmi, age, neck, gender):
-    """
-    Tính điểm STOP-BANG
-    
-    Parameters: Mỗi thành phần = 1 nếu có, 0 nếu không
-    - snoring: Ngáy to
-    - tired: Mệt mỏi ban ngày
-    - observed: Người khác thấy ngừng thở
-    - pressure: Tăng huyết áp
-    - bmi: BMI > 35
-    - age: Tuổi > 50
-    - neck: Chu vi cổ > 40cm (nam) hoặc > 41cm (nữ ở Châu Á)
-    - gender: Giới tính nam
-    
-    Returns:
-    - dict với total_score, risk_level và interpretation
-    """
-    total = (snoring + tired + observed + pressure + 
-             bmi + age + neck + gender)
-    
-    # Phân loại nguy cơ OSA
-    if total <= 2:
-        risk = "Thấp"
-        osa_probability = "< 15%"
-        action = "Nguy cơ OSA thấp, không cần đánh giá thêm trừ khi có triệu chứng rõ"
-        color = "green"
-    elif total <= 4:
-        risk = "Trung bình"
-        osa_probability = "15-30%"
-        action = "Nguy cơ OSA trung bình, cân nhắc polysomnography"
-        color = "orange"
-    else:  # >= 5
-        risk = "Cao"
-        osa_probability = "> 30%"
-        action = "Nguy cơ OSA cao, khuyến cáo làm polysomnography"
-        color = "red"
-    
-    return {
-        "total_score": total,
-        "risk_level": risk,
-        "osa_probability": osa_probability,
-        "action": action,
-        "color": color
-    }
+from scores.engine.ent.stop_bang import calculate_stop_bang
 
 
 def render():
@@ -486,4 +442,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
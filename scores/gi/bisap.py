@@ -5,6 +5,8 @@ Tiên lượng viêm tụy cấp - đơn giản, nhanh chóng
 
 import streamlit as st
 
+from scores.engine.gi.bisap import calculate_bisap
+
 
 def render():
     """Render BISAP Score interface"""
@@ -255,40 +257,15 @@ def render():
     
     # Calculate button
     if st.button("📊 Tính BISAP Score", type="primary", use_container_width=True):
-        # Calculate total score
-        bisap_score = sum([
-            bun_positive,
-            mental_impaired or (gcs < 15),
-            sirs_positive,
-            age_positive,
+        result = calculate_bisap(
+            bun_positive, mental_impaired, gcs, sirs_positive, age_positive,
             pleural
-        ])
-        
-        # Mortality risk
-        mortality_rates = {
-            0: "<1%",
-            1: "~2%",
-            2: "~10-15%",
-            3: "~20-25%",
-            4: "~40-50%",
-            5: ">50%"
-        }
-        
-        mortality = mortality_rates[bisap_score]
-        
-        # Severity classification
-        if bisap_score == 0:
-            severity = "Nhẹ"
-            color = "#28a745"
-            icon = "✅"
-        elif bisap_score <= 2:
-            severity = "Trung bình"
-            color = "#ffc107"
-            icon = "⚠️"
-        else:
-            severity = "Nặng"
-            color = "#dc3545"
-            icon = "🚨"
+        )
+        bisap_score = result['bisap_score']
+        mortality = result['mortality']
+        severity = result['severity']
+        color = result['color']
+        icon = result['icon']
         
         # Display results
         st.markdown("## 📊 Kết quả")
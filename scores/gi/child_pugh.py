@@ -21,6 +21,13 @@ Br J Surg. 1973;60(8):646-9.
 
 import streamlit as st
 
+from scores.engine.gi.child_pugh import (
+    get_bilirubin_points,
+    get_albumin_points,
+    get_inr_points,
+    calculate_child_pugh,
+)
+
 
 def render():
     """Render Child-Pugh Score Calculator"""
@@ -39,10 +46,6 @@ def render():
     
     st.markdown("---")
     
-    # Initialize score
-    total_score = 0
-    score_breakdown = {}
-    
     # Input section
     col1, col2 = st.columns(2)
     
@@ -83,18 +86,7 @@ def render():
             st.caption(f"≈ {bili_mgdl:.1f} mg/dL")
         
         # Score bilirubin
-        if bili_mgdl < 2:
-            bili_score = 1
-            bili_level = "<2 mg/dL"
-        elif bili_mgdl <= 3:
-            bili_score = 2
-            bili_level = "2-3 mg/dL"
-        else:
-            bili_score = 3
-            bili_level = ">3 mg/dL"
-        
-        total_score += bili_score
-        score_breakdown["Bilirubin"] = bili_score
+        bili_score, bili_level = get_bilirubin_points(bili_mgdl)
         
         if bili_score == 1:
             st.success(f"✅ {bili_level} → +{bili_score} điểm")
@@ -116,18 +108,7 @@ def render():
         st.caption(f"≈ {albumin * 10:.0f} g/L")
         
         # Score albumin
-        if albumin > 3.5:
-            alb_score = 1
-            alb_level = ">3.5 g/dL"
-        elif albumin >= 2.8:
-            alb_score = 2
-            alb_level = "2.8-3.5 g/dL"
-        else:
-            alb_score = 3
-            alb_level = "<2.8 g/dL"
-        
-        total_score += alb_score
-        score_breakdown["Albumin"] = alb_score
+        alb_score, alb_level = get_albumin_points(albumin)
         
         if alb_score == 1:
             st.success(f"✅ {alb_level} → +{alb_score} điểm")
@@ -148,18 +129,7 @@ def render():
         )
         
         # Score INR
-        if inr < 1.7:
-            inr_score = 1
-            inr_level = "<1.7"
-        elif inr <= 2.3:
-            inr_score = 2
-            inr_level = "1.7-2.3"
-        else:
-            inr_score = 3
-            inr_level = ">2.3"
-        
-        total_score += inr_score
-        score_breakdown["INR"] = inr_score
+        inr_score, inr_level = get_inr_points(inr)
         
         if inr_score == 1:
             st.success(f"✅ {inr_level} → +{inr_score} điểm")
@@ -193,9 +163,6 @@ def render():
             asc_score = 3
             st.error("🔴 Cổ chướng trung bình-nặng → +3 điểm")
         
-        total_score += asc_score
-        score_breakdown["Ascites"] = asc_score
-        
         # 5. Hepatic Encephalopathy
         st.markdown("#### 5. Bệnh Não Gan (Hepatic Encephalopathy)")
         
@@ -225,36 +192,21 @@ def render():
         else:
             enc_score = 3
             st.error("🔴 Bệnh não gan Grade 3-4 → +3 điểm")
-        
-        total_score += enc_score
-        score_breakdown["Encephalopathy"] = enc_score
     
     # Calculate button
     st.markdown("---")
     if st.button("🧮 Tính Child-Pugh Score", type="primary", use_container_width=True):
         
         # Determine Child-Pugh Class
-        if total_score <= 6:
-            cp_class = "A"
-            severity = "XƠ GAN BÙ TRỪ TỐT"
-            color = "green"
-            survival_1yr = "100%"
-            survival_2yr = "85%"
-            periop_mortality = "10%"
-        elif total_score <= 9:
-            cp_class = "B"
-            severity = "SUY CHỨC NĂNG GAN ĐÁNG KỂ"
-            color = "orange"
-            survival_1yr = "81%"
-            survival_2yr = "57%"
-            periop_mortality = "30%"
-        else:
-            cp_class = "C"
-            severity = "XƠ GAN MẤT BÙ"
-            color = "red"
-            survival_1yr = "45%"
-            survival_2yr = "35%"
-            periop_mortality = "82%"
+        result = calculate_child_pugh(bili_mgdl, albumin, inr, asc_score, enc_score)
+        total_score = result['total_score']
+        score_breakdown = result['score_breakdown']
+        cp_class = result['cp_class']
+        severity = result['severity']
+        color = result['color']
+        survival_1yr = result['survival_1yr']
+        survival_2yr = result['survival_2yr']
+        periop_mortality = result['periop_mortality']
         
         # Display result
         st.markdown("---")
@@ -13,66 +13,7 @@ Lancet. 2000;356(9238):1318-21.
 
 import streamlit as st
 
-
-def calculate_gbs(
-    bun_mgdl, hgb, sbp, hr, melena, syncope, liver_disease, heart_failure, gender
-):
-    """Calculate Glasgow-Blatchford Score"""
-    score = 0
-    
-    # BUN (Blood Urea Nitrogen)
-    if bun_mgdl >= 150:  # ≥25 mg/dL
-        score += 6
-    elif bun_mgdl >= 100:  # 18.2-24.9 mg/dL
-        score += 4
-    elif bun_mgdl >= 70:  # 12.7-18.1 mg/dL
-        score += 3
-    elif bun_mgdl >= 39:  # 6.5-12.6 mg/dL
-        score += 2
-    
-    # Hemoglobin
-    if gender == "Nam":
-        if hgb < 10.0:
-            score += 6
-        elif hgb < 12.0:
-            score += 3
-        elif hgb < 13.0:
-            score += 1
-    else:  # Nữ
-        if hgb < 10.0:
-            score += 6
-        elif hgb < 12.0:
-            score += 1
-    
-    # Systolic BP
-    if sbp < 90:
-        score += 3
-    elif sbp < 100:
-        score += 2
-    elif sbp < 110:
-        score += 1
-    
-    # Heart Rate
-    if hr >= 100:
-        score += 1
-    
-    # Melena
-    if melena:
-        score += 1
-    
-    # Syncope
-    if syncope:
-        score += 2
-    
-    # Liver disease
-    if liver_disease:
-        score += 2
-    
-    # Heart failure
-    if heart_failure:
-        score += 2
-    
-    return score
+from scores.engine.gi.glasgow_blatchford import calculate_gbs
 
 
 def render():
@@ -679,4 +620,3 @@ def render():
     st.caption("📚 Based on: Blatchford O, et al. Lancet. 2000;356(9238):1318-21")
     st.caption("⚠️ Score 0 = Very low risk, can safely discharge")
     st.caption("🏥 Best validated score for identifying low-risk UGIB patients")
-
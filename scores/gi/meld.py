@@ -15,46 +15,8 @@ Hepatology. 2001;33(2):464-70.
 """
 
 import streamlit as st
-import math
 
-
-def calculate_meld(bilirubin, inr, creatinine, dialysis=False):
-    """
-    Calculate MELD Score
-    
-    Args:
-        bilirubin: Total bilirubin in mg/dL
-        inr: INR value
-        creatinine: Serum creatinine in mg/dL
-        dialysis: Whether patient had dialysis twice in past week
-    
-    Returns:
-        MELD score (6-40)
-    """
-    # Apply minimums
-    bili = max(bilirubin, 1.0)
-    inr_val = max(inr, 1.0)
-    cr = max(creatinine, 1.0)
-    
-    # If on dialysis or Cr > 4, cap creatinine at 4
-    if dialysis or cr > 4.0:
-        cr = 4.0
-    
-    # MELD formula
-    meld = (
-        3.78 * math.log(bili) +
-        11.2 * math.log(inr_val) +
-        9.57 * math.log(cr) +
-        6.43
-    )
-    
-    # Round to nearest integer
-    meld = round(meld)
-    
-    # Cap between 6 and 40
-    meld = max(6, min(40, meld))
-    
-    return meld
+from scores.engine.gi.meld import calculate_meld
 
 
 def render():
@@ -662,4 +624,3 @@ def render():
     st.caption("📚 Based on: Kamath PS, et al. Hepatology. 2001;33(2):464-70")
     st.caption("⚠️ Standard score for liver transplant prioritization (UNOS)")
     st.caption("🏥 Predicts 3-month mortality in cirrhosis patients")
-
@@ -5,60 +5,10 @@ Tiên lượng viêm tụy cấp (Acute Pancreatitis)
 
 import streamlit as st
 
-
-def calculate_ranson(criteria_admission, criteria_48h):
-    """
-    Calculate Ranson score
-    
-    Args:
-        criteria_admission: Number of criteria met at admission (0-5)
-        criteria_48h: Number of criteria met at 48 hours (0-6)
-    
-    Returns:
-        dict: Ranson score and interpretation
-    """
-    total_score = criteria_admission + criteria_48h
-    
-    return {
-        "admission_criteria": criteria_admission,
-        "criteria_48h": criteria_48h,
-        "total_score": total_score
-    }
-
-
-def interpret_ranson(total_score):
-    """
-    Interpret Ranson score
-    
-    Returns mortality risk
-    """
-    if total_score < 3:
-        return {
-            "severity": "Nhẹ",
-            "color": "🟢",
-            "mortality": "< 1%",
-            "recommendation": "Điều trị nội khoa thường quy. Theo dõi",
-            "icu_need": "Không cần ICU (thường)",
-            "level": "mild"
-        }
-    elif total_score <= 5:
-        return {
-            "severity": "Trung bình",
-            "color": "🟡",
-            "mortality": "10-20%",
-            "recommendation": "Theo dõi chặt. Cân nhắc ICU/HDU",
-            "icu_need": "Xem xét ICU/HDU",
-            "level": "moderate"
-        }
-    else:  # ≥ 6
-        return {
-            "severity": "Nặng",
-            "color": "🔴",
-            "mortality": "> 50%",
-            "recommendation": "ICU care. Điều trị tích cực. Xem xét can thiệp",
-            "icu_need": "CẦN ICU",
-            "level": "severe"
-        }
+from scores.engine.gi.ranson import (
+    calculate_ranson,
+    interpret_ranson,
+)
 
 
 def render():
@@ -598,4 +548,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
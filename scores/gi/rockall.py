@@ -13,6 +13,12 @@ Gut. 1996;38(3):316-21.
 
 import streamlit as st
 
+from scores.engine.gi.rockall import (
+    get_rockall_age_points,
+    get_rockall_shock_points,
+    get_rockall_risk,
+)
+
 
 def render():
     """Render Rockall Score Calculator"""
@@ -59,12 +65,7 @@ def render():
             step=1
         )
         
-        if age < 60:
-            age_score = 0
-        elif age < 80:
-            age_score = 1
-        else:
-            age_score = 2
+        age_score = get_rockall_age_points(age)
         
         st.caption(f"Điểm: {age_score}")
         
@@ -87,15 +88,7 @@ def render():
             step=5
         )
         
-        if sbp >= 100 and hr < 100:
-            shock_score = 0
-            shock_level = "Không shock"
-        elif sbp >= 100 and hr >= 100:
-            shock_score = 1
-            shock_level = "Tachycardia"
-        else:  # SBP < 100
-            shock_score = 2
-            shock_level = "Hạ huyết áp (shock)"
+        shock_score, shock_level = get_rockall_shock_points(sbp, hr)
         
         st.caption(f"{shock_level} → Điểm: {shock_score}")
         
@@ -191,56 +184,11 @@ def render():
                 total_score = pre_endo_score
                 max_score = 7
             
-            # Determine risk
-            if not is_complete:
-                # Pre-endoscopy Rockall
-                if total_score == 0:
-                    mortality = "0.2%"
-                    rebleed = "4.9%"
-                    risk = "RẤT THẤP"
-                    color = "green"
-                elif total_score <= 2:
-                    mortality = "0.2-0.5%"
-                    rebleed = "5-11%"
-                    risk = "THẤP"
-                    color = "green"
-                elif total_score <= 4:
-                    mortality = "3-5%"
-                    rebleed = "14%"
-                    risk = "TRUNG BÌNH"
-                    color = "orange"
-                else:
-                    mortality = "11-25%"
-                    rebleed = "24%"
-                    risk = "CAO"
-                    color = "red"
-            else:
-                # Complete Rockall
-                if total_score <= 2:
-                    mortality = "0.2%"
-                    rebleed = "5%"
-                    risk = "RẤT THẤP"
-                    color = "green"
-                elif total_score <= 3:
-                    mortality = "2.9%"
-                    rebleed = "11%"
-                    risk = "THẤP"
-                    color = "green"
-                elif total_score <= 5:
-                    mortality = "5.3%"
-                    rebleed = "14%"
-                    risk = "TRUNG BÌNH"
-                    color = "orange"
-                elif total_score <= 7:
-                    mortality = "10.8%"
-                    rebleed = "24%"
-                    risk = "CAO"
-                    color = "red"
-                else:
-                    mortality = "26.7%"
-                    rebleed = "42%"
-                    risk = "RẤT CAO"
-                    color = "red"
+            result = get_rockall_risk(is_complete, total_score)
+            mortality = result['mortality']
+            rebleed = result['rebleed']
+            risk = result['risk']
+            color = result['color']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
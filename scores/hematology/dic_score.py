@@ -27,251 +27,7 @@ known to be associated with DIC (sepsis, trauma, malignancy, obstetric complicat
 
 import streamlit as st
 
-
-def calculate_dic_score(
-    platelet_count: float,
-    ddimer_level: int,
-    pt_prolongation: float,
-    fibrinogen: float
-) -> dict:
-    """
-    Calculate ISTH DIC Score
-    
-    Args:
-        platelet_count: Platelet count (×10³/μL or ×10⁹/L)
-        ddimer_level: D-dimer level category (0=no increase, 1=moderate, 2=strong)
-        pt_prolongation: PT prolongation in seconds above ULN
-        fibrinogen: Fibrinogen level (mg/dL)
-    
-    Returns:
-        Dictionary containing score, interpretation, recommendations, and details
-    """
-    score = 0
-    details = []
-    
-    # 1. Platelet count
-    if platelet_count >= 100:
-        plt_score = 0
-        details.append(f"Tiểu cầu: {platelet_count:.0f} ×10³/μL → 0 điểm (≥100)")
-    elif platelet_count >= 50:
-        plt_score = 1
-        details.append(f"Tiểu cầu: {platelet_count:.0f} ×10³/μL → 1 điểm (50-99)")
-    else:
-        plt_score = 2
-        details.append(f"Tiểu cầu: {platelet_count:.0f} ×10³/μL → 2 điểm (<50)")
-    score += plt_score
-    
-    # 2. D-dimer / FDP
-    ddimer_labels = [
-        "Không tăng",
-        "Tăng vừa (>ULN nhưng <3-4× ULN)",
-        "Tăng mạnh (≥3-4× ULN)"
-    ]
-    if ddimer_level == 0:
-        details.append(f"D-dimer/FDP: {ddimer_labels[0]} → 0 điểm")
-    elif ddimer_level == 1:
-        details.append(f"D-dimer/FDP: {ddimer_labels[1]} → 2 điểm")
-    else:  # ddimer_level == 2
-        details.append(f"D-dimer/FDP: {ddimer_labels[2]} → 3 điểm")
-    
-    ddimer_score = [0, 2, 3][ddimer_level]
-    score += ddimer_score
-    
-    # 3. PT prolongation
-    if pt_prolongation < 3:
-        pt_score = 0
-        details.append(f"PT kéo dài: {pt_prolongation:.1f}s → 0 điểm (<3s)")
-    elif pt_prolongation < 6:
-        pt_score = 1
-        details.append(f"PT kéo dài: {pt_prolongation:.1f}s → 1 điểm (3-5.9s)")
-    else:
-        pt_score = 2
-        details.append(f"PT kéo dài: {pt_prolongation:.1f}s → 2 điểm (≥6s)")
-    score += pt_score
-    
-    # 4. Fibrinogen
-    if fibrinogen >= 100:
-        fib_score = 0
-        details.append(f"Fibrinogen: {fibrinogen:.0f} mg/dL → 0 điểm (≥100)")
-    else:
-        fib_score = 1
-        details.append(f"Fibrinogen: {fibrinogen:.0f} mg/dL → 1 điểm (<100)")
-    score += fib_score
-    
-    # Determine interpretation and recommendations
-    if score >= 5:
-        interpretation = "TƯƠNG THÍCH VỚI DIC RÕ RÀNG (Overt DIC)"
-        risk_class = "POSITIVE"
-        color = "🔴"
-        recommendation = """
-        **🔴 Xử Trí Khuyến Cáo - OVERT DIC:**
-        
-        ### 1️⃣ ĐIỀU TRỊ BỆNH NỀN - QUAN TRỌNG NHẤT
-        
-        **Không thể điều trị DIC nếu không điều trị nguyên nhân gốc!**
-        
-        - **Sepsis:** Kháng sinh phù hợp, kiểm soát nhiễm trùng, resuscitation
-        - **Chấn thương:** Kiểm soát chảy máu, phẫu thuật, damage control
-        - **Ung thư:** Hóa trị, điều trị ung thư gây DIC (promyelocytic leukemia)
-        - **Sản khoa:** Lấy thai/nhau, điều trị pre-eclampsia/eclampsia
-        - **Độc tố:** Gắp rắn, transfusion reaction → điều trị specific
-        
-        ### 2️⃣ HỖ TRỢ ĐÔNG MÁU
-        
-        **A. Truyền Thành Phần Máu:**
-        
-        - **Tiểu cầu:**
-          - Mục tiêu: >50,000/μL (nếu chảy máu hoặc thủ thuật xâm lấn)
-          - Mục tiêu: >20,000/μL (nếu ổn định, không chảy máu)
-          - Liều: 1 unit tiểu cầu (thường tăng ~5,000-10,000/μL)
-        
-        - **Fresh Frozen Plasma (FFP):**
-          - Nếu PT/aPTT kéo dài + chảy máu hoặc cần thủ thuật
-          - Liều: 10-15 mL/kg (thường 4 units)
-          - Không khuyến cáo nếu không chảy máu
-        
-        - **Cryoprecipitate:**
-          - Nếu fibrinogen <100 mg/dL + chảy máu
-          - Liều: 10 units (tăng fibrinogen ~70-100 mg/dL)
-        
-        - **Packed Red Blood Cells:**
-          - Duy trì Hb >7 g/dL (hoặc >9 g/dL nếu CAD, hoạt động chảy máu)
-        
-        **B. Kháng Đông (Heparin):**
-        
-        ⚠️ **Controversial!** Chỉ xem xét trong trường hợp đặc biệt:
-        - **Có thể cân nhắc:**
-          * DIC chủ yếu huyết khối (purpura fulminans, acral ischemia)
-          * Acute promyelocytic leukemia (APL)
-          * Retained dead fetus syndrome
-          * Aortic aneurysm (Kasabach-Merritt)
-        
-        - **Liều:** UFH 5-10 U/kg/h (KHÔNG loading dose)
-        - **KHÔNG dùng nếu:** Chảy máu hoạt động, tiểu cầu <50,000
-        
-        **C. Thuốc Khác:**
-        
-        - **Tranexamic acid:** ❌ TRÁNH trong DIC cấp (nguy cơ huyết khối)
-        - **Antithrombin concentrate:** Có thể có lợi nhưng evidence hạn chế
-        - **Recombinant Factor VIIa:** Chỉ trong trường hợp cực kỳ đặc biệt
-        
-        ### 3️⃣ THEO DÕI
-        
-        - **CBC, PT/INR, aPTT, fibrinogen:** Mỗi 6-12h ban đầu
-        - **D-dimer:** Theo dõi xu hướng
-        - **Tính lại DIC score:** Hàng ngày
-        - **Đánh giá chảy máu:** Liên tục (da, niêm mạc, chỗ chích, catheter)
-        - **Đánh giá huyết khối:** Acral cyanosis, purpura fulminans, organ failure
-        
-        ### 4️⃣ XỬ TRÍ BIẾN CHỨNG
-        
-        - **Chảy máu:** Truyền thành phần, điều trị tại chỗ
-        - **Huyết khối vi mạch:** Heparin liều thấp (nếu phù hợp)
-        - **Suy cơ quan:** Hỗ trợ gan/thận/hô hấp
-        """
-        
-        education = """
-        **💡 Diễn Giải - OVERT DIC:**
-        
-        - **DIC Score ≥5:** Chẩn đoán DIC rõ ràng (với bệnh nền phù hợp)
-        - **DIC** là hội chứng đông máu nội mạch lan tỏa → tiêu thụ tiểu cầu/yếu tố đông máu
-        - **Cơ chế:** Kích hoạt đông máu → tiểu cầu/fibrinogen cạn kiệt → chảy máu paradoxical
-        - **Biểu hiện:** Chảy máu + huyết khối + suy cơ quan
-        - **Điều trị then chốt:** ĐIỀU TRỊ BỆNH NỀN (sepsis, trauma, etc.)
-        - **Truyền máu:** Hỗ trợ, KHÔNG "điều trị" DIC
-        """
-        
-    else:  # score < 5
-        interpretation = "GỢI Ý NHƯNG CHƯA XÁC ĐỊNH DIC (Non-Overt DIC)"
-        risk_class = "SUGGESTIVE"
-        color = "🟡"
-        recommendation = """
-        **🟡 Xử Trí Khuyến Cáo - NON-OVERT DIC:**
-        
-        ### 1️⃣ ĐÁNH GIÁ LẠI
-        
-        - **Tính lại DIC score sau 1-2 ngày**
-        - Có thể đang ở giai đoạn SỚM của DIC
-        - Theo dõi xu hướng các xét nghiệm đông máu
-        
-        ### 2️⃣ XEM XÉT CHẨN ĐOÁN KHÁC
-        
-        **Nếu DIC score thấp nhưng có rối loạn đông máu:**
-        
-        - **Suy gan:** PT kéo dài, giảm fibrinogen, NHƯNG D-dimer thường không tăng cao
-        - **ITP (Immune Thrombocytopenic Purpura):** Giảm tiểu cầu ĐƠN THUẦN, PT/aPTT bình thường
-        - **TTP/HUS:** Giảm tiểu cầu, thiếu máu tan máu, NHƯNG PT/aPTT bình thường
-        - **Thiếu vitamin K:** PT kéo dài, fibrinogen bình thường, tiểu cầu bình thường
-        - **Dilutional coagulopathy:** Sau truyền máu/dịch lớn
-        - **Heparin/Warfarin effect:** Kéo dài PT/aPTT
-        
-        ### 3️⃣ TIẾP TỤC ĐIỀU TRỊ BỆNH NỀN
-        
-        - Dù DIC score <5, vẫn cần điều trị tích cực bệnh nền
-        - Sepsis → kháng sinh, resuscitation
-        - Chấn thương → kiểm soát chảy máu
-        - Ung thư → hóa trị nếu phù hợp
-        
-        ### 4️⃣ THEO DÕI
-        
-        - **CBC, PT/INR, aPTT, fibrinogen, D-dimer:** Mỗi ngày
-        - **Tái đánh giá DIC score:** Sau 24-48h
-        - **Theo dõi triệu chứng:** Chảy máu, huyết khối, suy cơ quan
-        
-        ### 5️⃣ CHUẨN BỊ XỬ TRÍ
-        
-        - Nếu DIC score tăng lên ≥5 → xử trí như OVERT DIC
-        - Sẵn sàng thành phần máu nếu cần
-        - Tránh thủ thuật xâm lấn không cần thiết
-        """
-        
-        education = """
-        **💡 Diễn Giải - NON-OVERT DIC:**
-        
-        - **DIC Score <5:** Gợi ý rối loạn đông máu nhưng chưa đủ tiêu chuẩn DIC rõ ràng
-        - Có thể là:
-          * DIC giai đoạn SỚM (cần theo dõi)
-          * Rối loạn đông máu do nguyên nhân KHÁC (suy gan, ITP, TTP, etc.)
-          * Bệnh nền đã gây rối loạn đông máu nhưng chưa phát triển thành DIC
-        
-        - **Khuyến cáo:**
-          * Tính lại score sau 24-48h
-          * Tiếp tục điều trị bệnh nền tích cực
-          * Theo dõi xu hướng xét nghiệm
-          * Xem xét chẩn đoán phân biệt
-        """
-    
-    # Additional clinical notes
-    clinical_notes = """
-    **📌 LƯU Ý QUAN TRỌNG:**
-    
-    1. **ISTH DIC Score CHỈ ÁP DỤNG** khi có bệnh nền liên quan DIC:
-       - Sepsis / Nhiễm trùng nặng
-       - Chấn thương nặng / Đa chấn thương
-       - Ung thư (đặc biệt APL, ung thư tụy, ung thư tiền liệt tuyến)
-       - Biến chứng sản khoa (HELLP, thai chết lưu, nhau bong non, ối vào mạch)
-       - Phản ứng truyền máu
-       - Bệnh gan nặng
-       - Rắn độc cắn
-       - Phẫu thuật lớn (tim, gan, tụy)
-    
-    2. **KHÔNG tính DIC score nếu không có bệnh nền phù hợp!**
-    
-    3. **DIC là chẩn đoán lâm sàng + xét nghiệm:**
-       - Score ≥5 + bệnh nền + biểu hiện lâm sàng → DIC
-       - Score đơn thuần KHÔNG đủ để chẩn đoán
-    """
-    
-    return {
-        'score': score,
-        'interpretation': interpretation,
-        'risk_class': risk_class,
-        'recommendation': recommendation,
-        'education': education,
-        'details': details,
-        'color': color,
-        'clinical_notes': clinical_notes
-    }
+from scores.engine.hematology.dic_score import calculate_dic_score
 
 
 def render():
@@ -548,4 +304,3 @@ def render():
         
         N = bình thường, ↑ = tăng, ↓ = giảm
         """)
-
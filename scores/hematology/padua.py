@@ -5,6 +5,8 @@ Nguy cơ VTE ở bệnh nhân nội khoa - Chỉ định thromboprophylaxis
 
 import streamlit as st
 
+from scores.engine.hematology.padua import calculate_padua
+
 
 def render():
     """Render Padua Score interface"""
@@ -37,94 +39,54 @@ def render():
     
     st.subheader("📝 Đánh giá nguy cơ VTE")
     
-    score = 0
-    components = []
-    
     # Active cancer
     cancer = st.checkbox("Ung thư đang hoạt động", help="Metastasis hoặc đang hóa trị/xạ trị trong 6 tháng")
-    if cancer:
-        score += 3
-        components.append("Ung thư hoạt động (+3)")
     
     # Previous VTE
     prev_vte = st.checkbox("Tiền sử VTE (trừ thrombophlebitis nông)", help="PE hoặc DVT trước đây")
-    if prev_vte:
-        score += 3
-        components.append("Tiền sử VTE (+3)")
     
     # Reduced mobility
     mobility = st.checkbox("Giảm vận động", help="Nằm liệt giường (trừ đi toilet) ≥ 3 ngày")
-    if mobility:
-        score += 3
-        components.append("Giảm vận động (+3)")
     
     # Thrombophilic condition
     thrombophilia = st.checkbox("Rối loạn đông máu di truyền", help="Factor V Leiden, Prothrombin G20210A, deficiency AT/PC/PS")
-    if thrombophilia:
-        score += 3
-        components.append("Thrombophilia (+3)")
     
     # Recent trauma/surgery
     trauma = st.checkbox("Chấn thương và/hoặc phẫu thuật ≤ 1 tháng")
-    if trauma:
-        score += 2
-        components.append("Chấn thương/PT gần đây (+2)")
     
     # Age >= 70
     age = st.number_input("Tuổi", 18, 120, 60, 1)
-    age_70 = age >= 70
-    if age_70:
-        score += 1
-        components.append("Tuổi ≥ 70 (+1)")
     
     # Heart/respiratory failure
     hf_rf = st.checkbox("Suy tim và/hoặc suy hô hấp")
-    if hf_rf:
-        score += 1
-        components.append("Suy tim/hô hấp (+1)")
     
     # AMI/stroke
     ami_stroke = st.checkbox("Nhồi máu cơ tim cấp và/hoặc đột quỵ thiếu máu não")
-    if ami_stroke:
-        score += 1
-        components.append("AMI/Đột quỵ (+1)")
     
     # Acute infection/rheumatologic
     infection = st.checkbox("Nhiễm khuẩn cấp và/hoặc bệnh thấp khớp")
-    if infection:
-        score += 1
-        components.append("Nhiễm khuẩn/Thấp khớp (+1)")
     
     # Obesity
     bmi = st.number_input("BMI (kg/m²)", 10.0, 60.0, 25.0, 0.5)
-    obesity = bmi >= 30
-    if obesity:
-        score += 1
-        components.append(f"Béo phì BMI {bmi:.1f} (+1)")
     
     # Hormone therapy
     hormone = st.checkbox("Đang điều trị hormone (estrogen, HRT, tamoxifen...)")
-    if hormone:
-        score += 1
-        components.append("Điều trị hormone (+1)")
     
     st.markdown("---")
     
+    result = calculate_padua(
+        cancer, prev_vte, mobility, thrombophilia, trauma, age, hf_rf,
+        ami_stroke, infection, bmi, hormone
+    )
+    score = result['score']
+    components = result['components']
+    risk = result['risk']
+    color = result['color']
+    icon = result['icon']
+    vte_risk = result['vte_risk']
+    recommendation = result['recommendation']
+    
     if st.button("📊 Tính Padua Score", type="primary", use_container_width=True):
-        # Risk level
-        if score >= 4:
-            risk = "CAO"
-            color = "#dc3545"
-            icon = "🚨"
-            vte_risk = "~11%"
-            recommendation = "NÊN DỰ PHÒNG"
-        else:
-            risk = "THẤP"
-            color = "#28a745"
-            icon = "✅"
-            vte_risk = "~0.3%"
-            recommendation = "KHÔNG cần dự phòng thường quy"
-        
         st.markdown("## 📊 Kết quả")
         
         st.markdown(f"""
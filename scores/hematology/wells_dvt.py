@@ -33,154 +33,7 @@ Clinical Utility:
 
 import streamlit as st
 
-
-def calculate_wells_dvt(
-    active_cancer: bool,
-    paralysis_immobilization: bool,
-    bedridden_surgery: bool,
-    localized_tenderness: bool,
-    entire_leg_swollen: bool,
-    calf_swelling: bool,
-    pitting_edema: bool,
-    collateral_veins: bool,
-    alternative_diagnosis: bool
-) -> dict:
-    """
-    Calculate Wells DVT Score
-    
-    Args:
-        active_cancer: Active cancer (treatment ongoing, within 6 months, or palliative)
-        paralysis_immobilization: Paralysis, paresis, or recent plaster immobilization
-        bedridden_surgery: Recently bedridden >3 days or major surgery within 12 weeks
-        localized_tenderness: Localized tenderness along deep venous system
-        entire_leg_swollen: Entire leg swollen
-        calf_swelling: Calf swelling >3 cm compared to asymptomatic leg
-        pitting_edema: Pitting edema (confined to symptomatic leg)
-        collateral_veins: Collateral superficial veins (non-varicose)
-        alternative_diagnosis: Alternative diagnosis as likely or more likely than DVT
-    
-    Returns:
-        Dictionary containing score, probability, recommendations, and details
-    """
-    score = 0
-    details = []
-    
-    # Calculate score
-    if active_cancer:
-        score += 1
-        details.append("✓ Ung thư đang hoạt động (+1 điểm)")
-    
-    if paralysis_immobilization:
-        score += 1
-        details.append("✓ Liệt/bất động chân gần đây (+1 điểm)")
-    
-    if bedridden_surgery:
-        score += 1
-        details.append("✓ Nằm liệt giường >3 ngày hoặc phẫu thuật lớn trong 12 tuần (+1 điểm)")
-    
-    if localized_tenderness:
-        score += 1
-        details.append("✓ Đau chạm khu trú dọc hệ tĩnh mạch sâu (+1 điểm)")
-    
-    if entire_leg_swollen:
-        score += 1
-        details.append("✓ Toàn bộ chân phù (+1 điểm)")
-    
-    if calf_swelling:
-        score += 1
-        details.append("✓ Bắp chân phù >3 cm so với chân bên kia (+1 điểm)")
-    
-    if pitting_edema:
-        score += 1
-        details.append("✓ Phù lõm (chỉ ở chân triệu chứng) (+1 điểm)")
-    
-    if collateral_veins:
-        score += 1
-        details.append("✓ Tĩnh mạch nông nối bên (+1 điểm)")
-    
-    if alternative_diagnosis:
-        score -= 2
-        details.append("✓ Chẩn đoán khác có khả năng tương đương/cao hơn DVT (-2 điểm)")
-    
-    # Determine probability and recommendations
-    if score >= 2:
-        probability = "CÓ KHẢ NĂNG CAO (DVT Likely)"
-        probability_percent = "Nguy cơ DVT: ~28-34% (trước xét nghiệm)"
-        risk_class = "HIGH"
-        recommendation = """
-        **🔴 Xử Trí Khuyến Cáo:**
-        
-        1. **Cận Lâm Sàng:**
-           - Siêu âm tĩnh mạch chân (Duplex ultrasound) - NGAY
-           - Nếu siêu âm âm tính nhưng nghi ngờ cao → xem xét chụp CT/MRI tĩnh mạch
-        
-        2. **D-dimer:**
-           - Không khuyến cáo khi xác suất cao (âm tính vẫn cần hình ảnh)
-           - Chỉ xem xét nếu không thể làm siêu âm ngay
-        
-        3. **Xử Trí:**
-           - Cân nhắc bắt đầu kháng đông nếu siêu âm chậm trễ và không có chống chỉ định
-           - Theo dõi triệu chứng suy tĩnh mạch, thuyên tắc phổi
-        
-        4. **Lưu Ý:**
-           - Wells ≥2: Sensitivity ~86%, Specificity ~47%
-           - PPV ~28-34%, NPV ~93-96%
-        """
-        education = """
-        **💡 Diễn Giải:**
-        - Điểm Wells ≥2 → DVT có khả năng cao
-        - Siêu âm tĩnh mạch là tiêu chuẩn vàng
-        - Nếu siêu âm âm tính + D-dimer âm tính → loại trừ DVT
-        - Nếu siêu âm dương tính → bắt đầu điều trị kháng đông
-        """
-        color = "🔴"
-    else:  # score < 2
-        probability = "KHẢ NĂNG THẤP (DVT Unlikely)"
-        probability_percent = "Nguy cơ DVT: ~3-6% (trước xét nghiệm)"
-        risk_class = "LOW"
-        recommendation = """
-        **🟢 Xử Trí Khuyến Cáo:**
-        
-        1. **D-dimer:**
-           - Xét nghiệm D-dimer trước tiên
-           - D-dimer âm tính (age-adjusted) → loại trừ DVT (NPV ~99%)
-           - D-dimer dương tính → tiến hành siêu âm tĩnh mạch
-        
-        2. **Chiến Lược 2 Bước:**
-           ```
-           Wells <2 → D-dimer
-                ├─ Âm tính → Loại trừ DVT, tìm chẩn đoán khác
-                └─ Dương tính → Siêu âm tĩnh mạch chân
-           ```
-        
-        3. **Theo Dõi:**
-           - Nếu D-dimer âm: giải thích, tư vấn
-           - Nếu D-dimer dương: siêu âm trong 24-48h
-           - Tái khám nếu triệu chứng tiến triển
-        
-        4. **Lưu Ý:**
-           - Wells <2 + D-dimer âm: NPV ~99% → an toàn loại trừ DVT
-           - D-dimer dương tính không đồng nghĩa với DVT (nhiều nguyên nhân khác)
-        """
-        education = """
-        **💡 Diễn Giải:**
-        - Điểm Wells <2 → DVT ít có khả năng
-        - Nên dùng D-dimer để loại trừ (tránh siêu âm không cần thiết)
-        - D-dimer âm tính + Wells <2 → NPV cực cao (~99%)
-        - Nếu D-dimer dương → vẫn cần siêu âm để xác định
-        """
-        color = "🟢"
-    
-    return {
-        'score': score,
-        'probability': probability,
-        'probability_percent': probability_percent,
-        'risk_class': risk_class,
-        'recommendation': recommendation,
-        'education': education,
-        'details': details,
-        'color': color
-    }
+from scores.engine.hematology.wells_dvt import calculate_wells_dvt
 
 
 def render():
@@ -412,4 +265,3 @@ def render():
         - Hội chứng sau huyết khối
         - Bệnh lý khớp (viêm khớp, viêm bao hoạt dịch)
         """)
-
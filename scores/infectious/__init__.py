@@ -3,39 +3,19 @@ Infectious Disease Scoring Systems
 Infection assessment calculators
 """
 
-from .centor import render as render_centor
-from .sirs import render as render_sirs
-from .feverpain import render as render_feverpain
-from .pitt_bacteremia import render as render_pitt
-from .mascc import render as render_mascc
+from registry import render_calculator
 
 
 def render_infectious_calculator(calculator_id):
     """
     Route to the correct infectious disease calculator based on ID
-    
+
+    Calculator modules are looked up in registry.py and imported on first use.
+
     Args:
         calculator_id: The ID of the calculator to render
     """
-    import streamlit as st
-    
-    calculators = {
-        "Centor": render_centor,
-        "SIRS": render_sirs,
-        "FeverPAIN": render_feverpain,
-        "Pitt Bacteremia": render_pitt,
-        "MASCC": render_mascc,
-    }
-    
-    calculator_func = calculators.get(calculator_id)
-    if calculator_func:
-        calculator_func()
-    else:
-        st.error(f"Calculator '{calculator_id}' not found!")
-
+    render_calculator(calculator_id)
 
-__all__ = [
-    'render_infectious_calculator',
-    'render_centor',
-]
 
+__all__ = ['render_infectious_calculator']
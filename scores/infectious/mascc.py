@@ -5,23 +5,7 @@ Nguy cơ biến chứng trong sốt giảm bạch cầu hạt
 
 import streamlit as st
 
-
-def calculate_mascc(burden, hypotension, copd, solid_tumor_fungal, dehydration, outpatient, age):
-    """Tính MASCC Risk Index"""
-    total = burden + hypotension + copd + solid_tumor_fungal + dehydration + outpatient + age
-    
-    if total >= 21:
-        risk = "Thấp"
-        mortality = "< 1-5%"
-        management = "Có thể điều trị ngoại trú với kháng sinh uống"
-        color = "green"
-    else:
-        risk = "Cao"
-        mortality = "> 10-20%"
-        management = "Cần nhập viện, kháng sinh tĩnh mạch"
-        color = "red"
-    
-    return {"total_score": total, "risk_level": risk, "mortality": mortality, "management": management, "color": color}
+from scores.engine.infectious.mascc import calculate_mascc
 
 
 def render():
@@ -143,4 +127,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
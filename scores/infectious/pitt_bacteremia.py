@@ -5,36 +5,7 @@ Tiên lượng nhiễm khuẩn huyết
 
 import streamlit as st
 
-
-def calculate_pitt(temp, hypotension, ventilator, cardiac_arrest, mental_status):
-    """
-    Tính Pitt Bacteremia Score
-    
-    Parameters: Các thành phần điểm
-    Returns: dict với total_score và interpretation
-    """
-    total = temp + hypotension + ventilator + cardiac_arrest + mental_status
-    
-    # Phân loại
-    if total <= 1:
-        risk = "Thấp"
-        mortality = "1-5%"
-        color = "green"
-    elif total <= 3:
-        risk = "Trung bình"
-        mortality = "6-20%"
-        color = "orange"
-    else:  # >= 4
-        risk = "Cao"
-        mortality = "> 20%"
-        color = "red"
-    
-    return {
-        "total_score": total,
-        "risk_level": risk,
-        "mortality": mortality,
-        "color": color
-    }
+from scores.engine.infectious.pitt_bacteremia import calculate_pitt
 
 
 def render():
@@ -157,4 +128,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -15,6 +15,8 @@ Arch Intern Med. 1990;150(2):311-3.
 
 import streamlit as st
 
+from scores.engine.metabolism.anion_gap import calculate_anion_gap, calculate_delta_ratio
+
 
 def render():
     """Render Anion Gap Calculator"""
@@ -93,33 +95,17 @@ def render():
         st.markdown("---")
         
         if st.button("🧮 Tính Anion Gap", type="primary", use_container_width=True):
-            # Calculate AG
-            ag = na - (cl + hco3)
+            result = calculate_anion_gap(na, cl, hco3, albumin if adjust_for_albumin else None)
+            ag = result['ag']
+            ag_display = result['ag_display']
+            interpretation = result['interpretation']
+            color = result['color']
             
-            # Adjust for albumin if needed
             if adjust_for_albumin:
-                ag_corrected = ag + (2.5 * (4.0 - albumin))
                 st.info(f"""
                 **AG chưa điều chỉnh:** {ag:.1f} mEq/L
-                **AG điều chỉnh albumin:** {ag_corrected:.1f} mEq/L
+                **AG điều chỉnh albumin:** {result['ag_corrected']:.1f} mEq/L
                 """)
-                ag_display = ag_corrected
-            else:
-                ag_display = ag
-            
-            # Interpret
-            if ag_display < 8:
-                interpretation = "THẤP"
-                color = "info"
-            elif ag_display <= 12:
-                interpretation = "BÌNH THƯỜNG"
-                color = "success"
-            elif ag_display <= 16:
-                interpretation = "TĂNG NHẸ"
-                color = "warning"
-            else:
-                interpretation = "TĂNG CAO"
-                color = "error"
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -358,7 +344,7 @@ def render():
                 - AG = {ag_display:.1f} mEq/L
                 - Delta AG = {ag_display:.1f} - 12 = {ag_display - 12:.1f}
                 - Delta HCO₃ = 24 - {hco3:.1f} = {24 - hco3:.1f}
-                - **Ratio = {(ag_display - 12) / (24 - hco3) if (24 - hco3) != 0 else 0:.2f}**
+                - **Ratio = {calculate_delta_ratio(ag_display, hco3):.2f}**
                 
                 **Giải thích:**
                 - **Ratio < 1:** Toan hỗn hợp (AGMA + NAGMA)
@@ -15,6 +15,8 @@ Br Med J. 1973;4(5893):643-6.
 
 import streamlit as st
 
+from scores.engine.metabolism.corrected_calcium import calculate_corrected_calcium
+
 
 def render():
     """Render Corrected Calcium Calculator"""
@@ -88,26 +90,12 @@ def render():
         st.markdown("---")
         
         if st.button("🧮 Tính Corrected Calcium", type="primary", use_container_width=True):
-            # Calculate corrected calcium
-            ca_corrected_mgdl = ca_mgdl + 0.8 * (4.0 - albumin)
-            ca_corrected_mmol = ca_corrected_mgdl / 4
-            
-            # Determine if correction needed
-            if abs(ca_corrected_mgdl - ca_mgdl) < 0.3:
-                correction_needed = False
-            else:
-                correction_needed = True
-            
-            # Interpret corrected calcium
-            if ca_corrected_mgdl < 8.5:
-                interpretation = "THẤP (Hypocalcemia)"
-                color = "error"
-            elif ca_corrected_mgdl <= 10.5:
-                interpretation = "BÌNH THƯỜNG"
-                color = "success"
-            else:
-                interpretation = "CAO (Hypercalcemia)"
-                color = "warning"
+            result = calculate_corrected_calcium(ca_mgdl, albumin)
+            ca_corrected_mgdl = result['ca_corrected_mgdl']
+            ca_corrected_mmol = result['ca_corrected_mmol']
+            correction_needed = result['correction_needed']
+            interpretation = result['interpretation']
+            color = result['color']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -5,29 +5,7 @@ Tính độ thanh thải creatinine - Quan trọng cho điều chỉnh liều th
 
 import streamlit as st
 
-
-def calculate_crcl(age, weight, creatinine, gender, creatinine_unit="µmol/L"):
-    """
-    Cockcroft-Gault formula for Creatinine Clearance
-    
-    Returns CrCl in mL/min
-    """
-    # Convert creatinine to mg/dL if needed
-    if creatinine_unit == "µmol/L":
-        creatinine_mg = creatinine / 88.4
-    else:
-        creatinine_mg = creatinine
-    
-    # Cockcroft-Gault formula
-    # CrCl (male) = [(140 - age) × weight] / (72 × SCr)
-    # CrCl (female) = CrCl (male) × 0.85
-    
-    crcl = ((140 - age) * weight) / (72 * creatinine_mg)
-    
-    if gender == "female":
-        crcl = crcl * 0.85
-    
-    return crcl
+from scores.engine.metabolism.crcl import calculate_crcl
 
 
 def render():
@@ -474,4 +452,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
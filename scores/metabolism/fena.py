@@ -17,6 +17,8 @@ JAMA. 1976;236(6):579-81.
 
 import streamlit as st
 
+from scores.engine.metabolism.fena import calculate_fena
+
 
 def render():
     """Render FENa Calculator"""
@@ -146,22 +148,11 @@ def render():
         st.markdown("---")
         
         if st.button("🧮 Tính FENa", type="primary", use_container_width=True):
-            # Calculate FENa
-            fena = ((u_na * p_cr_mgdl) / (p_na * u_cr_mgdl)) * 100
-            
-            # Interpret
-            if fena < 1.0:
-                interpretation = "PRERENAL AKI"
-                color = "info"
-                cause = "Thiếu tưới máu thận"
-            elif fena <= 2.0:
-                interpretation = "KHÔNG RÕ RÀNG"
-                color = "warning"
-                cause = "Cần thêm thông tin lâm sàng"
-            else:
-                interpretation = "INTRINSIC RENAL AKI"
-                color = "error"
-                cause = "Tổn thương nhu mô thận"
+            result = calculate_fena(u_na, p_cr_mgdl, p_na, u_cr_mgdl)
+            fena = result['fena']
+            interpretation = result['interpretation']
+            color = result['color']
+            cause = result['cause']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
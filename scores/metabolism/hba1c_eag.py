@@ -5,92 +5,11 @@ Chuyển đổi giữa HbA1c và glucose trung bình ước tính
 
 import streamlit as st
 
-
-def calculate_eag_from_hba1c(hba1c_percent):
-    """
-    Calculate eAG from HbA1c using ADAG formula
-    eAG (mg/dL) = 28.7 × HbA1c - 46.7
-    eAG (mmol/L) = 1.59 × HbA1c - 2.59
-    
-    Args:
-        hba1c_percent: HbA1c in percentage (%)
-    
-    Returns:
-        tuple: (eAG in mg/dL, eAG in mmol/L)
-    """
-    eag_mgdl = 28.7 * hba1c_percent - 46.7
-    eag_mmol = 1.59 * hba1c_percent - 2.59
-    
-    return eag_mgdl, eag_mmol
-
-
-def calculate_hba1c_from_eag(eag_mgdl):
-    """
-    Calculate HbA1c from average glucose
-    HbA1c (%) = (eAG + 46.7) / 28.7
-    
-    Args:
-        eag_mgdl: Average glucose in mg/dL
-    
-    Returns:
-        float: HbA1c in percentage
-    """
-    hba1c = (eag_mgdl + 46.7) / 28.7
-    return hba1c
-
-
-def get_diabetes_status(hba1c_percent):
-    """
-    Determine diabetes status based on HbA1c
-    
-    Args:
-        hba1c_percent: HbA1c in percentage
-    
-    Returns:
-        dict: Status information
-    """
-    if hba1c_percent < 5.7:
-        return {
-            "status": "Bình thường",
-            "color": "🟢",
-            "risk": "Không có đái tháo đường",
-            "recommendation": "Duy trì lối sống lành mạnh"
-        }
-    elif hba1c_percent < 6.5:
-        return {
-            "status": "Tiền đái tháo đường",
-            "color": "🟡",
-            "risk": "Nguy cơ cao tiến triển thành ĐTĐ type 2",
-            "recommendation": "Can thiệp lối sống tích cực (ăn uống, vận động)"
-        }
-    elif hba1c_percent < 7.0:
-        return {
-            "status": "Đái tháo đường - Kiểm soát tốt",
-            "color": "🟠",
-            "risk": "ĐTĐ được kiểm soát",
-            "recommendation": "Tiếp tục điều trị, theo dõi định kỳ"
-        }
-    elif hba1c_percent < 8.0:
-        return {
-            "status": "Đái tháo đường - Kiểm soát trung bình",
-            "color": "🟠",
-            "risk": "Cần cải thiện kiểm soát đường huyết",
-            "recommendation": "Xem xét điều chỉnh phác đồ điều trị"
-        }
-    elif hba1c_percent < 9.0:
-        return {
-            "status": "Đái tháo đường - Kiểm soát kém",
-            "color": "🔴",
-            "risk": "Nguy cơ biến chứng cao",
-            "recommendation": "Cần điều chỉnh điều trị tích cực"
-        }
-    else:
-        return {
-            "status": "Đái tháo đường - Không kiểm soát",
-            "color": "🔴",
-            "risk": "Nguy cơ biến chứng cấp và mạn rất cao",
-            "recommendation": "Cần can thiệp điều trị khẩn cấp"
-        }
+from scores.engine.metabolism.hba1c_eag import (
+    calculate_eag_from_hba1c,
+    calculate_hba1c_from_eag,
+    get_diabetes_status,
+)
 
 
 def render():
@@ -383,4 +302,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -5,6 +5,8 @@ Tính độ thẩm thấu huyết thanh và osmolal gap
 
 import streamlit as st
 
+from scores.engine.metabolism.osmolality import calculate_osmolality, calculate_osmolal_gap
+
 
 def render():
     """Render Osmolality Calculator interface"""
@@ -131,22 +133,13 @@ def render():
     st.markdown("---")
     
     if st.button("🔬 Tính Osmolality", type="primary", use_container_width=True):
-        # Calculate osmolality
-        calc_osm = 2 * na + glucose_mg/18 + bun_mg/2.8
+        result = calculate_osmolality(na, glucose_mg, bun_mg)
+        calc_osm = result['calc_osm']
+        osm_status = result['osm_status']
+        osm_color = result['osm_color']
         
         st.markdown("## 📊 Kết quả")
         
-        # Calculated osmolality
-        if calc_osm < 275:
-            osm_status = "Thấp"
-            osm_color = "#ffc107"
-        elif calc_osm <= 295:
-            osm_status = "Bình thường"
-            osm_color = "#28a745"
-        else:
-            osm_status = "Cao"
-            osm_color = "#dc3545"
-        
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, {osm_color}22 0%, {osm_color}44 100%); 
                     padding: 30px; border-radius: 15px; border-left: 5px solid {osm_color}; margin: 20px 0;'>
@@ -171,23 +164,14 @@ def render():
         
         # Osmolal gap if measured available
         if measured_available:
-            osm_gap = measured_osm - calc_osm
+            gap = calculate_osmolal_gap(measured_osm, calc_osm)
+            osm_gap = gap['osm_gap']
+            gap_status = gap['gap_status']
+            gap_color = gap['gap_color']
+            gap_icon = gap['gap_icon']
             
             st.markdown("---")
             
-            if osm_gap < 10:
-                gap_status = "Bình thường"
-                gap_color = "#28a745"
-                gap_icon = "✅"
-            elif osm_gap < 20:
-                gap_status = "Tăng nhẹ"
-                gap_color = "#ffc107"
-                gap_icon = "⚠️"
-            else:
-                gap_status = "Tăng rõ rệt"
-                gap_color = "#dc3545"
-                gap_icon = "🚨"
-            
             st.markdown(f"""
             <div style='background: linear-gradient(135deg, {gap_color}22 0%, {gap_color}44 100%); 
                         padding: 30px; border-radius: 15px; border-left: 5px solid {gap_color}; margin: 20px 0;'>
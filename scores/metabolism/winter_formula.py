@@ -5,105 +5,11 @@ Công thức Winter - PCO2 dự đoán trong toan chuyển hóa
 
 import streamlit as st
 
-
-def calculate_expected_pco2(hco3):
-    """
-    Calculate expected PCO2 using Winter's Formula
-    Expected PCO2 = 1.5 × [HCO3] + 8 (± 2)
-    
-    Args:
-        hco3: Serum bicarbonate in mmol/L or mEq/L
-    
-    Returns:
-        tuple: (expected_pco2, lower_limit, upper_limit)
-    """
-    expected_pco2 = 1.5 * hco3 + 8
-    lower_limit = expected_pco2 - 2
-    upper_limit = expected_pco2 + 2
-    
-    return expected_pco2, lower_limit, upper_limit
-
-
-def interpret_compensation(actual_pco2, expected_pco2, lower_limit, upper_limit):
-    """
-    Interpret respiratory compensation status
-    
-    Args:
-        actual_pco2: Actual measured PCO2
-        expected_pco2: Expected PCO2 from Winter's formula
-        lower_limit: Lower limit of expected range
-        upper_limit: Upper limit of expected range
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if lower_limit <= actual_pco2 <= upper_limit:
-        return {
-            "status": "Bù thường thích hợp",
-            "color": "🟢",
-            "interpretation": "Bù thường hô hấp đầy đủ cho toan chuyển hóa",
-            "clinical": "Chỉ có rối loạn acid-base đơn thuần (Toan chuyển hóa)",
-            "action": "Điều trị nguyên nhân gây toan chuyển hóa"
-        }
-    elif actual_pco2 < lower_limit:
-        deviation = lower_limit - actual_pco2
-        return {
-            "status": "Bù thường quá mức",
-            "color": "🔵",
-            "interpretation": f"PCO2 thấp hơn dự đoán {deviation:.1f} mmHg",
-            "clinical": "Rối loạn acid-base hỗn hợp: Toan chuyển hóa + Kiềm hô hấp",
-            "action": "Tìm nguyên nhân tăng thông khí (lo âu, đau, nhiễm trùng phổi, v.v.)"
-        }
-    else:  # actual_pco2 > upper_limit
-        deviation = actual_pco2 - upper_limit
-        return {
-            "status": "Bù thường không đầy đủ",
-            "color": "🟠",
-            "interpretation": f"PCO2 cao hơn dự đoán {deviation:.1f} mmHg",
-            "clinical": "Rối loạn acid-base hỗn hợp: Toan chuyển hóa + Toan hô hấp",
-            "action": "Đánh giá chức năng hô hấp, xem xét hỗ trợ thông khí"
-        }
-
-
-def get_metabolic_acidosis_causes(anion_gap):
-    """
-    Get common causes based on anion gap
-    
-    Args:
-        anion_gap: Calculated anion gap
-    
-    Returns:
-        dict: Causes categorized by anion gap
-    """
-    if anion_gap > 12:
-        return {
-            "type": "Toan chuyển hóa Anion Gap cao",
-            "mnemonic": "MUDPILES / GOLDMARK",
-            "causes": [
-                "**M**ethanol",
-                "**U**remia (suy thận)",
-                "**D**KA (nhiễm toan do đái tháo đường)",
-                "**P**araldehyde / **P**ropylene glycol",
-                "**I**soniazid / **I**ron",
-                "**L**actic acidosis (nhiễm toan lactic)",
-                "**E**thylene glycol",
-                "**S**alicylates (aspirin)"
-            ]
-        }
-    else:
-        return {
-            "type": "Toan chuyển hóa Anion Gap bình thường",
-            "mnemonic": "HARDUPS",
-            "causes": [
-                "**H**yperalimentation",
-                "**A**cetazolamide / **A**ddison's disease",
-                "**R**TA (Renal Tubular Acidosis)",
-                "**D**iarrhea (tiêu chảy)",
-                "**U**reteral diversions",
-                "**P**ancreatic fistula",
-                "**S**aline excess"
-            ]
-        }
+from scores.engine.metabolism.winter_formula import (
+    calculate_expected_pco2,
+    interpret_compensation,
+    get_metabolic_acidosis_causes,
+)
 
 
 def render():
@@ -431,4 +337,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -4,98 +4,12 @@ Tính tốc độ lọc cầu thận ước tính
 """
 
 import streamlit as st
-import math
 
-
-def calculate_ckd_epi(creatinine_mg, age, gender, race, creatinine_unit="mg/dL"):
-    """
-    CKD-EPI 2009 formula (the most accurate current formula)
-    
-    Returns eGFR in mL/min/1.73m²
-    """
-    # Convert to mg/dL if needed
-    if creatinine_unit == "µmol/L":
-        creatinine_mg = creatinine_mg / 88.4
-    
-    # Gender-specific parameters
-    kappa = 0.7 if gender == "female" else 0.9
-    alpha = -0.329 if gender == "female" else -0.411
-    gender_factor = 1.018 if gender == "female" else 1.0
-    
-    # Race factor
-    race_factor = 1.159 if race == "black" else 1.0
-    
-    # Calculate
-    min_val = min(creatinine_mg / kappa, 1)
-    max_val = max(creatinine_mg / kappa, 1)
-    
-    egfr = 141 * (min_val ** alpha) * (max_val ** -1.209) * (0.993 ** age) * gender_factor * race_factor
-    
-    return egfr
-
-
-def calculate_mdrd(creatinine_mg, age, gender, race, creatinine_unit="mg/dL"):
-    """
-    MDRD formula (older, less accurate but still used)
-    
-    Returns eGFR in mL/min/1.73m²
-    """
-    # Convert to mg/dL if needed
-    if creatinine_unit == "µmol/L":
-        creatinine_mg = creatinine_mg / 88.4
-    
-    # Gender factor
-    gender_factor = 0.742 if gender == "female" else 1.0
-    
-    # Race factor
-    race_factor = 1.212 if race == "black" else 1.0
-    
-    # Calculate
-    egfr = 175 * (creatinine_mg ** -1.154) * (age ** -0.203) * gender_factor * race_factor
-    
-    return egfr
-
-
-def interpret_egfr(egfr):
-    """Interpret eGFR according to CKD stages"""
-    
-    if egfr >= 90:
-        stage = "G1 - Bình thường hoặc cao"
-        description = "Chức năng thận bình thường (nếu không có bằng chứng tổn thương thận khác)"
-        color = "green"
-        action = "Theo dõi thường quy nếu có yếu tố nguy cơ"
-    elif egfr >= 60:
-        stage = "G2 - Giảm nhẹ"
-        description = "Giảm GFR nhẹ (có thể bình thường ở người cao tuổi)"
-        color = "green"
-        action = "Theo dõi, kiểm soát yếu tố nguy cơ"
-    elif egfr >= 45:
-        stage = "G3a - Giảm nhẹ-trung bình"
-        description = "Suy thận mạn giai đoạn 3a"
-        color = "orange"
-        action = "Theo dõi 6-12 tháng, điều chỉnh liều thuốc, kiểm soát ĐTĐ/THA"
-    elif egfr >= 30:
-        stage = "G3b - Giảm trung bình-nặng"
-        description = "Suy thận mạn giai đoạn 3b"
-        color = "orange"
-        action = "Theo dõi 3-6 tháng, chuẩn bị điều trị thận, hội chẩn chuyên khoa"
-    elif egfr >= 15:
-        stage = "G4 - Giảm nặng"
-        description = "Suy thận mạn giai đoạn 4"
-        color = "red"
-        action = "⚠️ Theo dõi 1-3 tháng, chuẩn bị lọc máu/ghép thận, hội chẩn thận"
-    else:
-        stage = "G5 - Suy thận giai đoạn cuối"
-        description = "Suy thận giai đoạn cuối (ESRD)"
-        color = "red"
-        action = "🚨 Cần lọc máu hoặc ghép thận"
-    
-    return {
-        "stage": stage,
-        "description": description,
-        "color": color,
-        "action": action
-    }
+from scores.engine.nephrology.egfr import (
+    calculate_ckd_epi,
+    calculate_mdrd,
+    interpret_egfr,
+)
 
 
 def render():
@@ -453,4 +367,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
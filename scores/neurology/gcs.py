@@ -5,6 +5,8 @@ Consciousness level assessment
 
 import streamlit as st
 
+from scores.engine.neurology.gcs import calculate_gcs
+
 
 def render():
     """Glasgow Coma Scale Calculator"""
@@ -65,7 +67,9 @@ def render():
         motor_score = motor_options[motor_response]
         
         if st.button("🧮 Tính GCS", type="primary"):
-            total_score = eye_score + verbal_score + motor_score
+            result = calculate_gcs(eye_score, verbal_score, motor_score)
+            total_score = result['total_score']
+            severity = result['severity']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -75,15 +79,12 @@ def render():
                 if total_score >= 14:
                     st.success(f"## GCS = {total_score}")
                     st.success("✅ Tổn Thương Nhẹ")
-                    severity = "Mild TBI"
                 elif total_score >= 9:
                     st.warning(f"## GCS = {total_score}")
                     st.warning("⚠️ Tổn Thương Trung Bình")
-                    severity = "Moderate TBI"
                 else:
                     st.error(f"## GCS = {total_score}")
                     st.error("🚨 Tổn Thương Nặng")
-                    severity = "Severe TBI"
             
             st.markdown("### 💡 Giải Thích")
             
@@ -12,6 +12,8 @@ J Neurosurg. 1968;28(1):14-20.
 
 import streamlit as st
 
+from scores.engine.neurology.hunt_hess import adjust_hunt_hess_grade
+
 
 def render():
     """Render Hunt & Hess Scale Calculator"""
@@ -136,11 +138,9 @@ def render():
     
     # Calculate final grade
     grade_number = int(selected_grade.split()[1])
+    final_grade = adjust_hunt_hess_grade(grade_number, serious_disease)
     if serious_disease:
-        final_grade = min(grade_number + 1, 5)  # Max grade 5
         st.warning(f"**Điều chỉnh:** {selected_grade} + 1 (biến chứng toàn thân) = **Grade {final_grade}**")
-    else:
-        final_grade = grade_number
     
     # Calculate button
     st.markdown("---")
@@ -19,6 +19,8 @@ Stroke. 2001;32(4):891-7.
 
 import streamlit as st
 
+from scores.engine.neurology.ich_score import calculate_ich_score
+
 
 def render():
     """Render ICH Score Calculator"""
@@ -33,9 +35,6 @@ def render():
     
     st.markdown("---")
     
-    # Initialize score
-    total_score = 0
-    
     # Input section
     col1, col2 = st.columns(2)
     
@@ -52,7 +51,6 @@ def render():
             help="GCS đánh giá mức độ ý thức. Điểm càng thấp = tình trạng càng nặng"
         )
         gcs_score = gcs_options[gcs_selection]
-        total_score += gcs_score
         
         st.markdown("### 2️⃣ Thể Tích Máu Tụ (ICH Volume)")
         volume_options = {
@@ -65,7 +63,6 @@ def render():
             help="Thể tích tính theo công thức ABC/2 trên CT scan. ≥30 cm³ là dấu hiệu tiên lượng xấu"
         )
         volume_score = volume_options[volume_selection]
-        total_score += volume_score
         
         st.info("""
         **💡 Công thức ABC/2:**
@@ -87,7 +84,6 @@ def render():
             help="Intraventricular Hemorrhage (IVH) trên CT scan"
         )
         ivh_score = ivh_options[ivh_selection]
-        total_score += ivh_score
         
         st.markdown("### 4️⃣ Vị Trí Dưới Lều (Infratentorial)")
         location_options = {
@@ -100,7 +96,6 @@ def render():
             help="Xuất huyết dưới lều (tiểu não, thân não) có tiên lượng xấu hơn"
         )
         location_score = location_options[location_selection]
-        total_score += location_score
         
         st.markdown("### 5️⃣ Tuổi")
         age_options = {
@@ -113,7 +108,9 @@ def render():
             help="Tuổi cao là yếu tố tiên lượng xấu"
         )
         age_score = age_options[age_selection]
-        total_score += age_score
+    
+    result = calculate_ich_score(gcs_score, volume_score, ivh_score, location_score, age_score)
+    total_score = result['total_score']
     
     # Calculate button
     st.markdown("---")
@@ -136,17 +133,7 @@ def render():
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Mortality prediction
-        mortality_data = {
-            0: {"rate": "0%", "desc": "Rất thấp", "color": "🟢"},
-            1: {"rate": "13%", "desc": "Thấp", "color": "🟡"},
-            2: {"rate": "26%", "desc": "Trung bình", "color": "🟠"},
-            3: {"rate": "72%", "desc": "Cao", "color": "🔴"},
-            4: {"rate": "97%", "desc": "Rất cao", "color": "🔴"},
-            5: {"rate": "100%", "desc": "Cực cao", "color": "⚫"},
-            6: {"rate": "100%", "desc": "Cực cao", "color": "⚫"}
-        }
-        
-        mortality = mortality_data[total_score]
+        mortality = result['mortality']
         
         col1, col2, col3 = st.columns(3)
         
@@ -5,6 +5,8 @@ NIHSS - NIH Stroke Scale
 
 import streamlit as st
 
+from scores.engine.neurology.nihss import calculate_nihss
+
 
 def render():
     """NIHSS Calculator"""
@@ -250,37 +252,16 @@ def render():
         st.markdown("---")
         
         if st.button("🧮 Tính NIHSS Score", type="primary", use_container_width=True):
-            # Calculate total
-            total_score = (
-                loc_score + loc_q_score + loc_c_score +
-                gaze_score + visual_score + facial_score +
-                arm_l_score + arm_r_score +
-                leg_l_score + leg_r_score +
-                ataxia_score + sensory_score +
-                language_score + dysarthria_score + neglect_score
+            result = calculate_nihss(
+                loc_score, loc_q_score, loc_c_score, gaze_score, visual_score,
+                facial_score, arm_l_score, arm_r_score, leg_l_score,
+                leg_r_score, ataxia_score, sensory_score, language_score,
+                dysarthria_score, neglect_score
             )
-            
-            # Determine severity
-            if total_score == 0:
-                severity = "KHÔNG CÓ ĐỘT QUỴ"
-                color = "success"
-                thrombolysis = "Không"
-            elif total_score <= 4:
-                severity = "ĐỘT QUỴ NHẸ"
-                color = "info"
-                thrombolysis = "Cân nhắc (nếu triệu chứng disabling)"
-            elif total_score <= 15:
-                severity = "ĐỘT QUỴ TRUNG BÌNH"
-                color = "warning"
-                thrombolysis = "Có chỉ định (nếu trong thời gian vàng)"
-            elif total_score <= 20:
-                severity = "ĐỘT QUỴ TRUNG BÌNH - NẶNG"
-                color = "warning"
-                thrombolysis = "Có chỉ định cao"
-            else:
-                severity = "ĐỘT QUỴ NẶNG"
-                color = "error"
-                thrombolysis = "Có chỉ định cao + xem xét thrombectomy"
+            total_score = result['total_score']
+            severity = result['severity']
+            color = result['color']
+            thrombolysis = result['thrombolysis']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
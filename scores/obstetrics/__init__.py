@@ -3,36 +3,19 @@ Obstetrics Scoring Systems
 All obstetrics calculators organized by individual files
 """
 
-from .bishop import render as render_bishop
-from .modified_bishop import render as render_modified_bishop
-from .preeclampsia import render as render_preeclampsia
+from registry import render_calculator
 
 
 def render_obstetrics_calculator(calculator_id):
     """
     Route to the correct obstetrics calculator based on ID
-    
+
+    Calculator modules are looked up in registry.py and imported on first use.
+
     Args:
         calculator_id: The ID of the calculator to render
     """
-    import streamlit as st
-    
-    calculators = {
-        "Preeclampsia": render_preeclampsia,
-        "Bishop Score": render_bishop,
-        "Modified Bishop": render_modified_bishop,
-    }
-    
-    calculator_func = calculators.get(calculator_id)
-    if calculator_func:
-        calculator_func()
-    else:
-        st.error(f"Calculator '{calculator_id}' not found!")
-
+    render_calculator(calculator_id)
 
-__all__ = [
-    'render_obstetrics_calculator',
-    'render_bishop',
-    'render_modified_bishop',
-]
 
+__all__ = ['render_obstetrics_calculator']
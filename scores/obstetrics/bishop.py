@@ -5,124 +5,10 @@ Bishop Score
 
 import streamlit as st
 
-
-def calculate_bishop_score(dilation, effacement, station, consistency, position):
-    """
-    Calculate Bishop Score
-    
-    Args:
-        dilation: Cervical dilation (cm)
-        effacement: Cervical effacement (%)
-        station: Fetal station
-        consistency: Cervical consistency
-        position: Cervical position
-    
-    Returns:
-        int: Total Bishop score (0-13)
-    """
-    # Dilation score
-    if dilation == 0:
-        dilation_score = 0
-    elif dilation <= 2:
-        dilation_score = 1
-    elif dilation <= 4:
-        dilation_score = 2
-    else:  # > 4 cm
-        dilation_score = 3
-    
-    # Effacement score
-    if effacement <= 30:
-        effacement_score = 0
-    elif effacement <= 50:
-        effacement_score = 1
-    elif effacement <= 80:
-        effacement_score = 2
-    else:  # > 80%
-        effacement_score = 3
-    
-    # Station score (-3 to +2)
-    if station <= -3:
-        station_score = 0
-    elif station == -2:
-        station_score = 1
-    elif station in [-1, 0]:
-        station_score = 2
-    else:  # +1, +2
-        station_score = 3
-    
-    # Consistency score
-    consistency_scores = {
-        "firm": 0,
-        "medium": 1,
-        "soft": 2
-    }
-    consistency_score = consistency_scores.get(consistency, 0)
-    
-    # Position score
-    position_scores = {
-        "posterior": 0,
-        "mid": 1,
-        "anterior": 2
-    }
-    position_score = position_scores.get(position, 0)
-    
-    total = (dilation_score + effacement_score + station_score + 
-             consistency_score + position_score)
-    
-    return {
-        "total": total,
-        "dilation_score": dilation_score,
-        "effacement_score": effacement_score,
-        "station_score": station_score,
-        "consistency_score": consistency_score,
-        "position_score": position_score
-    }
-
-
-def interpret_bishop_score(total_score, is_nulliparous=True):
-    """
-    Interpret Bishop Score
-    
-    Args:
-        total_score: Total Bishop score
-        is_nulliparous: True if nulliparous (first pregnancy), False if multiparous
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if total_score <= 5:
-        return {
-            "favorability": "KHÔNG THUẬN LỢI (Unfavorable)",
-            "color": "🔴",
-            "induction_success": "Thấp (30-50% nếu nulliparous)",
-            "recommendation": "Cân nhắc cervical ripening trước induction",
-            "labor_duration": "Có thể kéo dài hoặc thất bại",
-            "csection_risk": "Cao (15-25% nếu nulliparous)",
-            "ripening": "Nên dùng ripening agents (Prostaglandin, Foley catheter)",
-            "severity": "unfavorable"
-        }
-    elif total_score <= 8:
-        return {
-            "favorability": "TRUNG BÌNH (Intermediate)",
-            "color": "🟡",
-            "induction_success": "Trung bình (60-75%)",
-            "recommendation": "Có thể induction, cân nhắc ripening",
-            "labor_duration": "Bình thường đến hơi kéo dài",
-            "csection_risk": "Trung bình (10-15%)",
-            "ripening": "Xem xét ripening nếu nulliparous",
-            "severity": "intermediate"
-        }
-    else:  # > 8
-        return {
-            "favorability": "THUẬN LỢI (Favorable)",
-            "color": "🟢",
-            "induction_success": "Cao (80-95%)",
-            "recommendation": "Induction có khả năng thành công cao",
-            "labor_duration": "Bình thường, có thể ngắn",
-            "csection_risk": "Thấp (5-10%)",
-            "ripening": "Thường không cần ripening",
-            "severity": "favorable"
-        }
+from scores.engine.obstetrics.bishop import (
+    calculate_bishop_score,
+    interpret_bishop_score,
+)
 
 
 def render():
@@ -607,4 +493,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -5,6 +5,8 @@ Phân loại mức độ nặng của tiền sản giật
 
 import streamlit as st
 
+from scores.engine.obstetrics.preeclampsia import get_severe_features, get_hellp_features
+
 
 def render():
     """Render Preeclampsia Severity interface"""
@@ -68,16 +70,12 @@ def render():
     
     st.info("**Preeclampsia NẶNG nếu có ≥1 tiêu chí sau:**")
     
-    severe_features = []
-    
     # Severe hypertension
     st.markdown("#### 🩺 Tăng huyết áp nặng:")
     severe_htn = st.checkbox(
         f"HA ≥ 160/110 mmHg (Hiện tại: {bp_sys}/{bp_dia})",
         value=(bp_sys >= 160 or bp_dia >= 110)
     )
-    if severe_htn:
-        severe_features.append("THA nặng (≥160/110)")
     
     st.markdown("---")
     
@@ -87,11 +85,6 @@ def render():
     headache = st.checkbox("Đau đầu dữ dội, dai dẳng, không đáp ứng điều trị")
     visual = st.checkbox("Rối loạn thị giác (nhìn mờ, chớp sáng, giảm thị lực)")
     
-    if headache:
-        severe_features.append("Đau đầu dữ dội")
-    if visual:
-        severe_features.append("Rối loạn thị giác")
-    
     st.markdown("---")
     
     # Labs
@@ -111,7 +104,6 @@ def render():
         plt_low = plt < 100
         if plt_low:
             st.error(f"⚠️ Giảm TC nặng")
-            severe_features.append(f"Tiểu cầu < 100 ({plt})")
     
     with col2:
         creat = st.number_input(
@@ -125,7 +117,6 @@ def render():
         creat_high = creat > 97  # >1.1 mg/dL
         if creat_high:
             st.error(f"⚠️ Suy thận")
-            severe_features.append(f"Creatinine tăng ({creat} µmol/L)")
     
     col1, col2 = st.columns(2)
     
@@ -141,7 +132,6 @@ def render():
         liver_enzymes = alt > 70  # 2x bình thường
         if liver_enzymes:
             st.error(f"⚠️ Tổn thương gan")
-            severe_features.append(f"Men gan tăng (>2x BT)")
     
     with col2:
         ldh = st.number_input(
@@ -158,8 +148,6 @@ def render():
         "Đau thượng vị / hạ sườn phải (gợi ý tổn thương gan)",
         help="Triệu chứng quan trọng, có thể tiến triển HELLP"
     )
-    if epigastric_pain:
-        severe_features.append("Đau thượng vị/hạ sườn phải")
     
     st.markdown("---")
     
@@ -169,8 +157,6 @@ def render():
         "Phù phổi (khó thở, ran ẩm, X-quang bất thường)",
         help="Dấu hiệu nghiêm trọng"
     )
-    if pulmonary_edema:
-        severe_features.append("Phù phổi")
     
     st.markdown("---")
     
@@ -180,11 +166,14 @@ def render():
         "Thai chậm phát triển trong tử cung (IUGR)",
         help="Liên quan đến suy nhau thai"
     )
-    if fetal_growth:
-        severe_features.append("Thai chậm phát triển (IUGR)")
     
     st.markdown("---")
     
+    severe_features = get_severe_features(
+        severe_htn, headache, visual, plt, creat, alt,
+        epigastric_pain, pulmonary_edema, fetal_growth
+    )
+    
     # Calculate button
     if st.button("📊 Đánh giá mức độ nặng", type="primary", use_container_width=True):
         is_severe = len(severe_features) > 0
@@ -316,13 +305,7 @@ def render():
         st.markdown("---")
         st.markdown("### 🔴 Đánh giá HELLP Syndrome:")
         
-        hellp_features = []
-        if plt < 100:
-            hellp_features.append("Thrombocytopenia")
-        if alt > 70 or liver_enzymes:
-            hellp_features.append("Elevated Liver enzymes")
-        if ldh > 600:
-            hellp_features.append("Hemolysis (LDH cao)")
+        hellp_features = get_hellp_features(plt, alt, ldh)
         
         if len(hellp_features) >= 2:
             st.error(f"""
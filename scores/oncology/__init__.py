@@ -3,37 +3,19 @@ Oncology Scoring Systems
 Cancer assessment calculators
 """
 
-from .ecog import render as render_ecog
-from .karnofsky import render as render_karnofsky
-from .pps import render as render_pps
-from .cipn import render as render_cipn
+from registry import render_calculator
 
 
 def render_oncology_calculator(calculator_id):
     """
     Route to the correct oncology calculator based on ID
-    
+
+    Calculator modules are looked up in registry.py and imported on first use.
+
     Args:
         calculator_id: The ID of the calculator to render
     """
-    import streamlit as st
-    
-    calculators = {
-        "ECOG": render_ecog,
-        "Karnofsky": render_karnofsky,
-        "Palliative Performance": render_pps,
-        "CIPN Grading": render_cipn,
-    }
-    
-    calculator_func = calculators.get(calculator_id)
-    if calculator_func:
-        calculator_func()
-    else:
-        st.error(f"Calculator '{calculator_id}' not found!")
-
+    render_calculator(calculator_id)
 
-__all__ = [
-    'render_oncology_calculator',
-    'render_ecog',
-]
 
+__all__ = ['render_oncology_calculator']
@@ -5,33 +5,7 @@ Thang đo thể trạng bệnh nhân ung thư
 
 import streamlit as st
 
-
-def interpret_karnofsky(score):
-    """Interpret Karnofsky score"""
-    
-    if score >= 80:
-        status = "Tốt - Tự chăm sóc được"
-        care = "Tự chăm sóc, hoạt động bình thường"
-        prognosis = "Tiên lượng tốt, có thể điều trị tích cực"
-        color = "green"
-    elif score >= 50:
-        status = "Trung bình - Cần hỗ trợ"
-        care = "Cần hỗ trợ nhưng chưa cần chăm sóc liên tục"
-        prognosis = "Có thể điều trị, cần theo dõi chặt"
-        color = "orange"
-    else:
-        status = "Kém - Cần chăm sóc nhiều"
-        care = "Cần chăm sóc y tế liên tục"
-        prognosis = "Tiên lượng xấu, cân nhắc chăm sóc giảm nhẹ"
-        color = "red"
-    
-    return {
-        "score": score,
-        "status": status,
-        "care": care,
-        "prognosis": prognosis,
-        "color": color
-    }
+from scores.engine.oncology.karnofsky import interpret_karnofsky
 
 
 def render():
@@ -229,4 +203,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -5,6 +5,8 @@ Thang đo thể trạng chăm sóc giảm nhẹ
 
 import streamlit as st
 
+from scores.engine.oncology.pps import interpret_pps
+
 
 def render():
     """Render PPS calculator interface"""
@@ -76,22 +78,10 @@ def render():
         """)
     
     if st.button("🔬 Đánh giá PPS", type="primary", use_container_width=True):
-        if pps_score >= 70:
-            prognosis = "Tuần/tháng"
-            color = "green"
-            care = "Chăm sóc giảm nhẹ ngoại trú"
-        elif pps_score >= 50:
-            prognosis = "Tuần"
-            color = "orange"
-            care = "Chăm sóc tại nhà với hỗ trợ"
-        elif pps_score >= 20:
-            prognosis = "Ngày/tuần"
-            color = "orange"
-            care = "Chăm sóc tại nhà hoặc hospice"
-        else:
-            prognosis = "Giờ/ngày"
-            color = "red"
-            care = "Hospice, chăm sóc end-of-life"
+        result = interpret_pps(pps_score)
+        prognosis = result['prognosis']
+        color = result['color']
+        care = result['care']
         
         score_color_map = {
             "green": "#28a745",
@@ -3,31 +3,19 @@ Ophthalmology Scoring Systems
 Eye disease calculators
 """
 
-from .iop_correction import render as render_iop_correction
+from registry import render_calculator
 
 
 def render_ophthalmology_calculator(calculator_id):
     """
     Route to the correct ophthalmology calculator based on ID
-    
+
+    Calculator modules are looked up in registry.py and imported on first use.
+
     Args:
         calculator_id: The ID of the calculator to render
     """
-    import streamlit as st
-    
-    calculators = {
-        "Intraocular Pressure": render_iop_correction,
-    }
-    
-    calculator_func = calculators.get(calculator_id)
-    if calculator_func:
-        calculator_func()
-    else:
-        st.error(f"Calculator '{calculator_id}' not found!")
-
+    render_calculator(calculator_id)
 
-__all__ = [
-    'render_ophthalmology_calculator',
-    'render_iop_correction',
-]
 
+__all__ = ['render_ophthalmology_calculator']
@@ -5,60 +5,7 @@ IOP Correction Calculator
 
 import streamlit as st
 
-
-def calculate_corrected_iop(measured_iop, cct):
-    """
-    Điều chỉnh IOP theo CCT
-    
-    Công thức: Corrected IOP = Measured IOP - (CCT - 545) × 0.007
-    
-    Parameters:
-    - measured_iop: Nhãn áp đo được (mmHg)
-    - cct: Độ dày giác mạc trung tâm (μm)
-    
-    Returns:
-    - dict với IOP điều chỉnh và interpretation
-    """
-    # Standard CCT = 545 μm
-    standard_cct = 545
-    correction_factor = 0.007  # mmHg per μm
-    
-    # Calculate correction
-    correction = (cct - standard_cct) * correction_factor
-    corrected_iop = measured_iop - correction
-    
-    # Interpret
-    if corrected_iop <= 21:
-        status = "Bình thường"
-        interpretation = "Nhãn áp trong giới hạn bình thường"
-        color = "green"
-    else:
-        status = "Cao"
-        interpretation = "Nhãn áp cao - Nguy cơ glaucoma"
-        color = "red"
-    
-    # CCT interpretation
-    if cct < 500:
-        cct_status = "Mỏng (< 500 μm)"
-        cct_note = "Giác mạc mỏng → IOP đo thường THẤP hơn thực tế → Nguy cơ glaucoma cao hơn"
-    elif cct > 590:
-        cct_status = "Dày (> 590 μm)"
-        cct_note = "Giác mạc dày → IOP đo thường CAO hơn thực tế → Nguy cơ glaucoma thấp hơn"
-    else:
-        cct_status = "Bình thường (500-590 μm)"
-        cct_note = "Giác mạc độ dày bình thường"
-    
-    return {
-        "measured_iop": measured_iop,
-        "cct": cct,
-        "correction": correction,
-        "corrected_iop": corrected_iop,
-        "status": status,
-        "interpretation": interpretation,
-        "color": color,
-        "cct_status": cct_status,
-        "cct_note": cct_note
-    }
+from scores.engine.ophthalmology.iop_correction import calculate_corrected_iop
 
 
 def render():
@@ -359,4 +306,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
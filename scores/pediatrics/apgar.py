@@ -5,62 +5,10 @@ APGAR Score - Newborn Assessment
 
 import streamlit as st
 
-
-def calculate_apgar(appearance, pulse, grimace, activity, respiration):
-    """
-    Calculate APGAR score
-    
-    Args:
-        appearance: Skin color score (0-2)
-        pulse: Heart rate score (0-2)
-        grimace: Reflex irritability score (0-2)
-        activity: Muscle tone score (0-2)
-        respiration: Breathing effort score (0-2)
-    
-    Returns:
-        int: Total APGAR score (0-10)
-    """
-    return appearance + pulse + grimace + activity + respiration
-
-
-def interpret_apgar(score, time_point):
-    """
-    Interpret APGAR score
-    
-    Args:
-        score: APGAR score (0-10)
-        time_point: "1 minute" or "5 minutes" or "10 minutes"
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if score >= 7:
-        return {
-            "status": "Bình thường",
-            "color": "🟢",
-            "condition": "Trẻ khỏe mạnh, thích nghi tốt",
-            "action": "Chăm sóc thường quy. Quan sát.",
-            "prognosis": "Tiên lượng tốt",
-            "level": "normal"
-        }
-    elif score >= 4:
-        return {
-            "status": "Ức chế vừa",
-            "color": "🟡",
-            "condition": "Trẻ cần hỗ trợ, theo dõi sát",
-            "action": "Kích thích, hút đờm, O2, theo dõi sát. Xem xét thông khí áp lực dương nếu cần.",
-            "prognosis": "Tiên lượng thận trọng, cần theo dõi",
-            "level": "moderate"
-        }
-    else:
-        return {
-            "status": "Ức chế nặng",
-            "color": "🔴",
-            "condition": "Trẻ nguy kịch, cần hồi sức tích cực",
-            "action": "HỒI SỨC NGAY: Thông khí áp lực dương, ép tim nếu cần, đánh giá nguyên nhân.",
-            "prognosis": "Nguy cơ cao tổn thương não và tử vong",
-            "level": "severe"
-        }
+from scores.engine.pediatrics.apgar import (
+    calculate_apgar,
+    interpret_apgar,
+)
 
 
 def render():
@@ -645,4 +593,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -5,6 +5,8 @@ Westley Croup Score
 
 import streamlit as st
 
+from scores.engine.pediatrics.westley_croup import calculate_westley_croup
+
 
 def render():
     """Render Westley Croup Score interface"""
@@ -38,8 +40,6 @@ def render():
     
     st.subheader("📝 Đánh giá trẻ")
     
-    score = 0
-    
     # Level of consciousness
     st.markdown("### 1️⃣ Tình trạng ý thức:")
     consciousness = st.radio(
@@ -48,7 +48,6 @@ def render():
         format_func=lambda x: "Bình thường (tỉnh táo, chơi bình thường)" if x == 0 else "Bất thường (lơ mơ, kích thích, lo lắng)",
         horizontal=False
     )
-    score += consciousness
     
     st.markdown("---")
     
@@ -63,7 +62,6 @@ def render():
             5: "Tím khi nghỉ ngơi"
         }[x]
     )
-    score += cyanosis
     
     st.markdown("---")
     
@@ -78,7 +76,6 @@ def render():
             2: "Có khi nghỉ ngơi"
         }[x]
     )
-    score += stridor
     
     st.markdown("---")
     
@@ -93,7 +90,6 @@ def render():
             2: "Giảm rõ rệt"
         }[x]
     )
-    score += air_entry
     
     st.markdown("---")
     
@@ -109,24 +105,16 @@ def render():
             3: "Nặng"
         }[x]
     )
-    score += retractions
     
     st.markdown("---")
     
+    result = calculate_westley_croup(consciousness, cyanosis, stridor, air_entry, retractions)
+    score = result['score']
+    
     if st.button("📊 Tính Westley Croup Score", type="primary", use_container_width=True):
-        # Severity
-        if score < 3:
-            severity = "Nhẹ"
-            color = "#28a745"
-            icon = "✅"
-        elif score <= 7:
-            severity = "Trung bình"
-            color = "#ffc107"
-            icon = "⚠️"
-        else:
-            severity = "Nặng"
-            color = "#dc3545"
-            icon = "🚨"
+        severity = result['severity']
+        color = result['color']
+        icon = result['icon']
         
         st.markdown("## 📊 Kết quả")
         
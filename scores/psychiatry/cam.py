@@ -5,6 +5,8 @@ CAM - Confusion Assessment Method
 
 import streamlit as st
 
+from scores.engine.psychiatry.cam import evaluate_cam
+
 def render():
     st.markdown("<h2 style='text-align: center; color: #7C3AED;'>🧠 CAM - Confusion Assessment Method</h2><p style='text-align: center;'><em>Chẩn đoán Delirium</em></p>", unsafe_allow_html=True)
     
@@ -28,7 +30,7 @@ def render():
     st.markdown("---")
     
     if st.button("🔬 Đánh giá CAM", type="primary", use_container_width=True):
-        has_delirium = feature1 and feature2 and (feature3 or feature4)
+        has_delirium = evaluate_cam(feature1, feature2, feature3, feature4)
         
         if has_delirium:
             st.error("""
@@ -5,18 +5,8 @@ CIWA-Ar - Clinical Institute Withdrawal Assessment for Alcohol
 
 import streamlit as st
 
-def calculate_ciwa(nausea, tremor, sweating, anxiety, agitation, tactile, auditory, visual, headache, orientation):
-    """Tính CIWA-Ar score"""
-    total = nausea + tremor + sweating + anxiety + agitation + tactile + auditory + visual + headache + orientation
-    
-    if total < 8:
-        severity = "Nhẹ"; management = "Theo dõi, không cần thuốc"; color = "green"
-    elif total <= 15:
-        severity = "Trung bình"; management = "Cân nhắc benzodiazepine"; color = "orange"
-    else:
-        severity = "Nặng"; management = "Benzodiazepine ngay, theo dõi ICU"; color = "red"
-    
-    return {"total_score": total, "severity": severity, "management": management, "color": color}
+from scores.engine.psychiatry.ciwa import calculate_ciwa
+
 
 def render():
     st.markdown("<h2 style='text-align: center; color: #DC2626;'>🍺 CIWA-Ar</h2><p style='text-align: center;'><em>Đánh giá cai rượu</em></p>", unsafe_allow_html=True)
@@ -53,6 +43,6 @@ def render():
         **Đánh giá lại:** Mỗi 1-4 giờ tùy mức độ
         """)
 
+
 if __name__ == "__main__":
     render()
-
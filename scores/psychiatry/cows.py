@@ -5,20 +5,8 @@ COWS - Clinical Opiate Withdrawal Scale
 
 import streamlit as st
 
-def calculate_cows(pulse, sweating, restlessness, pupil, bone_pain, runny, gi, tremor, yawning, anxiety, gooseflesh):
-    """Tính COWS score"""
-    total = pulse + sweating + restlessness + pupil + bone_pain + runny + gi + tremor + yawning + anxiety + gooseflesh
-    
-    if total <= 4:
-        severity = "Nhẹ"; management = "Hỗ trợ triệu chứng"; color = "green"
-    elif total <= 12:
-        severity = "Trung bình"; management = "Clonidine, hỗ trợ triệu chứng"; color = "orange"
-    elif total <= 24:
-        severity = "Trung bình-Nặng"; management = "Buprenorphine/Methadone"; color = "orange"
-    else:
-        severity = "Nặng"; management = "Điều trị tích cực, Buprenorphine/Methadone"; color = "red"
-    
-    return {"total_score": total, "severity": severity, "management": management, "color": color}
+from scores.engine.psychiatry.cows import calculate_cows
+
 
 def render():
     st.markdown("<h2 style='text-align: center; color: #7C3AED;'>💊 COWS - Clinical Opiate Withdrawal Scale</h2><p style='text-align: center;'><em>Đánh giá cai opioid</em></p>", unsafe_allow_html=True)
@@ -54,6 +42,6 @@ def render():
         - **>24:** Nặng → Buprenorphine liều cao hoặc Methadone 30-40mg
         """)
 
+
 if __name__ == "__main__":
     render()
-
@@ -5,78 +5,11 @@ Sàng lọc và đánh giá rối loạn lo âu lan tỏa
 
 import streamlit as st
 
-
-# GAD-7 questions in Vietnamese
-GAD7_QUESTIONS = [
-    "Cảm thấy lo lắng, bồn chồn hoặc căng thẳng",
-    "Không thể ngừng lo lắng hoặc không kiểm soát được sự lo lắng",
-    "Lo lắng quá nhiều về nhiều thứ khác nhau",
-    "Khó thư giãn",
-    "Bồn chồn đến mức khó ngồi yên",
-    "Dễ khó chịu hoặc cáu kỉnh",
-    "Cảm thấy sợ hãi như thể có điều gì đó tồi tệ sắp xảy ra"
-]
-
-
-def calculate_gad7(scores):
-    """
-    Calculate total GAD-7 score
-    
-    Args:
-        scores: List of 7 scores (0-3 for each question)
-    
-    Returns:
-        int: Total score (0-21)
-    """
-    return sum(scores)
-
-
-def interpret_gad7(total_score):
-    """
-    Interpret GAD-7 score
-    
-    Args:
-        total_score: Total GAD-7 score
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if total_score < 5:
-        return {
-            "severity": "Lo âu tối thiểu",
-            "color": "🟢",
-            "description": "Không có triệu chứng lo âu đáng kể",
-            "recommendation": "Không cần can thiệp. Tái đánh giá khi cần thiết.",
-            "monitoring": "Theo dõi thường xuyên nếu có yếu tố nguy cơ",
-            "level": "minimal"
-        }
-    elif total_score < 10:
-        return {
-            "severity": "Lo âu nhẹ",
-            "color": "🟡",
-            "description": "Có một số triệu chứng lo âu",
-            "recommendation": "Watchful waiting, hỗ trợ tâm lý. Kỹ thuật thư giãn, mindfulness.",
-            "monitoring": "Tái đánh giá sau 4-6 tuần",
-            "level": "mild"
-        }
-    elif total_score < 15:
-        return {
-            "severity": "Lo âu mức trung bình",
-            "color": "🟠",
-            "description": "Lo âu ảnh hưởng đến chức năng hàng ngày",
-            "recommendation": "Xem xét điều trị: CBT hoặc thuốc (SSRI/SNRI).",
-            "monitoring": "Tái đánh giá sau 2-4 tuần. Theo dõi đáp ứng điều trị.",
-            "level": "moderate"
-        }
-    else:
-        return {
-            "severity": "Lo âu nặng",
-            "color": "🔴",
-            "description": "Lo âu nghiêm trọng, ảnh hưởng đáng kể đến cuộc sống",
-            "recommendation": "Điều trị tích cực: Kết hợp CBT và thuốc. Chuyển chuyên khoa tâm thần nếu cần.",
-            "monitoring": "Theo dõi sát mỗi 1-2 tuần. Đánh giá các rối loạn đồng mắc (trầm cảm, panic).",
-            "level": "severe"
-        }
+from scores.engine.psychiatry.gad7 import (
+    GAD7_QUESTIONS,
+    calculate_gad7,
+    interpret_gad7,
+)
 
 
 def render():
@@ -499,4 +432,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -5,125 +5,12 @@ Sàng lọc và đánh giá mức độ trầm cảm
 
 import streamlit as st
 
-
-# PHQ-9 questions in Vietnamese
-PHQ9_QUESTIONS = [
-    "Ít quan tâm hoặc ít thích thú làm việc",
-    "Cảm thấy buồn, chán nản hoặc tuyệt vọng",
-    "Khó ngủ, ngủ không say giấc hoặc ngủ quá nhiều",
-    "Cảm thấy mệt mỏi hoặc không có năng lượng",
-    "Ít thèm ăn hoặc ăn quá nhiều",
-    "Cảm thấy tồi tệ về bản thân - hoặc cảm thấy mình là người thất bại hoặc đã làm gia đình hay chính bản thân thất vọng",
-    "Khó tập trung vào việc gì đó, chẳng hạn như đọc báo hoặc xem TV",
-    "Di chuyển hoặc nói chuyện chậm chạp đến mức người khác có thể nhận ra. Hoặc ngược lại - bồn chồn hoặc không yên đến mức di chuyển nhiều hơn bình thường",
-    "Nghĩ rằng tốt hơn là chết đi hoặc tự làm hại bản thân theo một cách nào đó"
-]
-
-
-def calculate_phq9(scores):
-    """
-    Calculate total PHQ-9 score
-    
-    Args:
-        scores: List of 9 scores (0-3 for each question)
-    
-    Returns:
-        int: Total score (0-27)
-    """
-    return sum(scores)
-
-
-def interpret_phq9(total_score):
-    """
-    Interpret PHQ-9 score
-    
-    Args:
-        total_score: Total PHQ-9 score
-    
-    Returns:
-        dict: Interpretation results
-    """
-    if total_score < 5:
-        return {
-            "severity": "Không có / Tối thiểu",
-            "color": "🟢",
-            "description": "Không có triệu chứng trầm cảm đáng kể",
-            "recommendation": "Không cần can thiệp. Tái đánh giá khi cần thiết.",
-            "monitoring": "Theo dõi thường xuyên nếu có yếu tố nguy cơ",
-            "level": "none"
-        }
-    elif total_score < 10:
-        return {
-            "severity": "Trầm cảm nhẹ",
-            "color": "🟡",
-            "description": "Có một số triệu chứng trầm cảm",
-            "recommendation": "Hỗ trợ, watchful waiting. Giáo dục bệnh nhân, vệ sinh giấc ngủ, tập thể dục.",
-            "monitoring": "Tái đánh giá sau 4-6 tuần. Xem xét can thiệp nếu không cải thiện.",
-            "level": "mild"
-        }
-    elif total_score < 15:
-        return {
-            "severity": "Trầm cảm mức trung bình",
-            "color": "🟠",
-            "description": "Trầm cảm ảnh hưởng đến chức năng hàng ngày",
-            "recommendation": "Xem xét điều trị: Tâm lý trị liệu (CBT) hoặc thuốc chống trầm cảm (SSRI).",
-            "monitoring": "Tái đánh giá sau 2-4 tuần. Theo dõi sát đáp ứng điều trị.",
-            "level": "moderate"
-        }
-    elif total_score < 20:
-        return {
-            "severity": "Trầm cảm mức trung bình nặng",
-            "color": "🟠",
-            "description": "Trầm cảm ảnh hưởng nghiêm trọng đến chức năng",
-            "recommendation": "Điều trị tích cực: Kết hợp tâm lý trị liệu VÀ thuốc chống trầm cảm.",
-            "monitoring": "Theo dõi sát, tái đánh giá mỗi 1-2 tuần. Cân nhắc hội chẩn tâm thần.",
-            "level": "moderate_severe"
-        }
-    else:
-        return {
-            "severity": "Trầm cảm nặng",
-            "color": "🔴",
-            "description": "Trầm cảm rất nặng, có thể cần can thiệp khẩn cấp",
-            "recommendation": "Điều trị tích cực: Thuốc + Tâm lý trị liệu. Chuyển tới chuyên khoa tâm thần. Xem xét nhập viện nếu có ý tưởng tự tử.",
-            "monitoring": "Theo dõi rất sát (hàng tuần). Đánh giá nguy cơ tự tử. Liên lạc với chuyên khoa tâm thần.",
-            "level": "severe"
-        }
-
-
-def assess_suicide_risk(question_9_score):
-    """
-    Assess suicide risk based on question 9
-    
-    Args:
-        question_9_score: Score for question 9 (0-3)
-    
-    Returns:
-        dict: Suicide risk assessment
-    """
-    if question_9_score == 0:
-        return {
-            "risk": "Không có",
-            "color": "🟢",
-            "action": "Không cần can thiệp đặc biệt về vấn đề này"
-        }
-    elif question_9_score == 1:
-        return {
-            "risk": "Có ý nghĩ (vài ngày)",
-            "color": "🟡",
-            "action": "Đánh giá thêm. Hỏi về kế hoạch, phương tiện. Tăng cường hỗ trợ."
-        }
-    elif question_9_score == 2:
-        return {
-            "risk": "Có ý nghĩ (hơn nửa số ngày)",
-            "color": "🟠",
-            "action": "Đánh giá chi tiết nguy cơ tự tử. Xem xét an toàn. Hội chẩn tâm thần khẩn."
-        }
-    else:  # score == 3
-        return {
-            "risk": "Có ý nghĩ (gần như mỗi ngày)",
-            "color": "🔴",
-            "action": "CẤP CỨU: Đánh giá ngay nguy cơ tự tử. Không để bệnh nhân một mình. Chuyển tới cơ sở tâm thần hoặc cấp cứu."
-        }
+from scores.engine.psychiatry.phq9 import (
+    PHQ9_QUESTIONS,
+    calculate_phq9,
+    interpret_phq9,
+    assess_suicide_risk,
+)
 
 
 def render():
@@ -513,4 +400,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
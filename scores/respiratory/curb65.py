@@ -5,6 +5,8 @@ Community-Acquired Pneumonia severity assessment
 
 import streamlit as st
 
+from scores.engine.respiratory.curb65 import calculate_curb65
+
 
 def render():
     """CURB-65 Score Calculator"""
@@ -58,8 +60,6 @@ def render():
         else:
             st.caption(f"≈ {urea_mmol:.1f} mmol/L")
         
-        urea_high = urea_mmol > 7.0  # >7 mmol/L (>20 mg/dL)
-        
         # Respiratory rate
         rr = st.number_input(
             "**R** - Respiratory Rate (nhịp thở/phút)",
@@ -97,28 +97,11 @@ def render():
         )
         
         if st.button("🧮 Tính CURB-65", type="primary"):
-            score = 0
-            details = []
-            
-            if confusion:
-                score += 1
-                details.append("✓ Confusion - Lú lẫn (+1)")
-            
-            if urea_high:
-                score += 1
-                details.append(f"✓ Urea >7 mmol/L ({urea_mmol:.1f}) (+1)")
-            
-            if rr >= 30:
-                score += 1
-                details.append(f"✓ RR ≥30/phút ({rr}) (+1)")
-            
-            if sbp < 90 or dbp <= 60:
-                score += 1
-                details.append(f"✓ BP thấp (SBP<90 hoặc DBP≤60) (+1)")
-            
-            if age >= 65:
-                score += 1
-                details.append(f"✓ Tuổi ≥65 ({age}) (+1)")
+            result = calculate_curb65(confusion, urea_mmol, rr, sbp, dbp, age)
+            score = result['score']
+            details = result['details']
+            mortality = result['mortality']
+            recommendation = result['recommendation']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -126,28 +109,18 @@ def render():
                 if score == 0:
                     st.success(f"## CURB-65 = {score}")
                     st.success("✅ Nguy Cơ THẤP")
-                    mortality = "0.7%"
-                    recommendation = "Điều trị ngoại trú"
                 elif score == 1:
                     st.info(f"## CURB-65 = {score}")
                     st.info("💡 Nguy Cơ THẤP")
-                    mortality = "2.1%"
-                    recommendation = "Điều trị ngoại trú hoặc theo dõi ngắn"
                 elif score == 2:
                     st.warning(f"## CURB-65 = {score}")
                     st.warning("⚠️ Nguy Cơ TRUNG BÌNH")
-                    mortality = "9.2%"
-                    recommendation = "Cân nhắc nhập viện"
                 elif score == 3:
                     st.error(f"## CURB-65 = {score}")
                     st.error("❗ Nguy Cơ CAO")
-                    mortality = "14.5%"
-                    recommendation = "Nhập viện, ICU nếu cần"
                 else:
                     st.error(f"## CURB-65 = {score}")
                     st.error("🚨 Nguy Cơ RẤT CAO")
-                    mortality = "40%"
-                    recommendation = "Nhập ICU ngay"
             
             st.markdown("### 💡 Giải Thích")
             
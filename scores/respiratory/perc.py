@@ -5,6 +5,8 @@ Loại trừ thuyên tắc phổi mà không cần D-dimer
 
 import streamlit as st
 
+from scores.engine.respiratory.perc import calculate_perc
+
 
 def render():
     """Render PERC Rule interface"""
@@ -142,19 +144,11 @@ def render():
     
     # Calculate button
     if st.button("🔍 Đánh giá PERC", type="primary", use_container_width=True):
-        # Count positive criteria
-        criteria = [
-            age_50,
-            hr_100,
-            spo2_95,
-            leg_swelling,
-            hemoptysis,
-            surgery_trauma,
-            prior_vte,
-            hormone
-        ]
-        
-        perc_score = sum(criteria)
+        result = calculate_perc(
+            age_50, hr_100, spo2_95, leg_swelling,
+            hemoptysis, surgery_trauma, prior_vte, hormone
+        )
+        perc_score = result['perc_score']
         
         # Display results
         st.markdown("## 📊 Kết quả")
@@ -216,25 +210,7 @@ def render():
             # List positive criteria
             st.markdown("### 📋 Tiêu chí dương tính:")
             
-            positive_criteria = []
-            if age_50:
-                positive_criteria.append("✓ Tuổi ≥ 50")
-            if hr_100:
-                positive_criteria.append("✓ Nhịp tim ≥ 100 nhịp/phút")
-            if spo2_95:
-                positive_criteria.append("✓ SpO₂ < 95%")
-            if leg_swelling:
-                positive_criteria.append("✓ Phù chân một bên")
-            if hemoptysis:
-                positive_criteria.append("✓ Ho ra máu")
-            if surgery_trauma:
-                positive_criteria.append("✓ Phẫu thuật/chấn thương gần đây")
-            if prior_vte:
-                positive_criteria.append("✓ Tiền sử PE/DVT")
-            if hormone:
-                positive_criteria.append("✓ Dùng hormone")
-            
-            for criterion in positive_criteria:
+            for criterion in result['positive_criteria']:
                 st.markdown(f"- {criterion}")
             
             st.markdown("---")
@@ -5,6 +5,8 @@ PSI/PORT Score (Pneumonia Severity Index)
 
 import streamlit as st
 
+from scores.engine.respiratory.psi_port import calculate_psi_port
+
 
 def render():
     """PSI/PORT Score Calculator"""
@@ -258,107 +260,17 @@ def render():
         st.markdown("---")
         
         if st.button("🧮 Tính PSI/PORT Score", type="primary", use_container_width=True):
-            # Calculate score
-            score = 0
-            details = []
-            
-            # Age
-            if gender == "Nam":
-                age_points = age
-                details.append(f"Tuổi (Nam): {age} điểm")
-            else:
-                age_points = age - 10
-                details.append(f"Tuổi (Nữ): {age} - 10 = {age_points} điểm")
-            score += age_points
-            
-            # Nursing home
-            if nursing_home:
-                score += 10
-                details.append("Nhà dưỡng lão: +10")
-            
-            # Comorbidities
-            if neoplastic:
-                score += 30
-                details.append("Ung thư: +30")
-            if liver:
-                score += 20
-                details.append("Bệnh gan: +20")
-            if chf:
-                score += 10
-                details.append("Suy tim: +10")
-            if cvd:
-                score += 10
-                details.append("Bệnh mạch máu não: +10")
-            if renal:
-                score += 10
-                details.append("Bệnh thận: +10")
-            
-            # Physical exam
-            if altered_mental:
-                score += 20
-                details.append("Rối loạn ý thức: +20")
-            if resp_rate >= 30:
-                score += 20
-                details.append(f"Nhịp thở ≥30 ({resp_rate}): +20")
-            if sbp < 90:
-                score += 20
-                details.append(f"HA tâm thu <90 ({sbp}): +20")
-            if temp_c < 35 or temp_c >= 40:
-                score += 15
-                details.append(f"Nhiệt độ bất thường ({temp_c}°C): +15")
-            if pulse >= 125:
-                score += 10
-                details.append(f"Mạch ≥125 ({pulse}): +10")
-            
-            # Labs
-            if ph < 7.35:
-                score += 30
-                details.append(f"pH <7.35 ({ph:.2f}): +30")
-            if bun_mgdl >= 30:
-                score += 20
-                details.append(f"BUN ≥30 mg/dL ({bun_mgdl:.1f}): +20")
-            if sodium < 130:
-                score += 20
-                details.append(f"Na <130 ({sodium:.0f}): +20")
-            if glucose_mgdl >= 250:
-                score += 10
-                details.append(f"Glucose ≥250 mg/dL ({glucose_mgdl:.0f}): +10")
-            if hct < 30:
-                score += 10
-                details.append(f"Hct <30% ({hct:.1f}): +10")
-            if pao2_mmhg < 60:
-                score += 10
-                details.append(f"PaO2 <60 mmHg ({pao2_mmhg:.0f}): +10")
-            if pleural_effusion:
-                score += 10
-                details.append("Tràn dịch màng phổi: +10")
-            
-            # Determine risk class
-            if score <= 50:
-                risk_class = "I"
-                mortality = "0.1%"
-                recommendation = "Điều trị ngoại trú"
-                color = "success"
-            elif score <= 70:
-                risk_class = "II"
-                mortality = "0.6%"
-                recommendation = "Điều trị ngoại trú"
-                color = "success"
-            elif score <= 90:
-                risk_class = "III"
-                mortality = "2.8%"
-                recommendation = "Cân nhắc nhập viện ngắn ngày"
-                color = "info"
-            elif score <= 130:
-                risk_class = "IV"
-                mortality = "8.2%"
-                recommendation = "Nhập viện"
-                color = "warning"
-            else:
-                risk_class = "V"
-                mortality = "29.2%"
-                recommendation = "Nhập viện/ICU"
-                color = "error"
+            result = calculate_psi_port(
+                age, gender, nursing_home, neoplastic, liver, chf, cvd, renal,
+                altered_mental, resp_rate, sbp, temp_c, pulse, ph, bun_mgdl,
+                sodium, glucose_mgdl, hct, pao2_mmhg, pleural_effusion
+            )
+            score = result['score']
+            details = result['details']
+            risk_class = result['risk_class']
+            mortality = result['mortality']
+            recommendation = result['recommendation']
+            color = result['color']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
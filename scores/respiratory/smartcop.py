@@ -22,6 +22,8 @@ Clin Infect Dis. 2008;47(3):375-84.
 
 import streamlit as st
 
+from scores.engine.respiratory.smartcop import calculate_smartcop
+
 
 def render():
     """Render SMART-COP Score Calculator"""
@@ -39,10 +41,6 @@ def render():
     
     st.markdown("---")
     
-    # Initialize score
-    total_score = 0
-    score_breakdown = {}
-    
     # Input section
     col1, col2 = st.columns(2)
     
@@ -59,13 +57,6 @@ def render():
             step=5,
             help="SBP <90 mmHg = 2 điểm"
         )
-        if sbp < 90:
-            s_score = 2
-        else:
-            s_score = 0
-        total_score += s_score
-        score_breakdown["S - SBP"] = s_score
-        
         if sbp < 90:
             st.warning(f"⚠️ SBP = {sbp} mmHg < 90 → **+2 điểm**")
         else:
@@ -79,13 +70,9 @@ def render():
             help="Tổn thương ≥2 thuỳ phổi trên X-quang"
         )
         if "≥2 thuỳ" in multilobar:
-            m_score = 1
             st.warning("⚠️ Multilobar infiltrates → **+1 điểm**")
         else:
-            m_score = 0
             st.success("✅ Tổn thương 1 thuỳ → 0 điểm")
-        total_score += m_score
-        score_breakdown["M - Multilobar"] = m_score
         
         # A - Albumin
         st.markdown("#### A - Albumin")
@@ -98,13 +85,9 @@ def render():
             help="Albumin <35 g/L = 1 điểm"
         )
         if albumin < 35:
-            a_score = 1
             st.warning(f"⚠️ Albumin = {albumin} g/L < 35 → **+1 điểm**")
         else:
-            a_score = 0
             st.success(f"✅ Albumin = {albumin} g/L ≥ 35 → 0 điểm")
-        total_score += a_score
-        score_breakdown["A - Albumin"] = a_score
         
         # R - Respiratory rate
         st.markdown("#### R - Respiratory Rate (Nhịp thở)")
@@ -129,21 +112,15 @@ def render():
         
         if age <= 50:
             if rr >= 25:
-                r_score = 1
                 st.warning(f"⚠️ Tuổi ≤50, RR = {rr} ≥ 25 → **+1 điểm**")
             else:
-                r_score = 0
                 st.success(f"✅ Tuổi ≤50, RR = {rr} < 25 → 0 điểm")
         else:  # age > 50
             if rr >= 30:
-                r_score = 1
                 st.warning(f"⚠️ Tuổi >50, RR = {rr} ≥ 30 → **+1 điểm**")
             else:
-                r_score = 0
                 st.success(f"✅ Tuổi >50, RR = {rr} < 30 → 0 điểm")
         
-        total_score += r_score
-        score_breakdown["R - RR"] = r_score
     
     with col2:
         # T - Tachycardia
@@ -158,13 +135,9 @@ def render():
             help="HR ≥125 = 1 điểm"
         )
         if hr >= 125:
-            t_score = 1
             st.warning(f"⚠️ HR = {hr} ≥ 125 → **+1 điểm**")
         else:
-            t_score = 0
             st.success(f"✅ HR = {hr} < 125 → 0 điểm")
-        total_score += t_score
-        score_breakdown["T - Tachycardia"] = t_score
         
         # C - Confusion
         st.markdown("#### C - Confusion (Lú lẫn)")
@@ -174,13 +147,9 @@ def render():
             help="Acute confusion/altered mental status"
         )
         if "Lú lẫn" in confusion:
-            c_score = 1
             st.warning("⚠️ Có lú lẫn → **+1 điểm**")
         else:
-            c_score = 0
             st.success("✅ Tỉnh táo → 0 điểm")
-        total_score += c_score
-        score_breakdown["C - Confusion"] = c_score
         
         # O - Oxygenation
         st.markdown("#### O - Oxygenation (Oxy hóa máu)")
@@ -197,8 +166,6 @@ def render():
             horizontal=True
         )
         
-        o_score = 0
-        
         if "PaO₂" in oxy_method:
             pao2 = st.number_input(
                 "PaO₂ (mmHg):",
@@ -211,19 +178,15 @@ def render():
             
             if age <= 50:
                 if pao2 < 60:
-                    o_score = 2
                     st.error(f"⚠️⚠️ Tuổi ≤50, PaO₂ = {pao2} < 60 → **+2 điểm**")
                 elif pao2 < 70:
-                    o_score = 1
                     st.warning(f"⚠️ PaO₂ = {pao2} < 70 → **+1 điểm**")
                 else:
                     st.success(f"✅ PaO₂ = {pao2} ≥ 70 → 0 điểm")
             else:  # age > 50
                 if pao2 < 50:
-                    o_score = 2
                     st.error(f"⚠️⚠️ Tuổi >50, PaO₂ = {pao2} < 50 → **+2 điểm**")
                 elif pao2 < 70:
-                    o_score = 1
                     st.warning(f"⚠️ PaO₂ = {pao2} < 70 → **+1 điểm**")
                 else:
                     st.success(f"✅ PaO₂ = {pao2} ≥ 70 → 0 điểm")
@@ -240,25 +203,19 @@ def render():
             
             if age <= 50:
                 if spo2 < 85:
-                    o_score = 2
                     st.error(f"⚠️⚠️ Tuổi ≤50, SpO₂ = {spo2}% < 85% → **+2 điểm**")
                 elif spo2 < 90:
-                    o_score = 1
                     st.warning(f"⚠️ SpO₂ = {spo2}% < 90% → **+1 điểm**")
                 else:
                     st.success(f"✅ SpO₂ = {spo2}% ≥ 90% → 0 điểm")
             else:  # age > 50
                 if spo2 < 80:
-                    o_score = 2
                     st.error(f"⚠️⚠️ Tuổi >50, SpO₂ = {spo2}% < 80% → **+2 điểm**")
                 elif spo2 < 90:
-                    o_score = 1
                     st.warning(f"⚠️ SpO₂ = {spo2}% < 90% → **+1 điểm**")
                 else:
                     st.success(f"✅ SpO₂ = {spo2}% ≥ 90% → 0 điểm")
         
-        total_score += o_score
-        score_breakdown["O - Oxygenation"] = o_score
         
         # P - Arterial pH
         st.markdown("#### P - Arterial pH (pH động mạch)")
@@ -280,17 +237,21 @@ def render():
                 help="pH < 7.35 = 2 điểm"
             )
             if ph < 7.35:
-                p_score = 2
                 st.error(f"⚠️⚠️ pH = {ph:.2f} < 7.35 → **+2 điểm**")
             else:
-                p_score = 0
                 st.success(f"✅ pH = {ph:.2f} ≥ 7.35 → 0 điểm")
         else:
-            p_score = 0
             st.info("ℹ️ Không có ABG → 0 điểm (nhưng nên làm nếu nghi nặng!)")
         
-        total_score += p_score
-        score_breakdown["P - pH"] = p_score
+    
+    result = calculate_smartcop(
+        sbp, "≥2 thuỳ" in multilobar, albumin, age, rr, hr, "Lú lẫn" in confusion,
+        pao2=pao2 if "PaO₂" in oxy_method else None,
+        spo2=spo2 if "PaO₂" not in oxy_method else None,
+        ph=ph if has_abg else None
+    )
+    total_score = result['total_score']
+    score_breakdown = result['score_breakdown']
     
     # Calculate button
     st.markdown("---")
@@ -322,13 +283,7 @@ def render():
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Predicted risk of IRVS
-        # Data from original paper (Charles et al. 2008)
-        irvs_risk = {
-            0: 5.0, 1: 5.4, 2: 8.3, 3: 12.1, 4: 17.8, 
-            5: 25.3, 6: 34.7, 7: 45.7, 8: 57.3, 9: 68.2, 10: 77.5, 11: 84.7
-        }
-        
-        predicted_risk = irvs_risk.get(total_score, 85.0)
+        predicted_risk = result['predicted_risk']
         
         # Metrics
         col1, col2, col3 = st.columns(3)
@@ -5,6 +5,8 @@ Wells Score for Pulmonary Embolism
 
 import streamlit as st
 
+from scores.engine.respiratory.wells_pe import calculate_wells_pe
+
 
 def render():
     """Wells PE Score Calculator"""
@@ -72,57 +74,17 @@ def render():
         st.markdown("---")
         
         if st.button("🧮 Tính Wells PE Score", type="primary", use_container_width=True):
-            # Calculate score
-            score = 0.0
-            details = []
-            
-            if dvt_signs:
-                score += 3.0
-                details.append("Dấu hiệu DVT: +3")
-            
-            if pe_likely:
-                score += 3.0
-                details.append("PE khả năng nhất: +3")
-            
-            if hr > 100:
-                score += 1.5
-                details.append(f"Nhịp tim >100 ({hr}): +1.5")
-            
-            if immobilization:
-                score += 1.5
-                details.append("Nằm bất động/Phẫu thuật: +1.5")
-            
-            if previous_vte:
-                score += 1.5
-                details.append("Tiền sử DVT/PE: +1.5")
-            
-            if hemoptysis:
-                score += 1.0
-                details.append("Ho ra máu: +1")
-            
-            if malignancy:
-                score += 1.0
-                details.append("Ung thư: +1")
-            
-            # Determine probability
-            if score < 2:
-                probability = "THẤP"
-                pe_prevalence = "3.6%"
-                color = "success"
-                recommendation = "Xét nghiệm D-dimer"
-                detail = "D-dimer âm tính → Loại trừ PE (không cần CTPA)"
-            elif score <= 6:
-                probability = "TRUNG BÌNH"
-                pe_prevalence = "20.5%"
-                color = "warning"
-                recommendation = "Xét nghiệm D-dimer"
-                detail = "D-dimer dương tính → Chụp CTPA"
-            else:
-                probability = "CAO"
-                pe_prevalence = "66.7%"
-                color = "error"
-                recommendation = "Chụp CTPA ngay"
-                detail = "Không cần D-dimer - chụp CTPA trực tiếp"
+            result = calculate_wells_pe(
+                dvt_signs, pe_likely, hr, immobilization, previous_vte,
+                hemoptysis, malignancy
+            )
+            score = result['score']
+            details = result['details']
+            probability = result['probability']
+            pe_prevalence = result['pe_prevalence']
+            color = result['color']
+            recommendation = result['recommendation']
+            detail = result['detail']
             
             with col2:
                 st.markdown("### 📊 Kết Quả")
@@ -5,32 +5,7 @@ RCRI - Revised Cardiac Risk Index Calculator
 
 import streamlit as st
 
-
-def calculate_rcri(high_risk_surgery, ischemic_heart, chf, cvd, dm_insulin, creat):
-    """
-    Tính RCRI
-    Mỗi yếu tố = 1 điểm
-    """
-    total = high_risk_surgery + ischemic_heart + chf + cvd + dm_insulin + creat
-    
-    if total == 0:
-        risk = "Rất thấp"
-        rate = "0.4-0.5%"
-        color = "green"
-    elif total == 1:
-        risk = "Thấp"
-        rate = "0.9-1.3%"
-        color = "green"
-    elif total == 2:
-        risk = "Trung bình"
-        rate = "4-7%"
-        color = "orange"
-    else:  # >= 3
-        risk = "Cao"
-        rate = "≥9-11%"
-        color = "red"
-    
-    return {"total_score": total, "risk_level": risk, "cardiac_event_rate": rate, "color": color}
+from scores.engine.surgery.rcri import calculate_rcri
 
 
 def render():
@@ -181,4 +156,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
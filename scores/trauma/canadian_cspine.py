@@ -5,72 +5,7 @@ Quy tắc quyết định chụp cột sống cổ sau chấn thương
 
 import streamlit as st
 
-
-def evaluate_canadian_cspine(age, dangerous_mechanism, paresthesias,
-                              simple_rear_end_mvc, sitting_position,
-                              ambulatory, delayed_neck_pain,
-                              midline_tenderness, unable_rotate):
-    """
-    Evaluate Canadian C-Spine Rule
-    
-    Returns:
-        dict: Evaluation results with imaging recommendation
-    """
-    # Step 1: High-risk factors
-    high_risk = any([
-        age >= 65,
-        dangerous_mechanism,
-        paresthesias
-    ])
-    
-    if high_risk:
-        return {
-            "imaging": "CẦN CHỤP",
-            "step": "Bước 1: Có yếu tố nguy cơ cao",
-            "recommendation": "Chụp X-quang/CT cột sống cổ ngay",
-            "color": "🔴",
-            "safe_to_clear": False,
-            "reason": "Có ≥ 1 yếu tố nguy cơ cao"
-        }
-    
-    # Step 2: Low-risk factors allowing assessment
-    low_risk = any([
-        simple_rear_end_mvc,
-        sitting_position,
-        ambulatory,
-        delayed_neck_pain
-    ])
-    
-    if not low_risk:
-        return {
-            "imaging": "CẦN CHỤP",
-            "step": "Bước 2: Không có yếu tố cho phép đánh giá ROM",
-            "recommendation": "Không an toàn để đánh giá ROM → Chụp",
-            "color": "🔴",
-            "safe_to_clear": False,
-            "reason": "Không đủ tiêu chí low-risk để đánh giá ROM"
-        }
-    
-    # Step 3: Able to rotate neck 45° both ways?
-    if midline_tenderness or unable_rotate:
-        return {
-            "imaging": "CẦN CHỤP",
-            "step": "Bước 3: Đau midline hoặc không xoay cổ được 45°",
-            "recommendation": "Chụp X-quang/CT cột sống cổ",
-            "color": "🔴",
-            "safe_to_clear": False,
-            "reason": "Đau midline hoặc ROM không đầy đủ"
-        }
-    
-    # All criteria passed
-    return {
-        "imaging": "KHÔNG CẦN CHỤP",
-        "step": "Đạt tất cả 3 bước",
-        "recommendation": "An toàn loại trừ lâm sàng (clinical clearance)",
-        "color": "🟢",
-        "safe_to_clear": True,
-        "reason": "Không có high-risk, có low-risk, và ROM tốt"
-    }
+from scores.engine.trauma.canadian_cspine import evaluate_canadian_cspine
 
 
 def render():
@@ -443,4 +378,3 @@ def render():
 
 if __name__ == "__main__":
     render()
-
@@ -31,154 +31,7 @@ Clinical Utility:
 
 import streamlit as st
 
-
-def code_gcs(gcs: int) -> int:
-    """Convert GCS to coded value"""
-    if gcs >= 13:
-        return 4
-    elif gcs >= 9:
-        return 3
-    elif gcs >= 6:
-        return 2
-    elif gcs >= 4:
-        return 1
-    else:
-        return 0
-
-
-def code_sbp(sbp: float) -> int:
-    """Convert SBP to coded value"""
-    if sbp >= 90:
-        return 4
-    elif sbp >= 76:
-        return 3
-    elif sbp >= 50:
-        return 2
-    elif sbp >= 1:
-        return 1
-    else:
-        return 0
-
-
-def code_rr(rr: float) -> int:
-    """Convert RR to coded value"""
-    if 10 <= rr <= 29:
-        return 4
-    elif rr >= 30:
-        return 3
-    elif rr >= 6:
-        return 2
-    elif rr >= 1:
-        return 1
-    else:
-        return 0
-
-
-def calculate_rts(gcs: int, sbp: float, rr: float) -> dict:
-    """
-    Calculate Revised Trauma Score
-    
-    Args:
-        gcs: Glasgow Coma Scale (3-15)
-        sbp: Systolic Blood Pressure (mmHg)
-        rr: Respiratory Rate (breaths/min)
-    
-    Returns:
-        Dictionary containing RTS, coded values, survival probability, and recommendations
-    """
-    
-    # Code the values
-    gcs_coded = code_gcs(gcs)
-    sbp_coded = code_sbp(sbp)
-    rr_coded = code_rr(rr)
-    
-    # Calculate RTS
-    rts = 0.9368 * gcs_coded + 0.7326 * sbp_coded + 0.2908 * rr_coded
-    
-    # Estimate survival probability (simplified approximation)
-    # Based on historical data from Champion et al.
-    if rts >= 7.0:
-        survival_prob = ">95%"
-        risk_class = "LOW"
-        color = "🟢"
-        interpretation = "Tỷ lệ sống sót CAO"
-    elif rts >= 5.0:
-        survival_prob = "70-95%"
-        risk_class = "MODERATE"
-        color = "🟡"
-        interpretation = "Tỷ lệ sống sót TRUNG BÌNH"
-    elif rts >= 3.0:
-        survival_prob = "30-70%"
-        risk_class = "HIGH"
-        color = "🟠"
-        interpretation = "Tỷ lệ sống sót THẤP"
-    else:
-        survival_prob = "<30%"
-        risk_class = "CRITICAL"
-        color = "🔴"
-        interpretation = "Tỷ lệ sống sót RẤT THẤP"
-    
-    # Triage and management recommendations
-    if risk_class == "LOW":
-        triage = "**Ưu tiên:** Không khẩn cấp hoặc vừa phải"
-        management = """
-        **Xử Trí:**
-        - Đánh giá toàn diện tổn thương
-        - Xử trí các chấn thương cụ thể
-        - Theo dõi tiêu chuẩn
-        - Tái đánh giá định kỳ
-        """
-    elif risk_class == "MODERATE":
-        triage = "**Ưu tiên:** Khẩn cấp - Cần can thiệp sớm"
-        management = """
-        **Xử Trí:**
-        - Stabilization ngay lập tức
-        - Đánh giá nhanh ABC
-        - Hồi sức tích cực
-        - Xem xét chuyển trauma center
-        - Chuẩn bị phẫu thuật nếu cần
-        - Theo dõi sát
-        """
-    else:  # HIGH or CRITICAL
-        triage = "**Ưu tiên:** CẤP CỨU - Can thiệp ngay lập tức"
-        management = """
-        **Xử Trí:**
-        - **RESUSCITATION NGAY:**
-          * Airway: Intubation nếu GCS ≤8
-          * Breathing: O2, mechanical ventilation nếu cần
-          * Circulation: IV access × 2, fluid resuscitation, blood products
-        
-        - **Kiểm soát chảy máu:**
-          * Direct pressure, tourniquet nếu chảy máu ngoại vi
-          * Pelvic binder nếu nghi chấn thương khung chậu
-          * FAST exam → phẫu thuật cấp cứu nếu nội xuất huyết
-        
-        - **Neuroprotection (nếu GCS thấp):**
-          * Elevate head 30°
-          * Tránh hạ glucose, hạ nhiệt độ
-          * CT đầu STAT
-        
-        - **Chuyển viện:**
-          * Trauma center level I/II ngay lập tức
-          * Thông báo trước (pre-notification)
-        
-        - **Massive transfusion protocol:**
-          * Activate nếu shock + chảy máu nặng
-          * Blood products 1:1:1 (RBC:FFP:Platelets)
-        """
-    
-    return {
-        'rts': rts,
-        'gcs_coded': gcs_coded,
-        'sbp_coded': sbp_coded,
-        'rr_coded': rr_coded,
-        'survival_prob': survival_prob,
-        'risk_class': risk_class,
-        'color': color,
-        'interpretation': interpretation,
-        'triage': triage,
-        'management': management
-    }
+from scores.engine.trauma.rts import calculate_rts
 
 
 def render():
@@ -419,4 +272,3 @@ def render():
         - ISS calculator có sẵn trong cùng module này
         - Kết hợp cả hai để có TRISS
         """)
-
@@ -1,14 +1,36 @@
 """
 Ventilator Module - Mechanical Ventilation Tools
 Modular structure for easy maintenance
+
+Page renders (Streamlit) are imported on first access, so the headless
+modules (waveforms, peep_fio2, compliance) never import Streamlit.
 """
 
-from .calculators import render_ardsnet, render_initial_settings
-from .tables import render_peep_fio2_table
+from importlib import import_module
+
+# Page renders (Streamlit), imported lazily: name → (module, attribute)
+_RENDERS = {
+    'render_ardsnet': ('calculators', 'render_ardsnet'),
+    'render_initial_settings': ('calculators', 'render_initial_settings'),
+    'render_waveform_analysis': ('calculators', 'render_waveform_analysis'),
+    'render_compliance_dashboard': ('calculators', 'render_compliance_dashboard'),
+    'render_peep_fio2_table': ('tables', 'render_peep_fio2_table'),
+}
+
+
+def __getattr__(name):
+    if name in _RENDERS:
+        module, attribute = _RENDERS[name]
+        render = getattr(import_module(f".{module}", __name__), attribute)
+        globals()[name] = render
+        return render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'render_ardsnet',
     'render_initial_settings',
+    'render_waveform_analysis',
+    'render_compliance_dashboard',
     'render_peep_fio2_table',
 ]
 
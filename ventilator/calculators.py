@@ -1,10 +1,21 @@
 """
 Ventilator Calculators
-ARDSNet and initial ventilator settings
+ARDSNet, initial ventilator settings, waveform analysis and the unit
+compliance dashboard
 """
 
+import os
+import tempfile
+
+import pandas as pd
 import streamlit as st
 
+from labs.normal_ranges import FEMALE_VALUES
+from scores.engine.metabolism.bmi_ibw_bsa import calculate_ibw
+
+from .compliance import VentilatorCompliance
+from .waveforms import BINARY_EXTENSIONS, analyze_waveform
+
 
 def render_ardsnet():
     """ARDSNet Tidal Volume Calculator"""
@@ -178,3 +189,185 @@ def render_initial_settings():
     - Trigger sensitivity
     """)
 
+
+def render_waveform_analysis():
+    """Ventilator waveform analysis (recorded pressure/flow)"""
+    st.subheader("📈 Phân Tích Dạng Sóng Máy Thở")
+    st.caption("Pplat, driving pressure, compliance, auto-PEEP và bất đồng bộ từ file ghi áp lực/lưu lượng")
+    
+    uploaded = st.file_uploader(
+        "File dạng sóng (CSV có cột pressure, flow [+ time]; .npy hoặc float32 .bin)",
+        type=["csv", "npy", "bin", "dat", "f32"],
+        key="wave_file"
+    )
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        fs = st.number_input("Tần số lấy mẫu (Hz)", min_value=10, max_value=1000, value=100, step=10,
+                             help="CSV có cột time sẽ tự tính", key="wave_fs")
+    with col2:
+        sex = st.radio("Giới tính", ["Nam", "Nữ"], horizontal=True, key="wave_sex")
+        height = st.number_input("Chiều cao (cm)", min_value=100, max_value=220, value=170, step=1,
+                                 key="wave_height")
+    with col3:
+        set_peep = st.number_input("PEEP cài đặt (cmH2O, 0 = tự ước tính)", min_value=0.0,
+                                   max_value=30.0, value=0.0, step=1.0, key="wave_peep")
+    
+    pbw = calculate_ibw(height, "female" if sex in FEMALE_VALUES else "male")
+    
+    if uploaded is None:
+        st.info("Tải lên file ghi từ máy thở (50-100 Hz) để phân tích từng nhịp thở")
+        return
+    
+    suffix = os.path.splitext(uploaded.name)[1].lower()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "waveform" + suffix)
+        with open(path, "wb") as f:
+            f.write(uploaded.getbuffer())
+        try:
+            result = analyze_waveform(
+                path,
+                fs=fs if suffix in BINARY_EXTENSIONS + (".npy",) else None,
+                set_peep=set_peep or None,
+                pbw=pbw
+            )
+        except (ValueError, KeyError) as error:
+            st.error(f"Không đọc được file: {error}")
+            return
+    
+    summary = result["summary"]
+    if not summary["breaths"]:
+        st.warning("Không phát hiện nhịp thở nào - kiểm tra cột flow (L/phút, hít vào dương)")
+        return
+    
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Số nhịp", summary["breaths"], f"{summary['hours'] * 60:.0f} phút", delta_color="off")
+    c2.metric("Pplat (median)", f"{summary['median_pplat']:.1f} cmH2O" if summary["median_pplat"] is not None else "-")
+    c3.metric("Driving pressure", f"{summary['median_driving_pressure']:.1f} cmH2O"
+              if summary["median_driving_pressure"] is not None else "-")
+    c4.metric("Compliance tĩnh", f"{summary['median_compliance']:.0f} mL/cmH2O"
+              if summary["median_compliance"] is not None else "-")
+    
+    checks = [
+        (summary["pplat_over_30"], "nhịp có Pplat > 30 cmH2O"),
+        (summary["driving_pressure_over_15"], "nhịp có driving pressure > 15 cmH2O"),
+        (summary["vt_over_8_ml_kg"], f"nhịp có Vt > 8 mL/kg PBW ({pbw:.1f} kg)"),
+        (summary["dynamic_hyperinflation"], "nhịp còn dòng thở ra cuối thì thở ra (auto-PEEP)"),
+    ]
+    for count, label in checks:
+        if count:
+            st.error(f"⚠️ {count} {label}")
+    if not any(count for count, _ in checks):
+        st.success("✅ Đạt mục tiêu thông khí bảo vệ phổi trên toàn bộ bản ghi")
+    
+    st.write(f"- **Auto-PEEP (median, khi có hold/dòng về 0):** "
+             f"{summary['median_auto_peep']:.1f} cmH2O" if summary["median_auto_peep"] is not None
+             else "- **Auto-PEEP:** không đo được (không có đoạn dòng = 0 cuối thì thở ra)")
+    st.write(f"- **Bất đồng bộ:** double trigger {summary['double_trigger']}, "
+             f"ineffective effort {summary['ineffective_effort']} "
+             f"(asynchrony index {summary['asynchrony_index']:.1f}%)")
+    
+    breaths = pd.DataFrame(result["breaths"])
+    st.line_chart(breaths.set_index("start_time")[["pplat", "driving_pressure", "peep"]],
+                  x_label="Giây", y_label="cmH2O")
+    with st.expander("📋 Chi tiết từng nhịp"):
+        st.dataframe(breaths.round(2), hide_index=True)
+
+
+ROUNDED_COLUMNS = ("pbw", "vt_ml_kg", "mean_vt_ml_kg", "hours", "vt_pct", "pplat_pct", "table_pct", "all_pct",
+                   "vt_unknown_hours", "pplat_unknown_hours", "table_unknown_hours", "all_unknown_hours")
+
+
+def _compliance_unit():
+    """Unit compliance engine kept across reruns"""
+    if "vent_compliance" not in st.session_state:
+        st.session_state["vent_compliance"] = VentilatorCompliance()
+        st.session_state["vent_compliance_files"] = set()
+    return st.session_state["vent_compliance"]
+
+
+def render_compliance_dashboard():
+    """ICU ventilator compliance dashboard (whole unit)"""
+    st.subheader("🏥 Tuân Thủ Thông Khí Bảo Vệ Phổi - Toàn Khoa")
+    st.caption("Vt/kg PBW ≤ 8, Pplat ≤ 30 cmH2O, PEEP theo bảng PEEP/FiO2 - % thời gian đạt mục tiêu")
+    
+    unit = _compliance_unit()
+    
+    uploaded = st.file_uploader(
+        "Dữ liệu máy thở (CSV: time, patient, sex, height, vt, pplat, peep, fio2 [+ table])",
+        type=["csv"],
+        key="vent_compliance_file"
+    )
+    if uploaded is not None and uploaded.file_id not in st.session_state["vent_compliance_files"]:
+        observations = pd.read_csv(uploaded)
+        missing = {"time", "patient"} - set(observations.columns)
+        if missing:
+            st.error(f"Thiếu cột: {', '.join(sorted(missing))}")
+        else:
+            observations["time"] = pd.to_datetime(observations["time"])
+            try:
+                count = unit.extend(observations.sort_values("time", kind="stable"))
+            except ValueError as error:
+                st.error(str(error))
+            else:
+                st.session_state["vent_compliance_files"].add(uploaded.file_id)
+                st.success(f"Đã nhận {count} quan sát")
+    
+    with st.expander("➕ Thêm quan sát (thời điểm hiện tại)"):
+        with st.form("vent_compliance_add"):
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                patient = st.text_input("Giường / bệnh nhân", key="vc_patient")
+                sex = st.radio("Giới tính", ["Nam", "Nữ"], horizontal=True, key="vc_sex")
+            with col2:
+                height = st.number_input("Chiều cao (cm)", 100, 220, 170, 1, key="vc_height")
+                vt = st.number_input("Vt cài đặt (mL)", 0, 1000, 420, 10, key="vc_vt")
+            with col3:
+                pplat = st.number_input("Pplat (cmH2O, 0 = không đo)", 0.0, 60.0, 0.0, 1.0, key="vc_pplat")
+                peep = st.number_input("PEEP (cmH2O)", 0, 30, 8, 1, key="vc_peep")
+            with col4:
+                fio2 = st.number_input("FiO2", 0.21, 1.0, 0.4, 0.05, key="vc_fio2")
+            if st.form_submit_button("Thêm", type="primary") and patient:
+                try:
+                    unit.add(pd.Timestamp.now(), patient, sex=sex, height=height, vt=vt,
+                             pplat=pplat or None, peep=peep, fio2=fio2)
+                except (TypeError, ValueError) as error:
+                    st.error(str(error))
+    
+    now = pd.Timestamp.now() if st.checkbox("Tính đến thời điểm hiện tại", key="vc_now") else None
+    summary = unit.summary(now)
+    if not summary["patients"]:
+        st.info("Chưa có dữ liệu - tải CSV hoặc thêm quan sát")
+        return
+    
+    def percent(value):
+        return f"{value:.0f}%" if value is not None else "-"
+    
+    def status(target, label):
+        unknown = summary[f"{target}_unknown"]
+        return f"{summary[f'{target}_breaches']} {label}" + (f" · {unknown} chưa rõ" if unknown else "")
+    
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.metric("Bệnh nhân", summary["patients"], f"{summary['observations']} quan sát", delta_color="off")
+    c2.metric("Vt ≤ 8 mL/kg", percent(summary["vt_pct"]), status("vt", "đang vượt"), delta_color="off")
+    c3.metric("Pplat ≤ 30", percent(summary["pplat_pct"]), status("pplat", "đang vượt"), delta_color="off")
+    c4.metric("PEEP theo bảng", percent(summary["table_pct"]), status("table", "lệch bảng"), delta_color="off")
+    c5.metric("Đạt tất cả", percent(summary["all_pct"]), status("all", "chưa đạt"), delta_color="off")
+    st.caption("% tính trên thời gian đánh giá được - thiếu PBW, Pplat chưa đo hoặc thiếu PEEP/FiO2 "
+               f"là \"chưa rõ\" ({summary['all_unknown_hours']:.1f} giờ chưa rõ)")
+    
+    snapshot = unit.snapshot(now)
+    if st.checkbox("Chỉ hiện bệnh nhân chưa đạt", key="vc_breaches"):
+        snapshot = snapshot[snapshot["all_ok"].eq(False)]
+    st.dataframe(
+        snapshot.drop(columns=["table"]).round(dict.fromkeys(ROUNDED_COLUMNS, 1)),
+        hide_index=True,
+        column_config={
+            "vt_ml_kg": "Vt/kg", "mean_vt_ml_kg": "Vt/kg TB", "peep_min": "PEEP min", "peep_max": "PEEP max",
+            "hours": "Giờ", "vt_pct": "Vt %", "pplat_pct": "Pplat %", "table_pct": "Bảng %", "all_pct": "Tất cả %",
+        }
+    )
+    
+    if st.button("🗑️ Xóa dữ liệu khoa", key="vc_reset"):
+        del st.session_state["vent_compliance"]
+        st.rerun()
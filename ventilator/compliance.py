@@ -0,0 +1,268 @@
+"""
+ICU Ventilator Compliance - incremental unit dashboard engine
+
+VentilatorCompliance ingests ventilator observations (patient, sex, height,
+set Vt, Pplat, PEEP, FiO2) one at a time and keeps running aggregates per
+patient, so the unit view is a read of O(beds) numbers, never a rescan of
+history:
+
+- PBW (calculate_ibw, Devine) computed once per patient and recomputed
+  only if sex / height change
+- Vt/kg PBW: latest and observation mean
+- time in target: the interval from one observation to the next is
+  credited to the state of the earlier observation (settings carried
+  forward); the open interval up to `now` is added at read time
+- unknown state: a target that cannot be judged (no PBW, Pplat never
+  measured, PEEP or FiO2 missing) is neither met nor breached; that time
+  is left out of both sides of the percentage and reported separately
+
+Targets (ARDSNet):
+- vt: Vt ≤ 8 mL/kg PBW (unknown without Vt or sex / height)
+- pplat: Pplat ≤ 30 cmH2O (last measured Pplat carried forward; unknown
+  until first measured)
+- table: PEEP within the PEEP/FiO2 table range at that FiO2
+  (ventilator/peep_fio2.py, per patient table, default ARDSNet_low;
+  unknown without PEEP and FiO2)
+- all: every target met (breached if any target is, otherwise unknown if
+  any target is)
+
+Usage (kept in st.session_state for the unit):
+    unit = VentilatorCompliance()
+    unit.add(t, "Bed 4", sex="F", height=160, vt=420, pplat=27, peep=10, fio2=0.5)
+    unit.snapshot(now)      # one row per patient
+    unit.summary(now)       # unit-level percentages
+"""
+
+import pandas as pd
+
+from labs.normal_ranges import FEMALE_VALUES
+from scores.engine.metabolism.bmi_ibw_bsa import calculate_ibw
+from ventilator.peep_fio2 import DEFAULT_TABLE, normalize_fio2, peep_range
+from ventilator.waveforms import PPLAT_LIMIT, VT_LIMIT_ML_KG
+
+
+TARGETS = ("vt", "pplat", "table", "all")
+OBSERVATION_FIELDS = ("time", "patient", "sex", "height", "vt", "pplat", "peep", "fio2")
+SNAPSHOT_COLUMNS = (
+    "patient", "pbw", "table", "observations", "last_time", "vt", "vt_ml_kg", "mean_vt_ml_kg",
+    "pplat", "peep", "fio2", "peep_min", "peep_max",
+    "vt_ok", "pplat_ok", "table_ok", "all_ok",
+    "hours", "vt_pct", "pplat_pct", "table_pct", "all_pct",
+    "vt_unknown_hours", "pplat_unknown_hours", "table_unknown_hours", "all_unknown_hours",
+)
+
+
+def _given(value):
+    """None / NaN (empty CSV cell) = not given"""
+    return value is not None and not pd.isna(value)
+
+
+def _within(value, low, high):
+    """True / False, or None (unknown) when the value or a limit is missing"""
+    if value is None or high is None:
+        return None
+    return (low is None or low <= value) and value <= high
+
+
+def _hours(delta):
+    """Elapsed hours for timestamps (datetime / Timestamp) or numbers (hours)"""
+    if hasattr(delta, "total_seconds"):
+        return delta.total_seconds() / 3600
+    return float(delta)
+
+
+class VentilatorCompliance:
+    """
+    Running ARDSNet compliance for every ventilated patient of a unit
+
+    Args:
+        table: Default PEEP/FiO2 table ("ARDSNet_low" / "ARDSNet_high")
+    """
+
+    def __init__(self, table: str = DEFAULT_TABLE):
+        self.table = table
+        self.observations = 0
+        self._patients = {}
+
+    def _patient(self, patient, sex, height, table):
+        state = self._patients.get(patient)
+        if state is None:
+            state = self._patients[patient] = {
+                "sex": None, "height": None, "pbw": None, "table": table if _given(table) else self.table,
+                "observations": 0, "last_time": None, "vt": None, "vt_ml_kg": None,
+                "vt_ml_kg_sum": 0.0, "vt_count": 0, "pplat": None, "peep": None, "fio2": None,
+                "peep_min": None, "peep_max": None, "ok": dict.fromkeys(TARGETS),
+                "hours": 0.0, "in_target": dict.fromkeys(TARGETS, 0.0),
+                "unknown": dict.fromkeys(TARGETS, 0.0),
+            }
+        elif _given(table):
+            state["table"] = table
+        if _given(sex) and sex != state["sex"] or _given(height) and height != state["height"]:
+            state["sex"] = sex if _given(sex) else state["sex"]
+            state["height"] = float(height) if _given(height) else state["height"]
+            if state["height"] is not None:
+                gender = "female" if state["sex"] in FEMALE_VALUES else "male"
+                state["pbw"] = calculate_ibw(state["height"], gender) or None
+        return state
+
+    def add(self, time, patient, sex=None, height=None, vt=None, pplat=None, peep=None, fio2=None,
+            table=None) -> dict:
+        """
+        Ingest one observation
+
+        Args:
+            time: Observation time (datetime, or a number in hours);
+                non-decreasing per patient
+            patient: Patient / bed identifier
+            sex, height (cm): Needed on the first observation of a patient
+            vt (mL), pplat, peep (cmH2O), fio2 (fraction or %): None keeps
+                the previous value
+            table: PEEP/FiO2 table for this patient (default: unit table)
+
+        Returns:
+            dict: patient state after the observation (as a snapshot row)
+        """
+        state = self._patient(patient, sex, height, table)
+        if state["last_time"] is not None:
+            elapsed = _hours(time - state["last_time"])
+            if elapsed < 0:
+                raise ValueError(f"{patient}: observations must arrive in time order")
+            state["hours"] += elapsed
+            for target in TARGETS:
+                if state["ok"][target]:
+                    state["in_target"][target] += elapsed
+                elif state["ok"][target] is None:
+                    state["unknown"][target] += elapsed
+        state["last_time"] = time
+        state["observations"] += 1
+        self.observations += 1
+
+        if _given(vt):
+            state["vt"] = float(vt)
+        if _given(pplat):
+            state["pplat"] = float(pplat)
+        if _given(peep):
+            state["peep"] = float(peep)
+        if _given(fio2):
+            state["fio2"] = float(normalize_fio2(fio2))
+        if state["fio2"] is not None:
+            state["peep_min"], state["peep_max"] = peep_range(state["fio2"], state["table"])
+
+        if state["vt"] is not None and state["pbw"]:
+            state["vt_ml_kg"] = state["vt"] / state["pbw"]
+            state["vt_ml_kg_sum"] += state["vt_ml_kg"]
+            state["vt_count"] += 1
+
+        ok = state["ok"]
+        ok["vt"] = _within(state["vt_ml_kg"], None, VT_LIMIT_ML_KG)
+        ok["pplat"] = _within(state["pplat"], None, PPLAT_LIMIT)
+        ok["table"] = _within(state["peep"], state["peep_min"], state["peep_max"])
+        met = [ok["vt"], ok["pplat"], ok["table"]]
+        ok["all"] = False if False in met else None if None in met else True
+        return self._row(patient, state, None)
+
+    def extend(self, observations) -> int:
+        """
+        Ingest observations in order
+
+        Args:
+            observations: DataFrame (or iterable of dicts) with the
+                OBSERVATION_FIELDS columns (plus optional 'table'),
+                sorted by time
+
+        Returns:
+            int: Number of observations ingested
+        """
+        if isinstance(observations, pd.DataFrame):
+            columns = [c for c in OBSERVATION_FIELDS + ("table",) if c in observations]
+            observations = (dict(zip(columns, values))
+                            for values in observations[columns].itertuples(index=False, name=None))
+        count = 0
+        for observation in observations:
+            self.add(**observation)
+            count += 1
+        return count
+
+    def remove(self, patient):
+        """Drop a patient (extubated / discharged)"""
+        self._patients.pop(patient, None)
+
+    def _row(self, patient, state, now):
+        hours = state["hours"]
+        in_target = dict(state["in_target"])
+        unknown = dict(state["unknown"])
+        if now is not None and state["last_time"] is not None:
+            extra = max(_hours(now - state["last_time"]), 0.0)
+            hours += extra
+            for target in TARGETS:
+                if state["ok"][target]:
+                    in_target[target] += extra
+                elif state["ok"][target] is None:
+                    unknown[target] += extra
+        row = {
+            "patient": patient,
+            "pbw": state["pbw"],
+            "table": state["table"],
+            "observations": state["observations"],
+            "last_time": state["last_time"],
+            "vt": state["vt"],
+            "vt_ml_kg": state["vt_ml_kg"],
+            "mean_vt_ml_kg": state["vt_ml_kg_sum"] / state["vt_count"] if state["vt_count"] else None,
+            "pplat": state["pplat"],
+            "peep": state["peep"],
+            "fio2": state["fio2"],
+            "peep_min": state["peep_min"],
+            "peep_max": state["peep_max"],
+            "hours": hours,
+        }
+        for target in TARGETS:
+            known = hours - unknown[target]
+            row[f"{target}_ok"] = state["ok"][target]
+            row[f"{target}_pct"] = 100 * in_target[target] / known if known > 1e-9 else None
+            row[f"{target}_unknown_hours"] = unknown[target]
+        return row
+
+    def snapshot(self, now=None) -> pd.DataFrame:
+        """
+        One row per patient (SNAPSHOT_COLUMNS); {target}_ok is True, False
+        or None (unknown), {target}_pct is over the known hours only
+
+        Args:
+            now: Current time; extends every patient's last interval to it
+        """
+        rows = [self._row(patient, state, now) for patient, state in self._patients.items()]
+        return pd.DataFrame(rows, columns=list(SNAPSHOT_COLUMNS))
+
+    def summary(self, now=None) -> dict:
+        """
+        Unit-level aggregates
+
+        Returns:
+            dict: patients, observations, hours, {target}_pct (unit time in
+            target over the time it could be judged, %), {target}_breaches
+            (patients currently out of target), {target}_unknown (patients
+            currently unknown), {target}_unknown_hours
+        """
+        hours = 0.0
+        in_target = dict.fromkeys(TARGETS, 0.0)
+        unknown_hours = dict.fromkeys(TARGETS, 0.0)
+        breaches = dict.fromkeys(TARGETS, 0)
+        unknown = dict.fromkeys(TARGETS, 0)
+        for patient, state in self._patients.items():
+            row = self._row(patient, state, now)
+            hours += row["hours"]
+            for target in TARGETS:
+                known = row["hours"] - row[f"{target}_unknown_hours"]
+                if row[f"{target}_pct"] is not None:
+                    in_target[target] += row[f"{target}_pct"] * known / 100
+                unknown_hours[target] += row[f"{target}_unknown_hours"]
+                breaches[target] += row[f"{target}_ok"] is False
+                unknown[target] += row[f"{target}_ok"] is None
+        result = {"patients": len(self._patients), "observations": self.observations, "hours": hours}
+        for target in TARGETS:
+            known = hours - unknown_hours[target]
+            result[f"{target}_pct"] = 100 * in_target[target] / known if known > 1e-9 else None
+            result[f"{target}_breaches"] = breaches[target]
+            result[f"{target}_unknown"] = unknown[target]
+            result[f"{target}_unknown_hours"] = unknown_hours[target]
+        return result
@@ -0,0 +1,280 @@
+"""
+PEEP/FiO2 Step Engine - ARDSNet lower and higher PEEP tables
+
+Each table is a ladder of (FiO2, PEEP) steps in which both FiO2 and PEEP
+never decrease, stored as sorted NumPy arrays at import. A patient's
+position is bracketed by the highest step not above and the lowest step
+not below the current FiO2 and PEEP (two bisects each), so "one step up /
+down" is O(log n) and a whole unit census is a few np.searchsorted calls
+per table. Off-table settings step to the bracketing step: 'up' never
+lowers FiO2 or PEEP, 'down' never raises either.
+
+Titration (ARDSNet): SpO2 < 88% (or PaO2 < 55) → one step up;
+SpO2 > 95% (or PaO2 > 80) → one step down; otherwise stay.
+
+Tables (ARDSNet 2000 / ALVEOLI 2004). The higher-PEEP "FiO2 0.5-0.8 at
+PEEP 20" step is expanded to one step per 0.1 FiO2.
+
+data/Ventilator.csv peep_table lists the table names used per condition
+("ARDSNet_low,ARDSNet_high").
+
+Usage:
+    from ventilator.peep_fio2 import next_peep_fio2_step
+
+    next_peep_fio2_step(fio2=0.5, peep=10, spo2=86)   # → FiO2 0.6 / PEEP 10
+"""
+
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from data_loader import get_data_version, load_table
+
+
+SPO2_TARGET = (88, 95)      # %
+PAO2_TARGET = (55, 80)      # mmHg
+
+PEEP_TABLES = {
+    "ARDSNet_low": (
+        (0.3, 5), (0.4, 5), (0.4, 8), (0.5, 8), (0.5, 10), (0.6, 10), (0.7, 10),
+        (0.7, 12), (0.7, 14), (0.8, 14), (0.9, 14), (0.9, 16), (0.9, 18),
+        (1.0, 18), (1.0, 20), (1.0, 22), (1.0, 24),
+    ),
+    "ARDSNet_high": (
+        (0.3, 5), (0.3, 8), (0.3, 10), (0.3, 12), (0.3, 14), (0.4, 14), (0.4, 16),
+        (0.5, 16), (0.5, 18), (0.5, 20), (0.6, 20), (0.7, 20), (0.8, 20),
+        (0.8, 22), (0.9, 22), (1.0, 22), (1.0, 24),
+    ),
+}
+TABLE_LABELS = {
+    "ARDSNet_low": "Lower PEEP / Higher FiO2",
+    "ARDSNet_high": "Higher PEEP / Lower FiO2",
+}
+DEFAULT_TABLE = "ARDSNet_low"
+
+
+def _compile(steps):
+    fio2 = np.array([step[0] for step in steps])
+    peep = np.array([step[1] for step in steps], dtype=float)
+    if np.any(np.diff(fio2) < 0) or np.any(np.diff(peep) < 0):
+        raise ValueError("PEEP/FiO2 steps must be non-decreasing in FiO2 and PEEP")
+    return {"fio2": fio2, "peep": peep, "fio2_list": fio2.tolist(), "peep_list": peep.tolist()}
+
+
+TABLES = {name: _compile(steps) for name, steps in PEEP_TABLES.items()}
+
+
+def _table(name):
+    """Compiled table by name (ValueError if unknown)"""
+    try:
+        return TABLES[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown PEEP/FiO2 table {name!r} (expected one of {', '.join(TABLES)})") from None
+
+
+def normalize_fio2(fio2):
+    """FiO2 as a fraction (accepts 21-100 %)"""
+    fio2 = np.asarray(fio2, dtype=float)
+    return np.where(fio2 > 1, fio2 / 100, fio2)
+
+
+def _direction(spo2, pao2):
+    """+1 step up (hypoxaemia), -1 step down, 0 in target"""
+    if spo2 is not None and spo2 < SPO2_TARGET[0] or pao2 is not None and pao2 < PAO2_TARGET[0]:
+        return 1
+    if spo2 is not None and spo2 > SPO2_TARGET[1] or pao2 is not None and pao2 > PAO2_TARGET[1]:
+        return -1
+    return 0
+
+
+def locate_step(fio2, peep, table=DEFAULT_TABLE) -> int:
+    """Index of the highest step with FiO2 ≤ fio2 and PEEP ≤ peep (-1 if below the table)"""
+    compiled = _table(table)
+    fio2 = float(normalize_fio2(fio2))
+    return min(bisect_right(compiled["fio2_list"], fio2 + 1e-9),
+               bisect_right(compiled["peep_list"], peep)) - 1
+
+
+def step_above(fio2, peep, table=DEFAULT_TABLE) -> int:
+    """Index of the lowest step with FiO2 ≥ fio2 and PEEP ≥ peep (len(table) if none)"""
+    compiled = _table(table)
+    fio2 = float(normalize_fio2(fio2))
+    return max(bisect_left(compiled["fio2_list"], fio2 - 1e-9),
+               bisect_left(compiled["peep_list"], peep))
+
+
+def peep_range(fio2, table=DEFAULT_TABLE) -> tuple:
+    """
+    PEEP range (min, max) the table allows at an FiO2
+
+    FiO2 between table values (e.g. 0.45) takes the steps of both
+    neighbouring 0.1 values; FiO2 below the table uses its first FiO2.
+    """
+    compiled = _table(table)
+    fio2 = float(normalize_fio2(fio2))
+    low = bisect_left(compiled["fio2_list"], np.floor(fio2 * 10 + 1e-6) / 10 - 1e-9)
+    high = bisect_right(compiled["fio2_list"], np.ceil(fio2 * 10 - 1e-6) / 10 + 1e-9) - 1
+    low = min(low, len(compiled["fio2_list"]) - 1)
+    high = max(high, bisect_right(compiled["fio2_list"], compiled["fio2_list"][0] + 1e-9) - 1)
+    return compiled["peep_list"][low], compiled["peep_list"][high]
+
+
+def peep_range_array(fio2, table=DEFAULT_TABLE) -> tuple:
+    """peep_range() for an array of FiO2 values → (min array, max array)"""
+    compiled = _table(table)
+    fio2 = normalize_fio2(fio2)
+    low = np.searchsorted(compiled["fio2"], np.floor(fio2 * 10 + 1e-6) / 10 - 1e-9, side="left")
+    high = np.searchsorted(compiled["fio2"], np.ceil(fio2 * 10 - 1e-6) / 10 + 1e-9, side="right") - 1
+    low = np.minimum(low, len(compiled["fio2"]) - 1)
+    high = np.maximum(high, np.searchsorted(compiled["fio2"], compiled["fio2"][0] + 1e-9, side="right") - 1)
+    return compiled["peep"][low], compiled["peep"][high]
+
+
+def next_peep_fio2_step(fio2, peep, spo2=None, pao2=None, table=DEFAULT_TABLE) -> dict:
+    """
+    Next PEEP/FiO2 combination for the current oxygenation
+
+    Args:
+        fio2: Current FiO2 (fraction or %)
+        peep: Current PEEP (cmH2O)
+        spo2: SpO2 (%), and/or
+        pao2: PaO2 (mmHg)
+        table: "ARDSNet_low" or "ARDSNet_high"
+
+    Returns:
+        dict: action ('up' / 'down' / 'stay'), fio2, peep (recommended),
+        step (-1 = no table step: current setting kept), steps (table
+        length), on_table (current setting is a table step), at_limit (no
+        step in that direction)
+
+    Raises:
+        ValueError: Unknown table
+    """
+    compiled = _table(table)
+    last = len(compiled["fio2_list"]) - 1
+    below = locate_step(fio2, peep, table)
+    above = step_above(fio2, peep, table)
+    on_table = below == above
+    fio2 = float(normalize_fio2(fio2))
+
+    # Off-table settings move to the nearest step at or above (up) / at or
+    # below (down) both the current FiO2 and PEEP, so 'up' never lowers either
+    direction = _direction(spo2, pao2)
+    if direction > 0:
+        step = above + 1 if on_table else above
+        step = step if step <= last else -1
+    elif direction < 0:
+        step = below - 1 if on_table else below
+    else:
+        step = below if on_table else -1
+    at_limit = direction != 0 and step < 0
+
+    return {
+        "action": ("stay", "up", "down")[direction],
+        "fio2": compiled["fio2_list"][step] if step >= 0 else fio2,
+        "peep": compiled["peep_list"][step] if step >= 0 else float(peep),
+        "step": step,
+        "steps": last + 1,
+        "on_table": on_table,
+        "at_limit": at_limit,
+        "table": table,
+    }
+
+
+def next_peep_fio2_batch(df, table=DEFAULT_TABLE) -> dict:
+    """
+    next_peep_fio2_step() for every patient of a census
+
+    Args:
+        df: DataFrame or dict of arrays with fio2, peep and spo2 and/or pao2
+            (NaN = not measured); optional 'table' column per patient
+        table: Table for rows without a 'table' value
+
+    Returns:
+        dict of arrays: action ('up' / 'down' / 'stay'), fio2, peep, step,
+        on_table, at_limit, evaluable (False when fio2 / peep is missing or
+        the row's table is unknown: current setting kept, step -1, never
+        at_limit)
+
+    Raises:
+        ValueError: Unknown default table
+    """
+    _table(table)
+    fio2 = normalize_fio2(df["fio2"])
+    peep = np.asarray(df["peep"], dtype=float)
+    n = len(fio2)
+    nan = np.full(n, np.nan)
+    spo2 = np.asarray(df["spo2"], dtype=float) if "spo2" in df else nan
+    pao2 = np.asarray(df["pao2"], dtype=float) if "pao2" in df else nan
+    up = (spo2 < SPO2_TARGET[0]) | (pao2 < PAO2_TARGET[0])
+    down = ~up & ((spo2 > SPO2_TARGET[1]) | (pao2 > PAO2_TARGET[1]))
+    direction = np.where(up, 1, np.where(down, -1, 0))
+
+    tables = (pd.Series(np.asarray(df["table"], dtype=object)).fillna(table).to_numpy()
+              if "table" in df else np.full(n, table, dtype=object))
+
+    out_fio2, out_peep = fio2.copy(), peep.copy()
+    step = np.full(n, -1)
+    on_table = np.zeros(n, dtype=bool)
+    at_limit = np.zeros(n, dtype=bool)
+    evaluable = ~np.isnan(fio2) & ~np.isnan(peep) & np.isin(tables, list(TABLES))
+    for name, rows in pd.Series(tables[evaluable]).groupby(tables[evaluable], sort=False).indices.items():
+        rows = np.flatnonzero(evaluable)[rows]
+        compiled = TABLES[name]
+        last = len(compiled["fio2"]) - 1
+        below = np.minimum(
+            np.searchsorted(compiled["fio2"], fio2[rows] + 1e-9, side="right"),
+            np.searchsorted(compiled["peep"], peep[rows], side="right")
+        ) - 1
+        above = np.maximum(
+            np.searchsorted(compiled["fio2"], fio2[rows] - 1e-9, side="left"),
+            np.searchsorted(compiled["peep"], peep[rows], side="left")
+        )
+        exact = below == above
+        move = direction[rows]
+        target = np.where(move > 0, above + exact,
+                          np.where(move < 0, below - exact, np.where(exact, below, -1)))
+        target = np.where(target > last, -1, target)
+        found = target >= 0
+        safe = np.maximum(target, 0)
+        out_fio2[rows] = np.where(found, compiled["fio2"][safe], fio2[rows])
+        out_peep[rows] = np.where(found, compiled["peep"][safe], peep[rows])
+        step[rows] = target
+        on_table[rows] = exact
+        at_limit[rows] = (move != 0) & ~found
+
+    return {
+        "action": np.take(np.array(["stay", "up", "down"], dtype=object), direction),
+        "fio2": out_fio2,
+        "peep": out_peep,
+        "step": step,
+        "on_table": on_table,
+        "at_limit": at_limit,
+        "evaluable": evaluable,
+    }
+
+
+def table_frame(table=DEFAULT_TABLE) -> pd.DataFrame:
+    """Table as a DataFrame (Step, FiO2, PEEP) for display"""
+    compiled = _table(table)
+    return pd.DataFrame({
+        "Step": np.arange(1, len(compiled["fio2"]) + 1),
+        "FiO2": compiled["fio2"],
+        "PEEP": compiled["peep"].astype(int),
+    })
+
+
+@lru_cache(maxsize=4)
+def _condition_tables(version: str) -> dict:
+    return {
+        row["condition"]: [name.strip() for name in row["peep_table"].split(",")
+                           if name.strip() in TABLES]
+        for row in load_table("Ventilator")
+    }
+
+
+def get_condition_tables(condition: str) -> list:
+    """PEEP tables listed for a condition in data/Ventilator.csv ([] if none)"""
+    return _condition_tables(get_data_version("Ventilator")).get(condition, [])
@@ -6,6 +6,77 @@ PEEP/FiO2 combinations and other reference data
 import streamlit as st
 import pandas as pd
 
+from ventilator.peep_fio2 import (
+    DEFAULT_TABLE,
+    TABLE_LABELS,
+    TABLES,
+    get_condition_tables,
+    next_peep_fio2_batch,
+    next_peep_fio2_step,
+    table_frame,
+)
+
+
+# Built once per process instead of on every rerun
+TABLE_FRAMES = {name: table_frame(name) for name in TABLES}
+ACTION_LABELS = {"up": "⬆️ Tăng 1 bước", "down": "⬇️ Giảm 1 bước", "stay": "✅ Giữ nguyên"}
+
+
+def render_peep_fio2_step():
+    """Next PEEP/FiO2 step for one patient"""
+    st.markdown("### 🧭 Bước Tiếp Theo")
+    tables = get_condition_tables("ARDS (invasive)") or list(TABLES)
+    table = st.radio("Strategy", tables, format_func=TABLE_LABELS.get, horizontal=True,
+                     key="peep_step_table")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        fio2 = st.number_input("FiO2 hiện tại", 0.21, 1.0, 0.5, 0.05, key="peep_step_fio2")
+    with col2:
+        peep = st.number_input("PEEP hiện tại (cmH2O)", 0, 30, 10, 1, key="peep_step_peep")
+    with col3:
+        spo2 = st.number_input("SpO2 (%)", 50, 100, 92, 1, key="peep_step_spo2")
+    with col4:
+        pao2 = st.number_input("PaO2 (mmHg, 0 = không có)", 0, 600, 0, 1, key="peep_step_pao2")
+
+    result = next_peep_fio2_step(fio2, peep, spo2=spo2, pao2=pao2 or None, table=table)
+    position = (f"bước {result['step'] + 1}/{result['steps']}" if result["step"] >= 0
+                else "giữ cài đặt hiện tại")
+    message = (f"{ACTION_LABELS[result['action']]} → **FiO2 {result['fio2']:.2f} / PEEP "
+               f"{result['peep']:g}** ({position})")
+    if result["at_limit"]:
+        st.error(f"Đã ở giới hạn bảng - {message}")
+    elif result["action"] == "stay":
+        st.success(message)
+    else:
+        st.warning(message)
+    if not result["on_table"]:
+        st.caption("Cài đặt hiện tại không nằm trong bảng - khuyến nghị là bước gần nhất theo hướng chỉnh (không giảm FiO2/PEEP khi tăng)")
+
+
+def render_peep_fio2_census():
+    """PEEP/FiO2 recommendation for every ventilated patient of a unit"""
+    st.caption("CSV: patient, fio2, peep, spo2 (tùy chọn: pao2, table = ARDSNet_low / ARDSNet_high)")
+    uploaded = st.file_uploader("Census CSV", type=["csv"], key="peep_census_file")
+    if uploaded is None:
+        return
+    census = pd.read_csv(uploaded)
+    missing = {"fio2", "peep"} - set(census.columns)
+    if missing or not {"spo2", "pao2"} & set(census.columns):
+        st.error("Thiếu cột fio2, peep hoặc spo2/pao2")
+        return
+    result = next_peep_fio2_batch(census, table=DEFAULT_TABLE)
+    report = census.assign(action=result["action"], next_fio2=result["fio2"],
+                           next_peep=result["peep"], at_limit=result["at_limit"],
+                           evaluable=result["evaluable"])
+    st.dataframe(report, hide_index=True, use_container_width=True)
+    not_evaluable = int((~result["evaluable"]).sum())
+    if not_evaluable:
+        st.warning(f"{not_evaluable} bệnh nhân không đánh giá được (thiếu fio2/peep hoặc table không hợp lệ) - giữ cài đặt hiện tại")
+    counts = report["action"].value_counts()
+    st.caption(" · ".join(f"{ACTION_LABELS[name]}: {int(counts.get(name, 0))}"
+                          for name in ACTION_LABELS))
+
 
 def render_peep_fio2_table():
     """ARDSNet PEEP/FiO2 Table"""
@@ -21,14 +92,6 @@ def render_peep_fio2_table():
     
     st.markdown("---")
     
-    # Create PEEP/FiO2 table
-    peep_fio2_data = {
-        "FiO2": [0.3, 0.4, 0.4, 0.5, 0.5, 0.6, 0.7, 0.7, 0.7, 0.8, 0.9, 0.9, 0.9, 1.0, 1.0, 1.0, 1.0],
-        "PEEP": [5, 5, 8, 8, 10, 10, 10, 12, 14, 14, 14, 16, 18, 18, 20, 22, 24]
-    }
-    
-    df = pd.DataFrame(peep_fio2_data)
-    
     st.markdown("### 📋 Bảng Lower PEEP Strategy")
     
     # Display as a nicer table
@@ -36,19 +99,15 @@ def render_peep_fio2_table():
     
     with col1:
         st.markdown("#### Phần 1")
-        st.dataframe(
-            df.head(9).style.highlight_max(axis=0, color='lightgreen'),
-            hide_index=True,
-            use_container_width=True
-        )
+        st.dataframe(TABLE_FRAMES["ARDSNet_low"].head(9), hide_index=True, use_container_width=True)
     
     with col2:
         st.markdown("#### Phần 2")
-        st.dataframe(
-            df.tail(8).style.highlight_max(axis=0, color='lightcoral'),
-            hide_index=True,
-            use_container_width=True
-        )
+        st.dataframe(TABLE_FRAMES["ARDSNet_low"].tail(8), hide_index=True, use_container_width=True)
+    
+    st.markdown("---")
+    
+    render_peep_fio2_step()
     
     st.markdown("---")
     
@@ -89,13 +148,11 @@ def render_peep_fio2_table():
         Một số nghiên cứu gợi ý Higher PEEP có thể tốt hơn ở một số bệnh nhân ARDS.
         """)
         
-        higher_peep_data = {
-            "FiO2": [0.3, 0.3, 0.3, 0.4, 0.4, 0.5, 0.5, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.0],
-            "PEEP": [5, 8, 10, 10, 12, 12, 14, 16, 16, 16, 16, 16, 20, 24]
-        }
-        
-        df_higher = pd.DataFrame(higher_peep_data)
-        st.dataframe(df_higher, hide_index=True, use_container_width=True)
+        st.caption("ALVEOLI 2004 - bước FiO2 0.5-0.8 / PEEP 20 tách thành từng bước 0.1")
+        st.dataframe(TABLE_FRAMES["ARDSNet_high"], hide_index=True, use_container_width=True)
+    
+    with st.expander("🏥 Khuyến Nghị Cho Cả Khoa (Census)"):
+        render_peep_fio2_census()
     
     with st.expander("📚 Tài Liệu Tham Khảo"):
         st.markdown("""
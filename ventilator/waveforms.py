@@ -0,0 +1,318 @@
+"""
+Ventilator Waveform Analytics
+Breath-by-breath analysis of recorded airway pressure / flow traces
+
+Input: pressure (cmH2O) and flow (L/min, inspiration positive) sampled at a
+fixed rate (typically 50-100 Hz), as
+- CSV with columns pressure, flow (+ optional time in seconds, volume, ...);
+  converted once to a .npy sidecar next to the file
+- .npy (2-D, one column per channel) or raw little-endian float32 (.bin,
+  .dat, .f32) with channels interleaved
+Recordings are opened as memory-mapped arrays and processed in blocks, so
+hours of 100 Hz data never have to be loaded at once.
+
+Per breath (inspiration start to next inspiration start):
+- Ti, Te, RR, Vt (integrated inspiratory flow), Ppeak
+- Pplat: mean pressure over the end of an end-inspiratory pause (zero flow
+  ≥ MIN_PAUSE_S before expiration); NaN without a pause
+- PEEP: pressure at end-expiration; total PEEP when flow has returned to
+  zero (expiratory hold or complete exhalation)
+- auto-PEEP = total PEEP - set PEEP; end-expiratory flow still below
+  EXP_FLOW at the next trigger flags dynamic hyperinflation
+- driving pressure = Pplat - PEEP, static compliance = Vt / driving pressure
+- asynchrony: double triggering (Te < half the median Ti) and ineffective
+  efforts (expiratory flow rising toward zero by ≥ INEFFECTIVE_FLOW and
+  falling again without a trigger)
+
+Lung-protective checks: Pplat > 30 cmH2O, driving pressure > 15 cmH2O,
+Vt > 8 mL/kg PBW (when pbw is given).
+
+Usage:
+    from ventilator.waveforms import analyze_waveform
+
+    result = analyze_waveform("bed12_vent.csv", pbw=65)
+    result["summary"]["pplat_over_30"]
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+TRIGGER_FLOW = 2.0          # L/min, inspiration start
+EXP_FLOW = -2.0             # L/min, expiration start
+ZERO_FLOW = 1.5             # L/min, |flow| below this = no flow
+MIN_CYCLE_S = 0.25          # s, triggers closer than this are merged
+MIN_PAUSE_S = 0.15          # s, shortest zero-flow pause used for Pplat / total PEEP
+PLATEAU_WINDOW_S = 0.1      # s, averaged at the end of a pause
+PEEP_WINDOW_S = 0.1         # s, averaged before the next trigger
+INEFFECTIVE_FLOW = 5.0      # L/min
+PPLAT_LIMIT = 30            # cmH2O
+DRIVING_PRESSURE_LIMIT = 15  # cmH2O
+VT_LIMIT_ML_KG = 8          # mL/kg PBW
+DEFAULT_BLOCK_S = 900       # s of recording per processing block
+
+BINARY_EXTENSIONS = (".bin", ".dat", ".f32")
+BREATH_FIELDS = (
+    "start_time", "ti", "te", "rr", "vt", "vte", "ppeak", "pplat", "peep",
+    "total_peep", "end_exp_flow", "driving_pressure", "compliance",
+    "double_trigger", "ineffective_effort",
+)
+
+
+def _csv_to_npy(path, chunksize=1_000_000):
+    """Convert a waveform CSV to a .npy sidecar (rebuilt when the CSV is newer)"""
+    target = path + ".npy"
+    if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+        return target, list(pd.read_csv(path, nrows=0).columns)
+
+    columns = list(pd.read_csv(path, nrows=0).columns)
+    with open(path, "rb") as f:
+        rows = sum(1 for _ in f) - 1
+    out = np.lib.format.open_memmap(target + ".tmp", mode="w+", dtype=np.float32,
+                                    shape=(rows, len(columns)))
+    position = 0
+    for chunk in pd.read_csv(path, chunksize=chunksize, dtype=np.float32):
+        out[position:position + len(chunk)] = chunk.to_numpy()
+        position += len(chunk)
+    out.flush()
+    del out
+    os.replace(target + ".tmp", target)
+    return target, columns
+
+
+def open_waveform(source, fs=None, channels=("pressure", "flow")):
+    """
+    Open a recording as a memory-mapped (samples x channels) array
+
+    Args:
+        source: CSV / .npy / raw float32 path, or an array (samples x channels)
+        fs: Sampling rate (Hz); from the CSV time column when omitted
+        channels: Column names of .npy / raw / array input
+
+    Returns:
+        tuple: (array, fs, channel names)
+
+    Raises:
+        ValueError: Sampling rate unknown
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        data, names = np.asarray(source), list(channels)
+    else:
+        path = os.fspath(source)
+        if path.lower().endswith(".csv"):
+            path, names = _csv_to_npy(path)
+            data = np.load(path, mmap_mode="r")
+        elif path.lower().endswith(".npy"):
+            data, names = np.load(path, mmap_mode="r"), list(channels)
+        elif path.lower().endswith(BINARY_EXTENSIONS):
+            names = list(channels)
+            data = np.memmap(path, dtype="<f4", mode="r").reshape(-1, len(names))
+        else:
+            raise ValueError(f"Unsupported waveform file: {path}")
+
+    if fs is None and "time" in names:
+        time = np.asarray(data[:min(len(data), 10_000), names.index("time")], dtype=float)
+        fs = 1 / np.median(np.diff(time))
+    if not fs:
+        raise ValueError("Sampling rate unknown - pass fs")
+    return data, float(fs), names
+
+
+def _segment_min(values, segment, suffix):
+    """Running minimum restarting at each segment (prefix or suffix)"""
+    offset = segment * 1e6
+    if suffix:
+        return np.minimum.accumulate((values + offset)[::-1])[::-1] - offset
+    return np.minimum.accumulate(values - offset) + offset
+
+
+def analyze_breaths(pressure, flow, fs) -> tuple:
+    """
+    Breath metrics for the complete breaths of one block
+
+    Args:
+        pressure: Airway pressure (cmH2O)
+        flow: Flow (L/min, inspiration positive)
+        fs: Sampling rate (Hz)
+
+    Returns:
+        tuple: (dict of per-breath arrays - see BREATH_FIELDS, start_time in
+        s from the block start; index of the last inspiration start, from
+        which the next block continues, or None if no breath started)
+    """
+    pressure = np.asarray(pressure, dtype=float)
+    flow = np.asarray(flow, dtype=float)
+    above = flow > TRIGGER_FLOW
+    starts = np.flatnonzero(~above[:-1] & above[1:]) + 1
+    if len(starts):
+        keep = np.concatenate([[True], np.diff(starts) >= MIN_CYCLE_S * fs])
+        starts = starts[keep]
+    if len(starts) < 2:
+        empty = {name: np.empty(0) for name in BREATH_FIELDS}
+        return empty, (int(starts[0]) if len(starts) else None)
+
+    begin, ends = starts[:-1], starts[1:]
+    n = len(begin)
+    index = np.arange(len(flow))
+
+    # Expiration: first sample after the trigger with flow below EXP_FLOW
+    negative = np.flatnonzero(flow < EXP_FLOW)
+    position = np.searchsorted(negative, begin)
+    exp_start = np.where(position < len(negative),
+                         negative[np.minimum(position, len(negative) - 1)], ends)
+    exp_start = np.minimum(exp_start, ends)
+
+    volume = np.concatenate([[0.0], np.cumsum(flow)]) * (1000 / 60 / fs)   # mL
+    cum_pressure = np.concatenate([[0.0], np.cumsum(pressure)])
+    cum_flow = np.concatenate([[0.0], np.cumsum(flow)])
+    vt = volume[exp_start] - volume[begin]
+    vte = volume[exp_start] - volume[ends]
+    ppeak = np.maximum.reduceat(pressure[:ends[-1]], begin)
+
+    # Zero-flow runs: length of the run ending at each sample, last zero sample
+    zero = np.abs(flow) < ZERO_FLOW
+    run = index - np.maximum.accumulate(np.where(zero, -1, index))
+    last_zero = np.maximum.accumulate(np.where(zero, index, -1))
+    min_pause = max(1, int(round(MIN_PAUSE_S * fs)))
+    plateau_window = max(1, int(round(PLATEAU_WINDOW_S * fs)))
+    peep_window = max(1, int(round(PEEP_WINDOW_S * fs)))
+    gap = max(2, int(round(0.1 * fs)))
+
+    # Pplat: zero-flow pause ending just before expiration
+    pause_end = last_zero[np.maximum(exp_start - 1, 0)]
+    pause_run = np.where(pause_end >= 0, run[np.maximum(pause_end, 0)], 0)
+    has_pause = ((pause_end > begin) & (exp_start - pause_end <= gap)
+                 & (pause_run >= min_pause) & (exp_start < ends))
+    width = np.clip(np.minimum(pause_run, plateau_window), 1, None)
+    pplat_end = np.maximum(pause_end, 0) + 1
+    pplat = np.where(has_pause,
+                     (cum_pressure[pplat_end] - cum_pressure[np.maximum(pplat_end - width, 0)]) / width,
+                     np.nan)
+
+    # End-expiration: PEEP, flow, total PEEP when flow has stopped
+    window_start = np.maximum(ends - peep_window, begin)
+    samples = ends - window_start
+    peep = (cum_pressure[ends] - cum_pressure[window_start]) / samples
+    end_exp_flow = (cum_flow[ends] - cum_flow[window_start]) / samples
+    hold_run = run[ends - 1]
+    total_peep = np.where((hold_run >= min_pause) & (ends - 1 > exp_start), peep, np.nan)
+
+    reference_peep = np.where(np.isnan(total_peep), peep, total_peep)
+    driving_pressure = pplat - reference_peep
+    with np.errstate(divide="ignore", invalid="ignore"):
+        compliance = np.where(driving_pressure > 0, vt / driving_pressure, np.nan)
+
+    ti = (exp_start - begin) / fs
+    te = (ends - exp_start) / fs
+    rr = 60 * fs / (ends - begin)
+    double_trigger = te < 0.5 * np.median(ti)
+
+    # Ineffective efforts: after peak expiratory flow, a rise toward zero
+    # above the later minimum (passive exhalation only ever rises)
+    span = slice(begin[0], ends[-1])
+    segment = np.repeat(np.arange(n), ends - begin)
+    block_flow = flow[span]
+    after_peak = (_segment_min(block_flow, segment, suffix=False)
+                  <= np.minimum.reduceat(block_flow, begin - begin[0])[segment])
+    expiring = index[span] >= exp_start[segment]
+    bump = np.where(after_peak & expiring,
+                    block_flow - _segment_min(block_flow, segment, suffix=True), 0.0)
+    ineffective_effort = np.maximum.reduceat(bump, begin - begin[0]) >= INEFFECTIVE_FLOW
+
+    breaths = {
+        "start_time": begin / fs,
+        "ti": ti,
+        "te": te,
+        "rr": rr,
+        "vt": vt,
+        "vte": vte,
+        "ppeak": ppeak,
+        "pplat": pplat,
+        "peep": peep,
+        "total_peep": total_peep,
+        "end_exp_flow": end_exp_flow,
+        "driving_pressure": driving_pressure,
+        "compliance": compliance,
+        "double_trigger": double_trigger,
+        "ineffective_effort": ineffective_effort,
+    }
+    return breaths, int(starts[-1])
+
+
+def _nanmedian(values):
+    values = values[~np.isnan(values)]
+    return float(np.median(values)) if len(values) else None
+
+
+def analyze_waveform(source, fs=None, set_peep=None, pbw=None, channels=("pressure", "flow"),
+                     block_seconds=DEFAULT_BLOCK_S) -> dict:
+    """
+    Breath-by-breath analysis of a whole recording, block by block
+
+    Args:
+        source: CSV / .npy / raw float32 path or array (see open_waveform)
+        fs: Sampling rate (Hz), required unless the CSV has a time column
+        set_peep: PEEP set on the ventilator (cmH2O); default the median
+            end-expiratory pressure
+        pbw: Predicted body weight (kg) for the Vt mL/kg check
+        channels: Channel names of .npy / raw / array input
+        block_seconds: Recording processed per block
+
+    Returns:
+        dict: breaths (per-breath arrays, BREATH_FIELDS + auto_peep,
+        dynamic_hyperinflation, pplat_high, driving_pressure_high,
+        vt_ml_kg, vt_high), summary (counts and medians), fs
+    """
+    data, fs, names = open_waveform(source, fs, channels)
+    columns = [names.index("pressure"), names.index("flow")]
+    block = int(block_seconds * fs)
+    total = len(data)
+
+    parts = []
+    position = 0
+    while position < total:
+        end = min(total, position + block)
+        values = np.asarray(data[position:end][:, columns], dtype=float)
+        breaths, carry = analyze_breaths(values[:, 0], values[:, 1], fs)
+        breaths["start_time"] = breaths["start_time"] + position / fs
+        parts.append(breaths)
+        if end == total:
+            break
+        # Restart one sample before the last trigger so it is detected again
+        position += carry - 1 if carry and carry > 1 else end - position
+
+    breaths = {name: np.concatenate([part[name] for part in parts]) for name in BREATH_FIELDS}
+    if set_peep is None:
+        set_peep = _nanmedian(breaths["peep"])
+    breaths["auto_peep"] = breaths["total_peep"] - set_peep if set_peep is not None else breaths["total_peep"]
+    breaths["dynamic_hyperinflation"] = breaths["end_exp_flow"] < EXP_FLOW
+    breaths["pplat_high"] = breaths["pplat"] > PPLAT_LIMIT
+    breaths["driving_pressure_high"] = breaths["driving_pressure"] > DRIVING_PRESSURE_LIMIT
+    breaths["vt_ml_kg"] = breaths["vt"] / pbw if pbw else np.full(len(breaths["vt"]), np.nan)
+    breaths["vt_high"] = breaths["vt_ml_kg"] > VT_LIMIT_ML_KG
+
+    count = len(breaths["vt"])
+    double = int(breaths["double_trigger"].sum())
+    ineffective = int(breaths["ineffective_effort"].sum())
+    summary = {
+        "breaths": count,
+        "hours": total / fs / 3600,
+        "set_peep": set_peep,
+        "median_rr": _nanmedian(breaths["rr"]),
+        "median_vt": _nanmedian(breaths["vt"]),
+        "median_pplat": _nanmedian(breaths["pplat"]),
+        "median_driving_pressure": _nanmedian(breaths["driving_pressure"]),
+        "median_compliance": _nanmedian(breaths["compliance"]),
+        "median_auto_peep": _nanmedian(breaths["auto_peep"]),
+        "plateau_breaths": int((~np.isnan(breaths["pplat"])).sum()),
+        "pplat_over_30": int(breaths["pplat_high"].sum()),
+        "driving_pressure_over_15": int(breaths["driving_pressure_high"].sum()),
+        "vt_over_8_ml_kg": int(breaths["vt_high"].sum()),
+        "dynamic_hyperinflation": int(breaths["dynamic_hyperinflation"].sum()),
+        "double_trigger": double,
+        "ineffective_effort": ineffective,
+        "asynchrony_index": 100 * (double + ineffective) / (count + ineffective) if count else None,
+    }
+    return {"breaths": breaths, "summary": summary, "fs": fs}